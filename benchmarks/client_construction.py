@@ -0,0 +1,41 @@
+# -*- coding: utf-8 -*-
+"""
+Python client for the Payline SOAP API
+Benchmark of the client construction: the WSDL is parsed for every client (cold)
+or once per process (shared service model)
+
+python benchmarks/client_construction.py [iterations]
+"""
+
+from __future__ import print_function
+
+import sys
+import timeit
+
+from pypayline import wsdl
+from pypayline.client import WebPaymentAPI, DirectPaymentAPI
+
+
+def construct(api_class):
+    """create a client with dummy credentials"""
+    return api_class(u'12345678901234', u'abCdeFgHiJKLmNoPqrst', u'1234567', homologation=True)
+
+
+def cold(api_class):
+    """simulate the previous behavior: the WSDL is parsed again for each client"""
+    wsdl.clear_registry()
+    return construct(api_class)
+
+
+def main(iterations=20):
+    for api_class in (WebPaymentAPI, DirectPaymentAPI):
+        cold_time = min(timeit.repeat(lambda: cold(api_class), number=iterations, repeat=3)) / iterations
+        construct(api_class)  # make sure the service model is loaded
+        warm_time = min(timeit.repeat(lambda: construct(api_class), number=iterations, repeat=3)) / iterations
+        print(u'{0:<18} parse per client: {1:9.3f} ms   shared model: {2:9.3f} ms   x{3:.0f}'.format(
+            api_class.__name__, cold_time * 1000, warm_time * 1000, cold_time / warm_time
+        ))
+
+
+if __name__ == '__main__':
+    main(*[int(arg) for arg in sys.argv[1:2]])
@@ -0,0 +1,52 @@
+# -*- coding: utf-8 -*-
+"""
+Python client for the Payline SOAP API
+Benchmark of a worker cold start: a fresh process creates a client, parsing the
+WSDL or loading the compiled file from the on-disk cache
+
+python benchmarks/cold_start.py [runs]
+"""
+
+from __future__ import print_function
+
+import os
+import shutil
+import subprocess
+import sys
+import tempfile
+
+
+SCRIPT = u'''
+import sys, time
+from pypayline.client import WebPaymentAPI
+start = time.time()
+WebPaymentAPI(u'12345678901234', u'abCdeFgHiJKLmNoPqrst', u'1234567', cache=sys.argv[1] or None)
+print(time.time() - start)
+'''
+
+
+def run(cache_dir):
+    """start a new interpreter and return the duration of the client construction"""
+    env = dict(os.environ)
+    env['PYTHONPATH'] = os.pathsep.join(
+        [os.path.dirname(os.path.dirname(os.path.abspath(__file__)))] + sys.path
+    )
+    output = subprocess.check_output([sys.executable, '-c', SCRIPT, cache_dir], env=env)
+    return float(output.decode('ascii').strip())
+
+
+def main(runs=5):
+    cache_dir = tempfile.mkdtemp()
+    try:
+        run(cache_dir)  # write the compiled file
+        parse_time = min(run('') for _index in range(runs))
+        cached_time = min(run(cache_dir) for _index in range(runs))
+    finally:
+        shutil.rmtree(cache_dir)
+    print(u'WebPaymentAPI first client   WSDL parse: {0:8.2f} ms   compiled file: {1:8.2f} ms'.format(
+        parse_time * 1000, cached_time * 1000
+    ))
+
+
+if __name__ == '__main__':
+    main(*[int(arg) for arg in sys.argv[1:2]])
@@ -0,0 +1,94 @@
+# -*- coding: utf-8 -*-
+"""
+Python client for the Payline SOAP API
+Benchmark of the operations which are not in the hot list of the backend: the methods of the
+generated modules (pypayline.codegen) against the dynamic dispatch of pysimplesoap, which walks
+the WSDL types to write the request and to read the response. The transports return a canned
+response, so only the client side is measured. The two must write the same requests and read
+the same responses.
+
+python benchmarks/generated_operations.py [iterations]
+"""
+
+from __future__ import print_function
+
+import sys
+import timeit
+
+from pypayline.backends.soap import parse_soap_response, prepare_soap_request
+from pypayline.client import DirectPaymentAPI, WebPaymentAPI
+from pypayline.simulator import ResponseWriter
+
+
+MERCHANT_ID, ACCESS_KEY, CONTRACT_NUMBER = u'12345678901234', u'abCdeFgHiJKLmNoPqrst', u'1234567'
+
+
+class CannedTransport(object):
+    """transport (and pysimplesoap Http) returning the same response to every request"""
+
+    def __init__(self):
+        self.content = None
+
+    def request(self, url, method='POST', body=None, headers=None, **options):
+        return {}, self.content
+
+
+def calls():
+    """(api class, method, request, response) of the benchmarked calls"""
+    return [
+        (DirectPaymentAPI, 'doCredit', {
+            'version': u'19',
+            'payment': {'amount': 1250, 'currency': 978, 'action': 422, 'mode': u'CPT', 'contractNumber': u'1234567'},
+            'card': {'number': u'4970100000000154', 'type': u'CB', 'expirationDate': u'1230', 'cvx': u'123'},
+            'order': {'ref': u'ORDER-1234', 'amount': 1250, 'currency': 978, 'date': u'06/06/2016 12:30'},
+        }, {
+            'result': {'code': u'00000', 'shortMessage': u'ACCEPTED', 'longMessage': u'Transaction approved'},
+            'transaction': {'id': u'25161135408341', 'date': u'06/06/2016 12:30', 'isPossibleFraud': u'0'},
+            'card': {'number': u'497010XXXXXX0154', 'type': u'CB', 'expirationDate': u'1230'},
+        }),
+        (DirectPaymentAPI, 'getToken', {
+            'cardNumber': u'4970100000000154', 'expirationDate': u'1230', 'contractNumber': u'1234567',
+        }, {
+            'result': {'code': u'02500', 'shortMessage': u'ACCEPTED'},
+            'token': u'1111AAAA2222BBBB', 'maskedCardNumber': u'497010XXXXXX0154', 'cardType': u'CB',
+        }),
+        (WebPaymentAPI, 'getWebWallet', {'version': u'19', 'token': u'1a2b3c4d5e6f'}, {
+            'result': {'code': u'02500', 'shortMessage': u'ACCEPTED'},
+            'wallet': {'walletId': u'w1', 'lastName': u'Doe', 'firstName': u'John', 'email': u'john@example.com',
+                       'card': {'number': u'497010XXXXXX0154', 'type': u'CB', 'expirationDate': u'1230'}},
+        }),
+    ]
+
+
+def main(iterations=1000):
+    for api_class, method, data, response in calls():
+        transport = CannedTransport()
+        # the pysimplesoap client of the full WSDL: the pruned one has the same operations
+        backend = api_class(MERCHANT_ID, ACCESS_KEY, CONTRACT_NUMBER, transport=transport).backend
+        full_backend = api_class(MERCHANT_ID, ACCESS_KEY, CONTRACT_NUMBER, full_wsdl=True).backend
+        soap_client = full_backend.soap_client
+        soap_client.http = transport
+        model = full_backend.service_model
+        port, = model.services[model.api_name]['ports'].values()
+        transport.content = ResponseWriter(model).write(port['operations'][method], response)
+
+        if backend.prepare_request(method, **data).body != prepare_soap_request(soap_client, method, **data).body:
+            raise AssertionError(u'{0}: the requests differ'.format(method))
+        if backend.parse_response(method, transport.content) != parse_soap_response(
+                soap_client, method, transport.content):
+            raise AssertionError(u'{0}: the responses differ'.format(method))
+
+        generated_method = getattr(backend, method)
+        generated_time = min(timeit.repeat(
+            lambda: generated_method(**data), number=iterations, repeat=3
+        )) / iterations
+        soap_time = min(timeit.repeat(
+            lambda: getattr(soap_client, method)(**data), number=iterations, repeat=3
+        )) / iterations
+        print(u'{0:<18} pysimplesoap: {1:8.1f} us   generated: {2:6.1f} us   x{3:.1f}'.format(
+            method, soap_time * 1e6, generated_time * 1e6, soap_time / generated_time
+        ))
+
+
+if __name__ == '__main__':
+    main(*[int(arg) for arg in sys.argv[1:2]])
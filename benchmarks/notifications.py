@@ -0,0 +1,139 @@
+# -*- coding: utf-8 -*-
+"""
+Python client for the Payline SOAP API
+Load test of the notification endpoint with the mock backend: a burst of notifications (each one
+sent 3 times) is posted by concurrent HTTP clients to a local WSGI server handling 4 requests at
+a time, as a few server workers do. The details are got in the request, or queued by
+pypayline.notifications.NotificationReceiver. The mock answers after a latency, as Payline does
+
+python benchmarks/notifications.py [notifications count] [latency in ms]
+"""
+
+from __future__ import print_function
+
+import sys
+import threading
+import time
+from decimal import Decimal
+from wsgiref.simple_server import WSGIRequestHandler, WSGIServer, make_server
+
+from six.moves import socketserver
+from six.moves.urllib.request import urlopen
+
+from pypayline.backends.mock import SoapMockBackend
+from pypayline.client import WebPaymentAPI
+from pypayline.notifications import NotificationReceiver, notification_token
+
+
+MERCHANT_ID, ACCESS_KEY, CONTRACT_NUMBER = u'12345678901234', u'abCdeFgHiJKLmNoPqrst', u'1234567'
+
+CLIENT_THREADS = 32
+SERVER_WORKERS = 4
+
+
+class SlowMockBackend(SoapMockBackend):
+    """the mock answering after a latency"""
+    latency = 0.02
+
+    def getWebPaymentDetails(self, **data):
+        time.sleep(self.latency)
+        return super(SlowMockBackend, self).getWebPaymentDetails(**data)
+
+
+class ThreadingWSGIServer(socketserver.ThreadingMixIn, WSGIServer):
+    daemon_threads = True
+    request_queue_size = 128
+
+
+class QuietHandler(WSGIRequestHandler):
+    def log_message(self, *args):
+        pass
+
+
+def server_workers(application):
+    """the application handles SERVER_WORKERS requests at the same time"""
+    workers = threading.Semaphore(SERVER_WORKERS)
+
+    def limited(environ, start_response):
+        with workers:
+            return application(environ, start_response)
+    return limited
+
+
+def inline_application(client, callback):
+    """the details are got in the request"""
+    def application(environ, start_response):
+        token = notification_token(environ.get('QUERY_STRING', ''))
+        callback(token, client.get_web_payment_details_result(token))
+        start_response('200 OK', [('Content-Type', 'text/plain')])
+        return [b'OK']
+    return application
+
+
+def burst(url, tokens):
+    """send the notifications from CLIENT_THREADS threads: return the durations of the requests"""
+    durations = []
+    lock = threading.Lock()
+
+    def send(index):
+        for token in tokens[index::CLIENT_THREADS]:
+            start = time.time()
+            urlopen('{0}/?notificationType=WEBTRS&token={1}'.format(url, token)).read()
+            with lock:
+                durations.append(time.time() - start)
+
+    threads = [threading.Thread(target=send, args=(index,)) for index in range(CLIENT_THREADS)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    return sorted(durations)
+
+
+def run(label, application, tokens, wait=None):
+    server = make_server(
+        '127.0.0.1', 0, server_workers(application), server_class=ThreadingWSGIServer, handler_class=QuietHandler
+    )
+    thread = threading.Thread(target=server.serve_forever)
+    thread.daemon = True
+    thread.start()
+    try:
+        start = time.time()
+        durations = burst('http://127.0.0.1:{0}'.format(server.server_port), tokens)
+        acknowledged = time.time() - start
+        if wait is not None:
+            wait()
+        processed = time.time() - start
+    finally:
+        server.shutdown()
+        server.server_close()
+    print(u'{0:<24} acknowledged in {1:6.2f}s  processed in {2:6.2f}s  '
+          u'p50 {3:7.1f} ms  p99 {4:7.1f} ms'.format(
+              label, acknowledged, processed, durations[len(durations) // 2] * 1000,
+              durations[int(len(durations) * 0.99)] * 1000
+          ))
+
+
+def main(count=500, latency=20):
+    SlowMockBackend.latency = latency / 1000.0
+    client = WebPaymentAPI(MERCHANT_ID, ACCESS_KEY, CONTRACT_NUMBER)
+    client.backend_class = SlowMockBackend
+    tokens = [
+        client.do_web_payment(
+            amount=Decimal("12.50"), currency=u'EUR', order_ref=u'ORDER-{0}'.format(index),
+            return_url=u'https://example.com/success/', cancel_url=u'https://example.com/cancel/'
+        )[1]
+        for index in range(count)
+    ] * 3
+    received = []
+    print(u'{0} notifications of {1} payments, {2} ms of latency of getWebPaymentDetails'.format(
+        len(tokens), count, latency
+    ))
+    run(u'details in the request', inline_application(client, lambda *args: received.append(args)), tokens)
+    receiver = NotificationReceiver(client, lambda *args: received.append(args), workers=16, max_queue=len(tokens))
+    run(u'NotificationReceiver', receiver, tokens, wait=receiver.join)
+    receiver.stop()
+
+
+if __name__ == '__main__':
+    main(*[int(arg) for arg in sys.argv[1:3]])
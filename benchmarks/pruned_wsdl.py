@@ -0,0 +1,69 @@
+# -*- coding: utf-8 -*-
+"""
+Python client for the Payline SOAP API
+Cost of PaylineBaseAPI.setup_backend with the full and the pruned WSDL of each service: duration
+of the WSDL parsing (without the on-disk cache) and memory kept by the parsed service model,
+measured with tracemalloc
+
+python benchmarks/pruned_wsdl.py [runs]
+"""
+
+from __future__ import print_function
+
+import gc
+import sys
+import time
+import tracemalloc
+
+from pypayline import wsdl
+from pypayline.client import WebPaymentAPI, DirectPaymentAPI, MassPaymentAPI, ExtendedAPI
+
+
+MERCHANT_ID, ACCESS_KEY, CONTRACT_NUMBER = u'12345678901234', u'abCdeFgHiJKLmNoPqrst', u'1234567'
+
+
+def new_client(api_class, full_wsdl):
+    """a client whose backend parses the WSDL again"""
+    wsdl.clear_registry()
+    return api_class(MERCHANT_ID, ACCESS_KEY, CONTRACT_NUMBER, cache=None, full_wsdl=full_wsdl)
+
+
+def duration(api_class, full_wsdl):
+    """seconds of the creation of the backend"""
+    client = new_client(api_class, full_wsdl)
+    start = time.time()
+    client.setup_backend()
+    return time.time() - start
+
+
+def memory(api_class, full_wsdl):
+    """bytes kept by the backend and its service model. tracemalloc slows the parsing down"""
+    client = new_client(api_class, full_wsdl)
+    gc.collect()
+    tracemalloc.start()
+    client.setup_backend()
+    gc.collect()
+    current, _peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return current
+
+
+def main(runs=5):
+    print(u'{0:<18} {1:>12} {2:>12} {3:>12} {4:>12}'.format(
+        u'setup_backend', u'full ms', u'pruned ms', u'full KB', u'pruned KB'
+    ))
+    for api_class in (WebPaymentAPI, DirectPaymentAPI, MassPaymentAPI, ExtendedAPI):
+        results = {}
+        for full_wsdl in (True, False):
+            results[full_wsdl] = (
+                min(duration(api_class, full_wsdl) for _index in range(runs)), memory(api_class, full_wsdl)
+            )
+        print(u'{0:<18} {1:12.1f} {2:12.1f} {3:12.1f} {4:12.1f}'.format(
+            api_class.__name__, results[True][0] * 1000, results[False][0] * 1000,
+            results[True][1] / 1024.0, results[False][1] / 1024.0
+        ))
+    wsdl.clear_registry()
+
+
+if __name__ == '__main__':
+    main(*[int(arg) for arg in sys.argv[1:2]])
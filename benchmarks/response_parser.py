@@ -0,0 +1,91 @@
+# -*- coding: utf-8 -*-
+"""
+Python client for the Payline SOAP API
+Benchmark of the getPaymentRecord response parsing on a synthetic response with many billing
+records: pysimplesoap (DOM), streaming parser and billing records yielded one by one.
+Peak memory is measured with tracemalloc
+
+python benchmarks/response_parser.py [records count]
+"""
+
+from __future__ import print_function
+
+import sys
+import time
+import tracemalloc
+
+from pypayline.backends.soap import parse_soap_response
+from pypayline.client import DirectPaymentAPI
+
+
+BILLING_RECORD = u"""<billingRecord>
+<date xmlns="http://obj.ws.payline.experian.com">06/06/2016</date>
+<amount xmlns="http://obj.ws.payline.experian.com">1000</amount>
+<status xmlns="http://obj.ws.payline.experian.com">0</status>
+<result><code xmlns="http://obj.ws.payline.experian.com">00000</code>
+<shortMessage xmlns="http://obj.ws.payline.experian.com">ACCEPTED</shortMessage>
+<longMessage xmlns="http://obj.ws.payline.experian.com">Transaction approved</longMessage></result>
+<transaction><id xmlns="http://obj.ws.payline.experian.com">{index:014}</id>
+<date xmlns="http://obj.ws.payline.experian.com">06/06/2016 10:21</date>
+<isDuplicated xmlns="http://obj.ws.payline.experian.com">0</isDuplicated>
+<isPossibleFraud xmlns="http://obj.ws.payline.experian.com">0</isPossibleFraud></transaction>
+<authorization><number xmlns="http://obj.ws.payline.experian.com">A{index}</number>
+<date xmlns="http://obj.ws.payline.experian.com">06/06/2016 10:21</date></authorization>
+<nbTry xmlns="http://obj.ws.payline.experian.com">1</nbTry>
+<rank xmlns="http://obj.ws.payline.experian.com">{index}</rank>
+</billingRecord>
+"""
+
+
+def payment_record_response(records_count):
+    """getPaymentRecord response with the given number of billing records"""
+    return u"""<?xml version="1.0" encoding="UTF-8"?>
+<soapenv:Envelope xmlns:soapenv="http://schemas.xmlsoap.org/soap/envelope/">
+<soapenv:Body>
+<getPaymentRecordResponse xmlns="http://impl.ws.payline.experian.com">
+<result><code xmlns="http://obj.ws.payline.experian.com">00000</code></result>
+<recurring><amount xmlns="http://obj.ws.payline.experian.com">1000</amount></recurring>
+<isDisabled>0</isDisabled>
+<billingRecordList>
+{records}</billingRecordList>
+<order><ref xmlns="http://obj.ws.payline.experian.com">ref1</ref></order>
+</getPaymentRecordResponse>
+</soapenv:Body>
+</soapenv:Envelope>""".format(
+        records=u''.join(BILLING_RECORD.format(index=index) for index in range(records_count))
+    ).encode('utf-8')
+
+
+def measure(function):
+    """return (seconds, peak memory in bytes) of a call. The time is measured without tracemalloc"""
+    start = time.time()
+    function()
+    duration = time.time() - start
+    tracemalloc.start()
+    function()
+    _current, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return duration, peak
+
+
+def main(records_count=10000):
+    backend = DirectPaymentAPI(u'12345678901234', u'abCdeFgHiJKLmNoPqrst', u'1234567').backend
+    content = payment_record_response(records_count)
+    backend.parser.get_response('getPaymentRecord')  # compile the parser before measuring
+
+    def consume_stream():
+        for _billing_record in backend.parser.stream('getPaymentRecord', content, ('billingRecordList', )):
+            pass
+
+    print(u'{0} billing records, response of {1:.1f} MB'.format(records_count, len(content) / 1e6))
+    for label, function in (
+        (u'pysimplesoap', lambda: parse_soap_response(backend.soap_client, 'getPaymentRecord', content)),
+        (u'streaming parser', lambda: backend.parser.parse('getPaymentRecord', content)),
+        (u'yielded records', consume_stream),
+    ):
+        duration, peak = measure(function)
+        print(u'{0:<18} {1:8.1f} ms   peak memory {2:8.1f} MB'.format(label, duration * 1000, peak / 1e6))
+
+
+if __name__ == '__main__':
+    main(*[int(arg) for arg in sys.argv[1:2]])
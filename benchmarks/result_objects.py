@@ -0,0 +1,85 @@
+# -*- coding: utf-8 -*-
+"""
+Python client for the Payline SOAP API
+Memory footprint of the responses kept by a long-running job: raw dictionnaries returned by the
+streaming parser against the typed results of pypayline.results. The memory is measured with
+tracemalloc, once the responses are parsed. The getPaymentRecord responses have 12 billing records
+
+python benchmarks/result_objects.py [results count]
+"""
+
+from __future__ import print_function
+
+import gc
+import sys
+import tracemalloc
+from decimal import Decimal
+
+from pypayline.backends.mock import SoapMockBackend
+from pypayline.client import WebPaymentAPI, DirectPaymentAPI
+from pypayline.results import PaymentRecord, WebPaymentDetails
+from pypayline.simulator import ResponseWriter
+
+from response_parser import payment_record_response
+
+
+MERCHANT_ID, ACCESS_KEY, CONTRACT_NUMBER = u'12345678901234', u'abCdeFgHiJKLmNoPqrst', u'1234567'
+
+
+def web_payment_details_response(backend):
+    """getWebPaymentDetails response of an accepted payment of the mock backend, written by the simulator"""
+    mock_client = WebPaymentAPI(MERCHANT_ID, ACCESS_KEY, CONTRACT_NUMBER)
+    mock_client.backend_class = SoapMockBackend
+    _redirect_url, token = mock_client.do_web_payment(
+        amount=Decimal("12.50"), currency=u'EUR', order_ref=u'ORDER-1234',
+        return_url=u'https://example.com/success/', cancel_url=u'https://example.com/cancel/'
+    )
+    response = mock_client.backend.getWebPaymentDetails(version=mock_client.web_service_version, token=token)
+    service = backend.service_model.services[backend.service_model.api_name]
+    port, = service['ports'].values()
+    return ResponseWriter(backend.service_model).write(port['operations']['getWebPaymentDetails'], response)
+
+
+def retained(function, count):
+    """bytes allocated by the results of count calls kept in a list"""
+    gc.collect()
+    tracemalloc.start()
+    start, _peak = tracemalloc.get_traced_memory()
+    kept = [function() for _index in range(count)]
+    gc.collect()
+    current, _peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del kept
+    return current - start
+
+
+def main(count=2000):
+    web_backend = WebPaymentAPI(MERCHANT_ID, ACCESS_KEY, CONTRACT_NUMBER).warmup().backend
+    direct_backend = DirectPaymentAPI(MERCHANT_ID, ACCESS_KEY, CONTRACT_NUMBER).warmup().backend
+    details = web_payment_details_response(web_backend)
+    record = payment_record_response(12)
+
+    def parse_details():
+        return web_backend.parse_response('getWebPaymentDetails', details)
+
+    def parse_record():
+        return direct_backend.parse_response('getPaymentRecord', record)
+
+    def read_lazy_elements():
+        result = WebPaymentDetails(parse_details())
+        result.extendedCard, result.buyer, result.billing_records
+        return result
+
+    print(u'{0} results of each kind, bytes per result'.format(count))
+    for label, function in (
+        (u'getWebPaymentDetails raw dict', parse_details),
+        (u'getWebPaymentDetails typed', lambda: WebPaymentDetails(parse_details())),
+        (u'getWebPaymentDetails typed, lazy read', read_lazy_elements),
+        (u'getPaymentRecord raw dict', parse_record),
+        (u'getPaymentRecord typed', lambda: PaymentRecord(parse_record())),
+    ):
+        print(u'{0:<40} {1:8.0f}'.format(label, retained(function, count) / float(count)))
+
+
+if __name__ == '__main__':
+    main(*[int(arg) for arg in sys.argv[1:2]])
@@ -0,0 +1,74 @@
+# -*- coding: utf-8 -*-
+"""
+Python client for the Payline SOAP API
+Cash flow forecast of many recurring plans: the calendars computed plan by plan with datetime
+(as a loop around do_web_payment rules would do) against pypayline.schedule.Schedules
+
+python benchmarks/schedules.py [plans count]
+"""
+
+from __future__ import print_function
+
+import calendar
+import random
+import sys
+import time
+from datetime import date, timedelta
+
+from pypayline import schedule
+
+
+def plans(count):
+    """(amounts in cents, times, billing cycles, start dates) of random plans of the next year"""
+    random.seed(0)
+    today = date.today()
+    cycles = sorted(schedule.BILLING_CYCLES)
+    columns = ([], [], [], [])
+    for _index in range(count):
+        columns[0].append(random.randint(1000, 100000))
+        columns[1].append(random.choice((2, 3, 4, 6, 10, 12)))
+        columns[2].append(random.choice(cycles))
+        columns[3].append(today + timedelta(days=random.randint(0, 365)))
+    return columns
+
+
+def plan_by_plan(amounts, times, billing_cycles, start_dates):
+    """cash flow by month with a list of installments by plan"""
+    totals = {}
+    for total, count, billing_cycle, start in zip(amounts, times, billing_cycles, start_dates):
+        first_amount, amount = schedule.split_amount(total, count)
+        half_months, days = schedule.BILLING_CYCLES[billing_cycle]
+        installments = []
+        for rank in range(count):
+            if half_months:
+                months, half = divmod(rank * half_months, 2)
+                year, month = divmod(start.year * 12 + start.month - 1 + months, 12)
+                day = min(start.day, calendar.monthrange(year, month + 1)[1])
+                due_date = date(year, month + 1, day) + timedelta(days=schedule.HALF_MONTH_DAYS * half)
+            else:
+                due_date = start + timedelta(days=days * rank)
+            installments.append((due_date, first_amount if rank == 0 else amount))
+        for due_date, installment in installments:
+            key = (due_date.year, due_date.month)
+            totals[key] = totals.get(key, 0) + installment
+    return sorted(totals.items())
+
+
+def batch(amounts, times, billing_cycles, start_dates):
+    """cash flow by month with Schedules"""
+    return schedule.Schedules(amounts, times, billing_cycles, start_dates, in_cents=True).cash_flow(by_month=True)
+
+
+def main(count=200000):
+    columns = plans(count)
+    results = []
+    print(u'{0} plans'.format(count))
+    for label, function in ((u'plan by plan', plan_by_plan), (u'Schedules', batch)):
+        start = time.time()
+        results.append(function(*columns))
+        print(u'{0:<20} {1:10.1f} ms'.format(label, (time.time() - start) * 1000))
+    assert results[0] == results[1]
+
+
+if __name__ == '__main__':
+    main(*[int(arg) for arg in sys.argv[1:2]])
@@ -0,0 +1,64 @@
+# -*- coding: utf-8 -*-
+"""
+Python client for the Payline SOAP API
+Benchmark of the SOAP envelope serialization: precompiled templates against pysimplesoap.
+The two serializers must produce the same bytes.
+
+python benchmarks/serializer.py [iterations]
+"""
+
+from __future__ import print_function
+
+import sys
+import timeit
+from decimal import Decimal
+
+from pypayline.backends.soap import prepare_soap_request
+from pypayline.client import WebPaymentAPI, DirectPaymentAPI
+
+
+def construct(api_class):
+    """create a client with dummy credentials"""
+    return api_class(u'12345678901234', u'abCdeFgHiJKLmNoPqrst', u'1234567', homologation=True)
+
+
+def requests():
+    """(backend, method, data) of the benchmarked calls"""
+    web_payment_api = construct(WebPaymentAPI)
+    direct_payment_api = construct(DirectPaymentAPI)
+    web_payment = web_payment_api.build_web_payment_request(
+        amount=Decimal("120.50"), currency=u"EUR", order_ref=u'ORDER-1234',
+        return_url=u'https://example.com/success/', cancel_url=u'https://example.com/cancel/',
+        notification_url=u'https://example.com/notification/',
+        recurring_times=3, recurring_period_in_months=1,
+    )
+    # pysimplesoap can't serialize a list of selected contracts
+    web_payment['selectedContractList'] = {'selectedContract': u'1234567'}
+    return [
+        (web_payment_api.backend, 'doWebPayment', web_payment),
+        (web_payment_api.backend, 'getWebPaymentDetails', {'version': u'19', 'token': u'1a2b3c4d5e6f'}),
+        (direct_payment_api.backend, 'getPaymentRecord', {'contractNumber': u'1234567', 'paymentRecordId': 42}),
+    ]
+
+
+def main(iterations=2000):
+    for backend, method, data in requests():
+        fast_body = backend.prepare_request(method, **data).body
+        soap_body = prepare_soap_request(backend.soap_client, method, **data).body
+        if fast_body != soap_body:
+            raise AssertionError(u'{0}: the serialized envelopes differ'.format(method))
+
+        fast_time = min(timeit.repeat(
+            lambda: backend.prepare_request(method, **data), number=iterations, repeat=3
+        )) / iterations
+        soap_time = min(timeit.repeat(
+            lambda: prepare_soap_request(backend.soap_client, method, **data), number=iterations, repeat=3
+        )) / iterations
+        print(u'{0:<22} pysimplesoap: {1:8.1f} us {2:7.1f} MB/s   templates: {3:6.1f} us {4:7.1f} MB/s   x{5:.0f}'.format(
+            method, soap_time * 1e6, len(soap_body) / soap_time / 1e6,
+            fast_time * 1e6, len(fast_body) / fast_time / 1e6, soap_time / fast_time
+        ))
+
+
+if __name__ == '__main__':
+    main(*[int(arg) for arg in sys.argv[1:2]])
@@ -0,0 +1,236 @@
+# -*- coding: utf-8 -*-
+"""
+Python client for the Payline SOAP API
+Benchmark suite of the payment path: client construction, request building, response
+handling and round-trips against the local simulator. The results are written as JSON
+and can be compared with the results of a previous run to detect the regressions.
+
+python benchmarks/suite.py [--output results.json] [--compare baseline.json] [--threshold 0.1]
+    [--runs 5] [--only name,name...]
+
+The exit status is 1 if a benchmark is slower than in the baseline by more than the threshold
+"""
+
+from __future__ import print_function
+
+import argparse
+import json
+import platform
+import sys
+import time
+from datetime import datetime
+from decimal import Decimal
+
+from pypayline import VERSION
+from pypayline.backends.transport import HttpTransport
+from pypayline.client import WebPaymentAPI, DirectPaymentAPI
+from pypayline.simulator import Simulator
+
+
+MERCHANT_ID, ACCESS_KEY, CONTRACT_NUMBER = u'12345678901234', u'abCdeFgHiJKLmNoPqrst', u'1234567'
+
+# minimum duration of a run: the number of loops is calibrated to reach it
+MIN_RUN_TIME = 0.2
+
+
+def construct(api_class, **kwargs):
+    """create a client with the credentials accepted by the simulator"""
+    return api_class(MERCHANT_ID, ACCESS_KEY, CONTRACT_NUMBER, **kwargs)
+
+
+def web_payment_kwargs():
+    """arguments of the benchmarked do_web_payment calls"""
+    return dict(
+        amount=Decimal("120.50"), currency=u"EUR", order_ref=u'ORDER-1234',
+        return_url=u'https://example.com/success/', cancel_url=u'https://example.com/cancel/',
+        notification_url=u'https://example.com/notification/',
+    )
+
+
+class Context(object):
+    """shared fixtures of the benchmarks: the simulator is started on first use"""
+
+    def __init__(self):
+        self._simulator = None
+
+    @property
+    def simulator(self):
+        if self._simulator is None:
+            self._simulator = Simulator(port=0, api_names=('WebPaymentAPI', 'DirectPaymentAPI')).start()
+        return self._simulator
+
+    def client(self, api_class=WebPaymentAPI):
+        """client of the simulator with its own connection pool"""
+        return construct(api_class, homologation=self.simulator.url, transport=HttpTransport())
+
+    def close(self):
+        if self._simulator is not None:
+            self._simulator.close()
+
+
+def bench_construct_web_payment_api(context):
+    construct(WebPaymentAPI)  # the service model is loaded once per process
+    return lambda: construct(WebPaymentAPI)
+
+
+def bench_construct_direct_payment_api(context):
+    construct(DirectPaymentAPI)
+    return lambda: construct(DirectPaymentAPI)
+
+
+def bench_build_do_web_payment(context):
+    """doWebPayment arguments and SOAP envelope"""
+    api = construct(WebPaymentAPI)
+    kwargs = web_payment_kwargs()
+
+    def build():
+        data = api.build_web_payment_request(**kwargs)
+        return api.backend.prepare_request('doWebPayment', **data)
+    return build
+
+
+def bench_handle_get_web_payment_details(context):
+    """parsing of a getWebPaymentDetails response and conversion to the result tuple"""
+    api = context.client()
+    _redirect_url, token = api.do_web_payment(**web_payment_kwargs())
+    content = api.backend.send('getWebPaymentDetails', version=api.web_service_version, token=token)
+
+    def handle():
+        return api.parse_web_payment_details(api.backend.parse_response('getWebPaymentDetails', content))
+    return handle
+
+
+def bench_roundtrip_do_web_payment(context):
+    api = context.client()
+    kwargs = web_payment_kwargs()
+    return lambda: api.do_web_payment(**kwargs)
+
+
+def bench_roundtrip_get_web_payment_details(context):
+    api = context.client()
+    _redirect_url, token = api.do_web_payment(**web_payment_kwargs())
+    return lambda: api.get_web_payment_details(token)
+
+
+def bench_roundtrip_get_payment_record(context):
+    api = context.client(DirectPaymentAPI)
+    return lambda: api.get_payment_record(CONTRACT_NUMBER, u'42')
+
+
+BENCHMARKS = [
+    ('construct_web_payment_api', bench_construct_web_payment_api),
+    ('construct_direct_payment_api', bench_construct_direct_payment_api),
+    ('build_do_web_payment', bench_build_do_web_payment),
+    ('handle_get_web_payment_details', bench_handle_get_web_payment_details),
+    ('roundtrip_do_web_payment', bench_roundtrip_do_web_payment),
+    ('roundtrip_get_web_payment_details', bench_roundtrip_get_web_payment_details),
+    ('roundtrip_get_payment_record', bench_roundtrip_get_payment_record),
+]
+
+
+def calibrate(function):
+    """number of loops of a run lasting at least MIN_RUN_TIME"""
+    loops = 1
+    while True:
+        start = time.time()
+        for _index in range(loops):
+            function()
+        if time.time() - start >= MIN_RUN_TIME or loops >= 1000000:
+            return loops
+        loops *= 2
+
+
+def median(values):
+    values = sorted(values)
+    middle = len(values) // 2
+    if len(values) % 2:
+        return values[middle]
+    return (values[middle - 1] + values[middle]) / 2.0
+
+
+def run(function, runs):
+    """return the statistics of a benchmark. The values are seconds per call"""
+    function()  # warmup
+    loops = calibrate(function)
+    values = []
+    for _run in range(runs):
+        start = time.time()
+        for _index in range(loops):
+            function()
+        values.append((time.time() - start) / loops)
+    return {
+        'loops': loops,
+        'values': values,
+        'min': min(values),
+        'median': median(values),
+    }
+
+
+def metadata():
+    from pysimplesoap import __version__ as pysimplesoap_version
+    return {
+        'date': datetime.now().isoformat(),
+        'pypayline': VERSION,
+        'pysimplesoap': pysimplesoap_version,
+        'python': platform.python_version(),
+        'implementation': platform.python_implementation(),
+        'platform': platform.platform(),
+    }
+
+
+def compare(results, baseline, threshold):
+    """print the changes against the baseline and return the names of the regressions"""
+    regressions = []
+    for name, result in sorted(results['benchmarks'].items()):
+        previous = baseline['benchmarks'].get(name)
+        if previous is None:
+            continue
+        ratio = result['median'] / previous['median']
+        is_regression = ratio > 1 + threshold
+        if is_regression:
+            regressions.append(name)
+        print(u'{0:<36} {1:10.1f} us -> {2:10.1f} us   x{3:.2f}{4}'.format(
+            name, previous['median'] * 1e6, result['median'] * 1e6, ratio, u'   REGRESSION' if is_regression else u''
+        ))
+    return regressions
+
+
+def main(args=None):
+    parser = argparse.ArgumentParser(description=u'pypayline benchmark suite')
+    parser.add_argument('--output', help=u'write the results to this JSON file')
+    parser.add_argument('--compare', help=u'JSON results of a previous run')
+    parser.add_argument('--threshold', type=float, default=0.1,
+                        help=u'relative slowdown of the median reported as a regression')
+    parser.add_argument('--runs', type=int, default=5)
+    parser.add_argument('--only', help=u'comma separated names of the benchmarks to run')
+    options = parser.parse_args(args)
+
+    selected = options.only.split(',') if options.only else None
+    results = {'metadata': metadata(), 'benchmarks': {}}
+    context = Context()
+    try:
+        for name, setup in BENCHMARKS:
+            if selected is not None and name not in selected:
+                continue
+            result = results['benchmarks'][name] = run(setup(context), options.runs)
+            print(u'{0:<36} median: {1:10.1f} us   min: {2:10.1f} us   ({3} loops)'.format(
+                name, result['median'] * 1e6, result['min'] * 1e6, result['loops']
+            ))
+    finally:
+        context.close()
+
+    if options.output:
+        with open(options.output, 'w') as output_file:
+            json.dump(results, output_file, indent=2, sort_keys=True)
+
+    if options.compare:
+        with open(options.compare) as baseline_file:
+            baseline = json.load(baseline_file)
+        print()
+        if compare(results, baseline, options.threshold):
+            return 1
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,78 @@
+# -*- coding: utf-8 -*-
+"""
+Python client for the Payline SOAP API
+asyncio batches of API calls : bounded parallelism and rate limiting
+"""
+
+import asyncio
+import logging
+
+from pypayline.batch import DEFAULT_MAX_WORKERS, get_rate_limiter
+
+
+logger = logging.getLogger(u'pypayline')
+
+
+class AsyncBatchResults(object):
+    """
+    Asynchronous iterator of the (item, result) of a batch, in the order of completion. At most
+    max_workers coroutines run at the same time and the errors are collected in the errors
+    dictionnary {item: exception} instead of stopping the batch
+    """
+
+    def __init__(self, function, items, max_workers=DEFAULT_MAX_WORKERS, rate_limit=None):
+        """
+        :param function : coroutine function called with each item
+        :param items : iterable of the items
+        :param max_workers : number of calls running at the same time
+        :param rate_limit : maximum number of calls per second (or a shared RateLimiter). No limit if None
+        """
+        if max_workers < 1:
+            raise ValueError(u'max_workers must be at least 1')
+        self.function = function
+        self.items = iter(items)
+        self.max_workers = max_workers
+        self.rate_limiter = get_rate_limiter(rate_limit)
+        self.errors = {}
+        self.count = 0
+
+    async def call(self, item):
+        """return (item, result, error) of a call"""
+        if self.rate_limiter is not None:
+            delay = self.rate_limiter.reserve()
+            if delay > 0:
+                await asyncio.sleep(delay)
+        try:
+            return item, await self.function(item), None
+        except Exception as err:
+            logger.warning(u'Batch call failed for {0}: {1}'.format(item, err))
+            return item, None, err
+
+    def __aiter__(self):
+        return self.results()
+
+    async def results(self):
+        pending = set()
+        has_items = True
+        try:
+            while True:
+                while has_items and len(pending) < self.max_workers:
+                    try:
+                        item = next(self.items)
+                    except StopIteration:
+                        has_items = False
+                    else:
+                        pending.add(asyncio.ensure_future(self.call(item)))
+                if not pending:
+                    break
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    item, value, error = task.result()
+                    self.count += 1
+                    if error is not None:
+                        self.errors[item] = error
+                    else:
+                        yield item, value
+        finally:
+            for task in pending:
+                task.cancel()
@@ -0,0 +1,253 @@
+# -*- coding: utf-8 -*-
+"""
+Python client for the Payline SOAP API
+asyncio client classes
+"""
+
+from pypayline.aiobatch import AsyncBatchResults
+from pypayline.aioidempotency import call_idempotent
+from pypayline.batch import DEFAULT_MAX_WORKERS
+from pypayline.cache import result_code as get_result_code
+from pypayline.client import WebPaymentAPI, DirectPaymentAPI
+from pypayline.results import PaymentRecord, WebPaymentDetails
+
+
+class AsyncWebPaymentAPI(WebPaymentAPI):
+    """
+    asyncio client for Payline WebPayment API: same arguments and results as WebPaymentAPI,
+    the calls are coroutines
+    """
+    backend_class = 'pypayline.backends.aiosoap.AsyncSoapBackend'
+
+    async def do_web_payment(self, amount, currency, order_ref, return_url, cancel_url, **kwargs):
+        """
+        Calls the Payline SOAP API for making a new payment. See WebPaymentAPI.do_web_payment
+        :return: (redirect_url, token)
+        """
+        request = self.build_web_payment_request(amount, currency, order_ref, return_url, cancel_url, **kwargs)
+        if self.idempotency is None:
+            return await self.send_web_payment(request)
+        return await call_idempotent(
+            self.idempotency, self.idempotency_key(request), lambda: self.send_web_payment(request)
+        )
+
+    async def send_web_payment(self, request):
+        """call doWebPayment with the parameters of build_web_payment_request: return (redirect_url, token)"""
+        redirect_url, token = await self.backend.doWebPayment(**request)
+        return redirect_url, token
+
+    async def get_web_payment_details(self, token):
+        """
+        Get the status of a payment. See WebPaymentAPI.get_web_payment_details
+        :return: (result_code, is_transaction_ok, order_ref, amount, currency, data)
+        """
+        return self.parse_web_payment_details(await self.web_payment_details_data(token))
+
+    async def get_web_payment_details_result(self, token):
+        """
+        Get the status of a payment as a typed result. See WebPaymentAPI.get_web_payment_details_result
+        :return: pypayline.results.WebPaymentDetails
+        """
+        return WebPaymentDetails(await self.web_payment_details_data(token))
+
+    async def web_payment_details_data(self, token):
+        """the raw getWebPaymentDetails response, from the result cache if enabled"""
+        key = self.cache_key('getWebPaymentDetails', token)
+        data = None if key is None else self.result_cache.get(key)
+        if data is None:
+            data = await self.backend.getWebPaymentDetails(
+                version=self.web_service_version,
+                token=token
+            )
+            if key is not None:
+                self.result_cache.set(key, data, get_result_code(data))
+        return data
+
+    def get_web_payment_details_many(self, tokens, max_workers=DEFAULT_MAX_WORKERS, rate_limit=None):
+        """
+        Get the status of many payments with concurrent calls. See WebPaymentAPI.get_web_payment_details_many
+        :return: AsyncBatchResults : asynchronous iterator (async for) of (token, get_web_payment_details tuple)
+            in the order of completion. The errors are collected in its errors attribute
+        """
+        return AsyncBatchResults(self.get_web_payment_details, tokens, max_workers=max_workers, rate_limit=rate_limit)
+
+
+class AsyncDirectPaymentAPI(DirectPaymentAPI):
+    """
+    asyncio client for Payline DirectPayment API: same arguments and results as DirectPaymentAPI,
+    the calls are coroutines
+    """
+    backend_class = 'pypayline.backends.aiosoap.AsyncSoapBackend'
+
+    async def get_payment_record(self, contract_number, payment_record_id):
+        """
+        Get the status of a payment. See DirectPaymentAPI.get_payment_record
+        :return: (result_code, order_ref, amount, data)
+        """
+        return self.parse_payment_record(await self.payment_record_data(contract_number, payment_record_id))
+
+    async def get_payment_record_result(self, contract_number, payment_record_id):
+        """
+        Get the status of a payment as a typed result. See DirectPaymentAPI.get_payment_record_result
+        :return: pypayline.results.PaymentRecord
+        """
+        return PaymentRecord(await self.payment_record_data(contract_number, payment_record_id))
+
+    async def payment_record_data(self, contract_number, payment_record_id):
+        """the raw getPaymentRecord response, from the result cache if enabled"""
+        key = self.cache_key('getPaymentRecord', contract_number, payment_record_id)
+        data = None if key is None else self.result_cache.get(key)
+        if data is None:
+            data = await self.backend.getPaymentRecord(
+                contractNumber=contract_number,
+                paymentRecordId=payment_record_id
+            )
+            if key is not None:
+                self.result_cache.set(key, data, get_result_code(data))
+        return data
+
+    def iter_billing_records(self, contract_number, payment_record_id):
+        """
+        Get the billing records of a recurring payment. See DirectPaymentAPI.iter_billing_records
+        :return: asynchronous iterator of the billing records (async for)
+        """
+        return self.backend.iterBillingRecords(
+            contractNumber=contract_number,
+            paymentRecordId=payment_record_id
+        )
+
+    async def do_authorization(self, amount, currency, order_ref, card, payline_action=100, buyer=None, taxes=0,
+                               country=''):
+        """
+        Authorize a payment with the card data. See DirectPaymentAPI.do_authorization
+        :return: (result_code, transaction_id, authorization_number, data)
+        """
+        data = await self.backend.doAuthorization(**self.build_authorization_request(
+            amount, currency, order_ref, card, payline_action=payline_action, buyer=buyer, taxes=taxes,
+            country=country
+        ))
+        return self.parse_authorization(data)
+
+    async def do_capture(self, transaction_id, amount, currency):
+        """
+        Capture an authorized payment. See DirectPaymentAPI.do_capture
+        :return: (result_code, transaction_id, data)
+        """
+        data = await self.backend.doCapture(**self.build_capture_request(transaction_id, amount, currency))
+        return self.parse_transaction_result(data)
+
+    async def do_refund(self, transaction_id, amount, currency, comment=None):
+        """
+        Refund a captured payment. See DirectPaymentAPI.do_refund
+        :return: (result_code, transaction_id, data)
+        """
+        data = await self.backend.doRefund(**self.build_refund_request(transaction_id, amount, currency, comment))
+        return self.parse_transaction_result(data)
+
+    async def do_reset(self, transaction_id, comment=None):
+        """
+        Cancel an authorization. See DirectPaymentAPI.do_reset
+        :return: (result_code, transaction_id, data)
+        """
+        data = await self.backend.doReset(**self.build_reset_request(transaction_id, comment))
+        return self.parse_transaction_result(data)
+
+    async def do_debit(self, amount, currency, order_ref, card, authorization_number, authorization_date,
+                       buyer=None, taxes=0, country=''):
+        """
+        Debit a card with an authorization obtained outside of Payline. See DirectPaymentAPI.do_debit
+        :return: (result_code, transaction_id, data)
+        """
+        data = await self.backend.doDebit(**self.build_debit_request(
+            amount, currency, order_ref, card, authorization_number, authorization_date,
+            buyer=buyer, taxes=taxes, country=country
+        ))
+        return self.parse_transaction_result(data)
+
+    async def create_wallet(self, wallet_id, card, last_name=None, first_name=None, email=None, buyer=None):
+        """
+        Register the card of a buyer in a wallet. See DirectPaymentAPI.create_wallet
+        :return: (result_code, data)
+        """
+        data = await self.backend.createWallet(**self.build_create_wallet_request(
+            wallet_id, card, last_name=last_name, first_name=first_name, email=email, buyer=buyer
+        ))
+        return self.parse_wallet_result(data)
+
+    async def update_wallet(self, wallet_id, card=None, card_ind=None, last_name=None, first_name=None, email=None,
+                            buyer=None):
+        """
+        Update the owner of a wallet or one of its cards. See DirectPaymentAPI.update_wallet
+        :return: (result_code, data)
+        """
+        try:
+            data = await self.backend.updateWallet(**self.build_update_wallet_request(
+                wallet_id, card=card, card_ind=card_ind, last_name=last_name, first_name=first_name, email=email,
+                buyer=buyer
+            ))
+        finally:
+            self.invalidate_wallet(wallet_id)
+        return self.parse_wallet_result(data)
+
+    async def get_wallet(self, wallet_id, card_ind=None):
+        """
+        Get a wallet and one of its cards. See DirectPaymentAPI.get_wallet
+        :return: (result_code, is_disabled, wallet, data)
+        """
+        data = await self.cached_wallet_call('getWallet', wallet_id, card_ind)
+        return self.parse_wallet(data)
+
+    async def get_cards(self, wallet_id, card_ind=None):
+        """
+        Get the cards of a wallet. See DirectPaymentAPI.get_cards
+        :return: (result_code, cards, data)
+        """
+        data = await self.cached_wallet_call('getCards', wallet_id, card_ind)
+        return self.parse_cards(data)
+
+    async def disable_wallet(self, wallet_ids, card_ind=None):
+        """
+        Disable some wallets or one of their cards. See DirectPaymentAPI.disable_wallet
+        :return: (result_code, wallet_ids, data)
+        """
+        if isinstance(wallet_ids, str):
+            wallet_ids = [wallet_ids]
+        try:
+            data = await self.backend.disableWallet(**self.build_disable_wallet_request(wallet_ids, card_ind))
+        finally:
+            for wallet_id in wallet_ids:
+                self.invalidate_wallet(wallet_id)
+        return self.parse_disable_wallet(data)
+
+    async def enable_wallet(self, wallet_id, card_ind=None):
+        """
+        Enable a disabled wallet or one of its cards. See DirectPaymentAPI.enable_wallet
+        :return: (result_code, data)
+        """
+        try:
+            data = await self.backend.enableWallet(**self.build_enable_wallet_request(wallet_id, card_ind))
+        finally:
+            self.invalidate_wallet(wallet_id)
+        return self.parse_wallet_result(data)
+
+    async def do_immediate_wallet_payment(self, wallet_id, amount, currency, order_ref, cvx=None, card_ind=None,
+                                          payline_action=100, buyer=None, taxes=0, country=''):
+        """
+        Authorize a payment with a card of a wallet. See DirectPaymentAPI.do_immediate_wallet_payment
+        :return: (result_code, transaction_id, authorization_number, data)
+        """
+        data = await self.backend.doImmediateWalletPayment(**self.build_immediate_wallet_payment_request(
+            wallet_id, amount, currency, order_ref, cvx=cvx, card_ind=card_ind, payline_action=payline_action,
+            buyer=buyer, taxes=taxes, country=country
+        ))
+        return self.parse_authorization(data)
+
+    async def cached_wallet_call(self, operation, wallet_id, card_ind):
+        """call getWallet or getCards, unless the result is in the wallet cache"""
+        key = self.wallet_cache_key(operation, wallet_id, card_ind)
+        data = None if key is None else self.wallet_cache.get(key)
+        if data is None:
+            data = await getattr(self.backend, operation)(**self.build_get_wallet_request(wallet_id, card_ind))
+            if key is not None:
+                self.wallet_cache.set(key, data, get_result_code(data))
+        return data
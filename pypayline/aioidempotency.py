@@ -0,0 +1,40 @@
+# -*- coding: utf-8 -*-
+"""
+Python client for the Payline SOAP API
+asyncio version of the IdempotencyLayer calls: see pypayline.idempotency
+"""
+
+import asyncio
+
+
+async def call_idempotent(layer, key, function):
+    """
+    return the stored result of a payment, or the result of await function() which is called
+    once for the concurrent calls with the same key. Its errors are raised by all of them
+    """
+    result = layer.get(key)
+    if result is not None:
+        layer.count('hits')
+        return result
+    future = layer._async_calls.get(key)
+    if future is not None:
+        layer.count('coalesced')
+        # the call is not cancelled when a waiting call is
+        return await asyncio.shield(future)
+    future = layer._async_calls[key] = asyncio.get_event_loop().create_future()
+    try:
+        result = await function()
+        layer.set(key, result)
+        layer.count('misses')
+        future.set_result(result)
+        return result
+    except asyncio.CancelledError:
+        future.cancel()
+        raise
+    except Exception as err:
+        future.set_exception(err)
+        # the error is raised by this call: it is retrieved if no call is waiting
+        future.exception()
+        raise
+    finally:
+        del layer._async_calls[key]
@@ -0,0 +1,157 @@
+# -*- coding: utf-8 -*-
+"""
+Python client for the Payline SOAP API
+asyncio version of the notification receiver: an ASGI application whose workers are coroutines
+getting the details with an asyncio client. See pypayline.notifications
+
+    application = AsyncNotificationReceiver(AsyncWebPaymentAPI(...), on_payment, workers=8)
+"""
+
+import asyncio
+import logging
+import time
+
+from pypayline.notifications import (
+    ACCEPTED, BUSY, DEFAULT_DEDUP_WINDOW, DEFAULT_MAX_QUEUE, DEFAULT_WORKERS, DUPLICATE, RESPONSES, DedupWindow,
+    notification_token
+)
+
+
+logger = logging.getLogger(u'pypayline')
+
+
+class AsyncNotificationReceiver(object):
+    """
+    ASGI application receiving the Payline notifications. The workers are started with the first
+    notification (or on the lifespan startup) in the event loop of the server
+    """
+
+    def __init__(self, client, callback, workers=DEFAULT_WORKERS, max_queue=DEFAULT_MAX_QUEUE,
+                 dedup_window=DEFAULT_DEDUP_WINDOW, error_callback=None, clock=time.time):
+        """
+        :param client : AsyncWebPaymentAPI getting the payment details
+        :param callback : function or coroutine function called with (token, WebPaymentDetails)
+        :param workers : number of coroutines getting the details at the same time
+        :param max_queue : maximum number of notifications waiting for a worker
+        :param dedup_window : seconds during which the notifications of a token are ignored
+        :param error_callback : function or coroutine function called with (token, exception) when the
+            details can't be fetched or the callback fails. The token is forgotten
+        :param clock : function returning the current time in seconds
+        """
+        self.client = client
+        self.callback = callback
+        self.workers = workers
+        self.max_queue = max_queue
+        self.error_callback = error_callback
+        self.dedup = DedupWindow(dedup_window, clock=clock)
+        self.queue = None
+        self.accepted = 0
+        self.duplicates = 0
+        self.rejected = 0
+        self.processed = 0
+        self.failed = 0
+        self._tasks = []
+
+    def start(self):
+        """start the workers in the running event loop if they are not running"""
+        if self._tasks:
+            return
+        self.queue = asyncio.Queue(self.max_queue)
+        self._tasks = [asyncio.ensure_future(self.work()) for _index in range(self.workers)]
+
+    async def stop(self):
+        """process the queued notifications and stop the workers"""
+        tasks, self._tasks = self._tasks, []
+        for _task in tasks:
+            await self.queue.put(None)
+        if tasks:
+            await asyncio.gather(*tasks)
+
+    async def join(self):
+        """wait until the queued notifications are processed"""
+        if self.queue is not None:
+            await self.queue.join()
+
+    def notify(self, token):
+        """
+        queue the notification of a payment without waiting for its processing
+        :return: ACCEPTED, DUPLICATE if the token has been received in the window or BUSY if the queue is full
+        """
+        if not self.dedup.add(token):
+            self.duplicates += 1
+            return DUPLICATE
+        self.start()
+        try:
+            self.queue.put_nowait(token)
+        except asyncio.QueueFull:
+            self.dedup.discard(token)
+            self.rejected += 1
+            logger.warning(u'Notification queue full: the notification of {0} is rejected'.format(token))
+            return BUSY
+        self.accepted += 1
+        return ACCEPTED
+
+    async def work(self):
+        while True:
+            token = await self.queue.get()
+            try:
+                if token is None:
+                    return
+                await self.process(token)
+            finally:
+                self.queue.task_done()
+
+    async def process(self, token):
+        """get the details of a payment and call the callback"""
+        try:
+            details = await self.client.get_web_payment_details_result(token)
+            result = self.callback(token, details)
+            if asyncio.iscoroutine(result):
+                await result
+        except Exception as err:
+            await self.failure(token, err)
+        else:
+            self.processed += 1
+
+    async def failure(self, token, err):
+        self.dedup.discard(token)
+        self.failed += 1
+        logger.exception(u'Notification of {0} failed: {1!r}'.format(token, err))
+        if self.error_callback is not None:
+            try:
+                result = self.error_callback(token, err)
+                if asyncio.iscoroutine(result):
+                    await result
+            except Exception:
+                logger.exception(u'Notification error callback failed')
+
+    async def __call__(self, scope, receive, send):
+        if scope['type'] == 'lifespan':
+            await self.lifespan(receive, send)
+            return
+        body = b''
+        if scope.get('method') == 'POST':
+            more_body = True
+            while more_body:
+                message = await receive()
+                body += message.get('body', b'')
+                more_body = message.get('more_body', False)
+        token = notification_token(scope.get('query_string', b''), body)
+        status, content = RESPONSES[self.notify(token) if token else None]
+        await send({
+            'type': 'http.response.start',
+            'status': int(status.split()[0]),
+            'headers': [(b'content-type', b'text/plain'), (b'content-length', str(len(content)).encode('ascii'))],
+        })
+        await send({'type': 'http.response.body', 'body': content})
+
+    async def lifespan(self, receive, send):
+        while True:
+            message = await receive()
+            if message['type'] == 'lifespan.startup':
+                self.start()
+                await send({'type': 'lifespan.startup.complete'})
+            elif message['type'] == 'lifespan.shutdown':
+                await self.stop()
+                await send({'type': 'lifespan.shutdown.complete'})
+                return
@@ -0,0 +1,73 @@
+# -*- coding: utf-8 -*-
+"""
+Python client for the Payline SOAP API
+asyncio version of the ResiliencePolicy calls: see pypayline.resilience
+"""
+
+import asyncio
+import logging
+
+from pypayline.resilience import is_transient
+
+
+logger = logging.getLogger(u'pypayline')
+
+
+async def call_with_policy(policy, method, function):
+    """
+    await function(timeout) with the ResiliencePolicy of the operation. The backoff delays
+    don't block the event loop
+    :return: the result of the first successful call
+    :raise: the error of the last call or CircuitOpenError
+    """
+    timeout = policy.timeout(method)
+    hedged = policy.hedge_delay is not None and method in policy.idempotent_operations
+    max_attempts = policy.max_attempts(method)
+    attempt = 0
+    while True:
+        attempt += 1
+        if policy.circuit_breaker is not None:
+            policy.circuit_breaker.before_call()
+        try:
+            if hedged:
+                result = await hedged_call(policy, function, timeout)
+            else:
+                result = await function(timeout)
+        except Exception as err:
+            transient = is_transient(err)
+            if policy.circuit_breaker is not None:
+                policy.circuit_breaker.record(transient)
+            if not transient or attempt >= max_attempts:
+                raise
+            logger.info(u'{0} failed ({1!r}): retry {2}/{3}'.format(method, err, attempt, max_attempts - 1))
+            policy.count('retries')
+            await asyncio.sleep(policy.retry.delay(attempt))
+        else:
+            if policy.circuit_breaker is not None:
+                policy.circuit_breaker.record(False)
+            return result
+
+
+async def hedged_call(policy, function, timeout):
+    """
+    await function(timeout), and once more if it has not returned after hedge_delay seconds:
+    return the first result (the other request is cancelled), or raise the last error if both fail
+    """
+    tasks = [asyncio.ensure_future(function(timeout))]
+    done, _pending = await asyncio.wait(tasks, timeout=policy.hedge_delay)
+    if not done:
+        policy.count('hedges')
+        tasks.append(asyncio.ensure_future(function(timeout)))
+    try:
+        pending = set(tasks)
+        while pending:
+            done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+            for task in done:
+                if task.exception() is None:
+                    return task.result()
+        # every request has failed
+        return tasks[-1].result()
+    finally:
+        for task in tasks:
+            if not task.done():
+                task.cancel()
@@ -0,0 +1,76 @@
+# -*- coding: utf-8 -*-
+"""
+Python client for the Payline SOAP API
+asyncio Backend for unit testing
+"""
+
+from pypayline.backends.mock import SoapMockBackend
+
+
+class AsyncSoapMockBackend(SoapMockBackend):
+    """Mock the SOAP API client with coroutines: same scenarios as SoapMockBackend"""
+
+    async def doWebPayment(self, **data):
+        """call the doWebPayment SOAP API"""
+        return SoapMockBackend.doWebPayment(self, **data)
+
+    async def getWebPaymentDetails(self, **data):
+        """call the getWebPaymentDetails SOAP API"""
+        return SoapMockBackend.getWebPaymentDetails(self, **data)
+
+    async def getPaymentRecord(self, **data):
+        """call the getPaymentRecord SOAP API"""
+        return SoapMockBackend.getPaymentRecord(self, **data)
+
+    async def doAuthorization(self, **data):
+        """call the doAuthorization SOAP API"""
+        return SoapMockBackend.doAuthorization(self, **data)
+
+    async def doCapture(self, **data):
+        """call the doCapture SOAP API"""
+        return SoapMockBackend.doCapture(self, **data)
+
+    async def doRefund(self, **data):
+        """call the doRefund SOAP API"""
+        return SoapMockBackend.doRefund(self, **data)
+
+    async def doReset(self, **data):
+        """call the doReset SOAP API"""
+        return SoapMockBackend.doReset(self, **data)
+
+    async def doDebit(self, **data):
+        """call the doDebit SOAP API"""
+        return SoapMockBackend.doDebit(self, **data)
+
+    async def createWallet(self, **data):
+        """call the createWallet SOAP API"""
+        return SoapMockBackend.createWallet(self, **data)
+
+    async def updateWallet(self, **data):
+        """call the updateWallet SOAP API"""
+        return SoapMockBackend.updateWallet(self, **data)
+
+    async def getWallet(self, **data):
+        """call the getWallet SOAP API"""
+        return SoapMockBackend.getWallet(self, **data)
+
+    async def getCards(self, **data):
+        """call the getCards SOAP API"""
+        return SoapMockBackend.getCards(self, **data)
+
+    async def disableWallet(self, **data):
+        """call the disableWallet SOAP API"""
+        return SoapMockBackend.disableWallet(self, **data)
+
+    async def enableWallet(self, **data):
+        """call the enableWallet SOAP API"""
+        return SoapMockBackend.enableWallet(self, **data)
+
+    async def doImmediateWalletPayment(self, **data):
+        """call the doImmediateWalletPayment SOAP API"""
+        return SoapMockBackend.doImmediateWalletPayment(self, **data)
+
+    async def iterBillingRecords(self, **data):
+        """call the getPaymentRecord SOAP API and yield the billing records"""
+        for billing_record in SoapMockBackend.getPaymentRecord(self, **data)['billingRecordList']:
+            yield billing_record
@@ -0,0 +1,123 @@
+# -*- coding: utf-8 -*-
+"""
+Python client for the Payline SOAP API
+asyncio SOAP Backend : the requests are serialized and parsed as in SoapBackend and sent
+without blocking the event loop
+"""
+
+import logging
+import time
+from urllib.error import HTTPError
+
+from pysimplesoap.client import SoapFault
+
+from pypayline.aioresilience import call_with_policy
+from pypayline.backends.aiotransport import get_async_transport
+from pypayline.backends.soap import SoapBackend, RequestCapture, web_payment_result
+from pypayline.exceptions import PaylineAuthError, PaylineApiError
+
+
+logger = logging.getLogger(u'pypayline')
+
+
+class AsyncWebPaymentMethods(object):
+    """hand-written methods of the WebPaymentAPI async backends"""
+
+    async def doWebPayment(self, **data):
+        """call the doWebPayment SOAP API"""
+        logger.debug(u'> %s', data)
+        response = await self.call('doWebPayment', **data)
+        logger.debug(u'< %s', response)
+        return web_payment_result(response)
+
+
+class AsyncBillingRecordMethods(object):
+    """hand-written methods of the DirectPaymentAPI async backends"""
+
+    async def iterBillingRecords(self, **data):
+        """call the getPaymentRecord SOAP API and yield the billing records while they are parsed"""
+        try:
+            request = self.prepare_request('getPaymentRecord', **data)
+            _headers, content = await self.transport.request(
+                request.location, 'POST', body=request.body, headers=request.headers,
+                **self.transport_options('getPaymentRecord')
+            )
+        except HTTPError as err:
+            raise PaylineAuthError(u'Error while creating client. Err HTTP {0}'.format(err.code))
+        try:
+            for billing_record in self.parser.stream('getPaymentRecord', content, ('billingRecordList', )):
+                yield billing_record
+        except SoapFault as err:
+            raise PaylineApiError(str(err))
+
+
+class AsyncSoapBackend(SoapBackend):
+    """
+    Manage communication with Payline over SOAP API from an asyncio event loop
+    """
+    transport_factory = staticmethod(get_async_transport)
+    service_methods = {'WebPaymentAPI': (AsyncWebPaymentMethods, ), 'DirectPaymentAPI': (AsyncBillingRecordMethods, )}
+
+    def __init__(self, *args, **kwargs):
+        """
+        initialize the soap client: same arguments as SoapBackend. The transport must be
+        asynchronous (see pypayline.backends.aiotransport.AsyncHttpTransport)
+        """
+        super(AsyncSoapBackend, self).__init__(*args, **kwargs)
+        # the requests are only serialized by pysimplesoap
+        self.soap_client.http = RequestCapture()
+
+    async def send_instrumented(self, event, method, data, timeout=None):
+        """send the request: the serialize, connect and wait timings and the sizes are recorded in the event"""
+        start = time.time()
+        request = self.prepare_request(method, **data)
+        sent = time.time()
+        event.timings['serialize'] = sent - start
+        event.request_size = len(request.body)
+        timings = {}
+        _headers, content = await self.transport.request(
+            request.location, 'POST', body=request.body, headers=request.headers,
+            **self.transport_options(method, timings, timeout)
+        )
+        event.timings['connect'] = timings.get('connect', 0.0)
+        event.timings['wait'] = time.time() - sent - event.timings['connect']
+        event.response_size = len(content)
+        return content
+
+    async def instrumented_call(self, method, data, timeout=None):
+        """call with the instrumentation hooks"""
+        event = self.instrumentation.start(self.api_name, method)
+        try:
+            content = await self.send_instrumented(event, method, data, timeout)
+            return self.parse_instrumented(event, method, content)
+        except Exception as err:
+            event.error = err
+            raise
+        finally:
+            self.instrumentation.finish(event)
+
+    async def call(self, method, **data):
+        """serialize the request, send it and parse the response of a SOAP operation"""
+        try:
+            if self.resilience is None:
+                return await self.attempt(method, data)
+            return await call_with_policy(self.resilience, method, lambda timeout: self.attempt(method, data, timeout))
+        except SoapFault as err:
+            raise PaylineApiError(str(err))
+        except HTTPError as err:
+            raise PaylineAuthError(u'Error while creating client. Err HTTP {0}'.format(err.code))
+
+    async def attempt(self, method, data, timeout=None):
+        """a single call of a SOAP operation: timeout overrides the read timeout of the transport"""
+        if self.instrumentation.enabled:
+            return await self.instrumented_call(method, data, timeout)
+        request = self.prepare_request(method, **data)
+        _headers, content = await self.transport.request(
+            request.location, 'POST', body=request.body, headers=request.headers,
+            **self.transport_options(method, timeout=timeout)
+        )
+        return self.parse_response(method, content)
+
+    async def call_operation(self, method, data):
+        """call a SOAP operation with the elements of data which are not None (awaited from the operation methods)"""
+        return await self.call(method, **dict((key, value) for key, value in data.items() if value is not None))
@@ -0,0 +1,334 @@
+# -*- coding: utf-8 -*-
+"""
+Python client for the Payline SOAP API
+asyncio HTTP transport : persistent non-blocking connections to the Payline hosts
+"""
+
+import asyncio
+import logging
+import socket
+import ssl
+import threading
+import time
+import weakref
+from http import client as http_client
+from urllib.error import HTTPError
+from urllib.parse import urlsplit
+
+from pypayline.backends.transport import (
+    DEFAULT_CONNECT_TIMEOUT, DEFAULT_IDLE_TIMEOUT, DEFAULT_POOL_SIZE, DEFAULT_READ_TIMEOUT
+)
+
+
+logger = logging.getLogger(u'pypayline')
+
+
+DEFAULT_MAX_CONNECTIONS = 100
+
+
+class AsyncConnection(object):
+    """a keep-alive connection: asyncio stream reader and writer"""
+
+    def __init__(self, reader, writer):
+        self.reader, self.writer = reader, writer
+
+    def close(self):
+        self.writer.close()
+
+
+class AsyncConnectionPool(object):
+    """
+    Persistent connections to one host. At most max_connections requests are sent at the same
+    time and pool_size idle connections are kept
+    """
+
+    def __init__(self, scheme, host, port, pool_size, max_connections, idle_timeout,
+                 connect_timeout, ssl_context=None):
+        self.scheme, self.host, self.port = scheme, host, port
+        self.pool_size = pool_size
+        self.max_connections = max_connections
+        self.idle_timeout = idle_timeout
+        self.connect_timeout = connect_timeout
+        self.ssl_context = ssl_context
+        self.connections_count = 0
+        self._idle = []  # (last used time, connection) : the last one is the most recent
+        self._semaphore = None
+
+    @property
+    def semaphore(self):
+        """limit of the concurrent requests, created in the running event loop"""
+        if self._semaphore is None:
+            self._semaphore = asyncio.Semaphore(self.max_connections)
+        return self._semaphore
+
+    async def new_connection(self):
+        """open a connection: socket.timeout is raised after connect_timeout seconds as in HttpTransport"""
+        try:
+            reader, writer = await asyncio.wait_for(
+                asyncio.open_connection(
+                    self.host, self.port, ssl=self.ssl_context,
+                    server_hostname=self.host if self.ssl_context else None
+                ),
+                self.connect_timeout
+            )
+        except asyncio.TimeoutError:
+            raise socket.timeout(u'timed out')
+        self.connections_count += 1
+        return AsyncConnection(reader, writer)
+
+    def get_idle_connection(self):
+        """return the most recent idle connection or None"""
+        now = time.time()
+        while self._idle:
+            last_used, connection = self._idle.pop()
+            if now - last_used < self.idle_timeout and not connection.reader.at_eof():
+                return connection
+            connection.close()
+        return None
+
+    def put_connection(self, connection):
+        """give back a connection after a complete response"""
+        if len(self._idle) < self.pool_size:
+            self._idle.append((time.time(), connection))
+        else:
+            connection.close()
+
+    def close(self):
+        """close all the idle connections"""
+        idle, self._idle = self._idle, []
+        for _last_used, connection in idle:
+            connection.close()
+
+
+class AsyncHttpTransport(object):
+    """
+    asyncio HTTP/1.1 transport keeping a pool of persistent connections per host and
+    event loop. A single transport can be shared by many clients.
+    """
+    # request() accepts a timings dictionnary (see pypayline.instrumentation)
+    reports_timings = True
+    # request() accepts a read timeout (see pypayline.resilience)
+    accepts_timeout = True
+    # request() accepts an idempotent flag (see HttpTransport.send_again)
+    accepts_idempotent = True
+
+    def __init__(self, pool_size=DEFAULT_POOL_SIZE, idle_timeout=DEFAULT_IDLE_TIMEOUT,
+                 connect_timeout=DEFAULT_CONNECT_TIMEOUT, read_timeout=DEFAULT_READ_TIMEOUT,
+                 max_connections=DEFAULT_MAX_CONNECTIONS, ssl_context=None):
+        """
+        :param pool_size : maximum number of idle connections kept per host
+        :param idle_timeout : idle connections older than this number of seconds are closed
+        :param connect_timeout : timeout in seconds when opening a connection
+        :param read_timeout : timeout in seconds when waiting for the response
+        :param max_connections : maximum number of requests sent at the same time to a host
+        :param ssl_context : ssl.SSLContext used for the https connections
+        """
+        self.pool_size = pool_size
+        self.idle_timeout = idle_timeout
+        self.connect_timeout = connect_timeout
+        self.read_timeout = read_timeout
+        self.max_connections = max_connections
+        self.ssl_context = ssl_context or ssl.create_default_context()
+        self.loop_pools = weakref.WeakKeyDictionary()
+
+    @property
+    def pools(self):
+        """connection pools of the running event loop"""
+        loop = asyncio.get_event_loop()
+        pools = self.loop_pools.get(loop)
+        if pools is None:
+            pools = self.loop_pools[loop] = {}
+        return pools
+
+    def get_pool(self, scheme, host, port):
+        """return the connection pool of a host for the running event loop"""
+        pools = self.pools
+        key = (scheme, host, port)
+        pool = pools.get(key)
+        if pool is None:
+            pool = AsyncConnectionPool(
+                scheme, host, port, self.pool_size, self.max_connections, self.idle_timeout,
+                self.connect_timeout, ssl_context=self.ssl_context if scheme == 'https' else None
+            )
+            pools[key] = pool
+        return pool
+
+    async def request(self, url, method='POST', body=None, headers=None, timings=None, timeout=None,
+                      idempotent=False):
+        """
+        Send a request
+        :param timings : if not None, the seconds spent to open the connection are added to timings['connect']
+        :param timeout : read timeout in seconds of this request. The read_timeout of the transport if None
+        :param idempotent : True if the request can be sent twice without side effect. It is sent again on a
+            new connection only if a reused connection is closed before the status line of the response
+        :return: (response headers, response content)
+        :raise: HTTPError if the response status is an error except 500 (used for SOAP faults)
+        :raise: socket.timeout if the response is not received in time, as HttpTransport
+        :raise: ValueError if the url is not an http or https url with a host
+        """
+        parts = urlsplit(url)
+        scheme = parts.scheme.lower()
+        if scheme not in ('http', 'https') or not parts.hostname:
+            raise ValueError(u'Invalid SOAP location {0!r}: an http or https url is expected'.format(url))
+        port = parts.port or (443 if scheme == 'https' else 80)
+        pool = self.get_pool(scheme, parts.hostname, port)
+        path = parts.path or '/'
+        if parts.query:
+            path = '{0}?{1}'.format(path, parts.query)
+
+        host_header = self.host_header(scheme, parts.hostname, port)
+        request = self.serialize_request(method, path, host_header, body, headers or {})
+        read_timeout = self.read_timeout if timeout is None else timeout
+
+        async with pool.semaphore:
+            connection = pool.get_idle_connection()
+            is_reused = connection is not None
+            if connection is None:
+                connection = await self.new_connection(pool, timings)
+            try:
+                response = await self.timed_exchange(connection, request, read_timeout)
+            except http_client.RemoteDisconnected:
+                connection.close()
+                # a payment may have been processed by Payline: it is never sent twice
+                if not (is_reused and idempotent):
+                    raise
+                # the server has closed the idle connection in the meantime: retry on a new one
+                logger.debug(u'Stale connection to {0}, reconnecting'.format(parts.hostname))
+                connection = await self.new_connection(pool, timings)
+                try:
+                    response = await self.timed_exchange(connection, request, read_timeout)
+                except BaseException:
+                    connection.close()
+                    raise
+            except BaseException:
+                connection.close()
+                raise
+
+            status, reason, response_headers, content, keep_alive = response
+            if keep_alive:
+                pool.put_connection(connection)
+            else:
+                connection.close()
+
+        if status >= 400 and status != 500:
+            raise HTTPError(url, status, reason, response_headers, None)
+        return response_headers, content
+
+    async def new_connection(self, pool, timings=None):
+        """open a connection of the pool, timed in timings['connect']"""
+        if timings is None:
+            return await pool.new_connection()
+        start = time.time()
+        connection = await pool.new_connection()
+        timings['connect'] = timings.get('connect', 0.0) + time.time() - start
+        return connection
+
+    async def timed_exchange(self, connection, request, read_timeout):
+        """exchange: socket.timeout is raised after read_timeout seconds as in HttpTransport"""
+        try:
+            return await asyncio.wait_for(self.exchange(connection, request), read_timeout)
+        except asyncio.TimeoutError:
+            raise socket.timeout(u'timed out')
+
+    @staticmethod
+    def host_header(scheme, host, port):
+        """value of the Host header, as sent by http.client: without the default port of the scheme"""
+        if ':' in host:
+            # IPv6 address
+            host = u'[{0}]'.format(host)
+        if port == (443 if scheme == 'https' else 80):
+            return host
+        return u'{0}:{1}'.format(host, port)
+
+    def serialize_request(self, method, path, host_header, body, headers):
+        """return the bytes of the HTTP request"""
+        if isinstance(body, str):
+            body = body.encode('utf-8')
+        body = body or b''
+        lines = [u'{0} {1} HTTP/1.1'.format(method, path), u'Host: {0}'.format(host_header)]
+        for key, value in headers.items():
+            if key.lower() not in ('host', 'content-length', 'connection'):
+                lines.append(u'{0}: {1}'.format(key, value))
+        lines.append(u'Content-Length: {0}'.format(len(body)))
+        lines.append(u'Connection: keep-alive')
+        return (u'\r\n'.join(lines) + u'\r\n\r\n').encode('latin-1') + body
+
+    async def exchange(self, connection, request):
+        """
+        send the request and read the response
+        :return: (status, reason, headers, content, keep_alive)
+        :raise: http_client.RemoteDisconnected if the connection is closed before the status line,
+            http_client.IncompleteRead if it is closed while the response is read
+        """
+        try:
+            connection.writer.write(request)
+            await connection.writer.drain()
+            status_line = await connection.reader.readline()
+        except ConnectionError:
+            status_line = b''
+        if not status_line:
+            raise http_client.RemoteDisconnected(u'Remote end closed connection without response')
+        try:
+            return await self.read_response(connection, status_line)
+        except asyncio.IncompleteReadError as err:
+            raise http_client.IncompleteRead(err.partial)
+        except ConnectionError:
+            raise http_client.IncompleteRead(b'')
+
+    async def read_response(self, connection, status_line):
+        """read the response after its status line: return (status, reason, headers, content, keep_alive)"""
+        version, status, reason = (status_line.decode('latin-1').rstrip('\r\n').split(' ', 2) + [''])[:3]
+        status = int(status)
+
+        headers = {}
+        while True:
+            line = await connection.reader.readline()
+            if line in (b'\r\n', b'\n', b''):
+                break
+            key, _separator, value = line.decode('latin-1').partition(':')
+            headers[key.strip().lower()] = value.strip()
+
+        keep_alive = version == 'HTTP/1.1' and headers.get('connection', '').lower() != 'close'
+        if headers.get('transfer-encoding', '').lower() == 'chunked':
+            chunks = []
+            while True:
+                size = int((await connection.reader.readline()).split(b';')[0].strip(), 16)
+                if size == 0:
+                    # trailers
+                    while (await connection.reader.readline()) not in (b'\r\n', b'\n', b''):
+                        pass
+                    break
+                chunks.append(await connection.reader.readexactly(size))
+                await connection.reader.readexactly(2)
+            content = b''.join(chunks)
+        elif 'content-length' in headers:
+            content = await connection.reader.readexactly(int(headers['content-length']))
+        else:
+            content = await connection.reader.read()
+            keep_alive = False
+        return status, reason, headers, content, keep_alive
+
+    def close(self):
+        """close all the idle connections"""
+        for pools in list(self.loop_pools.values()):
+            for pool in list(pools.values()):
+                pool.close()
+
+
+_transports = {}
+_transports_lock = threading.Lock()
+
+
+def get_async_transport(pool_size=DEFAULT_POOL_SIZE, idle_timeout=DEFAULT_IDLE_TIMEOUT,
+                        connect_timeout=DEFAULT_CONNECT_TIMEOUT, read_timeout=DEFAULT_READ_TIMEOUT):
+    """return the process-wide async transport for these settings: the clients share its connection pools"""
+    key = (pool_size, idle_timeout, connect_timeout, read_timeout)
+    with _transports_lock:
+        transport = _transports.get(key)
+        if transport is None:
+            transport = AsyncHttpTransport(
+                pool_size=pool_size, idle_timeout=idle_timeout,
+                connect_timeout=connect_timeout, read_timeout=read_timeout
+            )
+            _transports[key] = transport
+    return transport
@@ -0,0 +1,38 @@
+# -*- coding: utf-8 -*-
+"""
+Python client for the Payline SOAP API
+Modules generated from the WSDL files by pypayline.codegen: a module by service with the request
+functions and the response nodes of all its operations, and the operations module with the methods
+of the backends. Do not edit them: run python -m pypayline.codegen when the WSDL files change
+"""
+
+from __future__ import print_function
+
+import importlib
+import logging
+import re
+
+
+logger = logging.getLogger(u'pypayline')
+
+
+def generated_module_name(api_name):
+    """'WebPaymentAPI' -> 'web_payment_api'"""
+    return re.sub(r'([a-z0-9])([A-Z])', r'\1_\2', api_name).lower()
+
+
+def get_generated_module(service_model):
+    """
+    return the generated module of a service or None if there is none. It is only used if the
+    service model has been parsed from one of the WSDL files the module has been generated from
+    """
+    try:
+        module = importlib.import_module(
+            u'{0}.{1}'.format(__name__, generated_module_name(service_model.api_name))
+        )
+    except ImportError:
+        return None
+    if service_model.digest not in module.WSDL_DIGESTS:
+        logger.debug(u'{0}: the generated module does not match the WSDL'.format(service_model.api_name))
+        return None
+    return module
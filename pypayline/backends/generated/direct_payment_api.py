@@ -0,0 +1,2827 @@
+# -*- coding: utf-8 -*-
+"""
+Python client for the Payline SOAP API
+DirectPaymentAPI operations: the functions writing the requests and the nodes parsing the responses
+Generated by python -m pypayline.codegen: do not edit
+"""
+
+from __future__ import print_function
+
+from pysimplesoap.client import soap_namespaces
+from pysimplesoap.helpers import REVERSE_TYPE_MAP
+
+from pypayline.backends.parser import CompiledNode, Element, text_converter
+from pypayline.backends.serializer import (
+    ENVELOPE_END, ENVELOPE_START, UnsupportedValue, check_names, write_items, write_text
+)
+
+
+API_NAME = u'DirectPaymentAPI'
+
+# SHA-256 of the WSDL files (full and pruned) the module has been generated from
+WSDL_DIGESTS = (
+    'ef697cc3ac668c1252d26b2f290d46650c1976d36c2819fe13a8f214ad14cf2d',
+    '4d8fd7abd539506b31984a74a4f665f93283b150cd1374cf60ff0ff6f2ba1a0f',
+)
+
+SOAP_URI = soap_namespaces['soap']
+
+CONVERT_INTEGER = text_converter(REVERSE_TYPE_MAP['integer'])
+CONVERT_BOOLEAN = text_converter(REVERSE_TYPE_MAP['boolean'])
+CONVERT_INT = text_converter(REVERSE_TYPE_MAP['int'])
+
+
+PAYMENT_NAMES = frozenset((
+    'amount', 'currency', 'action', 'mode', 'contractNumber', 'differedActionDate', 'method', 'softDescriptor',
+    'cardBrand', 'registrationToken'
+))
+
+
+def write_payment(parts, value):
+    """append the elements of payment to parts"""
+    if not isinstance(value, dict):
+        raise UnsupportedValue(value)
+    check_names(PAYMENT_NAMES, value)
+    field = value.get('amount')
+    if field is not None:
+        write_text(parts, u'<amount xmlns="http://obj.ws.payline.experian.com">', u'</amount>', field)
+    field = value.get('currency')
+    if field is not None:
+        write_text(parts, u'<currency xmlns="http://obj.ws.payline.experian.com">', u'</currency>', field)
+    field = value.get('action')
+    if field is not None:
+        write_text(parts, u'<action xmlns="http://obj.ws.payline.experian.com">', u'</action>', field)
+    field = value.get('mode')
+    if field is not None:
+        write_text(parts, u'<mode xmlns="http://obj.ws.payline.experian.com">', u'</mode>', field)
+    field = value.get('contractNumber')
+    if field is not None:
+        write_text(parts, u'<contractNumber xmlns="http://obj.ws.payline.experian.com">', u'</contractNumber>', field)
+    field = value.get('differedActionDate')
+    if field is not None:
+        write_text(
+            parts, u'<differedActionDate xmlns="http://obj.ws.payline.experian.com">', u'</differedActionDate>', field
+        )
+    field = value.get('method')
+    if field is not None:
+        write_text(parts, u'<method xmlns="http://obj.ws.payline.experian.com">', u'</method>', field)
+    field = value.get('softDescriptor')
+    if field is not None:
+        write_text(parts, u'<softDescriptor xmlns="http://obj.ws.payline.experian.com">', u'</softDescriptor>', field)
+    field = value.get('cardBrand')
+    if field is not None:
+        write_text(parts, u'<cardBrand xmlns="http://obj.ws.payline.experian.com">', u'</cardBrand>', field)
+    field = value.get('registrationToken')
+    if field is not None:
+        write_text(
+            parts, u'<registrationToken xmlns="http://obj.ws.payline.experian.com">', u'</registrationToken>', field
+        )
+
+
+BANK_ACCOUNT_DATA_NAMES = frozenset(('countryCode', 'bankCode', 'accountNumber', 'key'))
+
+
+def write_bank_account_data(parts, value):
+    """append the elements of bankAccountData to parts"""
+    if not isinstance(value, dict):
+        raise UnsupportedValue(value)
+    check_names(BANK_ACCOUNT_DATA_NAMES, value)
+    field = value.get('countryCode')
+    if field is not None:
+        write_text(parts, u'<countryCode xmlns="http://obj.ws.payline.experian.com">', u'</countryCode>', field)
+    field = value.get('bankCode')
+    if field is not None:
+        write_text(parts, u'<bankCode xmlns="http://obj.ws.payline.experian.com">', u'</bankCode>', field)
+    field = value.get('accountNumber')
+    if field is not None:
+        write_text(parts, u'<accountNumber xmlns="http://obj.ws.payline.experian.com">', u'</accountNumber>', field)
+    field = value.get('key')
+    if field is not None:
+        write_text(parts, u'<key xmlns="http://obj.ws.payline.experian.com">', u'</key>', field)
+
+
+PAYMENT_DATA_NAMES = frozenset(('transactionID', 'network', 'tokenData'))
+
+
+def write_payment_data(parts, value):
+    """append the elements of paymentData to parts"""
+    if not isinstance(value, dict):
+        raise UnsupportedValue(value)
+    check_names(PAYMENT_DATA_NAMES, value)
+    field = value.get('transactionID')
+    if field is not None:
+        write_text(parts, u'<transactionID xmlns="http://obj.ws.payline.experian.com">', u'</transactionID>', field)
+    field = value.get('network')
+    if field is not None:
+        write_text(parts, u'<network xmlns="http://obj.ws.payline.experian.com">', u'</network>', field)
+    field = value.get('tokenData')
+    if field is not None:
+        write_text(parts, u'<tokenData xmlns="http://obj.ws.payline.experian.com">', u'</tokenData>', field)
+
+
+CARD_NAMES = frozenset((
+    'encryptionKeyId', 'encryptedData', 'number', 'type', 'expirationDate', 'cvx', 'ownerBirthdayDate', 'password',
+    'cardPresent', 'cardholder', 'token', 'paymentData'
+))
+
+
+def write_card(parts, value):
+    """append the elements of card to parts"""
+    if not isinstance(value, dict):
+        raise UnsupportedValue(value)
+    check_names(CARD_NAMES, value)
+    field = value.get('encryptionKeyId')
+    if field is not None:
+        write_text(parts, u'<encryptionKeyId xmlns="http://obj.ws.payline.experian.com">', u'</encryptionKeyId>', field)
+    field = value.get('encryptedData')
+    if field is not None:
+        write_text(parts, u'<encryptedData xmlns="http://obj.ws.payline.experian.com">', u'</encryptedData>', field)
+    field = value.get('number')
+    if field is not None:
+        write_text(parts, u'<number xmlns="http://obj.ws.payline.experian.com">', u'</number>', field)
+    field = value.get('type')
+    if field is not None:
+        write_text(parts, u'<type xmlns="http://obj.ws.payline.experian.com">', u'</type>', field)
+    field = value.get('expirationDate')
+    if field is not None:
+        write_text(parts, u'<expirationDate xmlns="http://obj.ws.payline.experian.com">', u'</expirationDate>', field)
+    field = value.get('cvx')
+    if field is not None:
+        write_text(parts, u'<cvx xmlns="http://obj.ws.payline.experian.com">', u'</cvx>', field)
+    field = value.get('ownerBirthdayDate')
+    if field is not None:
+        write_text(
+            parts, u'<ownerBirthdayDate xmlns="http://obj.ws.payline.experian.com">', u'</ownerBirthdayDate>', field
+        )
+    field = value.get('password')
+    if field is not None:
+        write_text(parts, u'<password xmlns="http://obj.ws.payline.experian.com">', u'</password>', field)
+    field = value.get('cardPresent')
+    if field is not None:
+        write_text(parts, u'<cardPresent xmlns="http://obj.ws.payline.experian.com">', u'</cardPresent>', field)
+    field = value.get('cardholder')
+    if field is not None:
+        write_text(parts, u'<cardholder xmlns="http://obj.ws.payline.experian.com">', u'</cardholder>', field)
+    field = value.get('token')
+    if field is not None:
+        write_text(parts, u'<token xmlns="http://obj.ws.payline.experian.com">', u'</token>', field)
+    field = value.get('paymentData')
+    if field is not None:
+        write_items(
+            parts, write_payment_data, u'<paymentData xmlns="http://obj.ws.payline.experian.com">', u'</paymentData>',
+            u'<paymentData xmlns="http://obj.ws.payline.experian.com"/>', field
+        )
+
+
+ORDER_DETAIL_NAMES = frozenset((
+    'ref', 'price', 'quantity', 'comment', 'category', 'brand', 'subcategory1', 'subcategory2', 'additionalData',
+    'taxRate'
+))
+
+
+def write_order_detail(parts, value):
+    """append the elements of orderDetail to parts"""
+    if not isinstance(value, dict):
+        raise UnsupportedValue(value)
+    check_names(ORDER_DETAIL_NAMES, value)
+    field = value.get('ref')
+    if field is not None:
+        write_text(parts, u'<ref xmlns="http://obj.ws.payline.experian.com">', u'</ref>', field)
+    field = value.get('price')
+    if field is not None:
+        write_text(parts, u'<price xmlns="http://obj.ws.payline.experian.com">', u'</price>', field)
+    field = value.get('quantity')
+    if field is not None:
+        write_text(parts, u'<quantity xmlns="http://obj.ws.payline.experian.com">', u'</quantity>', field)
+    field = value.get('comment')
+    if field is not None:
+        write_text(parts, u'<comment xmlns="http://obj.ws.payline.experian.com">', u'</comment>', field)
+    field = value.get('category')
+    if field is not None:
+        write_text(parts, u'<category xmlns="http://obj.ws.payline.experian.com">', u'</category>', field)
+    field = value.get('brand')
+    if field is not None:
+        write_text(parts, u'<brand xmlns="http://obj.ws.payline.experian.com">', u'</brand>', field)
+    field = value.get('subcategory1')
+    if field is not None:
+        write_text(parts, u'<subcategory1 xmlns="http://obj.ws.payline.experian.com">', u'</subcategory1>', field)
+    field = value.get('subcategory2')
+    if field is not None:
+        write_text(parts, u'<subcategory2 xmlns="http://obj.ws.payline.experian.com">', u'</subcategory2>', field)
+    field = value.get('additionalData')
+    if field is not None:
+        write_text(parts, u'<additionalData xmlns="http://obj.ws.payline.experian.com">', u'</additionalData>', field)
+    field = value.get('taxRate')
+    if field is not None:
+        write_text(parts, u'<taxRate xmlns="http://obj.ws.payline.experian.com">', u'</taxRate>', field)
+
+
+DETAILS_NAMES = frozenset(('details', ))
+
+
+def write_details(parts, value):
+    """append the elements of details to parts"""
+    if not isinstance(value, dict):
+        raise UnsupportedValue(value)
+    check_names(DETAILS_NAMES, value)
+    field = value.get('details')
+    if field is not None:
+        write_items(
+            parts, write_order_detail, u'<details xmlns="http://obj.ws.payline.experian.com">', u'</details>',
+            u'<details xmlns="http://obj.ws.payline.experian.com"/>', field
+        )
+
+
+ORDER_NAMES = frozenset((
+    'ref', 'origin', 'country', 'taxes', 'amount', 'currency', 'date', 'details', 'deliveryTime', 'deliveryMode',
+    'deliveryExpectedDate', 'deliveryExpectedDelay', 'deliveryCharge'
+))
+
+
+def write_order(parts, value):
+    """append the elements of order to parts"""
+    if not isinstance(value, dict):
+        raise UnsupportedValue(value)
+    check_names(ORDER_NAMES, value)
+    field = value.get('ref')
+    if field is not None:
+        write_text(parts, u'<ref xmlns="http://obj.ws.payline.experian.com">', u'</ref>', field)
+    field = value.get('origin')
+    if field is not None:
+        write_text(parts, u'<origin xmlns="http://obj.ws.payline.experian.com">', u'</origin>', field)
+    field = value.get('country')
+    if field is not None:
+        write_text(parts, u'<country xmlns="http://obj.ws.payline.experian.com">', u'</country>', field)
+    field = value.get('taxes')
+    if field is not None:
+        write_text(parts, u'<taxes xmlns="http://obj.ws.payline.experian.com">', u'</taxes>', field)
+    field = value.get('amount')
+    if field is not None:
+        write_text(parts, u'<amount xmlns="http://obj.ws.payline.experian.com">', u'</amount>', field)
+    field = value.get('currency')
+    if field is not None:
+        write_text(parts, u'<currency xmlns="http://obj.ws.payline.experian.com">', u'</currency>', field)
+    field = value.get('date')
+    if field is not None:
+        write_text(parts, u'<date xmlns="http://obj.ws.payline.experian.com">', u'</date>', field)
+    field = value.get('details')
+    if field is not None:
+        write_items(
+            parts, write_details, u'<details xmlns="http://obj.ws.payline.experian.com">', u'</details>',
+            u'<details xmlns="http://obj.ws.payline.experian.com"/>', field
+        )
+    field = value.get('deliveryTime')
+    if field is not None:
+        write_text(parts, u'<deliveryTime xmlns="http://obj.ws.payline.experian.com">', u'</deliveryTime>', field)
+    field = value.get('deliveryMode')
+    if field is not None:
+        write_text(parts, u'<deliveryMode xmlns="http://obj.ws.payline.experian.com">', u'</deliveryMode>', field)
+    field = value.get('deliveryExpectedDate')
+    if field is not None:
+        write_text(
+            parts, u'<deliveryExpectedDate xmlns="http://obj.ws.payline.experian.com">', u'</deliveryExpectedDate>',
+            field
+        )
+    field = value.get('deliveryExpectedDelay')
+    if field is not None:
+        write_text(
+            parts, u'<deliveryExpectedDelay xmlns="http://obj.ws.payline.experian.com">', u'</deliveryExpectedDelay>',
+            field
+        )
+    field = value.get('deliveryCharge')
+    if field is not None:
+        write_text(parts, u'<deliveryCharge xmlns="http://obj.ws.payline.experian.com">', u'</deliveryCharge>', field)
+
+
+ADDRESS_NAMES = frozenset((
+    'title', 'name', 'firstName', 'lastName', 'street1', 'street2', 'cityName', 'zipCode', 'country', 'phone', 'state',
+    'county', 'phoneType'
+))
+
+
+def write_address(parts, value):
+    """append the elements of address to parts"""
+    if not isinstance(value, dict):
+        raise UnsupportedValue(value)
+    check_names(ADDRESS_NAMES, value)
+    field = value.get('title')
+    if field is not None:
+        write_text(parts, u'<title xmlns="http://obj.ws.payline.experian.com">', u'</title>', field)
+    field = value.get('name')
+    if field is not None:
+        write_text(parts, u'<name xmlns="http://obj.ws.payline.experian.com">', u'</name>', field)
+    field = value.get('firstName')
+    if field is not None:
+        write_text(parts, u'<firstName xmlns="http://obj.ws.payline.experian.com">', u'</firstName>', field)
+    field = value.get('lastName')
+    if field is not None:
+        write_text(parts, u'<lastName xmlns="http://obj.ws.payline.experian.com">', u'</lastName>', field)
+    field = value.get('street1')
+    if field is not None:
+        write_text(parts, u'<street1 xmlns="http://obj.ws.payline.experian.com">', u'</street1>', field)
+    field = value.get('street2')
+    if field is not None:
+        write_text(parts, u'<street2 xmlns="http://obj.ws.payline.experian.com">', u'</street2>', field)
+    field = value.get('cityName')
+    if field is not None:
+        write_text(parts, u'<cityName xmlns="http://obj.ws.payline.experian.com">', u'</cityName>', field)
+    field = value.get('zipCode')
+    if field is not None:
+        write_text(parts, u'<zipCode xmlns="http://obj.ws.payline.experian.com">', u'</zipCode>', field)
+    field = value.get('country')
+    if field is not None:
+        write_text(parts, u'<country xmlns="http://obj.ws.payline.experian.com">', u'</country>', field)
+    field = value.get('phone')
+    if field is not None:
+        write_text(parts, u'<phone xmlns="http://obj.ws.payline.experian.com">', u'</phone>', field)
+    field = value.get('state')
+    if field is not None:
+        write_text(parts, u'<state xmlns="http://obj.ws.payline.experian.com">', u'</state>', field)
+    field = value.get('county')
+    if field is not None:
+        write_text(parts, u'<county xmlns="http://obj.ws.payline.experian.com">', u'</county>', field)
+    field = value.get('phoneType')
+    if field is not None:
+        write_text(parts, u'<phoneType xmlns="http://obj.ws.payline.experian.com">', u'</phoneType>', field)
+
+
+BUYER_NAMES = frozenset((
+    'title', 'lastName', 'firstName', 'email', 'shippingAdress', 'billingAddress', 'accountCreateDate',
+    'accountAverageAmount', 'accountOrderCount', 'walletId', 'walletDisplayed', 'walletSecured', 'walletCardInd', 'ip',
+    'mobilePhone', 'customerId', 'legalStatus', 'legalDocument', 'birthDate', 'fingerprintID', 'deviceFingerprint',
+    'isBot', 'isIncognito', 'isBehindProxy', 'isFromTor', 'isEmulator', 'isRooted', 'hasTimezoneMismatch'
+))
+
+
+def write_buyer(parts, value):
+    """append the elements of buyer to parts"""
+    if not isinstance(value, dict):
+        raise UnsupportedValue(value)
+    check_names(BUYER_NAMES, value)
+    field = value.get('title')
+    if field is not None:
+        write_text(parts, u'<title xmlns="http://obj.ws.payline.experian.com">', u'</title>', field)
+    field = value.get('lastName')
+    if field is not None:
+        write_text(parts, u'<lastName xmlns="http://obj.ws.payline.experian.com">', u'</lastName>', field)
+    field = value.get('firstName')
+    if field is not None:
+        write_text(parts, u'<firstName xmlns="http://obj.ws.payline.experian.com">', u'</firstName>', field)
+    field = value.get('email')
+    if field is not None:
+        write_text(parts, u'<email xmlns="http://obj.ws.payline.experian.com">', u'</email>', field)
+    field = value.get('shippingAdress')
+    if field is not None:
+        write_items(
+            parts, write_address, u'<shippingAdress xmlns="http://obj.ws.payline.experian.com">', u'</shippingAdress>',
+            u'<shippingAdress xmlns="http://obj.ws.payline.experian.com"/>', field
+        )
+    field = value.get('billingAddress')
+    if field is not None:
+        write_items(
+            parts, write_address, u'<billingAddress xmlns="http://obj.ws.payline.experian.com">', u'</billingAddress>',
+            u'<billingAddress xmlns="http://obj.ws.payline.experian.com"/>', field
+        )
+    field = value.get('accountCreateDate')
+    if field is not None:
+        write_text(
+            parts, u'<accountCreateDate xmlns="http://obj.ws.payline.experian.com">', u'</accountCreateDate>', field
+        )
+    field = value.get('accountAverageAmount')
+    if field is not None:
+        write_text(
+            parts, u'<accountAverageAmount xmlns="http://obj.ws.payline.experian.com">', u'</accountAverageAmount>',
+            field
+        )
+    field = value.get('accountOrderCount')
+    if field is not None:
+        write_text(
+            parts, u'<accountOrderCount xmlns="http://obj.ws.payline.experian.com">', u'</accountOrderCount>', field
+        )
+    field = value.get('walletId')
+    if field is not None:
+        write_text(parts, u'<walletId xmlns="http://obj.ws.payline.experian.com">', u'</walletId>', field)
+    field = value.get('walletDisplayed')
+    if field is not None:
+        write_text(parts, u'<walletDisplayed xmlns="http://obj.ws.payline.experian.com">', u'</walletDisplayed>', field)
+    field = value.get('walletSecured')
+    if field is not None:
+        write_text(parts, u'<walletSecured xmlns="http://obj.ws.payline.experian.com">', u'</walletSecured>', field)
+    field = value.get('walletCardInd')
+    if field is not None:
+        write_text(parts, u'<walletCardInd xmlns="http://obj.ws.payline.experian.com">', u'</walletCardInd>', field)
+    field = value.get('ip')
+    if field is not None:
+        write_text(parts, u'<ip xmlns="http://obj.ws.payline.experian.com">', u'</ip>', field)
+    field = value.get('mobilePhone')
+    if field is not None:
+        write_text(parts, u'<mobilePhone xmlns="http://obj.ws.payline.experian.com">', u'</mobilePhone>', field)
+    field = value.get('customerId')
+    if field is not None:
+        write_text(parts, u'<customerId xmlns="http://obj.ws.payline.experian.com">', u'</customerId>', field)
+    field = value.get('legalStatus')
+    if field is not None:
+        write_text(parts, u'<legalStatus xmlns="http://obj.ws.payline.experian.com">', u'</legalStatus>', field)
+    field = value.get('legalDocument')
+    if field is not None:
+        write_text(parts, u'<legalDocument xmlns="http://obj.ws.payline.experian.com">', u'</legalDocument>', field)
+    field = value.get('birthDate')
+    if field is not None:
+        write_text(parts, u'<birthDate xmlns="http://obj.ws.payline.experian.com">', u'</birthDate>', field)
+    field = value.get('fingerprintID')
+    if field is not None:
+        write_text(parts, u'<fingerprintID xmlns="http://obj.ws.payline.experian.com">', u'</fingerprintID>', field)
+    field = value.get('deviceFingerprint')
+    if field is not None:
+        write_text(
+            parts, u'<deviceFingerprint xmlns="http://obj.ws.payline.experian.com">', u'</deviceFingerprint>', field
+        )
+    field = value.get('isBot')
+    if field is not None:
+        write_text(parts, u'<isBot xmlns="http://obj.ws.payline.experian.com">', u'</isBot>', field)
+    field = value.get('isIncognito')
+    if field is not None:
+        write_text(parts, u'<isIncognito xmlns="http://obj.ws.payline.experian.com">', u'</isIncognito>', field)
+    field = value.get('isBehindProxy')
+    if field is not None:
+        write_text(parts, u'<isBehindProxy xmlns="http://obj.ws.payline.experian.com">', u'</isBehindProxy>', field)
+    field = value.get('isFromTor')
+    if field is not None:
+        write_text(parts, u'<isFromTor xmlns="http://obj.ws.payline.experian.com">', u'</isFromTor>', field)
+    field = value.get('isEmulator')
+    if field is not None:
+        write_text(parts, u'<isEmulator xmlns="http://obj.ws.payline.experian.com">', u'</isEmulator>', field)
+    field = value.get('isRooted')
+    if field is not None:
+        write_text(parts, u'<isRooted xmlns="http://obj.ws.payline.experian.com">', u'</isRooted>', field)
+    field = value.get('hasTimezoneMismatch')
+    if field is not None:
+        write_text(
+            parts, u'<hasTimezoneMismatch xmlns="http://obj.ws.payline.experian.com">', u'</hasTimezoneMismatch>',
+            field
+        )
+
+
+ADDRESS_OWNER_NAMES = frozenset(('street', 'cityName', 'zipCode', 'country', 'phone'))
+
+
+def write_address_owner(parts, value):
+    """append the elements of addressOwner to parts"""
+    if not isinstance(value, dict):
+        raise UnsupportedValue(value)
+    check_names(ADDRESS_OWNER_NAMES, value)
+    field = value.get('street')
+    if field is not None:
+        write_text(parts, u'<street xmlns="http://obj.ws.payline.experian.com">', u'</street>', field)
+    field = value.get('cityName')
+    if field is not None:
+        write_text(parts, u'<cityName xmlns="http://obj.ws.payline.experian.com">', u'</cityName>', field)
+    field = value.get('zipCode')
+    if field is not None:
+        write_text(parts, u'<zipCode xmlns="http://obj.ws.payline.experian.com">', u'</zipCode>', field)
+    field = value.get('country')
+    if field is not None:
+        write_text(parts, u'<country xmlns="http://obj.ws.payline.experian.com">', u'</country>', field)
+    field = value.get('phone')
+    if field is not None:
+        write_text(parts, u'<phone xmlns="http://obj.ws.payline.experian.com">', u'</phone>', field)
+
+
+OWNER_NAMES = frozenset(('lastName', 'firstName', 'billingAddress', 'issueCardDate'))
+
+
+def write_owner(parts, value):
+    """append the elements of owner to parts"""
+    if not isinstance(value, dict):
+        raise UnsupportedValue(value)
+    check_names(OWNER_NAMES, value)
+    field = value.get('lastName')
+    if field is not None:
+        write_text(parts, u'<lastName xmlns="http://obj.ws.payline.experian.com">', u'</lastName>', field)
+    field = value.get('firstName')
+    if field is not None:
+        write_text(parts, u'<firstName xmlns="http://obj.ws.payline.experian.com">', u'</firstName>', field)
+    field = value.get('billingAddress')
+    if field is not None:
+        write_items(
+            parts, write_address_owner, u'<billingAddress xmlns="http://obj.ws.payline.experian.com">',
+            u'</billingAddress>', u'<billingAddress xmlns="http://obj.ws.payline.experian.com"/>', field
+        )
+    field = value.get('issueCardDate')
+    if field is not None:
+        write_text(parts, u'<issueCardDate xmlns="http://obj.ws.payline.experian.com">', u'</issueCardDate>', field)
+
+
+PRIVATE_DATA_NAMES = frozenset(('key', 'value'))
+
+
+def write_private_data(parts, value):
+    """append the elements of privateData to parts"""
+    if not isinstance(value, dict):
+        raise UnsupportedValue(value)
+    check_names(PRIVATE_DATA_NAMES, value)
+    field = value.get('key')
+    if field is not None:
+        write_text(parts, u'<key xmlns="http://obj.ws.payline.experian.com">', u'</key>', field)
+    field = value.get('value')
+    if field is not None:
+        write_text(parts, u'<value xmlns="http://obj.ws.payline.experian.com">', u'</value>', field)
+
+
+PRIVATE_DATA_LIST_NAMES = frozenset(('privateData', ))
+
+
+def write_private_data_list(parts, value):
+    """append the elements of privateDataList to parts"""
+    if not isinstance(value, dict):
+        raise UnsupportedValue(value)
+    check_names(PRIVATE_DATA_LIST_NAMES, value)
+    field = value.get('privateData')
+    if field is not None:
+        write_items(
+            parts, write_private_data, u'<privateData xmlns="http://obj.ws.payline.experian.com">', u'</privateData>',
+            u'<privateData xmlns="http://obj.ws.payline.experian.com"/>', field
+        )
+
+
+AUTHENTICATION3_DSECURE_NAMES = frozenset((
+    'md', 'pares', 'xid', 'eci', 'cavv', 'cavvAlgorithm', 'vadsResult', 'typeSecurisation', 'PaResStatus',
+    'VeResStatus'
+))
+
+
+def write_authentication3_dsecure(parts, value):
+    """append the elements of authentication3DSecure to parts"""
+    if not isinstance(value, dict):
+        raise UnsupportedValue(value)
+    check_names(AUTHENTICATION3_DSECURE_NAMES, value)
+    field = value.get('md')
+    if field is not None:
+        write_text(parts, u'<md xmlns="http://obj.ws.payline.experian.com">', u'</md>', field)
+    field = value.get('pares')
+    if field is not None:
+        write_text(parts, u'<pares xmlns="http://obj.ws.payline.experian.com">', u'</pares>', field)
+    field = value.get('xid')
+    if field is not None:
+        write_text(parts, u'<xid xmlns="http://obj.ws.payline.experian.com">', u'</xid>', field)
+    field = value.get('eci')
+    if field is not None:
+        write_text(parts, u'<eci xmlns="http://obj.ws.payline.experian.com">', u'</eci>', field)
+    field = value.get('cavv')
+    if field is not None:
+        write_text(parts, u'<cavv xmlns="http://obj.ws.payline.experian.com">', u'</cavv>', field)
+    field = value.get('cavvAlgorithm')
+    if field is not None:
+        write_text(parts, u'<cavvAlgorithm xmlns="http://obj.ws.payline.experian.com">', u'</cavvAlgorithm>', field)
+    field = value.get('vadsResult')
+    if field is not None:
+        write_text(parts, u'<vadsResult xmlns="http://obj.ws.payline.experian.com">', u'</vadsResult>', field)
+    field = value.get('typeSecurisation')
+    if field is not None:
+        write_text(
+            parts, u'<typeSecurisation xmlns="http://obj.ws.payline.experian.com">', u'</typeSecurisation>', field
+        )
+    field = value.get('PaResStatus')
+    if field is not None:
+        write_text(parts, u'<PaResStatus xmlns="http://obj.ws.payline.experian.com">', u'</PaResStatus>', field)
+    field = value.get('VeResStatus')
+    if field is not None:
+        write_text(parts, u'<VeResStatus xmlns="http://obj.ws.payline.experian.com">', u'</VeResStatus>', field)
+
+
+SUB_MERCHANT_NAMES = frozenset((
+    'subMerchantId', 'subMerchantName', 'subMerchantMCC', 'subMerchantSIRET', 'subMerchantTaxCode', 'subMerchantStreet',
+    'subMerchantCity', 'subMerchantZipCode', 'subMerchantCountry', 'subMerchantState', 'subMerchantEmailAddress',
+    'subMerchantPhoneNumber'
+))
+
+
+def write_sub_merchant(parts, value):
+    """append the elements of subMerchant to parts"""
+    if not isinstance(value, dict):
+        raise UnsupportedValue(value)
+    check_names(SUB_MERCHANT_NAMES, value)
+    field = value.get('subMerchantId')
+    if field is not None:
+        write_text(parts, u'<subMerchantId xmlns="http://obj.ws.payline.experian.com">', u'</subMerchantId>', field)
+    field = value.get('subMerchantName')
+    if field is not None:
+        write_text(parts, u'<subMerchantName xmlns="http://obj.ws.payline.experian.com">', u'</subMerchantName>', field)
+    field = value.get('subMerchantMCC')
+    if field is not None:
+        write_text(parts, u'<subMerchantMCC xmlns="http://obj.ws.payline.experian.com">', u'</subMerchantMCC>', field)
+    field = value.get('subMerchantSIRET')
+    if field is not None:
+        write_text(
+            parts, u'<subMerchantSIRET xmlns="http://obj.ws.payline.experian.com">', u'</subMerchantSIRET>', field
+        )
+    field = value.get('subMerchantTaxCode')
+    if field is not None:
+        write_text(
+            parts, u'<subMerchantTaxCode xmlns="http://obj.ws.payline.experian.com">', u'</subMerchantTaxCode>', field
+        )
+    field = value.get('subMerchantStreet')
+    if field is not None:
+        write_text(
+            parts, u'<subMerchantStreet xmlns="http://obj.ws.payline.experian.com">', u'</subMerchantStreet>', field
+        )
+    field = value.get('subMerchantCity')
+    if field is not None:
+        write_text(parts, u'<subMerchantCity xmlns="http://obj.ws.payline.experian.com">', u'</subMerchantCity>', field)
+    field = value.get('subMerchantZipCode')
+    if field is not None:
+        write_text(
+            parts, u'<subMerchantZipCode xmlns="http://obj.ws.payline.experian.com">', u'</subMerchantZipCode>', field
+        )
+    field = value.get('subMerchantCountry')
+    if field is not None:
+        write_text(
+            parts, u'<subMerchantCountry xmlns="http://obj.ws.payline.experian.com">', u'</subMerchantCountry>', field
+        )
+    field = value.get('subMerchantState')
+    if field is not None:
+        write_text(
+            parts, u'<subMerchantState xmlns="http://obj.ws.payline.experian.com">', u'</subMerchantState>', field
+        )
+    field = value.get('subMerchantEmailAddress')
+    if field is not None:
+        write_text(
+            parts, u'<subMerchantEmailAddress xmlns="http://obj.ws.payline.experian.com">',
+            u'</subMerchantEmailAddress>', field
+        )
+    field = value.get('subMerchantPhoneNumber')
+    if field is not None:
+        write_text(
+            parts, u'<subMerchantPhoneNumber xmlns="http://obj.ws.payline.experian.com">', u'</subMerchantPhoneNumber>',
+            field
+        )
+
+
+AUTHORIZATION_NAMES = frozenset(('number', 'date'))
+
+
+def write_authorization(parts, value):
+    """append the elements of authorization to parts"""
+    if not isinstance(value, dict):
+        raise UnsupportedValue(value)
+    check_names(AUTHORIZATION_NAMES, value)
+    field = value.get('number')
+    if field is not None:
+        write_text(parts, u'<number xmlns="http://obj.ws.payline.experian.com">', u'</number>', field)
+    field = value.get('date')
+    if field is not None:
+        write_text(parts, u'<date xmlns="http://obj.ws.payline.experian.com">', u'</date>', field)
+
+
+WALLET_NAMES = frozenset((
+    'walletId', 'lastName', 'firstName', 'email', 'shippingAddress', 'card', 'comment', 'default', 'cardStatus',
+    'cardBrand'
+))
+
+
+def write_wallet(parts, value):
+    """append the elements of wallet to parts"""
+    if not isinstance(value, dict):
+        raise UnsupportedValue(value)
+    check_names(WALLET_NAMES, value)
+    field = value.get('walletId')
+    if field is not None:
+        write_text(parts, u'<walletId xmlns="http://obj.ws.payline.experian.com">', u'</walletId>', field)
+    field = value.get('lastName')
+    if field is not None:
+        write_text(parts, u'<lastName xmlns="http://obj.ws.payline.experian.com">', u'</lastName>', field)
+    field = value.get('firstName')
+    if field is not None:
+        write_text(parts, u'<firstName xmlns="http://obj.ws.payline.experian.com">', u'</firstName>', field)
+    field = value.get('email')
+    if field is not None:
+        write_text(parts, u'<email xmlns="http://obj.ws.payline.experian.com">', u'</email>', field)
+    field = value.get('shippingAddress')
+    if field is not None:
+        write_items(
+            parts, write_address, u'<shippingAddress xmlns="http://obj.ws.payline.experian.com">',
+            u'</shippingAddress>', u'<shippingAddress xmlns="http://obj.ws.payline.experian.com"/>', field
+        )
+    field = value.get('card')
+    if field is not None:
+        write_items(
+            parts, write_card, u'<card xmlns="http://obj.ws.payline.experian.com">', u'</card>',
+            u'<card xmlns="http://obj.ws.payline.experian.com"/>', field
+        )
+    field = value.get('comment')
+    if field is not None:
+        write_text(parts, u'<comment xmlns="http://obj.ws.payline.experian.com">', u'</comment>', field)
+    field = value.get('default')
+    if field is not None:
+        write_text(parts, u'<default xmlns="http://obj.ws.payline.experian.com">', u'</default>', field)
+    field = value.get('cardStatus')
+    if field is not None:
+        write_text(parts, u'<cardStatus xmlns="http://obj.ws.payline.experian.com">', u'</cardStatus>', field)
+    field = value.get('cardBrand')
+    if field is not None:
+        write_text(parts, u'<cardBrand xmlns="http://obj.ws.payline.experian.com">', u'</cardBrand>', field)
+
+
+CONTRACT_NUMBER_WALLET_LIST_NAMES = frozenset(('contractNumberWallet', ))
+
+
+def write_contract_number_wallet_list(parts, value):
+    """append the elements of contractNumberWalletList to parts"""
+    if not isinstance(value, dict):
+        raise UnsupportedValue(value)
+    check_names(CONTRACT_NUMBER_WALLET_LIST_NAMES, value)
+    field = value.get('contractNumberWallet')
+    if field is not None:
+        write_text(
+            parts, u'<contractNumberWallet xmlns="http://obj.ws.payline.experian.com">', u'</contractNumberWallet>',
+            field
+        )
+
+
+WALLET_ID_LIST_NAMES = frozenset(('walletId', ))
+
+
+def write_wallet_id_list(parts, value):
+    """append the elements of walletIdList to parts"""
+    if not isinstance(value, dict):
+        raise UnsupportedValue(value)
+    check_names(WALLET_ID_LIST_NAMES, value)
+    field = value.get('walletId')
+    if field is not None:
+        write_text(parts, u'<walletId xmlns="http://obj.ws.payline.experian.com">', u'</walletId>', field)
+
+
+RECURRING_NAMES = frozenset((
+    'firstAmount', 'amount', 'billingCycle', 'billingLeft', 'billingDay', 'startDate', 'endDate', 'newAmount',
+    'amountModificationDate'
+))
+
+
+def write_recurring(parts, value):
+    """append the elements of recurring to parts"""
+    if not isinstance(value, dict):
+        raise UnsupportedValue(value)
+    check_names(RECURRING_NAMES, value)
+    field = value.get('firstAmount')
+    if field is not None:
+        write_text(parts, u'<firstAmount xmlns="http://obj.ws.payline.experian.com">', u'</firstAmount>', field)
+    field = value.get('amount')
+    if field is not None:
+        write_text(parts, u'<amount xmlns="http://obj.ws.payline.experian.com">', u'</amount>', field)
+    field = value.get('billingCycle')
+    if field is not None:
+        write_text(parts, u'<billingCycle xmlns="http://obj.ws.payline.experian.com">', u'</billingCycle>', field)
+    field = value.get('billingLeft')
+    if field is not None:
+        write_text(parts, u'<billingLeft xmlns="http://obj.ws.payline.experian.com">', u'</billingLeft>', field)
+    field = value.get('billingDay')
+    if field is not None:
+        write_text(parts, u'<billingDay xmlns="http://obj.ws.payline.experian.com">', u'</billingDay>', field)
+    field = value.get('startDate')
+    if field is not None:
+        write_text(parts, u'<startDate xmlns="http://obj.ws.payline.experian.com">', u'</startDate>', field)
+    field = value.get('endDate')
+    if field is not None:
+        write_text(parts, u'<endDate xmlns="http://obj.ws.payline.experian.com">', u'</endDate>', field)
+    field = value.get('newAmount')
+    if field is not None:
+        write_text(parts, u'<newAmount xmlns="http://obj.ws.payline.experian.com">', u'</newAmount>', field)
+    field = value.get('amountModificationDate')
+    if field is not None:
+        write_text(
+            parts, u'<amountModificationDate xmlns="http://obj.ws.payline.experian.com">', u'</amountModificationDate>',
+            field
+        )
+
+
+CREATE_MERCHANT_REQUEST_CURRENCY_NAMES = frozenset(())
+
+
+def write_create_merchant_request_currency(parts, value):
+    """append the elements of createMerchantRequest_currency to parts"""
+    if not isinstance(value, dict):
+        raise UnsupportedValue(value)
+    check_names(CREATE_MERCHANT_REQUEST_CURRENCY_NAMES, value)
+
+
+CREATE_MERCHANT_REQUEST_NATIONAL_ID_NAMES = frozenset(())
+
+
+def write_create_merchant_request_national_id(parts, value):
+    """append the elements of createMerchantRequest_nationalID to parts"""
+    if not isinstance(value, dict):
+        raise UnsupportedValue(value)
+    check_names(CREATE_MERCHANT_REQUEST_NATIONAL_ID_NAMES, value)
+
+
+ADDRESS_INTERLOCUTOR_NAMES = frozenset(('street1', 'street2', 'city', 'zipCode', 'state', 'country'))
+
+
+def write_address_interlocutor(parts, value):
+    """append the elements of addressInterlocutor to parts"""
+    if not isinstance(value, dict):
+        raise UnsupportedValue(value)
+    check_names(ADDRESS_INTERLOCUTOR_NAMES, value)
+    field = value.get('street1')
+    if field is not None:
+        write_text(parts, u'<street1 xmlns="http://obj.ws.payline.experian.com">', u'</street1>', field)
+    field = value.get('street2')
+    if field is not None:
+        write_text(parts, u'<street2 xmlns="http://obj.ws.payline.experian.com">', u'</street2>', field)
+    field = value.get('city')
+    if field is not None:
+        write_text(parts, u'<city xmlns="http://obj.ws.payline.experian.com">', u'</city>', field)
+    field = value.get('zipCode')
+    if field is not None:
+        write_text(parts, u'<zipCode xmlns="http://obj.ws.payline.experian.com">', u'</zipCode>', field)
+    field = value.get('state')
+    if field is not None:
+        write_text(parts, u'<state xmlns="http://obj.ws.payline.experian.com">', u'</state>', field)
+    field = value.get('country')
+    if field is not None:
+        write_text(parts, u'<country xmlns="http://obj.ws.payline.experian.com">', u'</country>', field)
+
+
+INTERLOCUTOR_NAMES = frozenset(('firstName', 'lastName', 'email', 'phone', 'mobile', 'fax', 'addressInterlocutor'))
+
+
+def write_interlocutor(parts, value):
+    """append the elements of interlocutor to parts"""
+    if not isinstance(value, dict):
+        raise UnsupportedValue(value)
+    check_names(INTERLOCUTOR_NAMES, value)
+    field = value.get('firstName')
+    if field is not None:
+        write_text(parts, u'<firstName xmlns="http://obj.ws.payline.experian.com">', u'</firstName>', field)
+    field = value.get('lastName')
+    if field is not None:
+        write_text(parts, u'<lastName xmlns="http://obj.ws.payline.experian.com">', u'</lastName>', field)
+    field = value.get('email')
+    if field is not None:
+        write_text(parts, u'<email xmlns="http://obj.ws.payline.experian.com">', u'</email>', field)
+    field = value.get('phone')
+    if field is not None:
+        write_text(parts, u'<phone xmlns="http://obj.ws.payline.experian.com">', u'</phone>', field)
+    field = value.get('mobile')
+    if field is not None:
+        write_text(parts, u'<mobile xmlns="http://obj.ws.payline.experian.com">', u'</mobile>', field)
+    field = value.get('fax')
+    if field is not None:
+        write_text(parts, u'<fax xmlns="http://obj.ws.payline.experian.com">', u'</fax>', field)
+    field = value.get('addressInterlocutor')
+    if field is not None:
+        write_items(
+            parts, write_address_interlocutor, u'<addressInterlocutor xmlns="http://obj.ws.payline.experian.com">',
+            u'</addressInterlocutor>', u'<addressInterlocutor xmlns="http://obj.ws.payline.experian.com"/>', field
+        )
+
+
+SUBSCRIPTION_NAMES = frozenset(('id', 'option'))
+
+
+def write_subscription(parts, value):
+    """append the elements of subscription to parts"""
+    if not isinstance(value, dict):
+        raise UnsupportedValue(value)
+    check_names(SUBSCRIPTION_NAMES, value)
+    field = value.get('id')
+    if field is not None:
+        write_text(parts, u'<id xmlns="http://obj.ws.payline.experian.com">', u'</id>', field)
+    if value.get('option') is not None:
+        raise UnsupportedValue(value.get('option'))
+
+
+CREATE_MERCHANT_REQUEST_POSS_NAMES = frozenset(())
+
+
+def write_create_merchant_request_poss(parts, value):
+    """append the elements of createMerchantRequest_poss to parts"""
+    if not isinstance(value, dict):
+        raise UnsupportedValue(value)
+    check_names(CREATE_MERCHANT_REQUEST_POSS_NAMES, value)
+
+
+CHEQUE_NAMES = frozenset(('number', ))
+
+
+def write_cheque(parts, value):
+    """append the elements of cheque to parts"""
+    if not isinstance(value, dict):
+        raise UnsupportedValue(value)
+    check_names(CHEQUE_NAMES, value)
+    field = value.get('number')
+    if field is not None:
+        write_text(parts, u'<number xmlns="http://obj.ws.payline.experian.com">', u'</number>', field)
+
+
+RECURRING_FOR_UPDATE_NAMES = frozenset(('billingLeft', 'billingDay', 'endDate', 'newAmount', 'amountModificationDate'))
+
+
+def write_recurring_for_update(parts, value):
+    """append the elements of recurringForUpdate to parts"""
+    if not isinstance(value, dict):
+        raise UnsupportedValue(value)
+    check_names(RECURRING_FOR_UPDATE_NAMES, value)
+    field = value.get('billingLeft')
+    if field is not None:
+        write_text(parts, u'<billingLeft xmlns="http://obj.ws.payline.experian.com">', u'</billingLeft>', field)
+    field = value.get('billingDay')
+    if field is not None:
+        write_text(parts, u'<billingDay xmlns="http://obj.ws.payline.experian.com">', u'</billingDay>', field)
+    field = value.get('endDate')
+    if field is not None:
+        write_text(parts, u'<endDate xmlns="http://obj.ws.payline.experian.com">', u'</endDate>', field)
+    field = value.get('newAmount')
+    if field is not None:
+        write_text(parts, u'<newAmount xmlns="http://obj.ws.payline.experian.com">', u'</newAmount>', field)
+    field = value.get('amountModificationDate')
+    if field is not None:
+        write_text(
+            parts, u'<amountModificationDate xmlns="http://obj.ws.payline.experian.com">', u'</amountModificationDate>',
+            field
+        )
+
+
+BILLING_RECORD_FOR_UPDATE_NAMES = frozenset(('date', 'amount', 'status', 'executionDate'))
+
+
+def write_billing_record_for_update(parts, value):
+    """append the elements of billingRecordForUpdate to parts"""
+    if not isinstance(value, dict):
+        raise UnsupportedValue(value)
+    check_names(BILLING_RECORD_FOR_UPDATE_NAMES, value)
+    field = value.get('date')
+    if field is not None:
+        write_text(parts, u'<date xmlns="http://obj.ws.payline.experian.com">', u'</date>', field)
+    field = value.get('amount')
+    if field is not None:
+        write_text(parts, u'<amount xmlns="http://obj.ws.payline.experian.com">', u'</amount>', field)
+    field = value.get('status')
+    if field is not None:
+        write_text(parts, u'<status xmlns="http://obj.ws.payline.experian.com">', u'</status>', field)
+    field = value.get('executionDate')
+    if field is not None:
+        write_text(parts, u'<executionDate xmlns="http://obj.ws.payline.experian.com">', u'</executionDate>', field)
+
+
+CREDITOR_NAMES = frozenset(('bic', 'iban', 'name'))
+
+
+def write_creditor(parts, value):
+    """append the elements of creditor to parts"""
+    if not isinstance(value, dict):
+        raise UnsupportedValue(value)
+    check_names(CREDITOR_NAMES, value)
+    field = value.get('bic')
+    if field is not None:
+        write_text(parts, u'<bic xmlns="http://obj.ws.payline.experian.com">', u'</bic>', field)
+    field = value.get('iban')
+    if field is not None:
+        write_text(parts, u'<iban xmlns="http://obj.ws.payline.experian.com">', u'</iban>', field)
+    field = value.get('name')
+    if field is not None:
+        write_text(parts, u'<name xmlns="http://obj.ws.payline.experian.com">', u'</name>', field)
+
+
+DO_AUTHORIZATION_START = ENVELOPE_START.format(
+    soap_uri=SOAP_URI, name=u'doAuthorizationRequest', namespace=u'http://impl.ws.payline.experian.com'
+)
+DO_AUTHORIZATION_END = ENVELOPE_END.format(name=u'doAuthorizationRequest')
+DO_AUTHORIZATION_NAMES = frozenset((
+    'version', 'payment', 'bankAccountData', 'card', 'order', 'buyer', 'owner', 'privateDataList',
+    'authentication3DSecure', 'media', 'subMerchant', 'asynchronousRetryTimeout'
+))
+
+
+def build_do_authorization(version=None, payment=None, bankAccountData=None, card=None, order=None, buyer=None,
+                           owner=None, privateDataList=None, authentication3DSecure=None, media=None, subMerchant=None,
+                           asynchronousRetryTimeout=None):
+    """the doAuthorization request envelope as utf-8 bytes"""
+    parts = [DO_AUTHORIZATION_START]
+    if version is not None:
+        write_text(parts, u'<version>', u'</version>', version)
+    if payment is not None:
+        write_items(
+            parts, write_payment, u'<payment xmlns="http://impl.ws.payline.experian.com">', u'</payment>',
+            u'<payment xmlns="http://impl.ws.payline.experian.com"/>', payment
+        )
+    if bankAccountData is not None:
+        write_items(
+            parts, write_bank_account_data, u'<bankAccountData xmlns="http://impl.ws.payline.experian.com">',
+            u'</bankAccountData>', u'<bankAccountData xmlns="http://impl.ws.payline.experian.com"/>', bankAccountData
+        )
+    if card is not None:
+        write_items(
+            parts, write_card, u'<card xmlns="http://impl.ws.payline.experian.com">', u'</card>',
+            u'<card xmlns="http://impl.ws.payline.experian.com"/>', card
+        )
+    if order is not None:
+        write_items(
+            parts, write_order, u'<order xmlns="http://impl.ws.payline.experian.com">', u'</order>',
+            u'<order xmlns="http://impl.ws.payline.experian.com"/>', order
+        )
+    if buyer is not None:
+        write_items(
+            parts, write_buyer, u'<buyer xmlns="http://impl.ws.payline.experian.com">', u'</buyer>',
+            u'<buyer xmlns="http://impl.ws.payline.experian.com"/>', buyer
+        )
+    if owner is not None:
+        write_items(
+            parts, write_owner, u'<owner xmlns="http://impl.ws.payline.experian.com">', u'</owner>',
+            u'<owner xmlns="http://impl.ws.payline.experian.com"/>', owner
+        )
+    if privateDataList is not None:
+        write_items(
+            parts, write_private_data_list, u'<privateDataList xmlns="http://impl.ws.payline.experian.com">',
+            u'</privateDataList>', u'<privateDataList xmlns="http://impl.ws.payline.experian.com"/>', privateDataList
+        )
+    if authentication3DSecure is not None:
+        write_items(
+            parts, write_authentication3_dsecure,
+            u'<authentication3DSecure xmlns="http://impl.ws.payline.experian.com">', u'</authentication3DSecure>',
+            u'<authentication3DSecure xmlns="http://impl.ws.payline.experian.com"/>', authentication3DSecure
+        )
+    if media is not None:
+        write_text(parts, u'<media>', u'</media>', media)
+    if subMerchant is not None:
+        write_items(
+            parts, write_sub_merchant, u'<subMerchant xmlns="http://impl.ws.payline.experian.com">', u'</subMerchant>',
+            u'<subMerchant xmlns="http://impl.ws.payline.experian.com"/>', subMerchant
+        )
+    if asynchronousRetryTimeout is not None:
+        write_text(parts, u'<asynchronousRetryTimeout>', u'</asynchronousRetryTimeout>', asynchronousRetryTimeout)
+    parts.append(DO_AUTHORIZATION_END)
+    return u''.join(parts).encode('utf-8')
+
+
+DO_CAPTURE_START = ENVELOPE_START.format(
+    soap_uri=SOAP_URI, name=u'doCaptureRequest', namespace=u'http://impl.ws.payline.experian.com'
+)
+DO_CAPTURE_END = ENVELOPE_END.format(name=u'doCaptureRequest')
+DO_CAPTURE_NAMES = frozenset(('version', 'transactionID', 'payment', 'privateDataList', 'sequenceNumber', 'media'))
+
+
+def build_do_capture(version=None, transactionID=None, payment=None, privateDataList=None, sequenceNumber=None,
+                     media=None):
+    """the doCapture request envelope as utf-8 bytes"""
+    parts = [DO_CAPTURE_START]
+    if version is not None:
+        write_text(parts, u'<version>', u'</version>', version)
+    if transactionID is not None:
+        write_text(parts, u'<transactionID>', u'</transactionID>', transactionID)
+    if payment is not None:
+        write_items(
+            parts, write_payment, u'<payment xmlns="http://impl.ws.payline.experian.com">', u'</payment>',
+            u'<payment xmlns="http://impl.ws.payline.experian.com"/>', payment
+        )
+    if privateDataList is not None:
+        write_items(
+            parts, write_private_data_list, u'<privateDataList xmlns="http://impl.ws.payline.experian.com">',
+            u'</privateDataList>', u'<privateDataList xmlns="http://impl.ws.payline.experian.com"/>', privateDataList
+        )
+    if sequenceNumber is not None:
+        write_text(parts, u'<sequenceNumber>', u'</sequenceNumber>', sequenceNumber)
+    if media is not None:
+        write_text(parts, u'<media>', u'</media>', media)
+    parts.append(DO_CAPTURE_END)
+    return u''.join(parts).encode('utf-8')
+
+
+DO_RE_AUTHORIZATION_START = ENVELOPE_START.format(
+    soap_uri=SOAP_URI, name=u'doReAuthorizationRequest', namespace=u'http://impl.ws.payline.experian.com'
+)
+DO_RE_AUTHORIZATION_END = ENVELOPE_END.format(name=u'doReAuthorizationRequest')
+DO_RE_AUTHORIZATION_NAMES = frozenset(('version', 'transactionID', 'payment', 'order', 'privateDataList', 'media'))
+
+
+def build_do_re_authorization(version=None, transactionID=None, payment=None, order=None, privateDataList=None,
+                              media=None):
+    """the doReAuthorization request envelope as utf-8 bytes"""
+    parts = [DO_RE_AUTHORIZATION_START]
+    if version is not None:
+        write_text(parts, u'<version>', u'</version>', version)
+    if transactionID is not None:
+        write_text(parts, u'<transactionID>', u'</transactionID>', transactionID)
+    if payment is not None:
+        write_items(
+            parts, write_payment, u'<payment xmlns="http://impl.ws.payline.experian.com">', u'</payment>',
+            u'<payment xmlns="http://impl.ws.payline.experian.com"/>', payment
+        )
+    if order is not None:
+        write_items(
+            parts, write_order, u'<order xmlns="http://impl.ws.payline.experian.com">', u'</order>',
+            u'<order xmlns="http://impl.ws.payline.experian.com"/>', order
+        )
+    if privateDataList is not None:
+        write_items(
+            parts, write_private_data_list, u'<privateDataList xmlns="http://impl.ws.payline.experian.com">',
+            u'</privateDataList>', u'<privateDataList xmlns="http://impl.ws.payline.experian.com"/>', privateDataList
+        )
+    if media is not None:
+        write_text(parts, u'<media>', u'</media>', media)
+    parts.append(DO_RE_AUTHORIZATION_END)
+    return u''.join(parts).encode('utf-8')
+
+
+DO_DEBIT_START = ENVELOPE_START.format(
+    soap_uri=SOAP_URI, name=u'doDebitRequest', namespace=u'http://impl.ws.payline.experian.com'
+)
+DO_DEBIT_END = ENVELOPE_END.format(name=u'doDebitRequest')
+DO_DEBIT_NAMES = frozenset((
+    'version', 'payment', 'card', 'order', 'buyer', 'owner', 'privateDataList', 'authentication3DSecure',
+    'authorization', 'media', 'subMerchant'
+))
+
+
+def build_do_debit(version=None, payment=None, card=None, order=None, buyer=None, owner=None, privateDataList=None,
+                   authentication3DSecure=None, authorization=None, media=None, subMerchant=None):
+    """the doDebit request envelope as utf-8 bytes"""
+    parts = [DO_DEBIT_START]
+    if version is not None:
+        write_text(parts, u'<version>', u'</version>', version)
+    if payment is not None:
+        write_items(
+            parts, write_payment, u'<payment xmlns="http://impl.ws.payline.experian.com">', u'</payment>',
+            u'<payment xmlns="http://impl.ws.payline.experian.com"/>', payment
+        )
+    if card is not None:
+        write_items(
+            parts, write_card, u'<card xmlns="http://impl.ws.payline.experian.com">', u'</card>',
+            u'<card xmlns="http://impl.ws.payline.experian.com"/>', card
+        )
+    if order is not None:
+        write_items(
+            parts, write_order, u'<order xmlns="http://impl.ws.payline.experian.com">', u'</order>',
+            u'<order xmlns="http://impl.ws.payline.experian.com"/>', order
+        )
+    if buyer is not None:
+        write_items(
+            parts, write_buyer, u'<buyer xmlns="http://impl.ws.payline.experian.com">', u'</buyer>',
+            u'<buyer xmlns="http://impl.ws.payline.experian.com"/>', buyer
+        )
+    if owner is not None:
+        write_items(
+            parts, write_owner, u'<owner xmlns="http://impl.ws.payline.experian.com">', u'</owner>',
+            u'<owner xmlns="http://impl.ws.payline.experian.com"/>', owner
+        )
+    if privateDataList is not None:
+        write_items(
+            parts, write_private_data_list, u'<privateDataList xmlns="http://impl.ws.payline.experian.com">',
+            u'</privateDataList>', u'<privateDataList xmlns="http://impl.ws.payline.experian.com"/>', privateDataList
+        )
+    if authentication3DSecure is not None:
+        write_items(
+            parts, write_authentication3_dsecure,
+            u'<authentication3DSecure xmlns="http://impl.ws.payline.experian.com">', u'</authentication3DSecure>',
+            u'<authentication3DSecure xmlns="http://impl.ws.payline.experian.com"/>', authentication3DSecure
+        )
+    if authorization is not None:
+        write_items(
+            parts, write_authorization, u'<authorization xmlns="http://impl.ws.payline.experian.com">',
+            u'</authorization>', u'<authorization xmlns="http://impl.ws.payline.experian.com"/>', authorization
+        )
+    if media is not None:
+        write_text(parts, u'<media>', u'</media>', media)
+    if subMerchant is not None:
+        write_items(
+            parts, write_sub_merchant, u'<subMerchant xmlns="http://impl.ws.payline.experian.com">', u'</subMerchant>',
+            u'<subMerchant xmlns="http://impl.ws.payline.experian.com"/>', subMerchant
+        )
+    parts.append(DO_DEBIT_END)
+    return u''.join(parts).encode('utf-8')
+
+
+DO_REFUND_START = ENVELOPE_START.format(
+    soap_uri=SOAP_URI, name=u'doRefundRequest', namespace=u'http://impl.ws.payline.experian.com'
+)
+DO_REFUND_END = ENVELOPE_END.format(name=u'doRefundRequest')
+DO_REFUND_NAMES = frozenset((
+    'version', 'transactionID', 'payment', 'comment', 'privateDataList', 'sequenceNumber', 'media', 'details'
+))
+
+
+def build_do_refund(version=None, transactionID=None, payment=None, comment=None, privateDataList=None,
+                    sequenceNumber=None, media=None, details=None):
+    """the doRefund request envelope as utf-8 bytes"""
+    parts = [DO_REFUND_START]
+    if version is not None:
+        write_text(parts, u'<version>', u'</version>', version)
+    if transactionID is not None:
+        write_text(parts, u'<transactionID>', u'</transactionID>', transactionID)
+    if payment is not None:
+        write_items(
+            parts, write_payment, u'<payment xmlns="http://impl.ws.payline.experian.com">', u'</payment>',
+            u'<payment xmlns="http://impl.ws.payline.experian.com"/>', payment
+        )
+    if comment is not None:
+        write_text(parts, u'<comment>', u'</comment>', comment)
+    if privateDataList is not None:
+        write_items(
+            parts, write_private_data_list, u'<privateDataList xmlns="http://impl.ws.payline.experian.com">',
+            u'</privateDataList>', u'<privateDataList xmlns="http://impl.ws.payline.experian.com"/>', privateDataList
+        )
+    if sequenceNumber is not None:
+        write_text(parts, u'<sequenceNumber>', u'</sequenceNumber>', sequenceNumber)
+    if media is not None:
+        write_text(parts, u'<media>', u'</media>', media)
+    if details is not None:
+        write_items(
+            parts, write_details, u'<details xmlns="http://impl.ws.payline.experian.com">', u'</details>',
+            u'<details xmlns="http://impl.ws.payline.experian.com"/>', details
+        )
+    parts.append(DO_REFUND_END)
+    return u''.join(parts).encode('utf-8')
+
+
+DO_RESET_START = ENVELOPE_START.format(
+    soap_uri=SOAP_URI, name=u'doResetRequest', namespace=u'http://impl.ws.payline.experian.com'
+)
+DO_RESET_END = ENVELOPE_END.format(name=u'doResetRequest')
+DO_RESET_NAMES = frozenset(('version', 'transactionID', 'comment', 'media'))
+
+
+def build_do_reset(version=None, transactionID=None, comment=None, media=None):
+    """the doReset request envelope as utf-8 bytes"""
+    parts = [DO_RESET_START]
+    if version is not None:
+        write_text(parts, u'<version>', u'</version>', version)
+    if transactionID is not None:
+        write_text(parts, u'<transactionID>', u'</transactionID>', transactionID)
+    if comment is not None:
+        write_text(parts, u'<comment>', u'</comment>', comment)
+    if media is not None:
+        write_text(parts, u'<media>', u'</media>', media)
+    parts.append(DO_RESET_END)
+    return u''.join(parts).encode('utf-8')
+
+
+DO_CREDIT_START = ENVELOPE_START.format(
+    soap_uri=SOAP_URI, name=u'doCreditRequest', namespace=u'http://impl.ws.payline.experian.com'
+)
+DO_CREDIT_END = ENVELOPE_END.format(name=u'doCreditRequest')
+DO_CREDIT_NAMES = frozenset((
+    'version', 'payment', 'card', 'comment', 'order', 'buyer', 'owner', 'privateDataList', 'media', 'subMerchant'
+))
+
+
+def build_do_credit(version=None, payment=None, card=None, comment=None, order=None, buyer=None, owner=None,
+                    privateDataList=None, media=None, subMerchant=None):
+    """the doCredit request envelope as utf-8 bytes"""
+    parts = [DO_CREDIT_START]
+    if version is not None:
+        write_text(parts, u'<version>', u'</version>', version)
+    if payment is not None:
+        write_items(
+            parts, write_payment, u'<payment xmlns="http://impl.ws.payline.experian.com">', u'</payment>',
+            u'<payment xmlns="http://impl.ws.payline.experian.com"/>', payment
+        )
+    if card is not None:
+        write_items(
+            parts, write_card, u'<card xmlns="http://impl.ws.payline.experian.com">', u'</card>',
+            u'<card xmlns="http://impl.ws.payline.experian.com"/>', card
+        )
+    if comment is not None:
+        write_text(parts, u'<comment>', u'</comment>', comment)
+    if order is not None:
+        write_items(
+            parts, write_order, u'<order xmlns="http://impl.ws.payline.experian.com">', u'</order>',
+            u'<order xmlns="http://impl.ws.payline.experian.com"/>', order
+        )
+    if buyer is not None:
+        write_items(
+            parts, write_buyer, u'<buyer xmlns="http://impl.ws.payline.experian.com">', u'</buyer>',
+            u'<buyer xmlns="http://impl.ws.payline.experian.com"/>', buyer
+        )
+    if owner is not None:
+        write_items(
+            parts, write_owner, u'<owner xmlns="http://impl.ws.payline.experian.com">', u'</owner>',
+            u'<owner xmlns="http://impl.ws.payline.experian.com"/>', owner
+        )
+    if privateDataList is not None:
+        write_items(
+            parts, write_private_data_list, u'<privateDataList xmlns="http://impl.ws.payline.experian.com">',
+            u'</privateDataList>', u'<privateDataList xmlns="http://impl.ws.payline.experian.com"/>', privateDataList
+        )
+    if media is not None:
+        write_text(parts, u'<media>', u'</media>', media)
+    if subMerchant is not None:
+        write_items(
+            parts, write_sub_merchant, u'<subMerchant xmlns="http://impl.ws.payline.experian.com">', u'</subMerchant>',
+            u'<subMerchant xmlns="http://impl.ws.payline.experian.com"/>', subMerchant
+        )
+    parts.append(DO_CREDIT_END)
+    return u''.join(parts).encode('utf-8')
+
+
+CREATE_WALLET_START = ENVELOPE_START.format(
+    soap_uri=SOAP_URI, name=u'createWalletRequest', namespace=u'http://impl.ws.payline.experian.com'
+)
+CREATE_WALLET_END = ENVELOPE_END.format(name=u'createWalletRequest')
+CREATE_WALLET_NAMES = frozenset((
+    'version', 'contractNumber', 'wallet', 'buyer', 'owner', 'privateDataList', 'authentication3DSecure', 'media',
+    'contractNumberWalletList'
+))
+
+
+def build_create_wallet(version=None, contractNumber=None, wallet=None, buyer=None, owner=None, privateDataList=None,
+                        authentication3DSecure=None, media=None, contractNumberWalletList=None):
+    """the createWallet request envelope as utf-8 bytes"""
+    parts = [CREATE_WALLET_START]
+    if version is not None:
+        write_text(parts, u'<version>', u'</version>', version)
+    if contractNumber is not None:
+        write_text(parts, u'<contractNumber>', u'</contractNumber>', contractNumber)
+    if wallet is not None:
+        write_items(
+            parts, write_wallet, u'<wallet xmlns="http://impl.ws.payline.experian.com">', u'</wallet>',
+            u'<wallet xmlns="http://impl.ws.payline.experian.com"/>', wallet
+        )
+    if buyer is not None:
+        write_items(
+            parts, write_buyer, u'<buyer xmlns="http://impl.ws.payline.experian.com">', u'</buyer>',
+            u'<buyer xmlns="http://impl.ws.payline.experian.com"/>', buyer
+        )
+    if owner is not None:
+        write_items(
+            parts, write_owner, u'<owner xmlns="http://impl.ws.payline.experian.com">', u'</owner>',
+            u'<owner xmlns="http://impl.ws.payline.experian.com"/>', owner
+        )
+    if privateDataList is not None:
+        write_items(
+            parts, write_private_data_list, u'<privateDataList xmlns="http://impl.ws.payline.experian.com">',
+            u'</privateDataList>', u'<privateDataList xmlns="http://impl.ws.payline.experian.com"/>', privateDataList
+        )
+    if authentication3DSecure is not None:
+        write_items(
+            parts, write_authentication3_dsecure,
+            u'<authentication3DSecure xmlns="http://impl.ws.payline.experian.com">', u'</authentication3DSecure>',
+            u'<authentication3DSecure xmlns="http://impl.ws.payline.experian.com"/>', authentication3DSecure
+        )
+    if media is not None:
+        write_text(parts, u'<media>', u'</media>', media)
+    if contractNumberWalletList is not None:
+        write_items(
+            parts, write_contract_number_wallet_list,
+            u'<contractNumberWalletList xmlns="http://impl.ws.payline.experian.com">', u'</contractNumberWalletList>',
+            u'<contractNumberWalletList xmlns="http://impl.ws.payline.experian.com"/>', contractNumberWalletList
+        )
+    parts.append(CREATE_WALLET_END)
+    return u''.join(parts).encode('utf-8')
+
+
+UPDATE_WALLET_START = ENVELOPE_START.format(
+    soap_uri=SOAP_URI, name=u'updateWalletRequest', namespace=u'http://impl.ws.payline.experian.com'
+)
+UPDATE_WALLET_END = ENVELOPE_END.format(name=u'updateWalletRequest')
+UPDATE_WALLET_NAMES = frozenset((
+    'version', 'contractNumber', 'cardInd', 'wallet', 'buyer', 'owner', 'privateDataList', 'authentication3DSecure',
+    'media', 'contractNumberWalletList'
+))
+
+
+def build_update_wallet(version=None, contractNumber=None, cardInd=None, wallet=None, buyer=None, owner=None,
+                        privateDataList=None, authentication3DSecure=None, media=None, contractNumberWalletList=None):
+    """the updateWallet request envelope as utf-8 bytes"""
+    parts = [UPDATE_WALLET_START]
+    if version is not None:
+        write_text(parts, u'<version>', u'</version>', version)
+    if contractNumber is not None:
+        write_text(parts, u'<contractNumber>', u'</contractNumber>', contractNumber)
+    if cardInd is not None:
+        write_text(parts, u'<cardInd>', u'</cardInd>', cardInd)
+    if wallet is not None:
+        write_items(
+            parts, write_wallet, u'<wallet xmlns="http://impl.ws.payline.experian.com">', u'</wallet>',
+            u'<wallet xmlns="http://impl.ws.payline.experian.com"/>', wallet
+        )
+    if buyer is not None:
+        write_items(
+            parts, write_buyer, u'<buyer xmlns="http://impl.ws.payline.experian.com">', u'</buyer>',
+            u'<buyer xmlns="http://impl.ws.payline.experian.com"/>', buyer
+        )
+    if owner is not None:
+        write_items(
+            parts, write_owner, u'<owner xmlns="http://impl.ws.payline.experian.com">', u'</owner>',
+            u'<owner xmlns="http://impl.ws.payline.experian.com"/>', owner
+        )
+    if privateDataList is not None:
+        write_items(
+            parts, write_private_data_list, u'<privateDataList xmlns="http://impl.ws.payline.experian.com">',
+            u'</privateDataList>', u'<privateDataList xmlns="http://impl.ws.payline.experian.com"/>', privateDataList
+        )
+    if authentication3DSecure is not None:
+        write_items(
+            parts, write_authentication3_dsecure,
+            u'<authentication3DSecure xmlns="http://impl.ws.payline.experian.com">', u'</authentication3DSecure>',
+            u'<authentication3DSecure xmlns="http://impl.ws.payline.experian.com"/>', authentication3DSecure
+        )
+    if media is not None:
+        write_text(parts, u'<media>', u'</media>', media)
+    if contractNumberWalletList is not None:
+        write_items(
+            parts, write_contract_number_wallet_list,
+            u'<contractNumberWalletList xmlns="http://impl.ws.payline.experian.com">', u'</contractNumberWalletList>',
+            u'<contractNumberWalletList xmlns="http://impl.ws.payline.experian.com"/>', contractNumberWalletList
+        )
+    parts.append(UPDATE_WALLET_END)
+    return u''.join(parts).encode('utf-8')
+
+
+GET_WALLET_START = ENVELOPE_START.format(
+    soap_uri=SOAP_URI, name=u'getWalletRequest', namespace=u'http://impl.ws.payline.experian.com'
+)
+GET_WALLET_END = ENVELOPE_END.format(name=u'getWalletRequest')
+GET_WALLET_NAMES = frozenset(('version', 'contractNumber', 'walletId', 'cardInd', 'media'))
+
+
+def build_get_wallet(version=None, contractNumber=None, walletId=None, cardInd=None, media=None):
+    """the getWallet request envelope as utf-8 bytes"""
+    parts = [GET_WALLET_START]
+    if version is not None:
+        write_text(parts, u'<version>', u'</version>', version)
+    if contractNumber is not None:
+        write_text(parts, u'<contractNumber>', u'</contractNumber>', contractNumber)
+    if walletId is not None:
+        write_text(parts, u'<walletId>', u'</walletId>', walletId)
+    if cardInd is not None:
+        write_text(parts, u'<cardInd>', u'</cardInd>', cardInd)
+    if media is not None:
+        write_text(parts, u'<media>', u'</media>', media)
+    parts.append(GET_WALLET_END)
+    return u''.join(parts).encode('utf-8')
+
+
+GET_CARDS_START = ENVELOPE_START.format(
+    soap_uri=SOAP_URI, name=u'getCardsRequest', namespace=u'http://impl.ws.payline.experian.com'
+)
+GET_CARDS_END = ENVELOPE_END.format(name=u'getCardsRequest')
+GET_CARDS_NAMES = frozenset(('version', 'contractNumber', 'walletId', 'cardInd'))
+
+
+def build_get_cards(version=None, contractNumber=None, walletId=None, cardInd=None):
+    """the getCards request envelope as utf-8 bytes"""
+    parts = [GET_CARDS_START]
+    if version is not None:
+        write_text(parts, u'<version>', u'</version>', version)
+    if contractNumber is not None:
+        write_text(parts, u'<contractNumber>', u'</contractNumber>', contractNumber)
+    if walletId is not None:
+        write_text(parts, u'<walletId>', u'</walletId>', walletId)
+    if cardInd is not None:
+        write_text(parts, u'<cardInd>', u'</cardInd>', cardInd)
+    parts.append(GET_CARDS_END)
+    return u''.join(parts).encode('utf-8')
+
+
+DISABLE_WALLET_START = ENVELOPE_START.format(
+    soap_uri=SOAP_URI, name=u'disableWalletRequest', namespace=u'http://impl.ws.payline.experian.com'
+)
+DISABLE_WALLET_END = ENVELOPE_END.format(name=u'disableWalletRequest')
+DISABLE_WALLET_NAMES = frozenset(('contractNumber', 'cardInd', 'walletIdList'))
+
+
+def build_disable_wallet(contractNumber=None, cardInd=None, walletIdList=None):
+    """the disableWallet request envelope as utf-8 bytes"""
+    parts = [DISABLE_WALLET_START]
+    if contractNumber is not None:
+        write_text(parts, u'<contractNumber>', u'</contractNumber>', contractNumber)
+    if cardInd is not None:
+        write_text(parts, u'<cardInd>', u'</cardInd>', cardInd)
+    if walletIdList is not None:
+        write_items(
+            parts, write_wallet_id_list, u'<walletIdList xmlns="http://impl.ws.payline.experian.com">',
+            u'</walletIdList>', u'<walletIdList xmlns="http://impl.ws.payline.experian.com"/>', walletIdList
+        )
+    parts.append(DISABLE_WALLET_END)
+    return u''.join(parts).encode('utf-8')
+
+
+ENABLE_WALLET_START = ENVELOPE_START.format(
+    soap_uri=SOAP_URI, name=u'enableWalletRequest', namespace=u'http://impl.ws.payline.experian.com'
+)
+ENABLE_WALLET_END = ENVELOPE_END.format(name=u'enableWalletRequest')
+ENABLE_WALLET_NAMES = frozenset(('contractNumber', 'cardInd', 'walletId'))
+
+
+def build_enable_wallet(contractNumber=None, cardInd=None, walletId=None):
+    """the enableWallet request envelope as utf-8 bytes"""
+    parts = [ENABLE_WALLET_START]
+    if contractNumber is not None:
+        write_text(parts, u'<contractNumber>', u'</contractNumber>', contractNumber)
+    if cardInd is not None:
+        write_text(parts, u'<cardInd>', u'</cardInd>', cardInd)
+    if walletId is not None:
+        write_text(parts, u'<walletId>', u'</walletId>', walletId)
+    parts.append(ENABLE_WALLET_END)
+    return u''.join(parts).encode('utf-8')
+
+
+DO_IMMEDIATE_WALLET_PAYMENT_START = ENVELOPE_START.format(
+    soap_uri=SOAP_URI, name=u'doImmediateWalletPaymentRequest', namespace=u'http://impl.ws.payline.experian.com'
+)
+DO_IMMEDIATE_WALLET_PAYMENT_END = ENVELOPE_END.format(name=u'doImmediateWalletPaymentRequest')
+DO_IMMEDIATE_WALLET_PAYMENT_NAMES = frozenset((
+    'version', 'payment', 'order', 'buyer', 'walletId', 'cardInd', 'cvx', 'privateDataList', 'media',
+    'authentication3DSecure', 'subMerchant'
+))
+
+
+def build_do_immediate_wallet_payment(version=None, payment=None, order=None, buyer=None, walletId=None, cardInd=None,
+                                      cvx=None, privateDataList=None, media=None, authentication3DSecure=None,
+                                      subMerchant=None):
+    """the doImmediateWalletPayment request envelope as utf-8 bytes"""
+    parts = [DO_IMMEDIATE_WALLET_PAYMENT_START]
+    if version is not None:
+        write_text(parts, u'<version>', u'</version>', version)
+    if payment is not None:
+        write_items(
+            parts, write_payment, u'<payment xmlns="http://impl.ws.payline.experian.com">', u'</payment>',
+            u'<payment xmlns="http://impl.ws.payline.experian.com"/>', payment
+        )
+    if order is not None:
+        write_items(
+            parts, write_order, u'<order xmlns="http://impl.ws.payline.experian.com">', u'</order>',
+            u'<order xmlns="http://impl.ws.payline.experian.com"/>', order
+        )
+    if buyer is not None:
+        write_items(
+            parts, write_buyer, u'<buyer xmlns="http://impl.ws.payline.experian.com">', u'</buyer>',
+            u'<buyer xmlns="http://impl.ws.payline.experian.com"/>', buyer
+        )
+    if walletId is not None:
+        write_text(parts, u'<walletId>', u'</walletId>', walletId)
+    if cardInd is not None:
+        write_text(parts, u'<cardInd>', u'</cardInd>', cardInd)
+    if cvx is not None:
+        write_text(parts, u'<cvx>', u'</cvx>', cvx)
+    if privateDataList is not None:
+        write_items(
+            parts, write_private_data_list, u'<privateDataList xmlns="http://impl.ws.payline.experian.com">',
+            u'</privateDataList>', u'<privateDataList xmlns="http://impl.ws.payline.experian.com"/>', privateDataList
+        )
+    if media is not None:
+        write_text(parts, u'<media>', u'</media>', media)
+    if authentication3DSecure is not None:
+        write_items(
+            parts, write_authentication3_dsecure,
+            u'<authentication3DSecure xmlns="http://impl.ws.payline.experian.com">', u'</authentication3DSecure>',
+            u'<authentication3DSecure xmlns="http://impl.ws.payline.experian.com"/>', authentication3DSecure
+        )
+    if subMerchant is not None:
+        write_items(
+            parts, write_sub_merchant, u'<subMerchant xmlns="http://impl.ws.payline.experian.com">', u'</subMerchant>',
+            u'<subMerchant xmlns="http://impl.ws.payline.experian.com"/>', subMerchant
+        )
+    parts.append(DO_IMMEDIATE_WALLET_PAYMENT_END)
+    return u''.join(parts).encode('utf-8')
+
+
+DO_SCHEDULED_WALLET_PAYMENT_START = ENVELOPE_START.format(
+    soap_uri=SOAP_URI, name=u'doScheduledWalletPaymentRequest', namespace=u'http://impl.ws.payline.experian.com'
+)
+DO_SCHEDULED_WALLET_PAYMENT_END = ENVELOPE_END.format(name=u'doScheduledWalletPaymentRequest')
+DO_SCHEDULED_WALLET_PAYMENT_NAMES = frozenset((
+    'version', 'payment', 'orderRef', 'orderDate', 'scheduledDate', 'walletId', 'cardInd', 'order', 'privateDataList',
+    'media', 'subMerchant'
+))
+
+
+def build_do_scheduled_wallet_payment(version=None, payment=None, orderRef=None, orderDate=None, scheduledDate=None,
+                                      walletId=None, cardInd=None, order=None, privateDataList=None, media=None,
+                                      subMerchant=None):
+    """the doScheduledWalletPayment request envelope as utf-8 bytes"""
+    parts = [DO_SCHEDULED_WALLET_PAYMENT_START]
+    if version is not None:
+        write_text(parts, u'<version>', u'</version>', version)
+    if payment is not None:
+        write_items(
+            parts, write_payment, u'<payment xmlns="http://impl.ws.payline.experian.com">', u'</payment>',
+            u'<payment xmlns="http://impl.ws.payline.experian.com"/>', payment
+        )
+    if orderRef is not None:
+        write_text(parts, u'<orderRef>', u'</orderRef>', orderRef)
+    if orderDate is not None:
+        write_text(parts, u'<orderDate>', u'</orderDate>', orderDate)
+    if scheduledDate is not None:
+        write_text(parts, u'<scheduledDate>', u'</scheduledDate>', scheduledDate)
+    if walletId is not None:
+        write_text(parts, u'<walletId>', u'</walletId>', walletId)
+    if cardInd is not None:
+        write_text(parts, u'<cardInd>', u'</cardInd>', cardInd)
+    if order is not None:
+        write_items(
+            parts, write_order, u'<order xmlns="http://impl.ws.payline.experian.com">', u'</order>',
+            u'<order xmlns="http://impl.ws.payline.experian.com"/>', order
+        )
+    if privateDataList is not None:
+        write_items(
+            parts, write_private_data_list, u'<privateDataList xmlns="http://impl.ws.payline.experian.com">',
+            u'</privateDataList>', u'<privateDataList xmlns="http://impl.ws.payline.experian.com"/>', privateDataList
+        )
+    if media is not None:
+        write_text(parts, u'<media>', u'</media>', media)
+    if subMerchant is not None:
+        write_items(
+            parts, write_sub_merchant, u'<subMerchant xmlns="http://impl.ws.payline.experian.com">', u'</subMerchant>',
+            u'<subMerchant xmlns="http://impl.ws.payline.experian.com"/>', subMerchant
+        )
+    parts.append(DO_SCHEDULED_WALLET_PAYMENT_END)
+    return u''.join(parts).encode('utf-8')
+
+
+DO_RECURRENT_WALLET_PAYMENT_START = ENVELOPE_START.format(
+    soap_uri=SOAP_URI, name=u'doRecurrentWalletPaymentRequest', namespace=u'http://impl.ws.payline.experian.com'
+)
+DO_RECURRENT_WALLET_PAYMENT_END = ENVELOPE_END.format(name=u'doRecurrentWalletPaymentRequest')
+DO_RECURRENT_WALLET_PAYMENT_NAMES = frozenset((
+    'version', 'payment', 'orderRef', 'orderDate', 'scheduledDate', 'walletId', 'cardInd', 'recurring',
+    'privateDataList', 'order', 'media'
+))
+
+
+def build_do_recurrent_wallet_payment(version=None, payment=None, orderRef=None, orderDate=None, scheduledDate=None,
+                                      walletId=None, cardInd=None, recurring=None, privateDataList=None, order=None,
+                                      media=None):
+    """the doRecurrentWalletPayment request envelope as utf-8 bytes"""
+    parts = [DO_RECURRENT_WALLET_PAYMENT_START]
+    if version is not None:
+        write_text(parts, u'<version>', u'</version>', version)
+    if payment is not None:
+        write_items(
+            parts, write_payment, u'<payment xmlns="http://impl.ws.payline.experian.com">', u'</payment>',
+            u'<payment xmlns="http://impl.ws.payline.experian.com"/>', payment
+        )
+    if orderRef is not None:
+        write_text(parts, u'<orderRef>', u'</orderRef>', orderRef)
+    if orderDate is not None:
+        write_text(parts, u'<orderDate>', u'</orderDate>', orderDate)
+    if scheduledDate is not None:
+        write_text(parts, u'<scheduledDate>', u'</scheduledDate>', scheduledDate)
+    if walletId is not None:
+        write_text(parts, u'<walletId>', u'</walletId>', walletId)
+    if cardInd is not None:
+        write_text(parts, u'<cardInd>', u'</cardInd>', cardInd)
+    if recurring is not None:
+        write_items(
+            parts, write_recurring, u'<recurring xmlns="http://impl.ws.payline.experian.com">', u'</recurring>',
+            u'<recurring xmlns="http://impl.ws.payline.experian.com"/>', recurring
+        )
+    if privateDataList is not None:
+        write_items(
+            parts, write_private_data_list, u'<privateDataList xmlns="http://impl.ws.payline.experian.com">',
+            u'</privateDataList>', u'<privateDataList xmlns="http://impl.ws.payline.experian.com"/>', privateDataList
+        )
+    if order is not None:
+        write_items(
+            parts, write_order, u'<order xmlns="http://impl.ws.payline.experian.com">', u'</order>',
+            u'<order xmlns="http://impl.ws.payline.experian.com"/>', order
+        )
+    if media is not None:
+        write_text(parts, u'<media>', u'</media>', media)
+    parts.append(DO_RECURRENT_WALLET_PAYMENT_END)
+    return u''.join(parts).encode('utf-8')
+
+
+GET_PAYMENT_RECORD_START = ENVELOPE_START.format(
+    soap_uri=SOAP_URI, name=u'getPaymentRecordRequest', namespace=u'http://impl.ws.payline.experian.com'
+)
+GET_PAYMENT_RECORD_END = ENVELOPE_END.format(name=u'getPaymentRecordRequest')
+GET_PAYMENT_RECORD_NAMES = frozenset(('version', 'contractNumber', 'paymentRecordId'))
+
+
+def build_get_payment_record(version=None, contractNumber=None, paymentRecordId=None):
+    """the getPaymentRecord request envelope as utf-8 bytes"""
+    parts = [GET_PAYMENT_RECORD_START]
+    if version is not None:
+        write_text(parts, u'<version>', u'</version>', version)
+    if contractNumber is not None:
+        write_text(parts, u'<contractNumber>', u'</contractNumber>', contractNumber)
+    if paymentRecordId is not None:
+        write_text(parts, u'<paymentRecordId>', u'</paymentRecordId>', paymentRecordId)
+    parts.append(GET_PAYMENT_RECORD_END)
+    return u''.join(parts).encode('utf-8')
+
+
+DISABLE_PAYMENT_RECORD_START = ENVELOPE_START.format(
+    soap_uri=SOAP_URI, name=u'disablePaymentRecordRequest', namespace=u'http://impl.ws.payline.experian.com'
+)
+DISABLE_PAYMENT_RECORD_END = ENVELOPE_END.format(name=u'disablePaymentRecordRequest')
+DISABLE_PAYMENT_RECORD_NAMES = frozenset(('contractNumber', 'paymentRecordId'))
+
+
+def build_disable_payment_record(contractNumber=None, paymentRecordId=None):
+    """the disablePaymentRecord request envelope as utf-8 bytes"""
+    parts = [DISABLE_PAYMENT_RECORD_START]
+    if contractNumber is not None:
+        write_text(parts, u'<contractNumber>', u'</contractNumber>', contractNumber)
+    if paymentRecordId is not None:
+        write_text(parts, u'<paymentRecordId>', u'</paymentRecordId>', paymentRecordId)
+    parts.append(DISABLE_PAYMENT_RECORD_END)
+    return u''.join(parts).encode('utf-8')
+
+
+VERIFY_ENROLLMENT_START = ENVELOPE_START.format(
+    soap_uri=SOAP_URI, name=u'verifyEnrollmentRequest', namespace=u'http://impl.ws.payline.experian.com'
+)
+VERIFY_ENROLLMENT_END = ENVELOPE_END.format(name=u'verifyEnrollmentRequest')
+VERIFY_ENROLLMENT_NAMES = frozenset((
+    'version', 'card', 'payment', 'orderRef', 'mdFieldValue', 'userAgent', 'walletId', 'walletCardInd',
+    'generateVirtualCvx', 'merchantName', 'returnURL'
+))
+
+
+def build_verify_enrollment(version=None, card=None, payment=None, orderRef=None, mdFieldValue=None, userAgent=None,
+                            walletId=None, walletCardInd=None, generateVirtualCvx=None, merchantName=None,
+                            returnURL=None):
+    """the verifyEnrollment request envelope as utf-8 bytes"""
+    parts = [VERIFY_ENROLLMENT_START]
+    if version is not None:
+        write_text(parts, u'<version>', u'</version>', version)
+    if card is not None:
+        write_items(
+            parts, write_card, u'<card xmlns="http://impl.ws.payline.experian.com">', u'</card>',
+            u'<card xmlns="http://impl.ws.payline.experian.com"/>', card
+        )
+    if payment is not None:
+        write_items(
+            parts, write_payment, u'<payment xmlns="http://impl.ws.payline.experian.com">', u'</payment>',
+            u'<payment xmlns="http://impl.ws.payline.experian.com"/>', payment
+        )
+    if orderRef is not None:
+        write_text(parts, u'<orderRef>', u'</orderRef>', orderRef)
+    if mdFieldValue is not None:
+        write_text(parts, u'<mdFieldValue>', u'</mdFieldValue>', mdFieldValue)
+    if userAgent is not None:
+        write_text(parts, u'<userAgent>', u'</userAgent>', userAgent)
+    if walletId is not None:
+        write_text(parts, u'<walletId>', u'</walletId>', walletId)
+    if walletCardInd is not None:
+        write_text(parts, u'<walletCardInd>', u'</walletCardInd>', walletCardInd)
+    if generateVirtualCvx is not None:
+        write_text(parts, u'<generateVirtualCvx>', u'</generateVirtualCvx>', generateVirtualCvx)
+    if merchantName is not None:
+        write_text(parts, u'<merchantName>', u'</merchantName>', merchantName)
+    if returnURL is not None:
+        write_text(parts, u'<returnURL>', u'</returnURL>', returnURL)
+    parts.append(VERIFY_ENROLLMENT_END)
+    return u''.join(parts).encode('utf-8')
+
+
+VERIFY_AUTHENTICATION_START = ENVELOPE_START.format(
+    soap_uri=SOAP_URI, name=u'verifyAuthenticationRequest', namespace=u'http://impl.ws.payline.experian.com'
+)
+VERIFY_AUTHENTICATION_END = ENVELOPE_END.format(name=u'verifyAuthenticationRequest')
+VERIFY_AUTHENTICATION_NAMES = frozenset(('version', 'contractNumber', 'pares', 'md', 'card'))
+
+
+def build_verify_authentication(version=None, contractNumber=None, pares=None, md=None, card=None):
+    """the verifyAuthentication request envelope as utf-8 bytes"""
+    parts = [VERIFY_AUTHENTICATION_START]
+    if version is not None:
+        write_text(parts, u'<version>', u'</version>', version)
+    if contractNumber is not None:
+        write_text(parts, u'<contractNumber>', u'</contractNumber>', contractNumber)
+    if pares is not None:
+        write_text(parts, u'<pares>', u'</pares>', pares)
+    if md is not None:
+        write_text(parts, u'<md>', u'</md>', md)
+    if card is not None:
+        write_items(
+            parts, write_card, u'<card xmlns="http://impl.ws.payline.experian.com">', u'</card>',
+            u'<card xmlns="http://impl.ws.payline.experian.com"/>', card
+        )
+    parts.append(VERIFY_AUTHENTICATION_END)
+    return u''.join(parts).encode('utf-8')
+
+
+CREATE_MERCHANT_START = ENVELOPE_START.format(
+    soap_uri=SOAP_URI, name=u'createMerchantRequest', namespace=u'http://impl.ws.payline.experian.com'
+)
+CREATE_MERCHANT_END = ENVELOPE_END.format(name=u'createMerchantRequest')
+CREATE_MERCHANT_NAMES = frozenset((
+    'corporateName', 'publicName', 'currency', 'nationalID', 'distributor', 'merchantAddress', 'businessInterlocutor',
+    'technicalInterlocutor', 'subscription', 'poss', 'partner'
+))
+
+
+def build_create_merchant(corporateName=None, publicName=None, currency=None, nationalID=None, distributor=None,
+                          merchantAddress=None, businessInterlocutor=None, technicalInterlocutor=None,
+                          subscription=None, poss=None, partner=None):
+    """the createMerchant request envelope as utf-8 bytes"""
+    parts = [CREATE_MERCHANT_START]
+    if corporateName is not None:
+        write_text(parts, u'<corporateName>', u'</corporateName>', corporateName)
+    if publicName is not None:
+        write_text(parts, u'<publicName>', u'</publicName>', publicName)
+    if currency is not None:
+        write_items(
+            parts, write_create_merchant_request_currency, u'<currency xmlns="http://impl.ws.payline.experian.com">',
+            u'</currency>', u'<currency xmlns="http://impl.ws.payline.experian.com"/>', currency
+        )
+    if nationalID is not None:
+        write_items(
+            parts, write_create_merchant_request_national_id,
+            u'<nationalID xmlns="http://impl.ws.payline.experian.com">', u'</nationalID>',
+            u'<nationalID xmlns="http://impl.ws.payline.experian.com"/>', nationalID
+        )
+    if distributor is not None:
+        write_text(parts, u'<distributor>', u'</distributor>', distributor)
+    if merchantAddress is not None:
+        write_items(
+            parts, write_address_interlocutor, u'<merchantAddress xmlns="http://impl.ws.payline.experian.com">',
+            u'</merchantAddress>', u'<merchantAddress xmlns="http://impl.ws.payline.experian.com"/>', merchantAddress
+        )
+    if businessInterlocutor is not None:
+        write_items(
+            parts, write_interlocutor, u'<businessInterlocutor xmlns="http://impl.ws.payline.experian.com">',
+            u'</businessInterlocutor>', u'<businessInterlocutor xmlns="http://impl.ws.payline.experian.com"/>',
+            businessInterlocutor
+        )
+    if technicalInterlocutor is not None:
+        write_items(
+            parts, write_interlocutor, u'<technicalInterlocutor xmlns="http://impl.ws.payline.experian.com">',
+            u'</technicalInterlocutor>', u'<technicalInterlocutor xmlns="http://impl.ws.payline.experian.com"/>',
+            technicalInterlocutor
+        )
+    if subscription is not None:
+        write_items(
+            parts, write_subscription, u'<subscription xmlns="http://impl.ws.payline.experian.com">',
+            u'</subscription>', u'<subscription xmlns="http://impl.ws.payline.experian.com"/>', subscription
+        )
+    if poss is not None:
+        write_items(
+            parts, write_create_merchant_request_poss, u'<poss xmlns="http://impl.ws.payline.experian.com">',
+            u'</poss>', u'<poss xmlns="http://impl.ws.payline.experian.com"/>', poss
+        )
+    if partner is not None:
+        write_text(parts, u'<partner>', u'</partner>', partner)
+    parts.append(CREATE_MERCHANT_END)
+    return u''.join(parts).encode('utf-8')
+
+
+DO_SCORING_CHEQUE_START = ENVELOPE_START.format(
+    soap_uri=SOAP_URI, name=u'doScoringChequeRequest', namespace=u'http://impl.ws.payline.experian.com'
+)
+DO_SCORING_CHEQUE_END = ENVELOPE_END.format(name=u'doScoringChequeRequest')
+DO_SCORING_CHEQUE_NAMES = frozenset(('version', 'payment', 'cheque', 'order', 'privateDataList', 'media'))
+
+
+def build_do_scoring_cheque(version=None, payment=None, cheque=None, order=None, privateDataList=None, media=None):
+    """the doScoringCheque request envelope as utf-8 bytes"""
+    parts = [DO_SCORING_CHEQUE_START]
+    if version is not None:
+        write_text(parts, u'<version>', u'</version>', version)
+    if payment is not None:
+        write_items(
+            parts, write_payment, u'<payment xmlns="http://impl.ws.payline.experian.com">', u'</payment>',
+            u'<payment xmlns="http://impl.ws.payline.experian.com"/>', payment
+        )
+    if cheque is not None:
+        write_items(
+            parts, write_cheque, u'<cheque xmlns="http://impl.ws.payline.experian.com">', u'</cheque>',
+            u'<cheque xmlns="http://impl.ws.payline.experian.com"/>', cheque
+        )
+    if order is not None:
+        write_items(
+            parts, write_order, u'<order xmlns="http://impl.ws.payline.experian.com">', u'</order>',
+            u'<order xmlns="http://impl.ws.payline.experian.com"/>', order
+        )
+    if privateDataList is not None:
+        write_items(
+            parts, write_private_data_list, u'<privateDataList xmlns="http://impl.ws.payline.experian.com">',
+            u'</privateDataList>', u'<privateDataList xmlns="http://impl.ws.payline.experian.com"/>', privateDataList
+        )
+    if media is not None:
+        write_text(parts, u'<media>', u'</media>', media)
+    parts.append(DO_SCORING_CHEQUE_END)
+    return u''.join(parts).encode('utf-8')
+
+
+GET_ENCRYPTION_KEY_START = ENVELOPE_START.format(
+    soap_uri=SOAP_URI, name=u'getEncryptionKeyRequest', namespace=u'http://impl.ws.payline.experian.com'
+)
+GET_ENCRYPTION_KEY_END = ENVELOPE_END.format(name=u'getEncryptionKeyRequest')
+GET_ENCRYPTION_KEY_NAMES = frozenset(('parameters', ))
+
+
+def build_get_encryption_key(parameters=None):
+    """the getEncryptionKey request envelope as utf-8 bytes"""
+    parts = [GET_ENCRYPTION_KEY_START]
+    if parameters is not None:
+        write_text(parts, u'<parameters>', u'</parameters>', parameters)
+    parts.append(GET_ENCRYPTION_KEY_END)
+    return u''.join(parts).encode('utf-8')
+
+
+GET_MERCHANT_SETTINGS_START = ENVELOPE_START.format(
+    soap_uri=SOAP_URI, name=u'getMerchantSettingsRequest', namespace=u'http://impl.ws.payline.experian.com'
+)
+GET_MERCHANT_SETTINGS_END = ENVELOPE_END.format(name=u'getMerchantSettingsRequest')
+GET_MERCHANT_SETTINGS_NAMES = frozenset(('version', ))
+
+
+def build_get_merchant_settings(version=None):
+    """the getMerchantSettings request envelope as utf-8 bytes"""
+    parts = [GET_MERCHANT_SETTINGS_START]
+    if version is not None:
+        write_text(parts, u'<version>', u'</version>', version)
+    parts.append(GET_MERCHANT_SETTINGS_END)
+    return u''.join(parts).encode('utf-8')
+
+
+GET_BALANCE_START = ENVELOPE_START.format(
+    soap_uri=SOAP_URI, name=u'getBalanceRequest', namespace=u'http://impl.ws.payline.experian.com'
+)
+GET_BALANCE_END = ENVELOPE_END.format(name=u'getBalanceRequest')
+GET_BALANCE_NAMES = frozenset(('version', 'cardID', 'contractNumber'))
+
+
+def build_get_balance(version=None, cardID=None, contractNumber=None):
+    """the getBalance request envelope as utf-8 bytes"""
+    parts = [GET_BALANCE_START]
+    if version is not None:
+        write_text(parts, u'<version>', u'</version>', version)
+    if cardID is not None:
+        write_text(parts, u'<cardID>', u'</cardID>', cardID)
+    if contractNumber is not None:
+        write_text(parts, u'<contractNumber>', u'</contractNumber>', contractNumber)
+    parts.append(GET_BALANCE_END)
+    return u''.join(parts).encode('utf-8')
+
+
+GET_TOKEN_START = ENVELOPE_START.format(
+    soap_uri=SOAP_URI, name=u'getTokenRequest', namespace=u'http://impl.ws.payline.experian.com'
+)
+GET_TOKEN_END = ENVELOPE_END.format(name=u'getTokenRequest')
+GET_TOKEN_NAMES = frozenset(('cardNumber', 'expirationDate', 'contractNumber'))
+
+
+def build_get_token(cardNumber=None, expirationDate=None, contractNumber=None):
+    """the getToken request envelope as utf-8 bytes"""
+    parts = [GET_TOKEN_START]
+    if cardNumber is not None:
+        write_text(parts, u'<cardNumber>', u'</cardNumber>', cardNumber)
+    if expirationDate is not None:
+        write_text(parts, u'<expirationDate>', u'</expirationDate>', expirationDate)
+    if contractNumber is not None:
+        write_text(parts, u'<contractNumber>', u'</contractNumber>', contractNumber)
+    parts.append(GET_TOKEN_END)
+    return u''.join(parts).encode('utf-8')
+
+
+UN_BLOCK_START = ENVELOPE_START.format(
+    soap_uri=SOAP_URI, name=u'unBlockRequest', namespace=u'http://impl.ws.payline.experian.com'
+)
+UN_BLOCK_END = ENVELOPE_END.format(name=u'unBlockRequest')
+UN_BLOCK_NAMES = frozenset(('transactionID', 'transactionDate', 'version'))
+
+
+def build_un_block(transactionID=None, transactionDate=None, version=None):
+    """the unBlock request envelope as utf-8 bytes"""
+    parts = [UN_BLOCK_START]
+    if transactionID is not None:
+        write_text(parts, u'<transactionID>', u'</transactionID>', transactionID)
+    if transactionDate is not None:
+        write_text(parts, u'<transactionDate>', u'</transactionDate>', transactionDate)
+    if version is not None:
+        write_text(parts, u'<version>', u'</version>', version)
+    parts.append(UN_BLOCK_END)
+    return u''.join(parts).encode('utf-8')
+
+
+UPDATE_PAYMENT_RECORD_START = ENVELOPE_START.format(
+    soap_uri=SOAP_URI, name=u'updatePaymentRecordRequest', namespace=u'http://impl.ws.payline.experian.com'
+)
+UPDATE_PAYMENT_RECORD_END = ENVELOPE_END.format(name=u'updatePaymentRecordRequest')
+UPDATE_PAYMENT_RECORD_NAMES = frozenset(('version', 'contractNumber', 'paymentRecordId', 'recurring'))
+
+
+def build_update_payment_record(version=None, contractNumber=None, paymentRecordId=None, recurring=None):
+    """the updatePaymentRecord request envelope as utf-8 bytes"""
+    parts = [UPDATE_PAYMENT_RECORD_START]
+    if version is not None:
+        write_text(parts, u'<version>', u'</version>', version)
+    if contractNumber is not None:
+        write_text(parts, u'<contractNumber>', u'</contractNumber>', contractNumber)
+    if paymentRecordId is not None:
+        write_text(parts, u'<paymentRecordId>', u'</paymentRecordId>', paymentRecordId)
+    if recurring is not None:
+        write_items(
+            parts, write_recurring_for_update, u'<recurring xmlns="http://impl.ws.payline.experian.com">',
+            u'</recurring>', u'<recurring xmlns="http://impl.ws.payline.experian.com"/>', recurring
+        )
+    parts.append(UPDATE_PAYMENT_RECORD_END)
+    return u''.join(parts).encode('utf-8')
+
+
+GET_BILLING_RECORD_START = ENVELOPE_START.format(
+    soap_uri=SOAP_URI, name=u'getBillingRecordRequest', namespace=u'http://impl.ws.payline.experian.com'
+)
+GET_BILLING_RECORD_END = ENVELOPE_END.format(name=u'getBillingRecordRequest')
+GET_BILLING_RECORD_NAMES = frozenset(('contractNumber', 'paymentRecordId', 'billingRecordId'))
+
+
+def build_get_billing_record(contractNumber=None, paymentRecordId=None, billingRecordId=None):
+    """the getBillingRecord request envelope as utf-8 bytes"""
+    parts = [GET_BILLING_RECORD_START]
+    if contractNumber is not None:
+        write_text(parts, u'<contractNumber>', u'</contractNumber>', contractNumber)
+    if paymentRecordId is not None:
+        write_text(parts, u'<paymentRecordId>', u'</paymentRecordId>', paymentRecordId)
+    if billingRecordId is not None:
+        write_text(parts, u'<billingRecordId>', u'</billingRecordId>', billingRecordId)
+    parts.append(GET_BILLING_RECORD_END)
+    return u''.join(parts).encode('utf-8')
+
+
+UPDATE_BILLING_RECORD_START = ENVELOPE_START.format(
+    soap_uri=SOAP_URI, name=u'updateBillingRecordRequest', namespace=u'http://impl.ws.payline.experian.com'
+)
+UPDATE_BILLING_RECORD_END = ENVELOPE_END.format(name=u'updateBillingRecordRequest')
+UPDATE_BILLING_RECORD_NAMES = frozenset((
+    'contractNumber', 'paymentRecordId', 'billingRecordId', 'billingRecordForUpdate'
+))
+
+
+def build_update_billing_record(contractNumber=None, paymentRecordId=None, billingRecordId=None,
+                                billingRecordForUpdate=None):
+    """the updateBillingRecord request envelope as utf-8 bytes"""
+    parts = [UPDATE_BILLING_RECORD_START]
+    if contractNumber is not None:
+        write_text(parts, u'<contractNumber>', u'</contractNumber>', contractNumber)
+    if paymentRecordId is not None:
+        write_text(parts, u'<paymentRecordId>', u'</paymentRecordId>', paymentRecordId)
+    if billingRecordId is not None:
+        write_text(parts, u'<billingRecordId>', u'</billingRecordId>', billingRecordId)
+    if billingRecordForUpdate is not None:
+        write_items(
+            parts, write_billing_record_for_update,
+            u'<billingRecordForUpdate xmlns="http://impl.ws.payline.experian.com">', u'</billingRecordForUpdate>',
+            u'<billingRecordForUpdate xmlns="http://impl.ws.payline.experian.com"/>', billingRecordForUpdate
+        )
+    parts.append(UPDATE_BILLING_RECORD_END)
+    return u''.join(parts).encode('utf-8')
+
+
+DO_BANK_TRANSFER_START = ENVELOPE_START.format(
+    soap_uri=SOAP_URI, name=u'doBankTransferRequest', namespace=u'http://impl.ws.payline.experian.com'
+)
+DO_BANK_TRANSFER_END = ENVELOPE_END.format(name=u'doBankTransferRequest')
+DO_BANK_TRANSFER_NAMES = frozenset(('version', 'payment', 'creditor', 'comment', 'transactionID', 'orderID'))
+
+
+def build_do_bank_transfer(version=None, payment=None, creditor=None, comment=None, transactionID=None, orderID=None):
+    """the doBankTransfer request envelope as utf-8 bytes"""
+    parts = [DO_BANK_TRANSFER_START]
+    if version is not None:
+        write_text(parts, u'<version>', u'</version>', version)
+    if payment is not None:
+        write_items(
+            parts, write_payment, u'<payment xmlns="http://impl.ws.payline.experian.com">', u'</payment>',
+            u'<payment xmlns="http://impl.ws.payline.experian.com"/>', payment
+        )
+    if creditor is not None:
+        write_items(
+            parts, write_creditor, u'<creditor xmlns="http://impl.ws.payline.experian.com">', u'</creditor>',
+            u'<creditor xmlns="http://impl.ws.payline.experian.com"/>', creditor
+        )
+    if comment is not None:
+        write_text(parts, u'<comment>', u'</comment>', comment)
+    if transactionID is not None:
+        write_text(parts, u'<transactionID>', u'</transactionID>', transactionID)
+    if orderID is not None:
+        write_text(parts, u'<orderID>', u'</orderID>', orderID)
+    parts.append(DO_BANK_TRANSFER_END)
+    return u''.join(parts).encode('utf-8')
+
+
+IS_REGISTERED_START = ENVELOPE_START.format(
+    soap_uri=SOAP_URI, name=u'isRegisteredRequest', namespace=u'http://impl.ws.payline.experian.com'
+)
+IS_REGISTERED_END = ENVELOPE_END.format(name=u'isRegisteredRequest')
+IS_REGISTERED_NAMES = frozenset(('version', 'payment', 'order', 'privateDataList', 'buyer', 'miscData'))
+
+
+def build_is_registered(version=None, payment=None, order=None, privateDataList=None, buyer=None, miscData=None):
+    """the isRegistered request envelope as utf-8 bytes"""
+    parts = [IS_REGISTERED_START]
+    if version is not None:
+        write_text(parts, u'<version>', u'</version>', version)
+    if payment is not None:
+        write_items(
+            parts, write_payment, u'<payment xmlns="http://impl.ws.payline.experian.com">', u'</payment>',
+            u'<payment xmlns="http://impl.ws.payline.experian.com"/>', payment
+        )
+    if order is not None:
+        write_items(
+            parts, write_order, u'<order xmlns="http://impl.ws.payline.experian.com">', u'</order>',
+            u'<order xmlns="http://impl.ws.payline.experian.com"/>', order
+        )
+    if privateDataList is not None:
+        write_items(
+            parts, write_private_data_list, u'<privateDataList xmlns="http://impl.ws.payline.experian.com">',
+            u'</privateDataList>', u'<privateDataList xmlns="http://impl.ws.payline.experian.com"/>', privateDataList
+        )
+    if buyer is not None:
+        write_items(
+            parts, write_buyer, u'<buyer xmlns="http://impl.ws.payline.experian.com">', u'</buyer>',
+            u'<buyer xmlns="http://impl.ws.payline.experian.com"/>', buyer
+        )
+    if miscData is not None:
+        write_text(parts, u'<miscData>', u'</miscData>', miscData)
+    parts.append(IS_REGISTERED_END)
+    return u''.join(parts).encode('utf-8')
+
+
+# {operation: (function writing the request, names of its elements, soap action)}
+REQUESTS = {
+    'doAuthorization': (build_do_authorization, DO_AUTHORIZATION_NAMES, u'doAuthorization'),
+    'doCapture': (build_do_capture, DO_CAPTURE_NAMES, u'doCapture'),
+    'doReAuthorization': (build_do_re_authorization, DO_RE_AUTHORIZATION_NAMES, u'doReAuthorization'),
+    'doDebit': (build_do_debit, DO_DEBIT_NAMES, u'doDebit'),
+    'doRefund': (build_do_refund, DO_REFUND_NAMES, u'doRefund'),
+    'doReset': (build_do_reset, DO_RESET_NAMES, u'doReset'),
+    'doCredit': (build_do_credit, DO_CREDIT_NAMES, u'doCredit'),
+    'createWallet': (build_create_wallet, CREATE_WALLET_NAMES, u'createWallet'),
+    'updateWallet': (build_update_wallet, UPDATE_WALLET_NAMES, u'updateWallet'),
+    'getWallet': (build_get_wallet, GET_WALLET_NAMES, u'getWallet'),
+    'getCards': (build_get_cards, GET_CARDS_NAMES, u'getCards'),
+    'disableWallet': (build_disable_wallet, DISABLE_WALLET_NAMES, u'disableWallet'),
+    'enableWallet': (build_enable_wallet, ENABLE_WALLET_NAMES, u'enableWallet'),
+    'doImmediateWalletPayment': (
+        build_do_immediate_wallet_payment, DO_IMMEDIATE_WALLET_PAYMENT_NAMES, u'doImmediateWalletPayment'
+    ),
+    'doScheduledWalletPayment': (
+        build_do_scheduled_wallet_payment, DO_SCHEDULED_WALLET_PAYMENT_NAMES, u'doScheduledWalletPayment'
+    ),
+    'doRecurrentWalletPayment': (
+        build_do_recurrent_wallet_payment, DO_RECURRENT_WALLET_PAYMENT_NAMES, u'doRecurrentWalletPayment'
+    ),
+    'getPaymentRecord': (build_get_payment_record, GET_PAYMENT_RECORD_NAMES, u'getPaymentRecord'),
+    'disablePaymentRecord': (build_disable_payment_record, DISABLE_PAYMENT_RECORD_NAMES, u'disablePaymentRecord'),
+    'verifyEnrollment': (build_verify_enrollment, VERIFY_ENROLLMENT_NAMES, u'verifyEnrollment'),
+    'verifyAuthentication': (build_verify_authentication, VERIFY_AUTHENTICATION_NAMES, u'verifyAuthentication'),
+    'createMerchant': (build_create_merchant, CREATE_MERCHANT_NAMES, u'createMerchant'),
+    'doScoringCheque': (build_do_scoring_cheque, DO_SCORING_CHEQUE_NAMES, u'doScoringCheque'),
+    'getEncryptionKey': (build_get_encryption_key, GET_ENCRYPTION_KEY_NAMES, u'getEncryptionKey'),
+    'getMerchantSettings': (build_get_merchant_settings, GET_MERCHANT_SETTINGS_NAMES, u'getMerchantSettings'),
+    'getBalance': (build_get_balance, GET_BALANCE_NAMES, u'getBalance'),
+    'getToken': (build_get_token, GET_TOKEN_NAMES, u'getToken'),
+    'unBlock': (build_un_block, UN_BLOCK_NAMES, u'unBlock'),
+    'updatePaymentRecord': (build_update_payment_record, UPDATE_PAYMENT_RECORD_NAMES, u'updatePaymentRecord'),
+    'getBillingRecord': (build_get_billing_record, GET_BILLING_RECORD_NAMES, u'getBillingRecord'),
+    'updateBillingRecord': (build_update_billing_record, UPDATE_BILLING_RECORD_NAMES, u'updateBillingRecord'),
+    'doBankTransfer': (build_do_bank_transfer, DO_BANK_TRANSFER_NAMES, u'doBankTransfer'),
+    'isRegistered': (build_is_registered, IS_REGISTERED_NAMES, u'isRegistered'),
+}
+
+
+# nodes of the types of the responses: all are created before their elements refer to them
+do_authorization_response_node = CompiledNode()
+result_node = CompiledNode()
+transaction_node = CompiledNode()
+fraud_result_details_node = CompiledNode()
+avs_node = CompiledNode()
+authorization_node = CompiledNode()
+card_out_node = CompiledNode()
+extended_card_type_node = CompiledNode()
+private_data_list_node = CompiledNode()
+private_data_node = CompiledNode()
+do_capture_response_node = CompiledNode()
+do_re_authorization_response_node = CompiledNode()
+do_debit_response_node = CompiledNode()
+do_refund_response_node = CompiledNode()
+do_reset_response_node = CompiledNode()
+do_credit_response_node = CompiledNode()
+create_wallet_response_node = CompiledNode()
+contract_number_wallet_list_node = CompiledNode()
+update_wallet_response_node = CompiledNode()
+get_wallet_response_node = CompiledNode()
+wallet_node = CompiledNode()
+address_node = CompiledNode()
+card_node = CompiledNode()
+payment_data_node = CompiledNode()
+owner_node = CompiledNode()
+address_owner_node = CompiledNode()
+get_cards_response_node = CompiledNode()
+cards_list_node = CompiledNode()
+cards_node = CompiledNode()
+disable_wallet_response_node = CompiledNode()
+wallet_id_list_node = CompiledNode()
+enable_wallet_response_node = CompiledNode()
+do_immediate_wallet_payment_response_node = CompiledNode()
+do_scheduled_wallet_payment_response_node = CompiledNode()
+do_recurrent_wallet_payment_response_node = CompiledNode()
+billing_record_list_node = CompiledNode()
+billing_record_node = CompiledNode()
+get_payment_record_response_node = CompiledNode()
+recurring_node = CompiledNode()
+order_node = CompiledNode()
+details_node = CompiledNode()
+order_detail_node = CompiledNode()
+disable_payment_record_response_node = CompiledNode()
+verify_enrollment_response_node = CompiledNode()
+authentication3_dsecure_node = CompiledNode()
+verify_authentication_response_node = CompiledNode()
+create_merchant_response_node = CompiledNode()
+connection_data_node = CompiledNode()
+do_scoring_cheque_response_node = CompiledNode()
+scoring_cheque_node = CompiledNode()
+get_encryption_key_response_node = CompiledNode()
+key_node = CompiledNode()
+get_merchant_settings_response_node = CompiledNode()
+get_merchant_settings_response_list_point_of_sell_node = CompiledNode()
+point_of_sell_node = CompiledNode()
+point_of_sell_code_mcc_node = CompiledNode()
+ticket_send_node = CompiledNode()
+point_of_sell_contracts_node = CompiledNode()
+virtual_terminal_node = CompiledNode()
+virtual_terminal_functions_node = CompiledNode()
+point_of_sell_custom_payment_page_code_list_node = CompiledNode()
+get_balance_response_node = CompiledNode()
+get_balance_response_balance_node = CompiledNode()
+get_token_response_node = CompiledNode()
+un_block_response_node = CompiledNode()
+update_payment_record_response_node = CompiledNode()
+get_billing_record_response_node = CompiledNode()
+update_billing_record_response_node = CompiledNode()
+do_bank_transfer_response_node = CompiledNode()
+is_registered_response_node = CompiledNode()
+
+result_node.elements = {
+    'code': Element('code'),
+    'shortMessage': Element('shortMessage'),
+    'longMessage': Element('longMessage'),
+    'partnerCode': Element('partnerCode'),
+    'partnerCodeLabel': Element('partnerCodeLabel'),
+}
+
+fraud_result_details_node.elements = {
+    'code': Element('code'),
+    'shortMessage': Element('shortMessage'),
+    'longMessage': Element('longMessage'),
+}
+
+avs_node.elements = {
+    'result': Element('result'),
+    'resultFromAcquirer': Element('resultFromAcquirer'),
+}
+
+transaction_node.elements = {
+    'id': Element('id'),
+    'date': Element('date'),
+    'isDuplicated': Element('isDuplicated'),
+    'isPossibleFraud': Element('isPossibleFraud'),
+    'fraudResult': Element('fraudResult'),
+    'fraudResultDetails': Element('fraudResultDetails', node=fraud_result_details_node),
+    'explanation': Element('explanation'),
+    'threeDSecure': Element('threeDSecure'),
+    'softDescriptor': Element('softDescriptor'),
+    'score': Element('score'),
+    'externalWalletType': Element('externalWalletType'),
+    'externalWalletContractNumber': Element('externalWalletContractNumber'),
+    'partnerAdditionalData': Element('partnerAdditionalData'),
+    'avs': Element('avs', node=avs_node),
+}
+
+authorization_node.elements = {
+    'number': Element('number'),
+    'date': Element('date'),
+}
+
+card_out_node.elements = {
+    'number': Element('number'),
+    'type': Element('type'),
+    'expirationDate': Element('expirationDate'),
+    'cardholder': Element('cardholder'),
+    'token': Element('token'),
+}
+
+extended_card_type_node.elements = {
+    'country': Element('country'),
+    'isCvd': Element('isCvd'),
+    'bank': Element('bank'),
+    'type': Element('type'),
+    'network': Element('network'),
+    'product': Element('product'),
+}
+
+private_data_node.elements = {
+    'key': Element('key'),
+    'value': Element('value'),
+}
+
+private_data_list_node.elements = {
+    'privateData': Element('privateData', node=private_data_node, repeated=True),
+}
+private_data_list_node.item_name = 'privateData'
+
+do_authorization_response_node.elements = {
+    'result': Element('result', node=result_node),
+    'transaction': Element('transaction', node=transaction_node),
+    'authorization': Element('authorization', node=authorization_node),
+    'card': Element('card', node=card_out_node),
+    'extendedCard': Element('extendedCard', node=extended_card_type_node),
+    'privateDataList': Element('privateDataList', node=private_data_list_node),
+    'contractNumber': Element('contractNumber'),
+}
+
+do_capture_response_node.elements = {
+    'result': Element('result', node=result_node),
+    'transaction': Element('transaction', node=transaction_node),
+    'reAuthorization': Element('reAuthorization'),
+}
+
+do_re_authorization_response_node.elements = {
+    'result': Element('result', node=result_node),
+    'transaction': Element('transaction', node=transaction_node),
+    'card': Element('card', node=card_out_node),
+    'extendedCard': Element('extendedCard', node=extended_card_type_node),
+}
+
+do_debit_response_node.elements = {
+    'result': Element('result', node=result_node),
+    'transaction': Element('transaction', node=transaction_node),
+    'card': Element('card', node=card_out_node),
+    'extendedCard': Element('extendedCard', node=extended_card_type_node),
+}
+
+do_refund_response_node.elements = {
+    'result': Element('result', node=result_node),
+    'transaction': Element('transaction', node=transaction_node),
+}
+
+do_reset_response_node.elements = {
+    'result': Element('result', node=result_node),
+    'transaction': Element('transaction', node=transaction_node),
+}
+
+do_credit_response_node.elements = {
+    'result': Element('result', node=result_node),
+    'transaction': Element('transaction', node=transaction_node),
+    'card': Element('card', node=card_out_node),
+    'extendedCard': Element('extendedCard', node=extended_card_type_node),
+}
+
+contract_number_wallet_list_node.elements = {
+    'contractNumberWallet': Element('contractNumberWallet', repeated=True),
+}
+contract_number_wallet_list_node.item_name = 'contractNumberWallet'
+
+create_wallet_response_node.elements = {
+    'result': Element('result', node=result_node),
+    'card': Element('card', node=card_out_node),
+    'extendedCard': Element('extendedCard', node=extended_card_type_node),
+    'contractNumberWalletList': Element('contractNumberWalletList', node=contract_number_wallet_list_node),
+    'fraudResultDetails': Element('fraudResultDetails', node=fraud_result_details_node),
+}
+
+update_wallet_response_node.elements = {
+    'result': Element('result', node=result_node),
+    'card': Element('card', node=card_out_node),
+    'extendedCard': Element('extendedCard', node=extended_card_type_node),
+    'contractNumberWalletList': Element('contractNumberWalletList', node=contract_number_wallet_list_node),
+}
+
+address_node.elements = {
+    'title': Element('title'),
+    'name': Element('name'),
+    'firstName': Element('firstName'),
+    'lastName': Element('lastName'),
+    'street1': Element('street1'),
+    'street2': Element('street2'),
+    'cityName': Element('cityName'),
+    'zipCode': Element('zipCode'),
+    'country': Element('country'),
+    'phone': Element('phone'),
+    'state': Element('state'),
+    'county': Element('county'),
+    'phoneType': Element('phoneType'),
+}
+
+payment_data_node.elements = {
+    'transactionID': Element('transactionID'),
+    'network': Element('network'),
+    'tokenData': Element('tokenData'),
+}
+
+card_node.elements = {
+    'encryptionKeyId': Element('encryptionKeyId'),
+    'encryptedData': Element('encryptedData'),
+    'number': Element('number'),
+    'type': Element('type'),
+    'expirationDate': Element('expirationDate'),
+    'cvx': Element('cvx'),
+    'ownerBirthdayDate': Element('ownerBirthdayDate'),
+    'password': Element('password'),
+    'cardPresent': Element('cardPresent'),
+    'cardholder': Element('cardholder'),
+    'token': Element('token'),
+    'paymentData': Element('paymentData', node=payment_data_node),
+}
+
+wallet_node.elements = {
+    'walletId': Element('walletId'),
+    'lastName': Element('lastName'),
+    'firstName': Element('firstName'),
+    'email': Element('email'),
+    'shippingAddress': Element('shippingAddress', node=address_node),
+    'card': Element('card', node=card_node),
+    'comment': Element('comment'),
+    'default': Element('default'),
+    'cardStatus': Element('cardStatus'),
+    'cardBrand': Element('cardBrand'),
+}
+
+address_owner_node.elements = {
+    'street': Element('street'),
+    'cityName': Element('cityName'),
+    'zipCode': Element('zipCode'),
+    'country': Element('country'),
+    'phone': Element('phone'),
+}
+
+owner_node.elements = {
+    'lastName': Element('lastName'),
+    'firstName': Element('firstName'),
+    'billingAddress': Element('billingAddress', node=address_owner_node),
+    'issueCardDate': Element('issueCardDate'),
+}
+
+get_wallet_response_node.elements = {
+    'result': Element('result', node=result_node),
+    'wallet': Element('wallet', node=wallet_node),
+    'owner': Element('owner', node=owner_node),
+    'isDisabled': Element('isDisabled'),
+    'disableDate': Element('disableDate'),
+    'privateDataList': Element('privateDataList', node=private_data_list_node),
+    'extendedCard': Element('extendedCard', node=extended_card_type_node),
+    'contractNumberWalletList': Element('contractNumberWalletList', node=contract_number_wallet_list_node),
+    'media': Element('media'),
+}
+
+cards_node.elements = {
+    'walletId': Element('walletId'),
+    'lastName': Element('lastName'),
+    'firstName': Element('firstName'),
+    'email': Element('email'),
+    'shippingAddress': Element('shippingAddress', node=address_node),
+    'card': Element('card', node=card_node),
+    'cardInd': Element('cardInd'),
+    'comment': Element('comment'),
+    'isDisabled': Element('isDisabled'),
+    'disableDate': Element('disableDate'),
+    'extendedCard': Element('extendedCard', node=extended_card_type_node),
+    'default': Element('default'),
+}
+
+cards_list_node.elements = {
+    'cards': Element('cards', node=cards_node, repeated=True),
+}
+cards_list_node.item_name = 'cards'
+
+get_cards_response_node.elements = {
+    'result': Element('result', node=result_node),
+    'cardsList': Element('cardsList', node=cards_list_node),
+    'owner': Element('owner', node=owner_node),
+    'privateDataList': Element('privateDataList', node=private_data_list_node),
+}
+
+wallet_id_list_node.elements = {
+    'walletId': Element('walletId', repeated=True),
+}
+wallet_id_list_node.item_name = 'walletId'
+
+disable_wallet_response_node.elements = {
+    'result': Element('result', node=result_node),
+    'walletIdList': Element('walletIdList', node=wallet_id_list_node),
+}
+
+enable_wallet_response_node.elements = {
+    'result': Element('result', node=result_node),
+}
+
+do_immediate_wallet_payment_response_node.elements = {
+    'result': Element('result', node=result_node),
+    'transaction': Element('transaction', node=transaction_node),
+    'authorization': Element('authorization', node=authorization_node),
+}
+
+do_scheduled_wallet_payment_response_node.elements = {
+    'result': Element('result', node=result_node),
+    'paymentRecordId': Element('paymentRecordId'),
+}
+
+billing_record_node.elements = {
+    'date': Element('date'),
+    'amount': Element('amount'),
+    'status': Element('status'),
+    'result': Element('result', node=result_node),
+    'transaction': Element('transaction', node=transaction_node),
+    'authorization': Element('authorization', node=authorization_node),
+    'nbTry': Element('nbTry'),
+    'rank': Element('rank'),
+}
+
+billing_record_list_node.elements = {
+    'billingRecord': Element('billingRecord', node=billing_record_node, repeated=True),
+}
+billing_record_list_node.item_name = 'billingRecord'
+
+do_recurrent_wallet_payment_response_node.elements = {
+    'result': Element('result', node=result_node),
+    'paymentRecordId': Element('paymentRecordId'),
+    'billingRecordList': Element('billingRecordList', node=billing_record_list_node),
+}
+
+recurring_node.elements = {
+    'firstAmount': Element('firstAmount'),
+    'amount': Element('amount'),
+    'billingCycle': Element('billingCycle'),
+    'billingLeft': Element('billingLeft'),
+    'billingDay': Element('billingDay'),
+    'startDate': Element('startDate'),
+    'endDate': Element('endDate'),
+    'newAmount': Element('newAmount'),
+    'amountModificationDate': Element('amountModificationDate'),
+}
+
+order_detail_node.elements = {
+    'ref': Element('ref'),
+    'price': Element('price'),
+    'quantity': Element('quantity'),
+    'comment': Element('comment'),
+    'category': Element('category'),
+    'brand': Element('brand'),
+    'subcategory1': Element('subcategory1'),
+    'subcategory2': Element('subcategory2'),
+    'additionalData': Element('additionalData'),
+    'taxRate': Element('taxRate'),
+}
+
+details_node.elements = {
+    'details': Element('details', node=order_detail_node, repeated=True),
+}
+details_node.item_name = 'details'
+
+order_node.elements = {
+    'ref': Element('ref'),
+    'origin': Element('origin'),
+    'country': Element('country'),
+    'taxes': Element('taxes'),
+    'amount': Element('amount'),
+    'currency': Element('currency'),
+    'date': Element('date'),
+    'details': Element('details', node=details_node),
+    'deliveryTime': Element('deliveryTime'),
+    'deliveryMode': Element('deliveryMode'),
+    'deliveryExpectedDate': Element('deliveryExpectedDate'),
+    'deliveryExpectedDelay': Element('deliveryExpectedDelay'),
+    'deliveryCharge': Element('deliveryCharge'),
+}
+
+get_payment_record_response_node.elements = {
+    'result': Element('result', node=result_node),
+    'recurring': Element('recurring', node=recurring_node),
+    'isDisabled': Element('isDisabled'),
+    'disableDate': Element('disableDate'),
+    'billingRecordList': Element('billingRecordList', node=billing_record_list_node),
+    'privateDataList': Element('privateDataList', node=private_data_list_node),
+    'order': Element('order', node=order_node),
+    'walletId': Element('walletId'),
+}
+
+disable_payment_record_response_node.elements = {
+    'result': Element('result', node=result_node),
+}
+
+authentication3_dsecure_node.elements = {
+    'md': Element('md'),
+    'pares': Element('pares'),
+    'xid': Element('xid'),
+    'eci': Element('eci'),
+    'cavv': Element('cavv'),
+    'cavvAlgorithm': Element('cavvAlgorithm'),
+    'vadsResult': Element('vadsResult'),
+    'typeSecurisation': Element('typeSecurisation'),
+    'PaResStatus': Element('PaResStatus'),
+    'VeResStatus': Element('VeResStatus'),
+}
+
+verify_enrollment_response_node.elements = {
+    'result': Element('result', node=result_node),
+    'actionUrl': Element('actionUrl'),
+    'actionMethod': Element('actionMethod'),
+    'pareqFieldName': Element('pareqFieldName'),
+    'pareqFieldValue': Element('pareqFieldValue'),
+    'termUrlName': Element('termUrlName'),
+    'termUrlValue': Element('termUrlValue'),
+    'mdFieldName': Element('mdFieldName'),
+    'mdFieldValue': Element('mdFieldValue'),
+    'mpiResult': Element('mpiResult'),
+    'authentication3DSecure': Element('authentication3DSecure', node=authentication3_dsecure_node),
+    'virtualCvx': Element('virtualCvx'),
+    'token': Element('token'),
+}
+
+verify_authentication_response_node.elements = {
+    'result': Element('result', node=result_node),
+    'authentication3DSecure': Element('authentication3DSecure', node=authentication3_dsecure_node),
+    'mpiResult': Element('mpiResult'),
+}
+
+connection_data_node.elements = {
+    'merchantId': Element('merchantId'),
+    'userId': Element('userId'),
+    'password': Element('password'),
+    'secretQuestion': Element('secretQuestion'),
+    'secretAnswer': Element('secretAnswer'),
+}
+
+create_merchant_response_node.elements = {
+    'result': Element('result', node=result_node),
+    'connectionData': Element('connectionData', node=connection_data_node),
+}
+
+scoring_cheque_node.elements = {
+    'chequeNumber': Element('chequeNumber'),
+    'additionalDataResponse': Element('additionalDataResponse'),
+    'terminalId': Element('terminalId'),
+    'additionalPrivateData': Element('additionalPrivateData'),
+}
+
+do_scoring_cheque_response_node.elements = {
+    'result': Element('result', node=result_node),
+    'transaction': Element('transaction', node=transaction_node),
+    'scoringCheque': Element('scoringCheque', node=scoring_cheque_node),
+}
+
+key_node.elements = {
+    'keyId': Element('keyId', convert=CONVERT_INTEGER),
+    'modulus': Element('modulus'),
+    'publicExponent': Element('publicExponent'),
+    'expirationDate': Element('expirationDate'),
+}
+
+get_encryption_key_response_node.elements = {
+    'result': Element('result', node=result_node),
+    'key': Element('key', node=key_node),
+}
+
+point_of_sell_code_mcc_node.elements = {}
+
+ticket_send_node.elements = {
+    'toBuyer': Element('toBuyer', convert=CONVERT_BOOLEAN),
+    'toMerchant': Element('toMerchant', convert=CONVERT_BOOLEAN),
+}
+
+point_of_sell_contracts_node.elements = {}
+
+virtual_terminal_functions_node.elements = {}
+
+virtual_terminal_node.elements = {
+    'label': Element('label'),
+    'inactivityDelay': Element('inactivityDelay', convert=CONVERT_INT),
+    'logo': Element('logo'),
+    'functions': Element('functions', node=virtual_terminal_functions_node),
+}
+
+point_of_sell_custom_payment_page_code_list_node.elements = {}
+
+point_of_sell_node.elements = {
+    'siret': Element('siret'),
+    'codeMcc': Element('codeMcc', node=point_of_sell_code_mcc_node),
+    'label': Element('label'),
+    'webmasterEmail': Element('webmasterEmail'),
+    'comments': Element('comments'),
+    'webstoreURL': Element('webstoreURL'),
+    'notificationURL': Element('notificationURL'),
+    'privateLifeURL': Element('privateLifeURL'),
+    'saleCondURL': Element('saleCondURL'),
+    'buyerMustAcceptSaleCond': Element('buyerMustAcceptSaleCond', convert=CONVERT_BOOLEAN),
+    'endOfPaymentRedirection': Element('endOfPaymentRedirection', convert=CONVERT_BOOLEAN),
+    'ticketSend': Element('ticketSend', node=ticket_send_node),
+    'contracts': Element('contracts', node=point_of_sell_contracts_node),
+    'virtualTerminal': Element('virtualTerminal', node=virtual_terminal_node),
+    'customPaymentPageCodeList': Element(
+        'customPaymentPageCodeList', node=point_of_sell_custom_payment_page_code_list_node
+    ),
+}
+
+get_merchant_settings_response_list_point_of_sell_node.elements = {
+    'pointOfSell': Element('pointOfSell', node=point_of_sell_node, repeated=True),
+}
+get_merchant_settings_response_list_point_of_sell_node.item_name = 'pointOfSell'
+
+get_merchant_settings_response_node.elements = {
+    'result': Element('result', node=result_node),
+    'listPointOfSell': Element('listPointOfSell', node=get_merchant_settings_response_list_point_of_sell_node),
+}
+
+get_balance_response_balance_node.elements = {
+    'amount': Element('amount'),
+    'currency': Element('currency'),
+}
+
+get_balance_response_node.elements = {
+    'result': Element('result', node=result_node),
+    'balance': Element('balance', node=get_balance_response_balance_node),
+    'crdproduct': Element('crdproduct'),
+    'crdprogram': Element('crdprogram'),
+    'crddesign': Element('crddesign'),
+}
+
+get_token_response_node.elements = {
+    'result': Element('result', node=result_node),
+    'token': Element('token'),
+    'maskedCardNumber': Element('maskedCardNumber'),
+    'expirationDate': Element('expirationDate'),
+    'virtualCard': Element('virtualCard'),
+    'cardType': Element('cardType'),
+    'cardProduct': Element('cardProduct'),
+    'acceptanceNetwork': Element('acceptanceNetwork'),
+    'bank': Element('bank'),
+}
+
+un_block_response_node.elements = {
+    'result': Element('result', node=result_node),
+}
+
+update_payment_record_response_node.elements = {
+    'result': Element('result', node=result_node),
+    'recurring': Element('recurring', node=recurring_node),
+    'isDisabled': Element('isDisabled'),
+    'disableDate': Element('disableDate'),
+    'privateDataList': Element('privateDataList', node=private_data_list_node),
+    'order': Element('order', node=order_node),
+    'walletId': Element('walletId'),
+}
+
+get_billing_record_response_node.elements = {
+    'result': Element('result', node=result_node),
+    'recurring': Element('recurring', node=recurring_node),
+    'isDisabled': Element('isDisabled'),
+    'disableDate': Element('disableDate'),
+    'billingRecord': Element('billingRecord', node=billing_record_node),
+    'order': Element('order', node=order_node),
+    'privateDataList': Element('privateDataList', node=private_data_list_node),
+    'walletId': Element('walletId'),
+}
+
+update_billing_record_response_node.elements = {
+    'result': Element('result', node=result_node),
+    'recurring': Element('recurring', node=recurring_node),
+    'isDisabled': Element('isDisabled'),
+    'disableDate': Element('disableDate'),
+    'billingRecord': Element('billingRecord', node=billing_record_node),
+    'order': Element('order', node=order_node),
+    'privateDataList': Element('privateDataList', node=private_data_list_node),
+    'walletId': Element('walletId'),
+}
+
+do_bank_transfer_response_node.elements = {
+    'result': Element('result', node=result_node),
+    'transaction': Element('transaction', node=transaction_node),
+}
+
+is_registered_response_node.elements = {
+    'result': Element('result', node=result_node),
+    'token': Element('token'),
+    'data': Element('data'),
+}
+
+# {operation: node of the response}
+RESPONSES = {
+    'doAuthorization': do_authorization_response_node,
+    'doCapture': do_capture_response_node,
+    'doReAuthorization': do_re_authorization_response_node,
+    'doDebit': do_debit_response_node,
+    'doRefund': do_refund_response_node,
+    'doReset': do_reset_response_node,
+    'doCredit': do_credit_response_node,
+    'createWallet': create_wallet_response_node,
+    'updateWallet': update_wallet_response_node,
+    'getWallet': get_wallet_response_node,
+    'getCards': get_cards_response_node,
+    'disableWallet': disable_wallet_response_node,
+    'enableWallet': enable_wallet_response_node,
+    'doImmediateWalletPayment': do_immediate_wallet_payment_response_node,
+    'doScheduledWalletPayment': do_scheduled_wallet_payment_response_node,
+    'doRecurrentWalletPayment': do_recurrent_wallet_payment_response_node,
+    'getPaymentRecord': get_payment_record_response_node,
+    'disablePaymentRecord': disable_payment_record_response_node,
+    'verifyEnrollment': verify_enrollment_response_node,
+    'verifyAuthentication': verify_authentication_response_node,
+    'createMerchant': create_merchant_response_node,
+    'doScoringCheque': do_scoring_cheque_response_node,
+    'getEncryptionKey': get_encryption_key_response_node,
+    'getMerchantSettings': get_merchant_settings_response_node,
+    'getBalance': get_balance_response_node,
+    'getToken': get_token_response_node,
+    'unBlock': un_block_response_node,
+    'updatePaymentRecord': update_payment_record_response_node,
+    'getBillingRecord': get_billing_record_response_node,
+    'updateBillingRecord': update_billing_record_response_node,
+    'doBankTransfer': do_bank_transfer_response_node,
+    'isRegistered': is_registered_response_node,
+}
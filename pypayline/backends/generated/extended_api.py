@@ -0,0 +1,530 @@
+# -*- coding: utf-8 -*-
+"""
+Python client for the Payline SOAP API
+ExtendedAPI operations: the functions writing the requests and the nodes parsing the responses
+Generated by python -m pypayline.codegen: do not edit
+"""
+
+from __future__ import print_function
+
+from pysimplesoap.client import soap_namespaces
+
+from pypayline.backends.parser import CompiledNode, Element
+from pypayline.backends.serializer import ENVELOPE_END, ENVELOPE_START, write_text
+
+
+API_NAME = u'ExtendedAPI'
+
+# SHA-256 of the WSDL files (full and pruned) the module has been generated from
+WSDL_DIGESTS = (
+    '3b23b10ff0ba2a035226b5d7de36545117150697dde2204f63df350c159373ba',
+    '8a50ce382d1af3bea588729691669406a2df9d02f9ea3afd4c451939e1a8bdd7',
+)
+
+SOAP_URI = soap_namespaces['soap']
+
+
+GET_TRANSACTION_DETAILS_START = ENVELOPE_START.format(
+    soap_uri=SOAP_URI, name=u'getTransactionDetailsRequest', namespace=u'http://impl.ws.payline.experian.com'
+)
+GET_TRANSACTION_DETAILS_END = ENVELOPE_END.format(name=u'getTransactionDetailsRequest')
+GET_TRANSACTION_DETAILS_NAMES = frozenset((
+    'version', 'transactionId', 'orderRef', 'startDate', 'endDate', 'transactionHistory', 'archiveSearch'
+))
+
+
+def build_get_transaction_details(version=None, transactionId=None, orderRef=None, startDate=None, endDate=None,
+                                  transactionHistory=None, archiveSearch=None):
+    """the getTransactionDetails request envelope as utf-8 bytes"""
+    parts = [GET_TRANSACTION_DETAILS_START]
+    if version is not None:
+        write_text(parts, u'<version>', u'</version>', version)
+    if transactionId is not None:
+        write_text(parts, u'<transactionId>', u'</transactionId>', transactionId)
+    if orderRef is not None:
+        write_text(parts, u'<orderRef>', u'</orderRef>', orderRef)
+    if startDate is not None:
+        write_text(parts, u'<startDate>', u'</startDate>', startDate)
+    if endDate is not None:
+        write_text(parts, u'<endDate>', u'</endDate>', endDate)
+    if transactionHistory is not None:
+        write_text(parts, u'<transactionHistory>', u'</transactionHistory>', transactionHistory)
+    if archiveSearch is not None:
+        write_text(parts, u'<archiveSearch>', u'</archiveSearch>', archiveSearch)
+    parts.append(GET_TRANSACTION_DETAILS_END)
+    return u''.join(parts).encode('utf-8')
+
+
+TRANSACTIONS_SEARCH_START = ENVELOPE_START.format(
+    soap_uri=SOAP_URI, name=u'transactionsSearchRequest', namespace=u'http://impl.ws.payline.experian.com'
+)
+TRANSACTIONS_SEARCH_END = ENVELOPE_END.format(name=u'transactionsSearchRequest')
+TRANSACTIONS_SEARCH_NAMES = frozenset((
+    'version', 'transactionId', 'orderRef', 'startDate', 'endDate', 'contractNumber', 'authorizationNumber',
+    'returnCode', 'paymentMean', 'transactionType', 'name', 'firstName', 'email', 'cardNumber', 'currency', 'minAmount',
+    'maxAmount', 'walletId', 'sequenceNumber', 'token'
+))
+
+
+def build_transactions_search(version=None, transactionId=None, orderRef=None, startDate=None, endDate=None,
+                              contractNumber=None, authorizationNumber=None, returnCode=None, paymentMean=None,
+                              transactionType=None, name=None, firstName=None, email=None, cardNumber=None,
+                              currency=None, minAmount=None, maxAmount=None, walletId=None, sequenceNumber=None,
+                              token=None):
+    """the transactionsSearch request envelope as utf-8 bytes"""
+    parts = [TRANSACTIONS_SEARCH_START]
+    if version is not None:
+        write_text(parts, u'<version>', u'</version>', version)
+    if transactionId is not None:
+        write_text(parts, u'<transactionId>', u'</transactionId>', transactionId)
+    if orderRef is not None:
+        write_text(parts, u'<orderRef>', u'</orderRef>', orderRef)
+    if startDate is not None:
+        write_text(parts, u'<startDate>', u'</startDate>', startDate)
+    if endDate is not None:
+        write_text(parts, u'<endDate>', u'</endDate>', endDate)
+    if contractNumber is not None:
+        write_text(parts, u'<contractNumber>', u'</contractNumber>', contractNumber)
+    if authorizationNumber is not None:
+        write_text(parts, u'<authorizationNumber>', u'</authorizationNumber>', authorizationNumber)
+    if returnCode is not None:
+        write_text(parts, u'<returnCode>', u'</returnCode>', returnCode)
+    if paymentMean is not None:
+        write_text(parts, u'<paymentMean>', u'</paymentMean>', paymentMean)
+    if transactionType is not None:
+        write_text(parts, u'<transactionType>', u'</transactionType>', transactionType)
+    if name is not None:
+        write_text(parts, u'<name>', u'</name>', name)
+    if firstName is not None:
+        write_text(parts, u'<firstName>', u'</firstName>', firstName)
+    if email is not None:
+        write_text(parts, u'<email>', u'</email>', email)
+    if cardNumber is not None:
+        write_text(parts, u'<cardNumber>', u'</cardNumber>', cardNumber)
+    if currency is not None:
+        write_text(parts, u'<currency>', u'</currency>', currency)
+    if minAmount is not None:
+        write_text(parts, u'<minAmount>', u'</minAmount>', minAmount)
+    if maxAmount is not None:
+        write_text(parts, u'<maxAmount>', u'</maxAmount>', maxAmount)
+    if walletId is not None:
+        write_text(parts, u'<walletId>', u'</walletId>', walletId)
+    if sequenceNumber is not None:
+        write_text(parts, u'<sequenceNumber>', u'</sequenceNumber>', sequenceNumber)
+    if token is not None:
+        write_text(parts, u'<token>', u'</token>', token)
+    parts.append(TRANSACTIONS_SEARCH_END)
+    return u''.join(parts).encode('utf-8')
+
+
+GET_ALERT_DETAILS_START = ENVELOPE_START.format(
+    soap_uri=SOAP_URI, name=u'getAlertDetailsRequest', namespace=u'http://impl.ws.payline.experian.com'
+)
+GET_ALERT_DETAILS_END = ENVELOPE_END.format(name=u'getAlertDetailsRequest')
+GET_ALERT_DETAILS_NAMES = frozenset(('version', 'AlertId', 'TransactionId', 'TransactionDate'))
+
+
+def build_get_alert_details(version=None, AlertId=None, TransactionId=None, TransactionDate=None):
+    """the getAlertDetails request envelope as utf-8 bytes"""
+    parts = [GET_ALERT_DETAILS_START]
+    if version is not None:
+        write_text(parts, u'<version>', u'</version>', version)
+    if AlertId is not None:
+        write_text(parts, u'<AlertId>', u'</AlertId>', AlertId)
+    if TransactionId is not None:
+        write_text(parts, u'<TransactionId>', u'</TransactionId>', TransactionId)
+    if TransactionDate is not None:
+        write_text(parts, u'<TransactionDate>', u'</TransactionDate>', TransactionDate)
+    parts.append(GET_ALERT_DETAILS_END)
+    return u''.join(parts).encode('utf-8')
+
+
+# {operation: (function writing the request, names of its elements, soap action)}
+REQUESTS = {
+    'getTransactionDetails': (build_get_transaction_details, GET_TRANSACTION_DETAILS_NAMES, u'getTransactionDetails'),
+    'transactionsSearch': (build_transactions_search, TRANSACTIONS_SEARCH_NAMES, u'transactionsSearch'),
+    'getAlertDetails': (build_get_alert_details, GET_ALERT_DETAILS_NAMES, u'getAlertDetails'),
+}
+
+
+# nodes of the types of the responses: all are created before their elements refer to them
+get_transaction_details_response_node = CompiledNode()
+result_node = CompiledNode()
+transaction_node = CompiledNode()
+fraud_result_details_node = CompiledNode()
+avs_node = CompiledNode()
+payment_node = CompiledNode()
+authorization_node = CompiledNode()
+order_node = CompiledNode()
+details_node = CompiledNode()
+order_detail_node = CompiledNode()
+buyer_node = CompiledNode()
+address_node = CompiledNode()
+private_data_list_node = CompiledNode()
+private_data_node = CompiledNode()
+card_out_node = CompiledNode()
+extended_card_type_node = CompiledNode()
+associated_transactions_list_node = CompiledNode()
+associated_transactions_node = CompiledNode()
+status_history_list_node = CompiledNode()
+status_history_node = CompiledNode()
+payment_additional_list_node = CompiledNode()
+payment_additional_node = CompiledNode()
+authentication3_dsecure_node = CompiledNode()
+bank_account_data_node = CompiledNode()
+sub_merchant_node = CompiledNode()
+transactions_search_response_node = CompiledNode()
+transaction_list_node = CompiledNode()
+get_alert_details_response_node = CompiledNode()
+customer_trans_hist_node = CompiledNode()
+customer_trans_node = CompiledNode()
+payment_means_trans_hist_node = CompiledNode()
+payment_means_trans_node = CompiledNode()
+alerts_trans_hist_node = CompiledNode()
+alerts_trans_node = CompiledNode()
+
+result_node.elements = {
+    'code': Element('code'),
+    'shortMessage': Element('shortMessage'),
+    'longMessage': Element('longMessage'),
+    'partnerCode': Element('partnerCode'),
+    'partnerCodeLabel': Element('partnerCodeLabel'),
+}
+
+fraud_result_details_node.elements = {
+    'code': Element('code'),
+    'shortMessage': Element('shortMessage'),
+    'longMessage': Element('longMessage'),
+}
+
+avs_node.elements = {
+    'result': Element('result'),
+    'resultFromAcquirer': Element('resultFromAcquirer'),
+}
+
+transaction_node.elements = {
+    'id': Element('id'),
+    'date': Element('date'),
+    'isDuplicated': Element('isDuplicated'),
+    'isPossibleFraud': Element('isPossibleFraud'),
+    'fraudResult': Element('fraudResult'),
+    'fraudResultDetails': Element('fraudResultDetails', node=fraud_result_details_node),
+    'explanation': Element('explanation'),
+    'threeDSecure': Element('threeDSecure'),
+    'softDescriptor': Element('softDescriptor'),
+    'score': Element('score'),
+    'externalWalletType': Element('externalWalletType'),
+    'externalWalletContractNumber': Element('externalWalletContractNumber'),
+    'partnerAdditionalData': Element('partnerAdditionalData'),
+    'avs': Element('avs', node=avs_node),
+}
+
+payment_node.elements = {
+    'amount': Element('amount'),
+    'currency': Element('currency'),
+    'action': Element('action'),
+    'mode': Element('mode'),
+    'contractNumber': Element('contractNumber'),
+    'differedActionDate': Element('differedActionDate'),
+    'method': Element('method'),
+    'softDescriptor': Element('softDescriptor'),
+    'cardBrand': Element('cardBrand'),
+    'registrationToken': Element('registrationToken'),
+}
+
+authorization_node.elements = {
+    'number': Element('number'),
+    'date': Element('date'),
+}
+
+order_detail_node.elements = {
+    'ref': Element('ref'),
+    'price': Element('price'),
+    'quantity': Element('quantity'),
+    'comment': Element('comment'),
+    'category': Element('category'),
+    'brand': Element('brand'),
+    'subcategory1': Element('subcategory1'),
+    'subcategory2': Element('subcategory2'),
+    'additionalData': Element('additionalData'),
+    'taxRate': Element('taxRate'),
+}
+
+details_node.elements = {
+    'details': Element('details', node=order_detail_node, repeated=True),
+}
+details_node.item_name = 'details'
+
+order_node.elements = {
+    'ref': Element('ref'),
+    'origin': Element('origin'),
+    'country': Element('country'),
+    'taxes': Element('taxes'),
+    'amount': Element('amount'),
+    'currency': Element('currency'),
+    'date': Element('date'),
+    'details': Element('details', node=details_node),
+    'deliveryTime': Element('deliveryTime'),
+    'deliveryMode': Element('deliveryMode'),
+    'deliveryExpectedDate': Element('deliveryExpectedDate'),
+    'deliveryExpectedDelay': Element('deliveryExpectedDelay'),
+    'deliveryCharge': Element('deliveryCharge'),
+}
+
+address_node.elements = {
+    'title': Element('title'),
+    'name': Element('name'),
+    'firstName': Element('firstName'),
+    'lastName': Element('lastName'),
+    'street1': Element('street1'),
+    'street2': Element('street2'),
+    'cityName': Element('cityName'),
+    'zipCode': Element('zipCode'),
+    'country': Element('country'),
+    'phone': Element('phone'),
+    'state': Element('state'),
+    'county': Element('county'),
+    'phoneType': Element('phoneType'),
+}
+
+buyer_node.elements = {
+    'title': Element('title'),
+    'lastName': Element('lastName'),
+    'firstName': Element('firstName'),
+    'email': Element('email'),
+    'shippingAdress': Element('shippingAdress', node=address_node),
+    'billingAddress': Element('billingAddress', node=address_node),
+    'accountCreateDate': Element('accountCreateDate'),
+    'accountAverageAmount': Element('accountAverageAmount'),
+    'accountOrderCount': Element('accountOrderCount'),
+    'walletId': Element('walletId'),
+    'walletDisplayed': Element('walletDisplayed'),
+    'walletSecured': Element('walletSecured'),
+    'walletCardInd': Element('walletCardInd'),
+    'ip': Element('ip'),
+    'mobilePhone': Element('mobilePhone'),
+    'customerId': Element('customerId'),
+    'legalStatus': Element('legalStatus'),
+    'legalDocument': Element('legalDocument'),
+    'birthDate': Element('birthDate'),
+    'fingerprintID': Element('fingerprintID'),
+    'deviceFingerprint': Element('deviceFingerprint'),
+    'isBot': Element('isBot'),
+    'isIncognito': Element('isIncognito'),
+    'isBehindProxy': Element('isBehindProxy'),
+    'isFromTor': Element('isFromTor'),
+    'isEmulator': Element('isEmulator'),
+    'isRooted': Element('isRooted'),
+    'hasTimezoneMismatch': Element('hasTimezoneMismatch'),
+}
+
+private_data_node.elements = {
+    'key': Element('key'),
+    'value': Element('value'),
+}
+
+private_data_list_node.elements = {
+    'privateData': Element('privateData', node=private_data_node, repeated=True),
+}
+private_data_list_node.item_name = 'privateData'
+
+card_out_node.elements = {
+    'number': Element('number'),
+    'type': Element('type'),
+    'expirationDate': Element('expirationDate'),
+    'cardholder': Element('cardholder'),
+    'token': Element('token'),
+}
+
+extended_card_type_node.elements = {
+    'country': Element('country'),
+    'isCvd': Element('isCvd'),
+    'bank': Element('bank'),
+    'type': Element('type'),
+    'network': Element('network'),
+    'product': Element('product'),
+}
+
+associated_transactions_node.elements = {
+    'transactionId': Element('transactionId'),
+    'type': Element('type'),
+    'date': Element('date'),
+    'amount': Element('amount'),
+    'status': Element('status'),
+    'originTransactionId': Element('originTransactionId'),
+}
+
+associated_transactions_list_node.elements = {
+    'associatedTransactions': Element('associatedTransactions', node=associated_transactions_node, repeated=True),
+}
+associated_transactions_list_node.item_name = 'associatedTransactions'
+
+status_history_node.elements = {
+    'transactionId': Element('transactionId'),
+    'date': Element('date'),
+    'amount': Element('amount'),
+    'fees': Element('fees'),
+    'status': Element('status'),
+    'originTransactionId': Element('originTransactionId'),
+}
+
+status_history_list_node.elements = {
+    'statusHistory': Element('statusHistory', node=status_history_node, repeated=True),
+}
+status_history_list_node.item_name = 'statusHistory'
+
+authentication3_dsecure_node.elements = {
+    'md': Element('md'),
+    'pares': Element('pares'),
+    'xid': Element('xid'),
+    'eci': Element('eci'),
+    'cavv': Element('cavv'),
+    'cavvAlgorithm': Element('cavvAlgorithm'),
+    'vadsResult': Element('vadsResult'),
+    'typeSecurisation': Element('typeSecurisation'),
+    'PaResStatus': Element('PaResStatus'),
+    'VeResStatus': Element('VeResStatus'),
+}
+
+payment_additional_node.elements = {
+    'transaction': Element('transaction', node=transaction_node),
+    'payment': Element('payment', node=payment_node),
+    'authorization': Element('authorization', node=authorization_node),
+    'authentication3DSecure': Element('authentication3DSecure', node=authentication3_dsecure_node),
+    'card': Element('card', node=card_out_node),
+    'extendedCard': Element('extendedCard', node=extended_card_type_node),
+}
+
+payment_additional_list_node.elements = {
+    'paymentAdditional': Element('paymentAdditional', node=payment_additional_node, repeated=True),
+}
+payment_additional_list_node.item_name = 'paymentAdditional'
+
+bank_account_data_node.elements = {
+    'countryCode': Element('countryCode'),
+    'bankCode': Element('bankCode'),
+    'accountNumber': Element('accountNumber'),
+    'key': Element('key'),
+}
+
+sub_merchant_node.elements = {
+    'subMerchantId': Element('subMerchantId'),
+    'subMerchantName': Element('subMerchantName'),
+    'subMerchantMCC': Element('subMerchantMCC'),
+    'subMerchantSIRET': Element('subMerchantSIRET'),
+    'subMerchantTaxCode': Element('subMerchantTaxCode'),
+    'subMerchantStreet': Element('subMerchantStreet'),
+    'subMerchantCity': Element('subMerchantCity'),
+    'subMerchantZipCode': Element('subMerchantZipCode'),
+    'subMerchantCountry': Element('subMerchantCountry'),
+    'subMerchantState': Element('subMerchantState'),
+    'subMerchantEmailAddress': Element('subMerchantEmailAddress'),
+    'subMerchantPhoneNumber': Element('subMerchantPhoneNumber'),
+}
+
+get_transaction_details_response_node.elements = {
+    'result': Element('result', node=result_node),
+    'transaction': Element('transaction', node=transaction_node),
+    'payment': Element('payment', node=payment_node),
+    'authorization': Element('authorization', node=authorization_node),
+    'order': Element('order', node=order_node),
+    'buyer': Element('buyer', node=buyer_node),
+    'privateDataList': Element('privateDataList', node=private_data_list_node),
+    'card': Element('card', node=card_out_node),
+    'extendedCard': Element('extendedCard', node=extended_card_type_node),
+    'associatedTransactionsList': Element('associatedTransactionsList', node=associated_transactions_list_node),
+    'statusHistoryList': Element('statusHistoryList', node=status_history_list_node),
+    'media': Element('media'),
+    'contractNumber': Element('contractNumber'),
+    'paymentAdditionalList': Element('paymentAdditionalList', node=payment_additional_list_node),
+    'bankAccountData': Element('bankAccountData', node=bank_account_data_node),
+    'subMerchant': Element('subMerchant', node=sub_merchant_node),
+}
+
+transaction_list_node.elements = {
+    'transaction': Element('transaction', node=transaction_node, repeated=True),
+}
+transaction_list_node.item_name = 'transaction'
+
+transactions_search_response_node.elements = {
+    'result': Element('result', node=result_node),
+    'transactionList': Element('transactionList', node=transaction_list_node),
+}
+
+customer_trans_node.elements = {
+    'IsLCLFAlerted': Element('IsLCLFAlerted'),
+    'ExternalTransactionId': Element('ExternalTransactionId'),
+    'ReferenceOrder': Element('ReferenceOrder'),
+    'CardCode': Element('CardCode'),
+    'TransactionDate': Element('TransactionDate'),
+    'Amount': Element('Amount'),
+    'Status': Element('Status'),
+    'PosLabel': Element('PosLabel'),
+}
+
+customer_trans_hist_node.elements = {
+    'CustomerTrans': Element('CustomerTrans', node=customer_trans_node, repeated=True),
+}
+customer_trans_hist_node.item_name = 'CustomerTrans'
+
+payment_means_trans_node.elements = {
+    'IsLCLFAlerted': Element('IsLCLFAlerted'),
+    'ExternalTransactionId': Element('ExternalTransactionId'),
+    'ReferenceOrder': Element('ReferenceOrder'),
+    'CustomerData': Element('CustomerData'),
+    'TransactionDate': Element('TransactionDate'),
+    'Amount': Element('Amount'),
+    'Status': Element('Status'),
+    'PosLabel': Element('PosLabel'),
+}
+
+payment_means_trans_hist_node.elements = {
+    'PaymentMeansTrans': Element('PaymentMeansTrans', node=payment_means_trans_node, repeated=True),
+}
+payment_means_trans_hist_node.item_name = 'PaymentMeansTrans'
+
+alerts_trans_node.elements = {
+    'AlertId': Element('AlertId'),
+    'ExplanationLabel': Element('ExplanationLabel'),
+    'ExplanationCode': Element('ExplanationCode'),
+    'RuleName': Element('RuleName'),
+    'RuleAction': Element('RuleAction'),
+    'RuleCriteria': Element('RuleCriteria'),
+}
+
+alerts_trans_hist_node.elements = {
+    'AlertsTrans': Element('AlertsTrans', node=alerts_trans_node, repeated=True),
+}
+alerts_trans_hist_node.item_name = 'AlertsTrans'
+
+get_alert_details_response_node.elements = {
+    'result': Element('result', node=result_node),
+    'AlertId': Element('AlertId'),
+    'ExplanationCode': Element('ExplanationCode'),
+    'ExplanationLabel': Element('ExplanationLabel'),
+    'TransactionStatus': Element('TransactionStatus'),
+    'MerchantLabel': Element('MerchantLabel'),
+    'PosLabel': Element('PosLabel'),
+    'TransactionId': Element('TransactionId'),
+    'SecurityLevel': Element('SecurityLevel'),
+    'TransactionDate': Element('TransactionDate'),
+    'TransactionAmount': Element('TransactionAmount'),
+    'TransactionCurrency': Element('TransactionCurrency'),
+    'PaymentType': Element('PaymentType'),
+    'PaymentData': Element('PaymentData'),
+    'HolderName': Element('HolderName'),
+    'ReferenceData': Element('ReferenceData'),
+    'CustomerId': Element('CustomerId'),
+    'BuyerFirstName': Element('BuyerFirstName'),
+    'BuyerLastName': Element('BuyerLastName'),
+    'CustomerTransHist': Element('CustomerTransHist', node=customer_trans_hist_node),
+    'PaymentMeansTransHist': Element('PaymentMeansTransHist', node=payment_means_trans_hist_node),
+    'AlertsTransHist': Element('AlertsTransHist', node=alerts_trans_hist_node),
+}
+
+# {operation: node of the response}
+RESPONSES = {
+    'getTransactionDetails': get_transaction_details_response_node,
+    'transactionsSearch': transactions_search_response_node,
+    'getAlertDetails': get_alert_details_response_node,
+}
@@ -0,0 +1,344 @@
+# -*- coding: utf-8 -*-
+"""
+Python client for the Payline SOAP API
+MassPaymentAPI operations: the functions writing the requests and the nodes parsing the responses
+Generated by python -m pypayline.codegen: do not edit
+"""
+
+from __future__ import print_function
+
+from pysimplesoap.client import soap_namespaces
+
+from pypayline.backends.parser import CompiledNode, Element
+from pypayline.backends.serializer import (
+    ENVELOPE_END, ENVELOPE_START, UnsupportedValue, check_names, write_items, write_text
+)
+
+
+API_NAME = u'MassPaymentAPI'
+
+# SHA-256 of the WSDL files (full and pruned) the module has been generated from
+WSDL_DIGESTS = (
+    'bc554206bb5d72858d273f4f8b0fab61f29d984b820f71890f97ba7e264c1745',
+    '83e41466fd558c0a03fafa3da827528299e8858928fb2f9443a7d8a502bbacbd',
+)
+
+SOAP_URI = soap_namespaces['soap']
+
+
+PAYMENT_NAMES = frozenset((
+    'amount', 'currency', 'action', 'mode', 'contractNumber', 'differedActionDate', 'method', 'softDescriptor',
+    'cardBrand', 'registrationToken'
+))
+
+
+def write_payment(parts, value):
+    """append the elements of payment to parts"""
+    if not isinstance(value, dict):
+        raise UnsupportedValue(value)
+    check_names(PAYMENT_NAMES, value)
+    field = value.get('amount')
+    if field is not None:
+        write_text(parts, u'<amount xmlns="http://obj.ws.payline.experian.com">', u'</amount>', field)
+    field = value.get('currency')
+    if field is not None:
+        write_text(parts, u'<currency xmlns="http://obj.ws.payline.experian.com">', u'</currency>', field)
+    field = value.get('action')
+    if field is not None:
+        write_text(parts, u'<action xmlns="http://obj.ws.payline.experian.com">', u'</action>', field)
+    field = value.get('mode')
+    if field is not None:
+        write_text(parts, u'<mode xmlns="http://obj.ws.payline.experian.com">', u'</mode>', field)
+    field = value.get('contractNumber')
+    if field is not None:
+        write_text(parts, u'<contractNumber xmlns="http://obj.ws.payline.experian.com">', u'</contractNumber>', field)
+    field = value.get('differedActionDate')
+    if field is not None:
+        write_text(
+            parts, u'<differedActionDate xmlns="http://obj.ws.payline.experian.com">', u'</differedActionDate>', field
+        )
+    field = value.get('method')
+    if field is not None:
+        write_text(parts, u'<method xmlns="http://obj.ws.payline.experian.com">', u'</method>', field)
+    field = value.get('softDescriptor')
+    if field is not None:
+        write_text(parts, u'<softDescriptor xmlns="http://obj.ws.payline.experian.com">', u'</softDescriptor>', field)
+    field = value.get('cardBrand')
+    if field is not None:
+        write_text(parts, u'<cardBrand xmlns="http://obj.ws.payline.experian.com">', u'</cardBrand>', field)
+    field = value.get('registrationToken')
+    if field is not None:
+        write_text(
+            parts, u'<registrationToken xmlns="http://obj.ws.payline.experian.com">', u'</registrationToken>', field
+        )
+
+
+CAPTURE_NAMES = frozenset(('transactionID', 'payment'))
+
+
+def write_capture(parts, value):
+    """append the elements of capture to parts"""
+    if not isinstance(value, dict):
+        raise UnsupportedValue(value)
+    check_names(CAPTURE_NAMES, value)
+    field = value.get('transactionID')
+    if field is not None:
+        write_text(parts, u'<transactionID xmlns="http://obj.ws.payline.experian.com">', u'</transactionID>', field)
+    field = value.get('payment')
+    if field is not None:
+        write_items(
+            parts, write_payment, u'<payment xmlns="http://obj.ws.payline.experian.com">', u'</payment>',
+            u'<payment xmlns="http://obj.ws.payline.experian.com"/>', field
+        )
+
+
+CAPTURE_AUTHORIZATION_LIST_NAMES = frozenset(('capture', ))
+
+
+def write_capture_authorization_list(parts, value):
+    """append the elements of captureAuthorizationList to parts"""
+    if not isinstance(value, dict):
+        raise UnsupportedValue(value)
+    check_names(CAPTURE_AUTHORIZATION_LIST_NAMES, value)
+    field = value.get('capture')
+    if field is not None:
+        write_items(
+            parts, write_capture, u'<capture xmlns="http://obj.ws.payline.experian.com">', u'</capture>',
+            u'<capture xmlns="http://obj.ws.payline.experian.com"/>', field
+        )
+
+
+REFUND_NAMES = frozenset(('transactionID', 'payment'))
+
+
+def write_refund(parts, value):
+    """append the elements of refund to parts"""
+    if not isinstance(value, dict):
+        raise UnsupportedValue(value)
+    check_names(REFUND_NAMES, value)
+    field = value.get('transactionID')
+    if field is not None:
+        write_text(parts, u'<transactionID xmlns="http://obj.ws.payline.experian.com">', u'</transactionID>', field)
+    field = value.get('payment')
+    if field is not None:
+        write_items(
+            parts, write_payment, u'<payment xmlns="http://obj.ws.payline.experian.com">', u'</payment>',
+            u'<payment xmlns="http://obj.ws.payline.experian.com"/>', field
+        )
+
+
+REFUND_AUTHORIZATION_LIST_NAMES = frozenset(('refund', ))
+
+
+def write_refund_authorization_list(parts, value):
+    """append the elements of refundAuthorizationList to parts"""
+    if not isinstance(value, dict):
+        raise UnsupportedValue(value)
+    check_names(REFUND_AUTHORIZATION_LIST_NAMES, value)
+    field = value.get('refund')
+    if field is not None:
+        write_items(
+            parts, write_refund, u'<refund xmlns="http://obj.ws.payline.experian.com">', u'</refund>',
+            u'<refund xmlns="http://obj.ws.payline.experian.com"/>', field
+        )
+
+
+RESET_AUTHORIZATION_LIST_NAMES = frozenset(('transactionID', ))
+
+
+def write_reset_authorization_list(parts, value):
+    """append the elements of resetAuthorizationList to parts"""
+    if not isinstance(value, dict):
+        raise UnsupportedValue(value)
+    check_names(RESET_AUTHORIZATION_LIST_NAMES, value)
+    field = value.get('transactionID')
+    if field is not None:
+        write_text(parts, u'<transactionID xmlns="http://obj.ws.payline.experian.com">', u'</transactionID>', field)
+
+
+DO_MASS_CAPTURE_START = ENVELOPE_START.format(
+    soap_uri=SOAP_URI, name=u'doMassCaptureRequest', namespace=u'http://impl.ws.payline.experian.com'
+)
+DO_MASS_CAPTURE_END = ENVELOPE_END.format(name=u'doMassCaptureRequest')
+DO_MASS_CAPTURE_NAMES = frozenset(('version', 'captureAuthorizationList', 'comment'))
+
+
+def build_do_mass_capture(version=None, captureAuthorizationList=None, comment=None):
+    """the doMassCapture request envelope as utf-8 bytes"""
+    parts = [DO_MASS_CAPTURE_START]
+    if version is not None:
+        write_text(parts, u'<version>', u'</version>', version)
+    if captureAuthorizationList is not None:
+        write_items(
+            parts, write_capture_authorization_list,
+            u'<captureAuthorizationList xmlns="http://impl.ws.payline.experian.com">', u'</captureAuthorizationList>',
+            u'<captureAuthorizationList xmlns="http://impl.ws.payline.experian.com"/>', captureAuthorizationList
+        )
+    if comment is not None:
+        write_text(parts, u'<comment>', u'</comment>', comment)
+    parts.append(DO_MASS_CAPTURE_END)
+    return u''.join(parts).encode('utf-8')
+
+
+DO_MASS_REFUND_START = ENVELOPE_START.format(
+    soap_uri=SOAP_URI, name=u'doMassRefundRequest', namespace=u'http://impl.ws.payline.experian.com'
+)
+DO_MASS_REFUND_END = ENVELOPE_END.format(name=u'doMassRefundRequest')
+DO_MASS_REFUND_NAMES = frozenset(('version', 'refundAuthorizationList', 'comment'))
+
+
+def build_do_mass_refund(version=None, refundAuthorizationList=None, comment=None):
+    """the doMassRefund request envelope as utf-8 bytes"""
+    parts = [DO_MASS_REFUND_START]
+    if version is not None:
+        write_text(parts, u'<version>', u'</version>', version)
+    if refundAuthorizationList is not None:
+        write_items(
+            parts, write_refund_authorization_list,
+            u'<refundAuthorizationList xmlns="http://impl.ws.payline.experian.com">', u'</refundAuthorizationList>',
+            u'<refundAuthorizationList xmlns="http://impl.ws.payline.experian.com"/>', refundAuthorizationList
+        )
+    if comment is not None:
+        write_text(parts, u'<comment>', u'</comment>', comment)
+    parts.append(DO_MASS_REFUND_END)
+    return u''.join(parts).encode('utf-8')
+
+
+DO_MASS_RESET_START = ENVELOPE_START.format(
+    soap_uri=SOAP_URI, name=u'doMassResetRequest', namespace=u'http://impl.ws.payline.experian.com'
+)
+DO_MASS_RESET_END = ENVELOPE_END.format(name=u'doMassResetRequest')
+DO_MASS_RESET_NAMES = frozenset(('version', 'resetAuthorizationList', 'comment'))
+
+
+def build_do_mass_reset(version=None, resetAuthorizationList=None, comment=None):
+    """the doMassReset request envelope as utf-8 bytes"""
+    parts = [DO_MASS_RESET_START]
+    if version is not None:
+        write_text(parts, u'<version>', u'</version>', version)
+    if resetAuthorizationList is not None:
+        write_items(
+            parts, write_reset_authorization_list,
+            u'<resetAuthorizationList xmlns="http://impl.ws.payline.experian.com">', u'</resetAuthorizationList>',
+            u'<resetAuthorizationList xmlns="http://impl.ws.payline.experian.com"/>', resetAuthorizationList
+        )
+    if comment is not None:
+        write_text(parts, u'<comment>', u'</comment>', comment)
+    parts.append(DO_MASS_RESET_END)
+    return u''.join(parts).encode('utf-8')
+
+
+GET_MASS_TRAITMENT_DETAILS_START = ENVELOPE_START.format(
+    soap_uri=SOAP_URI, name=u'getMassTraitmentDetailsRequest', namespace=u'http://impl.ws.payline.experian.com'
+)
+GET_MASS_TRAITMENT_DETAILS_END = ENVELOPE_END.format(name=u'getMassTraitmentDetailsRequest')
+GET_MASS_TRAITMENT_DETAILS_NAMES = frozenset(('version', 'massTraitmentID'))
+
+
+def build_get_mass_traitment_details(version=None, massTraitmentID=None):
+    """the getMassTraitmentDetails request envelope as utf-8 bytes"""
+    parts = [GET_MASS_TRAITMENT_DETAILS_START]
+    if version is not None:
+        write_text(parts, u'<version>', u'</version>', version)
+    if massTraitmentID is not None:
+        write_text(parts, u'<massTraitmentID>', u'</massTraitmentID>', massTraitmentID)
+    parts.append(GET_MASS_TRAITMENT_DETAILS_END)
+    return u''.join(parts).encode('utf-8')
+
+
+# {operation: (function writing the request, names of its elements, soap action)}
+REQUESTS = {
+    'doMassCapture': (build_do_mass_capture, DO_MASS_CAPTURE_NAMES, u'doMassCapture'),
+    'doMassRefund': (build_do_mass_refund, DO_MASS_REFUND_NAMES, u'doMassRefund'),
+    'doMassReset': (build_do_mass_reset, DO_MASS_RESET_NAMES, u'doMassReset'),
+    'getMassTraitmentDetails': (
+        build_get_mass_traitment_details, GET_MASS_TRAITMENT_DETAILS_NAMES, u'getMassTraitmentDetails'
+    ),
+}
+
+
+# nodes of the types of the responses: all are created before their elements refer to them
+do_mass_capture_response_node = CompiledNode()
+result_node = CompiledNode()
+do_mass_refund_response_node = CompiledNode()
+do_mass_reset_response_node = CompiledNode()
+get_mass_traitment_details_response_node = CompiledNode()
+failed_list_object_node = CompiledNode()
+transaction_node = CompiledNode()
+fraud_result_details_node = CompiledNode()
+avs_node = CompiledNode()
+
+result_node.elements = {
+    'code': Element('code'),
+    'shortMessage': Element('shortMessage'),
+    'longMessage': Element('longMessage'),
+    'partnerCode': Element('partnerCode'),
+    'partnerCodeLabel': Element('partnerCodeLabel'),
+}
+
+do_mass_capture_response_node.elements = {
+    'result': Element('result', node=result_node),
+    'massTraitmentID': Element('massTraitmentID'),
+    'date': Element('date'),
+}
+
+do_mass_refund_response_node.elements = {
+    'result': Element('result', node=result_node),
+    'massTraitmentID': Element('massTraitmentID'),
+    'date': Element('date'),
+}
+
+do_mass_reset_response_node.elements = {
+    'result': Element('result', node=result_node),
+    'massTraitmentID': Element('massTraitmentID'),
+    'date': Element('date'),
+}
+
+fraud_result_details_node.elements = {
+    'code': Element('code'),
+    'shortMessage': Element('shortMessage'),
+    'longMessage': Element('longMessage'),
+}
+
+avs_node.elements = {
+    'result': Element('result'),
+    'resultFromAcquirer': Element('resultFromAcquirer'),
+}
+
+transaction_node.elements = {
+    'id': Element('id'),
+    'date': Element('date'),
+    'isDuplicated': Element('isDuplicated'),
+    'isPossibleFraud': Element('isPossibleFraud'),
+    'fraudResult': Element('fraudResult'),
+    'fraudResultDetails': Element('fraudResultDetails', node=fraud_result_details_node),
+    'explanation': Element('explanation'),
+    'threeDSecure': Element('threeDSecure'),
+    'softDescriptor': Element('softDescriptor'),
+    'score': Element('score'),
+    'externalWalletType': Element('externalWalletType'),
+    'externalWalletContractNumber': Element('externalWalletContractNumber'),
+    'partnerAdditionalData': Element('partnerAdditionalData'),
+    'avs': Element('avs', node=avs_node),
+}
+
+failed_list_object_node.elements = {
+    'failedObject': Element('failedObject', node=transaction_node, repeated=True),
+}
+failed_list_object_node.item_name = 'failedObject'
+
+get_mass_traitment_details_response_node.elements = {
+    'result': Element('result', node=result_node),
+    'massTraitementID': Element('massTraitementID'),
+    'totalLinesNumber': Element('totalLinesNumber'),
+    'failedLinesNumber': Element('failedLinesNumber'),
+    'failedListObject': Element('failedListObject', node=failed_list_object_node),
+}
+
+# {operation: node of the response}
+RESPONSES = {
+    'doMassCapture': do_mass_capture_response_node,
+    'doMassRefund': do_mass_refund_response_node,
+    'doMassReset': do_mass_reset_response_node,
+    'getMassTraitmentDetails': get_mass_traitment_details_response_node,
+}
@@ -0,0 +1,398 @@
+# -*- coding: utf-8 -*-
+"""
+Python client for the Payline SOAP API
+The methods of the backends: a method by operation of each Payline service
+Generated by python -m pypayline.codegen: do not edit
+"""
+
+from __future__ import print_function
+
+
+class WebPaymentAPIOperations(object):
+    """
+    The SOAP operations of the WebPaymentAPI service, with the elements of their request
+    as keyword arguments: the backends implement call_operation(method, data)
+    """
+
+    def createWebWallet(self, version=None, contractNumber=None, selectedContractList=None, updatePersonalDetails=None,
+                        buyer=None, owner=None, languageCode=None, customPaymentPageCode=None, securityMode=None,
+                        returnURL=None, cancelURL=None, notificationURL=None, privateDataList=None,
+                        customPaymentTemplateURL=None, contractNumberWalletList=None):
+        """call the createWebWallet SOAP API"""
+        return self.call_operation('createWebWallet', {
+            'version': version, 'contractNumber': contractNumber, 'selectedContractList': selectedContractList,
+            'updatePersonalDetails': updatePersonalDetails, 'buyer': buyer, 'owner': owner,
+            'languageCode': languageCode, 'customPaymentPageCode': customPaymentPageCode, 'securityMode': securityMode,
+            'returnURL': returnURL, 'cancelURL': cancelURL, 'notificationURL': notificationURL,
+            'privateDataList': privateDataList, 'customPaymentTemplateURL': customPaymentTemplateURL,
+            'contractNumberWalletList': contractNumberWalletList
+        })
+
+    def doWebPayment(self, version=None, payment=None, returnURL=None, cancelURL=None, order=None, notificationURL=None,
+                     selectedContractList=None, secondSelectedContractList=None, privateDataList=None,
+                     languageCode=None, customPaymentPageCode=None, buyer=None, owner=None, securityMode=None,
+                     recurring=None, customPaymentTemplateURL=None, contractNumberWalletList=None, merchantName=None,
+                     subMerchant=None, miscData=None, asynchronousRetryTimeout=None):
+        """call the doWebPayment SOAP API"""
+        return self.call_operation('doWebPayment', {
+            'version': version, 'payment': payment, 'returnURL': returnURL, 'cancelURL': cancelURL, 'order': order,
+            'notificationURL': notificationURL, 'selectedContractList': selectedContractList,
+            'secondSelectedContractList': secondSelectedContractList, 'privateDataList': privateDataList,
+            'languageCode': languageCode, 'customPaymentPageCode': customPaymentPageCode, 'buyer': buyer,
+            'owner': owner, 'securityMode': securityMode, 'recurring': recurring,
+            'customPaymentTemplateURL': customPaymentTemplateURL, 'contractNumberWalletList': contractNumberWalletList,
+            'merchantName': merchantName, 'subMerchant': subMerchant, 'miscData': miscData,
+            'asynchronousRetryTimeout': asynchronousRetryTimeout
+        })
+
+    def getWebPaymentDetails(self, version=None, token=None):
+        """call the getWebPaymentDetails SOAP API"""
+        return self.call_operation('getWebPaymentDetails', {'version': version, 'token': token})
+
+    def getWebWallet(self, version=None, token=None):
+        """call the getWebWallet SOAP API"""
+        return self.call_operation('getWebWallet', {'version': version, 'token': token})
+
+    def manageWebWallet(self, version=None, contractNumber=None, selectedContractList=None, updatePersonalDetails=None,
+                        buyer=None, owner=None, languageCode=None, customPaymentPageCode=None, securityMode=None,
+                        returnURL=None, cancelURL=None, notificationURL=None, privateDataList=None,
+                        customPaymentTemplateURL=None, contractNumberWalletList=None, merchantName=None):
+        """call the manageWebWallet SOAP API"""
+        return self.call_operation('manageWebWallet', {
+            'version': version, 'contractNumber': contractNumber, 'selectedContractList': selectedContractList,
+            'updatePersonalDetails': updatePersonalDetails, 'buyer': buyer, 'owner': owner,
+            'languageCode': languageCode, 'customPaymentPageCode': customPaymentPageCode, 'securityMode': securityMode,
+            'returnURL': returnURL, 'cancelURL': cancelURL, 'notificationURL': notificationURL,
+            'privateDataList': privateDataList, 'customPaymentTemplateURL': customPaymentTemplateURL,
+            'contractNumberWalletList': contractNumberWalletList, 'merchantName': merchantName
+        })
+
+    def updateWebWallet(self, version=None, contractNumber=None, cardInd=None, walletId=None,
+                        updatePersonalDetails=None, updateOwnerDetails=None, updatePaymentDetails=None, buyer=None,
+                        languageCode=None, customPaymentPageCode=None, securityMode=None, returnURL=None,
+                        cancelURL=None, notificationURL=None, privateDataList=None, customPaymentTemplateURL=None,
+                        contractNumberWalletList=None):
+        """call the updateWebWallet SOAP API"""
+        return self.call_operation('updateWebWallet', {
+            'version': version, 'contractNumber': contractNumber, 'cardInd': cardInd, 'walletId': walletId,
+            'updatePersonalDetails': updatePersonalDetails, 'updateOwnerDetails': updateOwnerDetails,
+            'updatePaymentDetails': updatePaymentDetails, 'buyer': buyer, 'languageCode': languageCode,
+            'customPaymentPageCode': customPaymentPageCode, 'securityMode': securityMode, 'returnURL': returnURL,
+            'cancelURL': cancelURL, 'notificationURL': notificationURL, 'privateDataList': privateDataList,
+            'customPaymentTemplateURL': customPaymentTemplateURL, 'contractNumberWalletList': contractNumberWalletList
+        })
+
+
+class DirectPaymentAPIOperations(object):
+    """
+    The SOAP operations of the DirectPaymentAPI service, with the elements of their request
+    as keyword arguments: the backends implement call_operation(method, data)
+    """
+
+    def createMerchant(self, corporateName=None, publicName=None, currency=None, nationalID=None, distributor=None,
+                       merchantAddress=None, businessInterlocutor=None, technicalInterlocutor=None, subscription=None,
+                       poss=None, partner=None):
+        """call the createMerchant SOAP API"""
+        return self.call_operation('createMerchant', {
+            'corporateName': corporateName, 'publicName': publicName, 'currency': currency, 'nationalID': nationalID,
+            'distributor': distributor, 'merchantAddress': merchantAddress,
+            'businessInterlocutor': businessInterlocutor, 'technicalInterlocutor': technicalInterlocutor,
+            'subscription': subscription, 'poss': poss, 'partner': partner
+        })
+
+    def createWallet(self, version=None, contractNumber=None, wallet=None, buyer=None, owner=None, privateDataList=None,
+                     authentication3DSecure=None, media=None, contractNumberWalletList=None):
+        """call the createWallet SOAP API"""
+        return self.call_operation('createWallet', {
+            'version': version, 'contractNumber': contractNumber, 'wallet': wallet, 'buyer': buyer, 'owner': owner,
+            'privateDataList': privateDataList, 'authentication3DSecure': authentication3DSecure, 'media': media,
+            'contractNumberWalletList': contractNumberWalletList
+        })
+
+    def disablePaymentRecord(self, contractNumber=None, paymentRecordId=None):
+        """call the disablePaymentRecord SOAP API"""
+        return self.call_operation('disablePaymentRecord', {
+            'contractNumber': contractNumber, 'paymentRecordId': paymentRecordId
+        })
+
+    def disableWallet(self, contractNumber=None, cardInd=None, walletIdList=None):
+        """call the disableWallet SOAP API"""
+        return self.call_operation('disableWallet', {
+            'contractNumber': contractNumber, 'cardInd': cardInd, 'walletIdList': walletIdList
+        })
+
+    def doAuthorization(self, version=None, payment=None, bankAccountData=None, card=None, order=None, buyer=None,
+                        owner=None, privateDataList=None, authentication3DSecure=None, media=None, subMerchant=None,
+                        asynchronousRetryTimeout=None):
+        """call the doAuthorization SOAP API"""
+        return self.call_operation('doAuthorization', {
+            'version': version, 'payment': payment, 'bankAccountData': bankAccountData, 'card': card, 'order': order,
+            'buyer': buyer, 'owner': owner, 'privateDataList': privateDataList,
+            'authentication3DSecure': authentication3DSecure, 'media': media, 'subMerchant': subMerchant,
+            'asynchronousRetryTimeout': asynchronousRetryTimeout
+        })
+
+    def doBankTransfer(self, version=None, payment=None, creditor=None, comment=None, transactionID=None, orderID=None):
+        """call the doBankTransfer SOAP API"""
+        return self.call_operation('doBankTransfer', {
+            'version': version, 'payment': payment, 'creditor': creditor, 'comment': comment,
+            'transactionID': transactionID, 'orderID': orderID
+        })
+
+    def doCapture(self, version=None, transactionID=None, payment=None, privateDataList=None, sequenceNumber=None,
+                  media=None):
+        """call the doCapture SOAP API"""
+        return self.call_operation('doCapture', {
+            'version': version, 'transactionID': transactionID, 'payment': payment, 'privateDataList': privateDataList,
+            'sequenceNumber': sequenceNumber, 'media': media
+        })
+
+    def doCredit(self, version=None, payment=None, card=None, comment=None, order=None, buyer=None, owner=None,
+                 privateDataList=None, media=None, subMerchant=None):
+        """call the doCredit SOAP API"""
+        return self.call_operation('doCredit', {
+            'version': version, 'payment': payment, 'card': card, 'comment': comment, 'order': order, 'buyer': buyer,
+            'owner': owner, 'privateDataList': privateDataList, 'media': media, 'subMerchant': subMerchant
+        })
+
+    def doDebit(self, version=None, payment=None, card=None, order=None, buyer=None, owner=None, privateDataList=None,
+                authentication3DSecure=None, authorization=None, media=None, subMerchant=None):
+        """call the doDebit SOAP API"""
+        return self.call_operation('doDebit', {
+            'version': version, 'payment': payment, 'card': card, 'order': order, 'buyer': buyer, 'owner': owner,
+            'privateDataList': privateDataList, 'authentication3DSecure': authentication3DSecure,
+            'authorization': authorization, 'media': media, 'subMerchant': subMerchant
+        })
+
+    def doImmediateWalletPayment(self, version=None, payment=None, order=None, buyer=None, walletId=None, cardInd=None,
+                                 cvx=None, privateDataList=None, media=None, authentication3DSecure=None,
+                                 subMerchant=None):
+        """call the doImmediateWalletPayment SOAP API"""
+        return self.call_operation('doImmediateWalletPayment', {
+            'version': version, 'payment': payment, 'order': order, 'buyer': buyer, 'walletId': walletId,
+            'cardInd': cardInd, 'cvx': cvx, 'privateDataList': privateDataList, 'media': media,
+            'authentication3DSecure': authentication3DSecure, 'subMerchant': subMerchant
+        })
+
+    def doReAuthorization(self, version=None, transactionID=None, payment=None, order=None, privateDataList=None,
+                          media=None):
+        """call the doReAuthorization SOAP API"""
+        return self.call_operation('doReAuthorization', {
+            'version': version, 'transactionID': transactionID, 'payment': payment, 'order': order,
+            'privateDataList': privateDataList, 'media': media
+        })
+
+    def doRecurrentWalletPayment(self, version=None, payment=None, orderRef=None, orderDate=None, scheduledDate=None,
+                                 walletId=None, cardInd=None, recurring=None, privateDataList=None, order=None,
+                                 media=None):
+        """call the doRecurrentWalletPayment SOAP API"""
+        return self.call_operation('doRecurrentWalletPayment', {
+            'version': version, 'payment': payment, 'orderRef': orderRef, 'orderDate': orderDate,
+            'scheduledDate': scheduledDate, 'walletId': walletId, 'cardInd': cardInd, 'recurring': recurring,
+            'privateDataList': privateDataList, 'order': order, 'media': media
+        })
+
+    def doRefund(self, version=None, transactionID=None, payment=None, comment=None, privateDataList=None,
+                 sequenceNumber=None, media=None, details=None):
+        """call the doRefund SOAP API"""
+        return self.call_operation('doRefund', {
+            'version': version, 'transactionID': transactionID, 'payment': payment, 'comment': comment,
+            'privateDataList': privateDataList, 'sequenceNumber': sequenceNumber, 'media': media, 'details': details
+        })
+
+    def doReset(self, version=None, transactionID=None, comment=None, media=None):
+        """call the doReset SOAP API"""
+        return self.call_operation('doReset', {
+            'version': version, 'transactionID': transactionID, 'comment': comment, 'media': media
+        })
+
+    def doScheduledWalletPayment(self, version=None, payment=None, orderRef=None, orderDate=None, scheduledDate=None,
+                                 walletId=None, cardInd=None, order=None, privateDataList=None, media=None,
+                                 subMerchant=None):
+        """call the doScheduledWalletPayment SOAP API"""
+        return self.call_operation('doScheduledWalletPayment', {
+            'version': version, 'payment': payment, 'orderRef': orderRef, 'orderDate': orderDate,
+            'scheduledDate': scheduledDate, 'walletId': walletId, 'cardInd': cardInd, 'order': order,
+            'privateDataList': privateDataList, 'media': media, 'subMerchant': subMerchant
+        })
+
+    def doScoringCheque(self, version=None, payment=None, cheque=None, order=None, privateDataList=None, media=None):
+        """call the doScoringCheque SOAP API"""
+        return self.call_operation('doScoringCheque', {
+            'version': version, 'payment': payment, 'cheque': cheque, 'order': order,
+            'privateDataList': privateDataList, 'media': media
+        })
+
+    def enableWallet(self, contractNumber=None, cardInd=None, walletId=None):
+        """call the enableWallet SOAP API"""
+        return self.call_operation('enableWallet', {
+            'contractNumber': contractNumber, 'cardInd': cardInd, 'walletId': walletId
+        })
+
+    def getBalance(self, version=None, cardID=None, contractNumber=None):
+        """call the getBalance SOAP API"""
+        return self.call_operation('getBalance', {
+            'version': version, 'cardID': cardID, 'contractNumber': contractNumber
+        })
+
+    def getBillingRecord(self, contractNumber=None, paymentRecordId=None, billingRecordId=None):
+        """call the getBillingRecord SOAP API"""
+        return self.call_operation('getBillingRecord', {
+            'contractNumber': contractNumber, 'paymentRecordId': paymentRecordId, 'billingRecordId': billingRecordId
+        })
+
+    def getCards(self, version=None, contractNumber=None, walletId=None, cardInd=None):
+        """call the getCards SOAP API"""
+        return self.call_operation('getCards', {
+            'version': version, 'contractNumber': contractNumber, 'walletId': walletId, 'cardInd': cardInd
+        })
+
+    def getEncryptionKey(self, parameters=None):
+        """call the getEncryptionKey SOAP API"""
+        return self.call_operation('getEncryptionKey', {'parameters': parameters})
+
+    def getMerchantSettings(self, version=None):
+        """call the getMerchantSettings SOAP API"""
+        return self.call_operation('getMerchantSettings', {'version': version})
+
+    def getPaymentRecord(self, version=None, contractNumber=None, paymentRecordId=None):
+        """call the getPaymentRecord SOAP API"""
+        return self.call_operation('getPaymentRecord', {
+            'version': version, 'contractNumber': contractNumber, 'paymentRecordId': paymentRecordId
+        })
+
+    def getToken(self, cardNumber=None, expirationDate=None, contractNumber=None):
+        """call the getToken SOAP API"""
+        return self.call_operation('getToken', {
+            'cardNumber': cardNumber, 'expirationDate': expirationDate, 'contractNumber': contractNumber
+        })
+
+    def getWallet(self, version=None, contractNumber=None, walletId=None, cardInd=None, media=None):
+        """call the getWallet SOAP API"""
+        return self.call_operation('getWallet', {
+            'version': version, 'contractNumber': contractNumber, 'walletId': walletId, 'cardInd': cardInd,
+            'media': media
+        })
+
+    def isRegistered(self, version=None, payment=None, order=None, privateDataList=None, buyer=None, miscData=None):
+        """call the isRegistered SOAP API"""
+        return self.call_operation('isRegistered', {
+            'version': version, 'payment': payment, 'order': order, 'privateDataList': privateDataList, 'buyer': buyer,
+            'miscData': miscData
+        })
+
+    def unBlock(self, transactionID=None, transactionDate=None, version=None):
+        """call the unBlock SOAP API"""
+        return self.call_operation('unBlock', {
+            'transactionID': transactionID, 'transactionDate': transactionDate, 'version': version
+        })
+
+    def updateBillingRecord(self, contractNumber=None, paymentRecordId=None, billingRecordId=None,
+                            billingRecordForUpdate=None):
+        """call the updateBillingRecord SOAP API"""
+        return self.call_operation('updateBillingRecord', {
+            'contractNumber': contractNumber, 'paymentRecordId': paymentRecordId, 'billingRecordId': billingRecordId,
+            'billingRecordForUpdate': billingRecordForUpdate
+        })
+
+    def updatePaymentRecord(self, version=None, contractNumber=None, paymentRecordId=None, recurring=None):
+        """call the updatePaymentRecord SOAP API"""
+        return self.call_operation('updatePaymentRecord', {
+            'version': version, 'contractNumber': contractNumber, 'paymentRecordId': paymentRecordId,
+            'recurring': recurring
+        })
+
+    def updateWallet(self, version=None, contractNumber=None, cardInd=None, wallet=None, buyer=None, owner=None,
+                     privateDataList=None, authentication3DSecure=None, media=None, contractNumberWalletList=None):
+        """call the updateWallet SOAP API"""
+        return self.call_operation('updateWallet', {
+            'version': version, 'contractNumber': contractNumber, 'cardInd': cardInd, 'wallet': wallet, 'buyer': buyer,
+            'owner': owner, 'privateDataList': privateDataList, 'authentication3DSecure': authentication3DSecure,
+            'media': media, 'contractNumberWalletList': contractNumberWalletList
+        })
+
+    def verifyAuthentication(self, version=None, contractNumber=None, pares=None, md=None, card=None):
+        """call the verifyAuthentication SOAP API"""
+        return self.call_operation('verifyAuthentication', {
+            'version': version, 'contractNumber': contractNumber, 'pares': pares, 'md': md, 'card': card
+        })
+
+    def verifyEnrollment(self, version=None, card=None, payment=None, orderRef=None, mdFieldValue=None, userAgent=None,
+                         walletId=None, walletCardInd=None, generateVirtualCvx=None, merchantName=None, returnURL=None):
+        """call the verifyEnrollment SOAP API"""
+        return self.call_operation('verifyEnrollment', {
+            'version': version, 'card': card, 'payment': payment, 'orderRef': orderRef, 'mdFieldValue': mdFieldValue,
+            'userAgent': userAgent, 'walletId': walletId, 'walletCardInd': walletCardInd,
+            'generateVirtualCvx': generateVirtualCvx, 'merchantName': merchantName, 'returnURL': returnURL
+        })
+
+
+class MassPaymentAPIOperations(object):
+    """
+    The SOAP operations of the MassPaymentAPI service, with the elements of their request
+    as keyword arguments: the backends implement call_operation(method, data)
+    """
+
+    def doMassCapture(self, version=None, captureAuthorizationList=None, comment=None):
+        """call the doMassCapture SOAP API"""
+        return self.call_operation('doMassCapture', {
+            'version': version, 'captureAuthorizationList': captureAuthorizationList, 'comment': comment
+        })
+
+    def doMassRefund(self, version=None, refundAuthorizationList=None, comment=None):
+        """call the doMassRefund SOAP API"""
+        return self.call_operation('doMassRefund', {
+            'version': version, 'refundAuthorizationList': refundAuthorizationList, 'comment': comment
+        })
+
+    def doMassReset(self, version=None, resetAuthorizationList=None, comment=None):
+        """call the doMassReset SOAP API"""
+        return self.call_operation('doMassReset', {
+            'version': version, 'resetAuthorizationList': resetAuthorizationList, 'comment': comment
+        })
+
+    def getMassTraitmentDetails(self, version=None, massTraitmentID=None):
+        """call the getMassTraitmentDetails SOAP API"""
+        return self.call_operation('getMassTraitmentDetails', {'version': version, 'massTraitmentID': massTraitmentID})
+
+
+class ExtendedAPIOperations(object):
+    """
+    The SOAP operations of the ExtendedAPI service, with the elements of their request
+    as keyword arguments: the backends implement call_operation(method, data)
+    """
+
+    def getAlertDetails(self, version=None, AlertId=None, TransactionId=None, TransactionDate=None):
+        """call the getAlertDetails SOAP API"""
+        return self.call_operation('getAlertDetails', {
+            'version': version, 'AlertId': AlertId, 'TransactionId': TransactionId, 'TransactionDate': TransactionDate
+        })
+
+    def getTransactionDetails(self, version=None, transactionId=None, orderRef=None, startDate=None, endDate=None,
+                              transactionHistory=None, archiveSearch=None):
+        """call the getTransactionDetails SOAP API"""
+        return self.call_operation('getTransactionDetails', {
+            'version': version, 'transactionId': transactionId, 'orderRef': orderRef, 'startDate': startDate,
+            'endDate': endDate, 'transactionHistory': transactionHistory, 'archiveSearch': archiveSearch
+        })
+
+    def transactionsSearch(self, version=None, transactionId=None, orderRef=None, startDate=None, endDate=None,
+                           contractNumber=None, authorizationNumber=None, returnCode=None, paymentMean=None,
+                           transactionType=None, name=None, firstName=None, email=None, cardNumber=None, currency=None,
+                           minAmount=None, maxAmount=None, walletId=None, sequenceNumber=None, token=None):
+        """call the transactionsSearch SOAP API"""
+        return self.call_operation('transactionsSearch', {
+            'version': version, 'transactionId': transactionId, 'orderRef': orderRef, 'startDate': startDate,
+            'endDate': endDate, 'contractNumber': contractNumber, 'authorizationNumber': authorizationNumber,
+            'returnCode': returnCode, 'paymentMean': paymentMean, 'transactionType': transactionType, 'name': name,
+            'firstName': firstName, 'email': email, 'cardNumber': cardNumber, 'currency': currency,
+            'minAmount': minAmount, 'maxAmount': maxAmount, 'walletId': walletId, 'sequenceNumber': sequenceNumber,
+            'token': token
+        })
+
+
+# the methods of the backend of each service
+SERVICE_OPERATIONS = {
+    'WebPaymentAPI': WebPaymentAPIOperations, 'DirectPaymentAPI': DirectPaymentAPIOperations,
+    'MassPaymentAPI': MassPaymentAPIOperations, 'ExtendedAPI': ExtendedAPIOperations
+}
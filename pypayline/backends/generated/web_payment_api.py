@@ -0,0 +1,1325 @@
+# -*- coding: utf-8 -*-
+"""
+Python client for the Payline SOAP API
+WebPaymentAPI operations: the functions writing the requests and the nodes parsing the responses
+Generated by python -m pypayline.codegen: do not edit
+"""
+
+from __future__ import print_function
+
+from pysimplesoap.client import soap_namespaces
+
+from pypayline.backends.parser import CompiledNode, Element
+from pypayline.backends.serializer import (
+    ENVELOPE_END, ENVELOPE_START, UnsupportedValue, check_names, write_items, write_text
+)
+
+
+API_NAME = u'WebPaymentAPI'
+
+# SHA-256 of the WSDL files (full and pruned) the module has been generated from
+WSDL_DIGESTS = (
+    '7c26100c45a942d6c4e502e87455a54013856847be5e68de19b7f3c6ed0f5a48',
+    '26c4b4b2c38ec2803175be752dcd04238ee84782b134d410f19c711713ac8f02',
+)
+
+SOAP_URI = soap_namespaces['soap']
+
+
+PAYMENT_NAMES = frozenset((
+    'amount', 'currency', 'action', 'mode', 'contractNumber', 'differedActionDate', 'method', 'softDescriptor',
+    'cardBrand', 'registrationToken'
+))
+
+
+def write_payment(parts, value):
+    """append the elements of payment to parts"""
+    if not isinstance(value, dict):
+        raise UnsupportedValue(value)
+    check_names(PAYMENT_NAMES, value)
+    field = value.get('amount')
+    if field is not None:
+        write_text(parts, u'<amount xmlns="http://obj.ws.payline.experian.com">', u'</amount>', field)
+    field = value.get('currency')
+    if field is not None:
+        write_text(parts, u'<currency xmlns="http://obj.ws.payline.experian.com">', u'</currency>', field)
+    field = value.get('action')
+    if field is not None:
+        write_text(parts, u'<action xmlns="http://obj.ws.payline.experian.com">', u'</action>', field)
+    field = value.get('mode')
+    if field is not None:
+        write_text(parts, u'<mode xmlns="http://obj.ws.payline.experian.com">', u'</mode>', field)
+    field = value.get('contractNumber')
+    if field is not None:
+        write_text(parts, u'<contractNumber xmlns="http://obj.ws.payline.experian.com">', u'</contractNumber>', field)
+    field = value.get('differedActionDate')
+    if field is not None:
+        write_text(
+            parts, u'<differedActionDate xmlns="http://obj.ws.payline.experian.com">', u'</differedActionDate>', field
+        )
+    field = value.get('method')
+    if field is not None:
+        write_text(parts, u'<method xmlns="http://obj.ws.payline.experian.com">', u'</method>', field)
+    field = value.get('softDescriptor')
+    if field is not None:
+        write_text(parts, u'<softDescriptor xmlns="http://obj.ws.payline.experian.com">', u'</softDescriptor>', field)
+    field = value.get('cardBrand')
+    if field is not None:
+        write_text(parts, u'<cardBrand xmlns="http://obj.ws.payline.experian.com">', u'</cardBrand>', field)
+    field = value.get('registrationToken')
+    if field is not None:
+        write_text(
+            parts, u'<registrationToken xmlns="http://obj.ws.payline.experian.com">', u'</registrationToken>', field
+        )
+
+
+ORDER_DETAIL_NAMES = frozenset((
+    'ref', 'price', 'quantity', 'comment', 'category', 'brand', 'subcategory1', 'subcategory2', 'additionalData',
+    'taxRate'
+))
+
+
+def write_order_detail(parts, value):
+    """append the elements of orderDetail to parts"""
+    if not isinstance(value, dict):
+        raise UnsupportedValue(value)
+    check_names(ORDER_DETAIL_NAMES, value)
+    field = value.get('ref')
+    if field is not None:
+        write_text(parts, u'<ref xmlns="http://obj.ws.payline.experian.com">', u'</ref>', field)
+    field = value.get('price')
+    if field is not None:
+        write_text(parts, u'<price xmlns="http://obj.ws.payline.experian.com">', u'</price>', field)
+    field = value.get('quantity')
+    if field is not None:
+        write_text(parts, u'<quantity xmlns="http://obj.ws.payline.experian.com">', u'</quantity>', field)
+    field = value.get('comment')
+    if field is not None:
+        write_text(parts, u'<comment xmlns="http://obj.ws.payline.experian.com">', u'</comment>', field)
+    field = value.get('category')
+    if field is not None:
+        write_text(parts, u'<category xmlns="http://obj.ws.payline.experian.com">', u'</category>', field)
+    field = value.get('brand')
+    if field is not None:
+        write_text(parts, u'<brand xmlns="http://obj.ws.payline.experian.com">', u'</brand>', field)
+    field = value.get('subcategory1')
+    if field is not None:
+        write_text(parts, u'<subcategory1 xmlns="http://obj.ws.payline.experian.com">', u'</subcategory1>', field)
+    field = value.get('subcategory2')
+    if field is not None:
+        write_text(parts, u'<subcategory2 xmlns="http://obj.ws.payline.experian.com">', u'</subcategory2>', field)
+    field = value.get('additionalData')
+    if field is not None:
+        write_text(parts, u'<additionalData xmlns="http://obj.ws.payline.experian.com">', u'</additionalData>', field)
+    field = value.get('taxRate')
+    if field is not None:
+        write_text(parts, u'<taxRate xmlns="http://obj.ws.payline.experian.com">', u'</taxRate>', field)
+
+
+DETAILS_NAMES = frozenset(('details', ))
+
+
+def write_details(parts, value):
+    """append the elements of details to parts"""
+    if not isinstance(value, dict):
+        raise UnsupportedValue(value)
+    check_names(DETAILS_NAMES, value)
+    field = value.get('details')
+    if field is not None:
+        write_items(
+            parts, write_order_detail, u'<details xmlns="http://obj.ws.payline.experian.com">', u'</details>',
+            u'<details xmlns="http://obj.ws.payline.experian.com"/>', field
+        )
+
+
+ORDER_NAMES = frozenset((
+    'ref', 'origin', 'country', 'taxes', 'amount', 'currency', 'date', 'details', 'deliveryTime', 'deliveryMode',
+    'deliveryExpectedDate', 'deliveryExpectedDelay', 'deliveryCharge'
+))
+
+
+def write_order(parts, value):
+    """append the elements of order to parts"""
+    if not isinstance(value, dict):
+        raise UnsupportedValue(value)
+    check_names(ORDER_NAMES, value)
+    field = value.get('ref')
+    if field is not None:
+        write_text(parts, u'<ref xmlns="http://obj.ws.payline.experian.com">', u'</ref>', field)
+    field = value.get('origin')
+    if field is not None:
+        write_text(parts, u'<origin xmlns="http://obj.ws.payline.experian.com">', u'</origin>', field)
+    field = value.get('country')
+    if field is not None:
+        write_text(parts, u'<country xmlns="http://obj.ws.payline.experian.com">', u'</country>', field)
+    field = value.get('taxes')
+    if field is not None:
+        write_text(parts, u'<taxes xmlns="http://obj.ws.payline.experian.com">', u'</taxes>', field)
+    field = value.get('amount')
+    if field is not None:
+        write_text(parts, u'<amount xmlns="http://obj.ws.payline.experian.com">', u'</amount>', field)
+    field = value.get('currency')
+    if field is not None:
+        write_text(parts, u'<currency xmlns="http://obj.ws.payline.experian.com">', u'</currency>', field)
+    field = value.get('date')
+    if field is not None:
+        write_text(parts, u'<date xmlns="http://obj.ws.payline.experian.com">', u'</date>', field)
+    field = value.get('details')
+    if field is not None:
+        write_items(
+            parts, write_details, u'<details xmlns="http://obj.ws.payline.experian.com">', u'</details>',
+            u'<details xmlns="http://obj.ws.payline.experian.com"/>', field
+        )
+    field = value.get('deliveryTime')
+    if field is not None:
+        write_text(parts, u'<deliveryTime xmlns="http://obj.ws.payline.experian.com">', u'</deliveryTime>', field)
+    field = value.get('deliveryMode')
+    if field is not None:
+        write_text(parts, u'<deliveryMode xmlns="http://obj.ws.payline.experian.com">', u'</deliveryMode>', field)
+    field = value.get('deliveryExpectedDate')
+    if field is not None:
+        write_text(
+            parts, u'<deliveryExpectedDate xmlns="http://obj.ws.payline.experian.com">', u'</deliveryExpectedDate>',
+            field
+        )
+    field = value.get('deliveryExpectedDelay')
+    if field is not None:
+        write_text(
+            parts, u'<deliveryExpectedDelay xmlns="http://obj.ws.payline.experian.com">', u'</deliveryExpectedDelay>',
+            field
+        )
+    field = value.get('deliveryCharge')
+    if field is not None:
+        write_text(parts, u'<deliveryCharge xmlns="http://obj.ws.payline.experian.com">', u'</deliveryCharge>', field)
+
+
+SELECTED_CONTRACT_LIST_NAMES = frozenset(('selectedContract', ))
+
+
+def write_selected_contract_list(parts, value):
+    """append the elements of selectedContractList to parts"""
+    if not isinstance(value, dict):
+        raise UnsupportedValue(value)
+    check_names(SELECTED_CONTRACT_LIST_NAMES, value)
+    field = value.get('selectedContract')
+    if field is not None:
+        write_text(
+            parts, u'<selectedContract xmlns="http://obj.ws.payline.experian.com">', u'</selectedContract>', field
+        )
+
+
+PRIVATE_DATA_NAMES = frozenset(('key', 'value'))
+
+
+def write_private_data(parts, value):
+    """append the elements of privateData to parts"""
+    if not isinstance(value, dict):
+        raise UnsupportedValue(value)
+    check_names(PRIVATE_DATA_NAMES, value)
+    field = value.get('key')
+    if field is not None:
+        write_text(parts, u'<key xmlns="http://obj.ws.payline.experian.com">', u'</key>', field)
+    field = value.get('value')
+    if field is not None:
+        write_text(parts, u'<value xmlns="http://obj.ws.payline.experian.com">', u'</value>', field)
+
+
+PRIVATE_DATA_LIST_NAMES = frozenset(('privateData', ))
+
+
+def write_private_data_list(parts, value):
+    """append the elements of privateDataList to parts"""
+    if not isinstance(value, dict):
+        raise UnsupportedValue(value)
+    check_names(PRIVATE_DATA_LIST_NAMES, value)
+    field = value.get('privateData')
+    if field is not None:
+        write_items(
+            parts, write_private_data, u'<privateData xmlns="http://obj.ws.payline.experian.com">', u'</privateData>',
+            u'<privateData xmlns="http://obj.ws.payline.experian.com"/>', field
+        )
+
+
+ADDRESS_NAMES = frozenset((
+    'title', 'name', 'firstName', 'lastName', 'street1', 'street2', 'cityName', 'zipCode', 'country', 'phone', 'state',
+    'county', 'phoneType'
+))
+
+
+def write_address(parts, value):
+    """append the elements of address to parts"""
+    if not isinstance(value, dict):
+        raise UnsupportedValue(value)
+    check_names(ADDRESS_NAMES, value)
+    field = value.get('title')
+    if field is not None:
+        write_text(parts, u'<title xmlns="http://obj.ws.payline.experian.com">', u'</title>', field)
+    field = value.get('name')
+    if field is not None:
+        write_text(parts, u'<name xmlns="http://obj.ws.payline.experian.com">', u'</name>', field)
+    field = value.get('firstName')
+    if field is not None:
+        write_text(parts, u'<firstName xmlns="http://obj.ws.payline.experian.com">', u'</firstName>', field)
+    field = value.get('lastName')
+    if field is not None:
+        write_text(parts, u'<lastName xmlns="http://obj.ws.payline.experian.com">', u'</lastName>', field)
+    field = value.get('street1')
+    if field is not None:
+        write_text(parts, u'<street1 xmlns="http://obj.ws.payline.experian.com">', u'</street1>', field)
+    field = value.get('street2')
+    if field is not None:
+        write_text(parts, u'<street2 xmlns="http://obj.ws.payline.experian.com">', u'</street2>', field)
+    field = value.get('cityName')
+    if field is not None:
+        write_text(parts, u'<cityName xmlns="http://obj.ws.payline.experian.com">', u'</cityName>', field)
+    field = value.get('zipCode')
+    if field is not None:
+        write_text(parts, u'<zipCode xmlns="http://obj.ws.payline.experian.com">', u'</zipCode>', field)
+    field = value.get('country')
+    if field is not None:
+        write_text(parts, u'<country xmlns="http://obj.ws.payline.experian.com">', u'</country>', field)
+    field = value.get('phone')
+    if field is not None:
+        write_text(parts, u'<phone xmlns="http://obj.ws.payline.experian.com">', u'</phone>', field)
+    field = value.get('state')
+    if field is not None:
+        write_text(parts, u'<state xmlns="http://obj.ws.payline.experian.com">', u'</state>', field)
+    field = value.get('county')
+    if field is not None:
+        write_text(parts, u'<county xmlns="http://obj.ws.payline.experian.com">', u'</county>', field)
+    field = value.get('phoneType')
+    if field is not None:
+        write_text(parts, u'<phoneType xmlns="http://obj.ws.payline.experian.com">', u'</phoneType>', field)
+
+
+BUYER_NAMES = frozenset((
+    'title', 'lastName', 'firstName', 'email', 'shippingAdress', 'billingAddress', 'accountCreateDate',
+    'accountAverageAmount', 'accountOrderCount', 'walletId', 'walletDisplayed', 'walletSecured', 'walletCardInd', 'ip',
+    'mobilePhone', 'customerId', 'legalStatus', 'legalDocument', 'birthDate', 'fingerprintID', 'deviceFingerprint',
+    'isBot', 'isIncognito', 'isBehindProxy', 'isFromTor', 'isEmulator', 'isRooted', 'hasTimezoneMismatch'
+))
+
+
+def write_buyer(parts, value):
+    """append the elements of buyer to parts"""
+    if not isinstance(value, dict):
+        raise UnsupportedValue(value)
+    check_names(BUYER_NAMES, value)
+    field = value.get('title')
+    if field is not None:
+        write_text(parts, u'<title xmlns="http://obj.ws.payline.experian.com">', u'</title>', field)
+    field = value.get('lastName')
+    if field is not None:
+        write_text(parts, u'<lastName xmlns="http://obj.ws.payline.experian.com">', u'</lastName>', field)
+    field = value.get('firstName')
+    if field is not None:
+        write_text(parts, u'<firstName xmlns="http://obj.ws.payline.experian.com">', u'</firstName>', field)
+    field = value.get('email')
+    if field is not None:
+        write_text(parts, u'<email xmlns="http://obj.ws.payline.experian.com">', u'</email>', field)
+    field = value.get('shippingAdress')
+    if field is not None:
+        write_items(
+            parts, write_address, u'<shippingAdress xmlns="http://obj.ws.payline.experian.com">', u'</shippingAdress>',
+            u'<shippingAdress xmlns="http://obj.ws.payline.experian.com"/>', field
+        )
+    field = value.get('billingAddress')
+    if field is not None:
+        write_items(
+            parts, write_address, u'<billingAddress xmlns="http://obj.ws.payline.experian.com">', u'</billingAddress>',
+            u'<billingAddress xmlns="http://obj.ws.payline.experian.com"/>', field
+        )
+    field = value.get('accountCreateDate')
+    if field is not None:
+        write_text(
+            parts, u'<accountCreateDate xmlns="http://obj.ws.payline.experian.com">', u'</accountCreateDate>', field
+        )
+    field = value.get('accountAverageAmount')
+    if field is not None:
+        write_text(
+            parts, u'<accountAverageAmount xmlns="http://obj.ws.payline.experian.com">', u'</accountAverageAmount>',
+            field
+        )
+    field = value.get('accountOrderCount')
+    if field is not None:
+        write_text(
+            parts, u'<accountOrderCount xmlns="http://obj.ws.payline.experian.com">', u'</accountOrderCount>', field
+        )
+    field = value.get('walletId')
+    if field is not None:
+        write_text(parts, u'<walletId xmlns="http://obj.ws.payline.experian.com">', u'</walletId>', field)
+    field = value.get('walletDisplayed')
+    if field is not None:
+        write_text(parts, u'<walletDisplayed xmlns="http://obj.ws.payline.experian.com">', u'</walletDisplayed>', field)
+    field = value.get('walletSecured')
+    if field is not None:
+        write_text(parts, u'<walletSecured xmlns="http://obj.ws.payline.experian.com">', u'</walletSecured>', field)
+    field = value.get('walletCardInd')
+    if field is not None:
+        write_text(parts, u'<walletCardInd xmlns="http://obj.ws.payline.experian.com">', u'</walletCardInd>', field)
+    field = value.get('ip')
+    if field is not None:
+        write_text(parts, u'<ip xmlns="http://obj.ws.payline.experian.com">', u'</ip>', field)
+    field = value.get('mobilePhone')
+    if field is not None:
+        write_text(parts, u'<mobilePhone xmlns="http://obj.ws.payline.experian.com">', u'</mobilePhone>', field)
+    field = value.get('customerId')
+    if field is not None:
+        write_text(parts, u'<customerId xmlns="http://obj.ws.payline.experian.com">', u'</customerId>', field)
+    field = value.get('legalStatus')
+    if field is not None:
+        write_text(parts, u'<legalStatus xmlns="http://obj.ws.payline.experian.com">', u'</legalStatus>', field)
+    field = value.get('legalDocument')
+    if field is not None:
+        write_text(parts, u'<legalDocument xmlns="http://obj.ws.payline.experian.com">', u'</legalDocument>', field)
+    field = value.get('birthDate')
+    if field is not None:
+        write_text(parts, u'<birthDate xmlns="http://obj.ws.payline.experian.com">', u'</birthDate>', field)
+    field = value.get('fingerprintID')
+    if field is not None:
+        write_text(parts, u'<fingerprintID xmlns="http://obj.ws.payline.experian.com">', u'</fingerprintID>', field)
+    field = value.get('deviceFingerprint')
+    if field is not None:
+        write_text(
+            parts, u'<deviceFingerprint xmlns="http://obj.ws.payline.experian.com">', u'</deviceFingerprint>', field
+        )
+    field = value.get('isBot')
+    if field is not None:
+        write_text(parts, u'<isBot xmlns="http://obj.ws.payline.experian.com">', u'</isBot>', field)
+    field = value.get('isIncognito')
+    if field is not None:
+        write_text(parts, u'<isIncognito xmlns="http://obj.ws.payline.experian.com">', u'</isIncognito>', field)
+    field = value.get('isBehindProxy')
+    if field is not None:
+        write_text(parts, u'<isBehindProxy xmlns="http://obj.ws.payline.experian.com">', u'</isBehindProxy>', field)
+    field = value.get('isFromTor')
+    if field is not None:
+        write_text(parts, u'<isFromTor xmlns="http://obj.ws.payline.experian.com">', u'</isFromTor>', field)
+    field = value.get('isEmulator')
+    if field is not None:
+        write_text(parts, u'<isEmulator xmlns="http://obj.ws.payline.experian.com">', u'</isEmulator>', field)
+    field = value.get('isRooted')
+    if field is not None:
+        write_text(parts, u'<isRooted xmlns="http://obj.ws.payline.experian.com">', u'</isRooted>', field)
+    field = value.get('hasTimezoneMismatch')
+    if field is not None:
+        write_text(
+            parts, u'<hasTimezoneMismatch xmlns="http://obj.ws.payline.experian.com">', u'</hasTimezoneMismatch>',
+            field
+        )
+
+
+ADDRESS_OWNER_NAMES = frozenset(('street', 'cityName', 'zipCode', 'country', 'phone'))
+
+
+def write_address_owner(parts, value):
+    """append the elements of addressOwner to parts"""
+    if not isinstance(value, dict):
+        raise UnsupportedValue(value)
+    check_names(ADDRESS_OWNER_NAMES, value)
+    field = value.get('street')
+    if field is not None:
+        write_text(parts, u'<street xmlns="http://obj.ws.payline.experian.com">', u'</street>', field)
+    field = value.get('cityName')
+    if field is not None:
+        write_text(parts, u'<cityName xmlns="http://obj.ws.payline.experian.com">', u'</cityName>', field)
+    field = value.get('zipCode')
+    if field is not None:
+        write_text(parts, u'<zipCode xmlns="http://obj.ws.payline.experian.com">', u'</zipCode>', field)
+    field = value.get('country')
+    if field is not None:
+        write_text(parts, u'<country xmlns="http://obj.ws.payline.experian.com">', u'</country>', field)
+    field = value.get('phone')
+    if field is not None:
+        write_text(parts, u'<phone xmlns="http://obj.ws.payline.experian.com">', u'</phone>', field)
+
+
+OWNER_NAMES = frozenset(('lastName', 'firstName', 'billingAddress', 'issueCardDate'))
+
+
+def write_owner(parts, value):
+    """append the elements of owner to parts"""
+    if not isinstance(value, dict):
+        raise UnsupportedValue(value)
+    check_names(OWNER_NAMES, value)
+    field = value.get('lastName')
+    if field is not None:
+        write_text(parts, u'<lastName xmlns="http://obj.ws.payline.experian.com">', u'</lastName>', field)
+    field = value.get('firstName')
+    if field is not None:
+        write_text(parts, u'<firstName xmlns="http://obj.ws.payline.experian.com">', u'</firstName>', field)
+    field = value.get('billingAddress')
+    if field is not None:
+        write_items(
+            parts, write_address_owner, u'<billingAddress xmlns="http://obj.ws.payline.experian.com">',
+            u'</billingAddress>', u'<billingAddress xmlns="http://obj.ws.payline.experian.com"/>', field
+        )
+    field = value.get('issueCardDate')
+    if field is not None:
+        write_text(parts, u'<issueCardDate xmlns="http://obj.ws.payline.experian.com">', u'</issueCardDate>', field)
+
+
+RECURRING_NAMES = frozenset((
+    'firstAmount', 'amount', 'billingCycle', 'billingLeft', 'billingDay', 'startDate', 'endDate', 'newAmount',
+    'amountModificationDate'
+))
+
+
+def write_recurring(parts, value):
+    """append the elements of recurring to parts"""
+    if not isinstance(value, dict):
+        raise UnsupportedValue(value)
+    check_names(RECURRING_NAMES, value)
+    field = value.get('firstAmount')
+    if field is not None:
+        write_text(parts, u'<firstAmount xmlns="http://obj.ws.payline.experian.com">', u'</firstAmount>', field)
+    field = value.get('amount')
+    if field is not None:
+        write_text(parts, u'<amount xmlns="http://obj.ws.payline.experian.com">', u'</amount>', field)
+    field = value.get('billingCycle')
+    if field is not None:
+        write_text(parts, u'<billingCycle xmlns="http://obj.ws.payline.experian.com">', u'</billingCycle>', field)
+    field = value.get('billingLeft')
+    if field is not None:
+        write_text(parts, u'<billingLeft xmlns="http://obj.ws.payline.experian.com">', u'</billingLeft>', field)
+    field = value.get('billingDay')
+    if field is not None:
+        write_text(parts, u'<billingDay xmlns="http://obj.ws.payline.experian.com">', u'</billingDay>', field)
+    field = value.get('startDate')
+    if field is not None:
+        write_text(parts, u'<startDate xmlns="http://obj.ws.payline.experian.com">', u'</startDate>', field)
+    field = value.get('endDate')
+    if field is not None:
+        write_text(parts, u'<endDate xmlns="http://obj.ws.payline.experian.com">', u'</endDate>', field)
+    field = value.get('newAmount')
+    if field is not None:
+        write_text(parts, u'<newAmount xmlns="http://obj.ws.payline.experian.com">', u'</newAmount>', field)
+    field = value.get('amountModificationDate')
+    if field is not None:
+        write_text(
+            parts, u'<amountModificationDate xmlns="http://obj.ws.payline.experian.com">', u'</amountModificationDate>',
+            field
+        )
+
+
+CONTRACT_NUMBER_WALLET_LIST_NAMES = frozenset(('contractNumberWallet', ))
+
+
+def write_contract_number_wallet_list(parts, value):
+    """append the elements of contractNumberWalletList to parts"""
+    if not isinstance(value, dict):
+        raise UnsupportedValue(value)
+    check_names(CONTRACT_NUMBER_WALLET_LIST_NAMES, value)
+    field = value.get('contractNumberWallet')
+    if field is not None:
+        write_text(
+            parts, u'<contractNumberWallet xmlns="http://obj.ws.payline.experian.com">', u'</contractNumberWallet>',
+            field
+        )
+
+
+SUB_MERCHANT_NAMES = frozenset((
+    'subMerchantId', 'subMerchantName', 'subMerchantMCC', 'subMerchantSIRET', 'subMerchantTaxCode', 'subMerchantStreet',
+    'subMerchantCity', 'subMerchantZipCode', 'subMerchantCountry', 'subMerchantState', 'subMerchantEmailAddress',
+    'subMerchantPhoneNumber'
+))
+
+
+def write_sub_merchant(parts, value):
+    """append the elements of subMerchant to parts"""
+    if not isinstance(value, dict):
+        raise UnsupportedValue(value)
+    check_names(SUB_MERCHANT_NAMES, value)
+    field = value.get('subMerchantId')
+    if field is not None:
+        write_text(parts, u'<subMerchantId xmlns="http://obj.ws.payline.experian.com">', u'</subMerchantId>', field)
+    field = value.get('subMerchantName')
+    if field is not None:
+        write_text(parts, u'<subMerchantName xmlns="http://obj.ws.payline.experian.com">', u'</subMerchantName>', field)
+    field = value.get('subMerchantMCC')
+    if field is not None:
+        write_text(parts, u'<subMerchantMCC xmlns="http://obj.ws.payline.experian.com">', u'</subMerchantMCC>', field)
+    field = value.get('subMerchantSIRET')
+    if field is not None:
+        write_text(
+            parts, u'<subMerchantSIRET xmlns="http://obj.ws.payline.experian.com">', u'</subMerchantSIRET>', field
+        )
+    field = value.get('subMerchantTaxCode')
+    if field is not None:
+        write_text(
+            parts, u'<subMerchantTaxCode xmlns="http://obj.ws.payline.experian.com">', u'</subMerchantTaxCode>', field
+        )
+    field = value.get('subMerchantStreet')
+    if field is not None:
+        write_text(
+            parts, u'<subMerchantStreet xmlns="http://obj.ws.payline.experian.com">', u'</subMerchantStreet>', field
+        )
+    field = value.get('subMerchantCity')
+    if field is not None:
+        write_text(parts, u'<subMerchantCity xmlns="http://obj.ws.payline.experian.com">', u'</subMerchantCity>', field)
+    field = value.get('subMerchantZipCode')
+    if field is not None:
+        write_text(
+            parts, u'<subMerchantZipCode xmlns="http://obj.ws.payline.experian.com">', u'</subMerchantZipCode>', field
+        )
+    field = value.get('subMerchantCountry')
+    if field is not None:
+        write_text(
+            parts, u'<subMerchantCountry xmlns="http://obj.ws.payline.experian.com">', u'</subMerchantCountry>', field
+        )
+    field = value.get('subMerchantState')
+    if field is not None:
+        write_text(
+            parts, u'<subMerchantState xmlns="http://obj.ws.payline.experian.com">', u'</subMerchantState>', field
+        )
+    field = value.get('subMerchantEmailAddress')
+    if field is not None:
+        write_text(
+            parts, u'<subMerchantEmailAddress xmlns="http://obj.ws.payline.experian.com">',
+            u'</subMerchantEmailAddress>', field
+        )
+    field = value.get('subMerchantPhoneNumber')
+    if field is not None:
+        write_text(
+            parts, u'<subMerchantPhoneNumber xmlns="http://obj.ws.payline.experian.com">', u'</subMerchantPhoneNumber>',
+            field
+        )
+
+
+DO_WEB_PAYMENT_START = ENVELOPE_START.format(
+    soap_uri=SOAP_URI, name=u'doWebPaymentRequest', namespace=u'http://impl.ws.payline.experian.com'
+)
+DO_WEB_PAYMENT_END = ENVELOPE_END.format(name=u'doWebPaymentRequest')
+DO_WEB_PAYMENT_NAMES = frozenset((
+    'version', 'payment', 'returnURL', 'cancelURL', 'order', 'notificationURL', 'selectedContractList',
+    'secondSelectedContractList', 'privateDataList', 'languageCode', 'customPaymentPageCode', 'buyer', 'owner',
+    'securityMode', 'recurring', 'customPaymentTemplateURL', 'contractNumberWalletList', 'merchantName', 'subMerchant',
+    'miscData', 'asynchronousRetryTimeout'
+))
+
+
+def build_do_web_payment(version=None, payment=None, returnURL=None, cancelURL=None, order=None, notificationURL=None,
+                         selectedContractList=None, secondSelectedContractList=None, privateDataList=None,
+                         languageCode=None, customPaymentPageCode=None, buyer=None, owner=None, securityMode=None,
+                         recurring=None, customPaymentTemplateURL=None, contractNumberWalletList=None,
+                         merchantName=None, subMerchant=None, miscData=None, asynchronousRetryTimeout=None):
+    """the doWebPayment request envelope as utf-8 bytes"""
+    parts = [DO_WEB_PAYMENT_START]
+    if version is not None:
+        write_text(parts, u'<version>', u'</version>', version)
+    if payment is not None:
+        write_items(
+            parts, write_payment, u'<payment xmlns="http://impl.ws.payline.experian.com">', u'</payment>',
+            u'<payment xmlns="http://impl.ws.payline.experian.com"/>', payment
+        )
+    if returnURL is not None:
+        write_text(parts, u'<returnURL>', u'</returnURL>', returnURL)
+    if cancelURL is not None:
+        write_text(parts, u'<cancelURL>', u'</cancelURL>', cancelURL)
+    if order is not None:
+        write_items(
+            parts, write_order, u'<order xmlns="http://impl.ws.payline.experian.com">', u'</order>',
+            u'<order xmlns="http://impl.ws.payline.experian.com"/>', order
+        )
+    if notificationURL is not None:
+        write_text(parts, u'<notificationURL>', u'</notificationURL>', notificationURL)
+    if selectedContractList is not None:
+        write_items(
+            parts, write_selected_contract_list, u'<selectedContractList xmlns="http://impl.ws.payline.experian.com">',
+            u'</selectedContractList>', u'<selectedContractList xmlns="http://impl.ws.payline.experian.com"/>',
+            selectedContractList
+        )
+    if secondSelectedContractList is not None:
+        write_items(
+            parts, write_selected_contract_list,
+            u'<secondSelectedContractList xmlns="http://impl.ws.payline.experian.com">',
+            u'</secondSelectedContractList>',
+            u'<secondSelectedContractList xmlns="http://impl.ws.payline.experian.com"/>', secondSelectedContractList
+        )
+    if privateDataList is not None:
+        write_items(
+            parts, write_private_data_list, u'<privateDataList xmlns="http://impl.ws.payline.experian.com">',
+            u'</privateDataList>', u'<privateDataList xmlns="http://impl.ws.payline.experian.com"/>', privateDataList
+        )
+    if languageCode is not None:
+        write_text(parts, u'<languageCode>', u'</languageCode>', languageCode)
+    if customPaymentPageCode is not None:
+        write_text(parts, u'<customPaymentPageCode>', u'</customPaymentPageCode>', customPaymentPageCode)
+    if buyer is not None:
+        write_items(
+            parts, write_buyer, u'<buyer xmlns="http://impl.ws.payline.experian.com">', u'</buyer>',
+            u'<buyer xmlns="http://impl.ws.payline.experian.com"/>', buyer
+        )
+    if owner is not None:
+        write_items(
+            parts, write_owner, u'<owner xmlns="http://impl.ws.payline.experian.com">', u'</owner>',
+            u'<owner xmlns="http://impl.ws.payline.experian.com"/>', owner
+        )
+    if securityMode is not None:
+        write_text(parts, u'<securityMode>', u'</securityMode>', securityMode)
+    if recurring is not None:
+        write_items(
+            parts, write_recurring, u'<recurring xmlns="http://impl.ws.payline.experian.com">', u'</recurring>',
+            u'<recurring xmlns="http://impl.ws.payline.experian.com"/>', recurring
+        )
+    if customPaymentTemplateURL is not None:
+        write_text(parts, u'<customPaymentTemplateURL>', u'</customPaymentTemplateURL>', customPaymentTemplateURL)
+    if contractNumberWalletList is not None:
+        write_items(
+            parts, write_contract_number_wallet_list,
+            u'<contractNumberWalletList xmlns="http://impl.ws.payline.experian.com">', u'</contractNumberWalletList>',
+            u'<contractNumberWalletList xmlns="http://impl.ws.payline.experian.com"/>', contractNumberWalletList
+        )
+    if merchantName is not None:
+        write_text(parts, u'<merchantName>', u'</merchantName>', merchantName)
+    if subMerchant is not None:
+        write_items(
+            parts, write_sub_merchant, u'<subMerchant xmlns="http://impl.ws.payline.experian.com">', u'</subMerchant>',
+            u'<subMerchant xmlns="http://impl.ws.payline.experian.com"/>', subMerchant
+        )
+    if miscData is not None:
+        write_text(parts, u'<miscData>', u'</miscData>', miscData)
+    if asynchronousRetryTimeout is not None:
+        write_text(parts, u'<asynchronousRetryTimeout>', u'</asynchronousRetryTimeout>', asynchronousRetryTimeout)
+    parts.append(DO_WEB_PAYMENT_END)
+    return u''.join(parts).encode('utf-8')
+
+
+GET_WEB_PAYMENT_DETAILS_START = ENVELOPE_START.format(
+    soap_uri=SOAP_URI, name=u'getWebPaymentDetailsRequest', namespace=u'http://impl.ws.payline.experian.com'
+)
+GET_WEB_PAYMENT_DETAILS_END = ENVELOPE_END.format(name=u'getWebPaymentDetailsRequest')
+GET_WEB_PAYMENT_DETAILS_NAMES = frozenset(('version', 'token'))
+
+
+def build_get_web_payment_details(version=None, token=None):
+    """the getWebPaymentDetails request envelope as utf-8 bytes"""
+    parts = [GET_WEB_PAYMENT_DETAILS_START]
+    if version is not None:
+        write_text(parts, u'<version>', u'</version>', version)
+    if token is not None:
+        write_text(parts, u'<token>', u'</token>', token)
+    parts.append(GET_WEB_PAYMENT_DETAILS_END)
+    return u''.join(parts).encode('utf-8')
+
+
+MANAGE_WEB_WALLET_START = ENVELOPE_START.format(
+    soap_uri=SOAP_URI, name=u'manageWebWalletRequest', namespace=u'http://impl.ws.payline.experian.com'
+)
+MANAGE_WEB_WALLET_END = ENVELOPE_END.format(name=u'manageWebWalletRequest')
+MANAGE_WEB_WALLET_NAMES = frozenset((
+    'version', 'contractNumber', 'selectedContractList', 'updatePersonalDetails', 'buyer', 'owner', 'languageCode',
+    'customPaymentPageCode', 'securityMode', 'returnURL', 'cancelURL', 'notificationURL', 'privateDataList',
+    'customPaymentTemplateURL', 'contractNumberWalletList', 'merchantName'
+))
+
+
+def build_manage_web_wallet(version=None, contractNumber=None, selectedContractList=None, updatePersonalDetails=None,
+                            buyer=None, owner=None, languageCode=None, customPaymentPageCode=None, securityMode=None,
+                            returnURL=None, cancelURL=None, notificationURL=None, privateDataList=None,
+                            customPaymentTemplateURL=None, contractNumberWalletList=None, merchantName=None):
+    """the manageWebWallet request envelope as utf-8 bytes"""
+    parts = [MANAGE_WEB_WALLET_START]
+    if version is not None:
+        write_text(parts, u'<version>', u'</version>', version)
+    if contractNumber is not None:
+        write_text(parts, u'<contractNumber>', u'</contractNumber>', contractNumber)
+    if selectedContractList is not None:
+        write_items(
+            parts, write_selected_contract_list, u'<selectedContractList xmlns="http://impl.ws.payline.experian.com">',
+            u'</selectedContractList>', u'<selectedContractList xmlns="http://impl.ws.payline.experian.com"/>',
+            selectedContractList
+        )
+    if updatePersonalDetails is not None:
+        write_text(parts, u'<updatePersonalDetails>', u'</updatePersonalDetails>', updatePersonalDetails)
+    if buyer is not None:
+        write_items(
+            parts, write_buyer, u'<buyer xmlns="http://impl.ws.payline.experian.com">', u'</buyer>',
+            u'<buyer xmlns="http://impl.ws.payline.experian.com"/>', buyer
+        )
+    if owner is not None:
+        write_items(
+            parts, write_owner, u'<owner xmlns="http://impl.ws.payline.experian.com">', u'</owner>',
+            u'<owner xmlns="http://impl.ws.payline.experian.com"/>', owner
+        )
+    if languageCode is not None:
+        write_text(parts, u'<languageCode>', u'</languageCode>', languageCode)
+    if customPaymentPageCode is not None:
+        write_text(parts, u'<customPaymentPageCode>', u'</customPaymentPageCode>', customPaymentPageCode)
+    if securityMode is not None:
+        write_text(parts, u'<securityMode>', u'</securityMode>', securityMode)
+    if returnURL is not None:
+        write_text(parts, u'<returnURL>', u'</returnURL>', returnURL)
+    if cancelURL is not None:
+        write_text(parts, u'<cancelURL>', u'</cancelURL>', cancelURL)
+    if notificationURL is not None:
+        write_text(parts, u'<notificationURL>', u'</notificationURL>', notificationURL)
+    if privateDataList is not None:
+        write_items(
+            parts, write_private_data_list, u'<privateDataList xmlns="http://impl.ws.payline.experian.com">',
+            u'</privateDataList>', u'<privateDataList xmlns="http://impl.ws.payline.experian.com"/>', privateDataList
+        )
+    if customPaymentTemplateURL is not None:
+        write_text(parts, u'<customPaymentTemplateURL>', u'</customPaymentTemplateURL>', customPaymentTemplateURL)
+    if contractNumberWalletList is not None:
+        write_items(
+            parts, write_contract_number_wallet_list,
+            u'<contractNumberWalletList xmlns="http://impl.ws.payline.experian.com">', u'</contractNumberWalletList>',
+            u'<contractNumberWalletList xmlns="http://impl.ws.payline.experian.com"/>', contractNumberWalletList
+        )
+    if merchantName is not None:
+        write_text(parts, u'<merchantName>', u'</merchantName>', merchantName)
+    parts.append(MANAGE_WEB_WALLET_END)
+    return u''.join(parts).encode('utf-8')
+
+
+CREATE_WEB_WALLET_START = ENVELOPE_START.format(
+    soap_uri=SOAP_URI, name=u'createWebWalletRequest', namespace=u'http://impl.ws.payline.experian.com'
+)
+CREATE_WEB_WALLET_END = ENVELOPE_END.format(name=u'createWebWalletRequest')
+CREATE_WEB_WALLET_NAMES = frozenset((
+    'version', 'contractNumber', 'selectedContractList', 'updatePersonalDetails', 'buyer', 'owner', 'languageCode',
+    'customPaymentPageCode', 'securityMode', 'returnURL', 'cancelURL', 'notificationURL', 'privateDataList',
+    'customPaymentTemplateURL', 'contractNumberWalletList'
+))
+
+
+def build_create_web_wallet(version=None, contractNumber=None, selectedContractList=None, updatePersonalDetails=None,
+                            buyer=None, owner=None, languageCode=None, customPaymentPageCode=None, securityMode=None,
+                            returnURL=None, cancelURL=None, notificationURL=None, privateDataList=None,
+                            customPaymentTemplateURL=None, contractNumberWalletList=None):
+    """the createWebWallet request envelope as utf-8 bytes"""
+    parts = [CREATE_WEB_WALLET_START]
+    if version is not None:
+        write_text(parts, u'<version>', u'</version>', version)
+    if contractNumber is not None:
+        write_text(parts, u'<contractNumber>', u'</contractNumber>', contractNumber)
+    if selectedContractList is not None:
+        write_items(
+            parts, write_selected_contract_list, u'<selectedContractList xmlns="http://impl.ws.payline.experian.com">',
+            u'</selectedContractList>', u'<selectedContractList xmlns="http://impl.ws.payline.experian.com"/>',
+            selectedContractList
+        )
+    if updatePersonalDetails is not None:
+        write_text(parts, u'<updatePersonalDetails>', u'</updatePersonalDetails>', updatePersonalDetails)
+    if buyer is not None:
+        write_items(
+            parts, write_buyer, u'<buyer xmlns="http://impl.ws.payline.experian.com">', u'</buyer>',
+            u'<buyer xmlns="http://impl.ws.payline.experian.com"/>', buyer
+        )
+    if owner is not None:
+        write_items(
+            parts, write_owner, u'<owner xmlns="http://impl.ws.payline.experian.com">', u'</owner>',
+            u'<owner xmlns="http://impl.ws.payline.experian.com"/>', owner
+        )
+    if languageCode is not None:
+        write_text(parts, u'<languageCode>', u'</languageCode>', languageCode)
+    if customPaymentPageCode is not None:
+        write_text(parts, u'<customPaymentPageCode>', u'</customPaymentPageCode>', customPaymentPageCode)
+    if securityMode is not None:
+        write_text(parts, u'<securityMode>', u'</securityMode>', securityMode)
+    if returnURL is not None:
+        write_text(parts, u'<returnURL>', u'</returnURL>', returnURL)
+    if cancelURL is not None:
+        write_text(parts, u'<cancelURL>', u'</cancelURL>', cancelURL)
+    if notificationURL is not None:
+        write_text(parts, u'<notificationURL>', u'</notificationURL>', notificationURL)
+    if privateDataList is not None:
+        write_items(
+            parts, write_private_data_list, u'<privateDataList xmlns="http://impl.ws.payline.experian.com">',
+            u'</privateDataList>', u'<privateDataList xmlns="http://impl.ws.payline.experian.com"/>', privateDataList
+        )
+    if customPaymentTemplateURL is not None:
+        write_text(parts, u'<customPaymentTemplateURL>', u'</customPaymentTemplateURL>', customPaymentTemplateURL)
+    if contractNumberWalletList is not None:
+        write_items(
+            parts, write_contract_number_wallet_list,
+            u'<contractNumberWalletList xmlns="http://impl.ws.payline.experian.com">', u'</contractNumberWalletList>',
+            u'<contractNumberWalletList xmlns="http://impl.ws.payline.experian.com"/>', contractNumberWalletList
+        )
+    parts.append(CREATE_WEB_WALLET_END)
+    return u''.join(parts).encode('utf-8')
+
+
+UPDATE_WEB_WALLET_START = ENVELOPE_START.format(
+    soap_uri=SOAP_URI, name=u'updateWebWalletRequest', namespace=u'http://impl.ws.payline.experian.com'
+)
+UPDATE_WEB_WALLET_END = ENVELOPE_END.format(name=u'updateWebWalletRequest')
+UPDATE_WEB_WALLET_NAMES = frozenset((
+    'version', 'contractNumber', 'cardInd', 'walletId', 'updatePersonalDetails', 'updateOwnerDetails',
+    'updatePaymentDetails', 'buyer', 'languageCode', 'customPaymentPageCode', 'securityMode', 'returnURL', 'cancelURL',
+    'notificationURL', 'privateDataList', 'customPaymentTemplateURL', 'contractNumberWalletList'
+))
+
+
+def build_update_web_wallet(version=None, contractNumber=None, cardInd=None, walletId=None, updatePersonalDetails=None,
+                            updateOwnerDetails=None, updatePaymentDetails=None, buyer=None, languageCode=None,
+                            customPaymentPageCode=None, securityMode=None, returnURL=None, cancelURL=None,
+                            notificationURL=None, privateDataList=None, customPaymentTemplateURL=None,
+                            contractNumberWalletList=None):
+    """the updateWebWallet request envelope as utf-8 bytes"""
+    parts = [UPDATE_WEB_WALLET_START]
+    if version is not None:
+        write_text(parts, u'<version>', u'</version>', version)
+    if contractNumber is not None:
+        write_text(parts, u'<contractNumber>', u'</contractNumber>', contractNumber)
+    if cardInd is not None:
+        write_text(parts, u'<cardInd>', u'</cardInd>', cardInd)
+    if walletId is not None:
+        write_text(parts, u'<walletId>', u'</walletId>', walletId)
+    if updatePersonalDetails is not None:
+        write_text(parts, u'<updatePersonalDetails>', u'</updatePersonalDetails>', updatePersonalDetails)
+    if updateOwnerDetails is not None:
+        write_text(parts, u'<updateOwnerDetails>', u'</updateOwnerDetails>', updateOwnerDetails)
+    if updatePaymentDetails is not None:
+        write_text(parts, u'<updatePaymentDetails>', u'</updatePaymentDetails>', updatePaymentDetails)
+    if buyer is not None:
+        write_items(
+            parts, write_buyer, u'<buyer xmlns="http://impl.ws.payline.experian.com">', u'</buyer>',
+            u'<buyer xmlns="http://impl.ws.payline.experian.com"/>', buyer
+        )
+    if languageCode is not None:
+        write_text(parts, u'<languageCode>', u'</languageCode>', languageCode)
+    if customPaymentPageCode is not None:
+        write_text(parts, u'<customPaymentPageCode>', u'</customPaymentPageCode>', customPaymentPageCode)
+    if securityMode is not None:
+        write_text(parts, u'<securityMode>', u'</securityMode>', securityMode)
+    if returnURL is not None:
+        write_text(parts, u'<returnURL>', u'</returnURL>', returnURL)
+    if cancelURL is not None:
+        write_text(parts, u'<cancelURL>', u'</cancelURL>', cancelURL)
+    if notificationURL is not None:
+        write_text(parts, u'<notificationURL>', u'</notificationURL>', notificationURL)
+    if privateDataList is not None:
+        write_items(
+            parts, write_private_data_list, u'<privateDataList xmlns="http://impl.ws.payline.experian.com">',
+            u'</privateDataList>', u'<privateDataList xmlns="http://impl.ws.payline.experian.com"/>', privateDataList
+        )
+    if customPaymentTemplateURL is not None:
+        write_text(parts, u'<customPaymentTemplateURL>', u'</customPaymentTemplateURL>', customPaymentTemplateURL)
+    if contractNumberWalletList is not None:
+        write_items(
+            parts, write_contract_number_wallet_list,
+            u'<contractNumberWalletList xmlns="http://impl.ws.payline.experian.com">', u'</contractNumberWalletList>',
+            u'<contractNumberWalletList xmlns="http://impl.ws.payline.experian.com"/>', contractNumberWalletList
+        )
+    parts.append(UPDATE_WEB_WALLET_END)
+    return u''.join(parts).encode('utf-8')
+
+
+GET_WEB_WALLET_START = ENVELOPE_START.format(
+    soap_uri=SOAP_URI, name=u'getWebWalletRequest', namespace=u'http://impl.ws.payline.experian.com'
+)
+GET_WEB_WALLET_END = ENVELOPE_END.format(name=u'getWebWalletRequest')
+GET_WEB_WALLET_NAMES = frozenset(('version', 'token'))
+
+
+def build_get_web_wallet(version=None, token=None):
+    """the getWebWallet request envelope as utf-8 bytes"""
+    parts = [GET_WEB_WALLET_START]
+    if version is not None:
+        write_text(parts, u'<version>', u'</version>', version)
+    if token is not None:
+        write_text(parts, u'<token>', u'</token>', token)
+    parts.append(GET_WEB_WALLET_END)
+    return u''.join(parts).encode('utf-8')
+
+
+# {operation: (function writing the request, names of its elements, soap action)}
+REQUESTS = {
+    'doWebPayment': (build_do_web_payment, DO_WEB_PAYMENT_NAMES, u'doWebPayment'),
+    'getWebPaymentDetails': (build_get_web_payment_details, GET_WEB_PAYMENT_DETAILS_NAMES, u'getWebPaymentDetails'),
+    'manageWebWallet': (build_manage_web_wallet, MANAGE_WEB_WALLET_NAMES, u'manageWebWallet'),
+    'createWebWallet': (build_create_web_wallet, CREATE_WEB_WALLET_NAMES, u'createWebWallet'),
+    'updateWebWallet': (build_update_web_wallet, UPDATE_WEB_WALLET_NAMES, u'updateWebWallet'),
+    'getWebWallet': (build_get_web_wallet, GET_WEB_WALLET_NAMES, u'getWebWallet'),
+}
+
+
+# nodes of the types of the responses: all are created before their elements refer to them
+do_web_payment_response_node = CompiledNode()
+result_node = CompiledNode()
+get_web_payment_details_response_node = CompiledNode()
+transaction_node = CompiledNode()
+fraud_result_details_node = CompiledNode()
+avs_node = CompiledNode()
+payment_node = CompiledNode()
+authorization_node = CompiledNode()
+private_data_list_node = CompiledNode()
+private_data_node = CompiledNode()
+billing_record_list_node = CompiledNode()
+billing_record_node = CompiledNode()
+authentication3_dsecure_node = CompiledNode()
+card_out_node = CompiledNode()
+extended_card_type_node = CompiledNode()
+order_node = CompiledNode()
+details_node = CompiledNode()
+order_detail_node = CompiledNode()
+payment_additional_list_node = CompiledNode()
+payment_additional_node = CompiledNode()
+wallet_node = CompiledNode()
+address_node = CompiledNode()
+card_node = CompiledNode()
+payment_data_node = CompiledNode()
+contract_number_wallet_list_node = CompiledNode()
+bank_account_data_node = CompiledNode()
+sub_merchant_node = CompiledNode()
+buyer_node = CompiledNode()
+manage_web_wallet_response_node = CompiledNode()
+create_web_wallet_response_node = CompiledNode()
+update_web_wallet_response_node = CompiledNode()
+get_web_wallet_response_node = CompiledNode()
+owner_node = CompiledNode()
+address_owner_node = CompiledNode()
+
+result_node.elements = {
+    'code': Element('code'),
+    'shortMessage': Element('shortMessage'),
+    'longMessage': Element('longMessage'),
+    'partnerCode': Element('partnerCode'),
+    'partnerCodeLabel': Element('partnerCodeLabel'),
+}
+
+do_web_payment_response_node.elements = {
+    'result': Element('result', node=result_node),
+    'token': Element('token'),
+    'redirectURL': Element('redirectURL'),
+    'stepCode': Element('stepCode'),
+    'reqCode': Element('reqCode'),
+    'method': Element('method'),
+}
+
+fraud_result_details_node.elements = {
+    'code': Element('code'),
+    'shortMessage': Element('shortMessage'),
+    'longMessage': Element('longMessage'),
+}
+
+avs_node.elements = {
+    'result': Element('result'),
+    'resultFromAcquirer': Element('resultFromAcquirer'),
+}
+
+transaction_node.elements = {
+    'id': Element('id'),
+    'date': Element('date'),
+    'isDuplicated': Element('isDuplicated'),
+    'isPossibleFraud': Element('isPossibleFraud'),
+    'fraudResult': Element('fraudResult'),
+    'fraudResultDetails': Element('fraudResultDetails', node=fraud_result_details_node),
+    'explanation': Element('explanation'),
+    'threeDSecure': Element('threeDSecure'),
+    'softDescriptor': Element('softDescriptor'),
+    'score': Element('score'),
+    'externalWalletType': Element('externalWalletType'),
+    'externalWalletContractNumber': Element('externalWalletContractNumber'),
+    'partnerAdditionalData': Element('partnerAdditionalData'),
+    'avs': Element('avs', node=avs_node),
+}
+
+payment_node.elements = {
+    'amount': Element('amount'),
+    'currency': Element('currency'),
+    'action': Element('action'),
+    'mode': Element('mode'),
+    'contractNumber': Element('contractNumber'),
+    'differedActionDate': Element('differedActionDate'),
+    'method': Element('method'),
+    'softDescriptor': Element('softDescriptor'),
+    'cardBrand': Element('cardBrand'),
+    'registrationToken': Element('registrationToken'),
+}
+
+authorization_node.elements = {
+    'number': Element('number'),
+    'date': Element('date'),
+}
+
+private_data_node.elements = {
+    'key': Element('key'),
+    'value': Element('value'),
+}
+
+private_data_list_node.elements = {
+    'privateData': Element('privateData', node=private_data_node, repeated=True),
+}
+private_data_list_node.item_name = 'privateData'
+
+billing_record_node.elements = {
+    'date': Element('date'),
+    'amount': Element('amount'),
+    'status': Element('status'),
+    'result': Element('result', node=result_node),
+    'transaction': Element('transaction', node=transaction_node),
+    'authorization': Element('authorization', node=authorization_node),
+    'nbTry': Element('nbTry'),
+    'rank': Element('rank'),
+}
+
+billing_record_list_node.elements = {
+    'billingRecord': Element('billingRecord', node=billing_record_node, repeated=True),
+}
+billing_record_list_node.item_name = 'billingRecord'
+
+authentication3_dsecure_node.elements = {
+    'md': Element('md'),
+    'pares': Element('pares'),
+    'xid': Element('xid'),
+    'eci': Element('eci'),
+    'cavv': Element('cavv'),
+    'cavvAlgorithm': Element('cavvAlgorithm'),
+    'vadsResult': Element('vadsResult'),
+    'typeSecurisation': Element('typeSecurisation'),
+    'PaResStatus': Element('PaResStatus'),
+    'VeResStatus': Element('VeResStatus'),
+}
+
+card_out_node.elements = {
+    'number': Element('number'),
+    'type': Element('type'),
+    'expirationDate': Element('expirationDate'),
+    'cardholder': Element('cardholder'),
+    'token': Element('token'),
+}
+
+extended_card_type_node.elements = {
+    'country': Element('country'),
+    'isCvd': Element('isCvd'),
+    'bank': Element('bank'),
+    'type': Element('type'),
+    'network': Element('network'),
+    'product': Element('product'),
+}
+
+order_detail_node.elements = {
+    'ref': Element('ref'),
+    'price': Element('price'),
+    'quantity': Element('quantity'),
+    'comment': Element('comment'),
+    'category': Element('category'),
+    'brand': Element('brand'),
+    'subcategory1': Element('subcategory1'),
+    'subcategory2': Element('subcategory2'),
+    'additionalData': Element('additionalData'),
+    'taxRate': Element('taxRate'),
+}
+
+details_node.elements = {
+    'details': Element('details', node=order_detail_node, repeated=True),
+}
+details_node.item_name = 'details'
+
+order_node.elements = {
+    'ref': Element('ref'),
+    'origin': Element('origin'),
+    'country': Element('country'),
+    'taxes': Element('taxes'),
+    'amount': Element('amount'),
+    'currency': Element('currency'),
+    'date': Element('date'),
+    'details': Element('details', node=details_node),
+    'deliveryTime': Element('deliveryTime'),
+    'deliveryMode': Element('deliveryMode'),
+    'deliveryExpectedDate': Element('deliveryExpectedDate'),
+    'deliveryExpectedDelay': Element('deliveryExpectedDelay'),
+    'deliveryCharge': Element('deliveryCharge'),
+}
+
+payment_additional_node.elements = {
+    'transaction': Element('transaction', node=transaction_node),
+    'payment': Element('payment', node=payment_node),
+    'authorization': Element('authorization', node=authorization_node),
+    'authentication3DSecure': Element('authentication3DSecure', node=authentication3_dsecure_node),
+    'card': Element('card', node=card_out_node),
+    'extendedCard': Element('extendedCard', node=extended_card_type_node),
+}
+
+payment_additional_list_node.elements = {
+    'paymentAdditional': Element('paymentAdditional', node=payment_additional_node, repeated=True),
+}
+payment_additional_list_node.item_name = 'paymentAdditional'
+
+address_node.elements = {
+    'title': Element('title'),
+    'name': Element('name'),
+    'firstName': Element('firstName'),
+    'lastName': Element('lastName'),
+    'street1': Element('street1'),
+    'street2': Element('street2'),
+    'cityName': Element('cityName'),
+    'zipCode': Element('zipCode'),
+    'country': Element('country'),
+    'phone': Element('phone'),
+    'state': Element('state'),
+    'county': Element('county'),
+    'phoneType': Element('phoneType'),
+}
+
+payment_data_node.elements = {
+    'transactionID': Element('transactionID'),
+    'network': Element('network'),
+    'tokenData': Element('tokenData'),
+}
+
+card_node.elements = {
+    'encryptionKeyId': Element('encryptionKeyId'),
+    'encryptedData': Element('encryptedData'),
+    'number': Element('number'),
+    'type': Element('type'),
+    'expirationDate': Element('expirationDate'),
+    'cvx': Element('cvx'),
+    'ownerBirthdayDate': Element('ownerBirthdayDate'),
+    'password': Element('password'),
+    'cardPresent': Element('cardPresent'),
+    'cardholder': Element('cardholder'),
+    'token': Element('token'),
+    'paymentData': Element('paymentData', node=payment_data_node),
+}
+
+wallet_node.elements = {
+    'walletId': Element('walletId'),
+    'lastName': Element('lastName'),
+    'firstName': Element('firstName'),
+    'email': Element('email'),
+    'shippingAddress': Element('shippingAddress', node=address_node),
+    'card': Element('card', node=card_node),
+    'comment': Element('comment'),
+    'default': Element('default'),
+    'cardStatus': Element('cardStatus'),
+    'cardBrand': Element('cardBrand'),
+}
+
+contract_number_wallet_list_node.elements = {
+    'contractNumberWallet': Element('contractNumberWallet', repeated=True),
+}
+contract_number_wallet_list_node.item_name = 'contractNumberWallet'
+
+bank_account_data_node.elements = {
+    'countryCode': Element('countryCode'),
+    'bankCode': Element('bankCode'),
+    'accountNumber': Element('accountNumber'),
+    'key': Element('key'),
+}
+
+sub_merchant_node.elements = {
+    'subMerchantId': Element('subMerchantId'),
+    'subMerchantName': Element('subMerchantName'),
+    'subMerchantMCC': Element('subMerchantMCC'),
+    'subMerchantSIRET': Element('subMerchantSIRET'),
+    'subMerchantTaxCode': Element('subMerchantTaxCode'),
+    'subMerchantStreet': Element('subMerchantStreet'),
+    'subMerchantCity': Element('subMerchantCity'),
+    'subMerchantZipCode': Element('subMerchantZipCode'),
+    'subMerchantCountry': Element('subMerchantCountry'),
+    'subMerchantState': Element('subMerchantState'),
+    'subMerchantEmailAddress': Element('subMerchantEmailAddress'),
+    'subMerchantPhoneNumber': Element('subMerchantPhoneNumber'),
+}
+
+buyer_node.elements = {
+    'title': Element('title'),
+    'lastName': Element('lastName'),
+    'firstName': Element('firstName'),
+    'email': Element('email'),
+    'shippingAdress': Element('shippingAdress', node=address_node),
+    'billingAddress': Element('billingAddress', node=address_node),
+    'accountCreateDate': Element('accountCreateDate'),
+    'accountAverageAmount': Element('accountAverageAmount'),
+    'accountOrderCount': Element('accountOrderCount'),
+    'walletId': Element('walletId'),
+    'walletDisplayed': Element('walletDisplayed'),
+    'walletSecured': Element('walletSecured'),
+    'walletCardInd': Element('walletCardInd'),
+    'ip': Element('ip'),
+    'mobilePhone': Element('mobilePhone'),
+    'customerId': Element('customerId'),
+    'legalStatus': Element('legalStatus'),
+    'legalDocument': Element('legalDocument'),
+    'birthDate': Element('birthDate'),
+    'fingerprintID': Element('fingerprintID'),
+    'deviceFingerprint': Element('deviceFingerprint'),
+    'isBot': Element('isBot'),
+    'isIncognito': Element('isIncognito'),
+    'isBehindProxy': Element('isBehindProxy'),
+    'isFromTor': Element('isFromTor'),
+    'isEmulator': Element('isEmulator'),
+    'isRooted': Element('isRooted'),
+    'hasTimezoneMismatch': Element('hasTimezoneMismatch'),
+}
+
+get_web_payment_details_response_node.elements = {
+    'result': Element('result', node=result_node),
+    'transaction': Element('transaction', node=transaction_node),
+    'payment': Element('payment', node=payment_node),
+    'authorization': Element('authorization', node=authorization_node),
+    'privateDataList': Element('privateDataList', node=private_data_list_node),
+    'paymentRecordId': Element('paymentRecordId'),
+    'billingRecordList': Element('billingRecordList', node=billing_record_list_node),
+    'authentication3DSecure': Element('authentication3DSecure', node=authentication3_dsecure_node),
+    'card': Element('card', node=card_out_node),
+    'extendedCard': Element('extendedCard', node=extended_card_type_node),
+    'order': Element('order', node=order_node),
+    'paymentAdditionalList': Element('paymentAdditionalList', node=payment_additional_list_node),
+    'media': Element('media'),
+    'numberOfAttempt': Element('numberOfAttempt'),
+    'wallet': Element('wallet', node=wallet_node),
+    'contractNumberWalletList': Element('contractNumberWalletList', node=contract_number_wallet_list_node),
+    'contractNumber': Element('contractNumber'),
+    'bankAccountData': Element('bankAccountData', node=bank_account_data_node),
+    'subMerchant': Element('subMerchant', node=sub_merchant_node),
+    'buyer': Element('buyer', node=buyer_node),
+}
+
+manage_web_wallet_response_node.elements = {
+    'result': Element('result', node=result_node),
+    'token': Element('token'),
+    'redirectURL': Element('redirectURL'),
+}
+
+create_web_wallet_response_node.elements = {
+    'result': Element('result', node=result_node),
+    'token': Element('token'),
+    'redirectURL': Element('redirectURL'),
+}
+
+update_web_wallet_response_node.elements = {
+    'result': Element('result', node=result_node),
+    'token': Element('token'),
+    'redirectURL': Element('redirectURL'),
+}
+
+address_owner_node.elements = {
+    'street': Element('street'),
+    'cityName': Element('cityName'),
+    'zipCode': Element('zipCode'),
+    'country': Element('country'),
+    'phone': Element('phone'),
+}
+
+owner_node.elements = {
+    'lastName': Element('lastName'),
+    'firstName': Element('firstName'),
+    'billingAddress': Element('billingAddress', node=address_owner_node),
+    'issueCardDate': Element('issueCardDate'),
+}
+
+get_web_wallet_response_node.elements = {
+    'result': Element('result', node=result_node),
+    'wallet': Element('wallet', node=wallet_node),
+    'owner': Element('owner', node=owner_node),
+    'privateDataList': Element('privateDataList', node=private_data_list_node),
+    'extendedCard': Element('extendedCard', node=extended_card_type_node),
+    'media': Element('media'),
+    'numberOfAttempt': Element('numberOfAttempt'),
+    'contractNumberWalletList': Element('contractNumberWalletList', node=contract_number_wallet_list_node),
+}
+
+# {operation: node of the response}
+RESPONSES = {
+    'doWebPayment': do_web_payment_response_node,
+    'getWebPaymentDetails': get_web_payment_details_response_node,
+    'manageWebWallet': manage_web_wallet_response_node,
+    'createWebWallet': create_web_wallet_response_node,
+    'updateWebWallet': update_web_wallet_response_node,
+    'getWebWallet': get_web_wallet_response_node,
+}
@@ -6,22 +6,135 @@ Backend for unit testing
 
 from __future__ import print_function
 
-from datetime import datetime
+from datetime import datetime, timedelta
 from decimal import Decimal
+import itertools
 import re
+import threading
+import uuid
+from collections import OrderedDict
 
 from pypayline.exceptions import PaylineAuthError, PaylineApiError
 
 
-TOKEN = u'3cXyapUchee8x645C6782541635718391'
+# maximum number of payments kept by the mock: the least recently used are forgotten
+MAX_PAYMENTS = 100000
 
-LAST_DATA = {
+# maximum number of mass traitments kept by the mock
+MAX_MASS_TRAITMENTS = 10000
 
-}
+# maximum number of transactions (doAuthorization, doDebit...) kept by the mock
+MAX_TRANSACTIONS = 100000
 
-LAST_PAYMENT_DATA = {
+# maximum number of wallets kept by the mock
+MAX_WALLETS = 100000
+
+# doAuthorization and doDebit are refused for this card number
+REFUSED_CARD_NUMBER = u'4000000000000002'
+
+# payment actions of the direct operations
+AUTHORIZATION_AND_CAPTURE_ACTION = 101
+DEBIT_ACTION = 204
+
+# number of getMassTraitmentDetails calls returning "in progress" before the traitment is complete
+MASS_TRAITMENT_PENDING_CALLS = 2
+
+MASS_TRAITMENT_MAX_LINES = 5000
+
+# transactionsSearch: one transaction every SEARCH_TRANSACTION_INTERVAL, at most SEARCH_LIMIT per response
+SEARCH_TRANSACTION_INTERVAL = timedelta(minutes=1)
+SEARCH_LIMIT = 5000
+
+
+class StateStore(object):
+    """
+    Thread-safe store of the states kept by the mock (payments by token, mass traitments by id).
+    It is bounded: the least recently used states are dropped when it is full
+    """
+
+    def __init__(self, max_size):
+        """
+        :param max_size : maximum number of states
+        """
+        self.max_size = max_size
+        self._states = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key):
+        """return the state or None if it doesn't exist (or has been dropped)"""
+        with self._lock:
+            state = self._states.pop(key, None)
+            if state is not None:
+                # most recently used
+                self._states[key] = state
+            return state
+
+    def set(self, key, state):
+        """store a state"""
+        with self._lock:
+            self._states.pop(key, None)
+            self._states[key] = state
+            while len(self._states) > self.max_size:
+                self._states.popitem(last=False)
+
+    def update(self, key, function):
+        """
+        call function(state) while the store is locked and return its result
+        None is returned if the state doesn't exist
+        """
+        with self._lock:
+            state = self._states.get(key)
+            if state is None:
+                return None
+            return function(state)
+
+    def clear(self):
+        """forget all the states"""
+        with self._lock:
+            self._states.clear()
+
+    def __len__(self):
+        return len(self._states)
+
+
+# token: {'payment': ..., 'order': ...} of the doWebPayment calls
+PAYMENTS = StateStore(MAX_PAYMENTS)
+
+# massTraitmentID: details of the mass traitments
+MASS_TRAITMENTS = StateStore(MAX_MASS_TRAITMENTS)
+
+# transaction id: {'amount', 'currency', 'captured', 'refunded', 'reset'} of the direct payments.
+# The captures share the state of their authorization
+TRANSACTIONS = StateStore(MAX_TRANSACTIONS)
+
+# walletId: {'wallet': {lastName, firstName, email}, 'cards': {cardInd: {'card', 'isDisabled'}}}.
+# Only the masked numbers of the cards are kept
+WALLETS = StateStore(MAX_WALLETS)
+
+_mass_traitment_ids = itertools.count(1)
+_mass_traitment_ids_lock = threading.Lock()
+
+
+def new_token():
+    """return a new unique token"""
+    return uuid.uuid4().hex
+
+
+def masked_card(card):
+    """the card data returned by Payline: the number is masked and the cvx is never returned"""
+    number = card.get('number') or u''
+    return {
+        'number': u'{0}XXXXXX{1}'.format(number[:6], number[-4:]),
+        'type': card.get('type'),
+        'expirationDate': card.get('expirationDate'),
+        'cardholder': card.get('cardholder'),
+    }
+
+
+def new_transaction_id():
+    """return a new unique transaction id"""
+    return uuid.uuid4().hex[:14].upper()
 
-}
 
 class SoapMockBackend(object):
     """Mock the SOAP API client"""
@@ -43,9 +156,10 @@ class SoapMockBackend(object):
                 }
             }
         }
-        self.doWebPaymentData = LAST_PAYMENT_DATA
+        # arguments of the last doWebPayment call of this backend
+        self.doWebPaymentData = {}
 
-    def get_response(self, error=None):
+    def get_response(self, error=None, token=None):
         if self.http_headers.get('Authorization', None) != u'Basic MTIzNDU2Nzg5MDEyMzQ6YWJDZGVGZ0hpSktMbU5vUHFyc3Q=':
             raise PaylineAuthError(u'Error while creating client. Err HTTP {0}'.format(401))
 
@@ -60,10 +174,9 @@ class SoapMockBackend(object):
                 }
             }
         else:
-            token = TOKEN
             host = u'https://homologation-webpayment.payline.com/webpayment/step2.do'
             return {
-                'redirectURL': u'{0}?reqCode=prepareStep2&token={1}'.format(host, TOKEN),
+                'redirectURL': u'{0}?reqCode=prepareStep2&token={1}'.format(host, token),
                 'token': token,
                 'result': {
                     'code': u'00000',
@@ -91,17 +204,14 @@ class SoapMockBackend(object):
             return self.get_response(
                 "Invalid field format : Cancel URL : Must be an https:// or http:// url (max length : 255)")
 
-        return self.get_response(error=None)
+        return self.get_response(error=None, token=new_token())
 
     def doWebPayment(self, **data):
         """call the doWebPayment SOAP API"""
-        LAST_PAYMENT_DATA.clear()
-        LAST_PAYMENT_DATA.update(**data)
-        LAST_DATA.clear()
+        self.doWebPaymentData = data
         response = self._handle_response(data)
         if response['result']['code'] == u'00000':
-            LAST_DATA['last_payment'] = data['payment']
-            LAST_DATA['last_order'] = data['order']
+            PAYMENTS.set(response['token'], {'payment': data['payment'], 'order': data['order']})
         else:
             raise PaylineApiError(response['result']['longMessage'])
         return response['redirectURL'], response['token']
@@ -111,8 +221,19 @@ class SoapMockBackend(object):
         if self.http_headers.get('Authorization', None) != u'Basic MTIzNDU2Nzg5MDEyMzQ6YWJDZGVGZ0hpSktMbU5vUHFyc3Q=':
             raise PaylineAuthError(u'Error while creating client. Err HTTP {0}'.format(401))
 
+        state = PAYMENTS.get(data['token'])
+        if state is None:
+            return self.get_response(u"This token does not exist")
+
+        if self.cancelled:
+            return self.get_response(u"Payment cancelled by the buyer")
+
+        payment = state['payment']
+        if payment is None:
+            return self.get_response(u"The consummer is not redirected on payment web pages")
+
         is_possible_fraud = False
-        if LAST_DATA['last_payment']["amount"] >= 1000000:
+        if payment["amount"] >= 1000000:
             is_possible_fraud = True
 
         card_country = u'FRA'
@@ -121,19 +242,20 @@ class SoapMockBackend(object):
         no_card_data = False
         paypal_data = ''
 
-        if LAST_DATA and LAST_DATA['last_payment']["amount"] == 1001:
+        if payment["amount"] == 1001:
             ret_code = '01001'  # Approved
-        elif LAST_DATA and LAST_DATA['last_payment']["amount"] == 2500:
+        elif payment["amount"] == 2500:
             ret_code = '02500'    # Approved
-        elif LAST_DATA and LAST_DATA['last_payment']["amount"] == 2501:
+        elif payment["amount"] == 2501:
             ret_code = '02501'  # Approved
-        elif LAST_DATA and LAST_DATA['last_payment']["amount"] == 12345:
-            LAST_DATA['contractNumber'] = None
-            LAST_DATA['last_payment'] = None
+        elif payment["amount"] == 12345:
+            # the payment can't be read anymore
+            PAYMENTS.update(data['token'], lambda state: state.update(payment=None))
+            payment = None
             ret_code = '01100'  # Error
-        elif LAST_DATA and LAST_DATA['last_payment']["amount"] == 23456:
+        elif payment["amount"] == 23456:
             card_country = u'ZZZ'
-        elif LAST_DATA and LAST_DATA['last_payment']["amount"] == 23457:
+        elif payment["amount"] == 23457:
             # will fallback to analyze partner data
             no_card_data = True
             paypal_data = '''{
@@ -141,7 +263,7 @@ class SoapMockBackend(object):
                 "accountCountryCode": "BE",
                 "referenceID": "%s"
             }''' % transaction_id
-        elif LAST_DATA and LAST_DATA['last_payment']["amount"] == 23458:
+        elif payment["amount"] == 23458:
             # will cause error with Paypal mock
             transaction_id = u"9876543210"
             no_card_data = True
@@ -162,8 +284,8 @@ class SoapMockBackend(object):
                 'externalWalletContractNumber': '',
                 'partnerAdditionalData': paypal_data,
             },
-            'payment': LAST_DATA.get('last_payment', None),
-            'order': LAST_DATA.get('last_order', None),
+            'payment': payment,
+            'order': state['order'],
             'result': {
                 'code': ret_code,
                 'longMessage': u'Transaction approved',
@@ -194,15 +316,6 @@ class SoapMockBackend(object):
         if no_card_data:
             response.pop('extendedCard')
 
-        if data['token'] != TOKEN:
-            response = self.get_response(u"This token does not exist")
-
-        if self.cancelled:
-            response = self.get_response(u"Payment cancelled by the buyer")
-
-        if 'last_payment' not in LAST_DATA:
-            response = self.get_response(u"The consummer is not redirected on payment web pages")
-
         return response
 
     def getPaymentRecord(self, **data):
@@ -256,3 +369,419 @@ class SoapMockBackend(object):
         }
 
         return response
+
+    def iterBillingRecords(self, **data):
+        """call the getPaymentRecord SOAP API and yield the billing records"""
+        for billing_record in self.getPaymentRecord(**data)['billingRecordList']:
+            yield billing_record
+
+    @staticmethod
+    def _transaction_response(code, message, transaction_id=None):
+        """response of the direct operations"""
+        response = {
+            'result': {
+                'code': code,
+                'longMessage': message,
+                'shortMessage': message,
+            },
+        }
+        if transaction_id is not None:
+            response['transaction'] = {
+                'id': transaction_id,
+                'date': datetime.now().strftime('%d/%m/%Y %H:%M'),
+                'isDuplicated': u'0',
+                'isPossibleFraud': u'0',
+            }
+        return response
+
+    def _new_transaction(self, data, captured):
+        """register the transaction of a doAuthorization or doDebit call and return its response"""
+        if self.http_headers.get('Authorization', None) != u'Basic MTIzNDU2Nzg5MDEyMzQ6YWJDZGVGZ0hpSktMbU5vUHFyc3Q=':
+            raise PaylineAuthError(u'Error while creating client. Err HTTP {0}'.format(401))
+
+        payment = data['payment']
+        if payment['amount'] <= 0:
+            return self._transaction_response(u'02303', u'Invalid amount')
+        card = data.get('card') or {}
+        if card.get('number') == REFUSED_CARD_NUMBER:
+            return self._transaction_response(u'01100', u'Do not honor')
+
+        transaction_id = new_transaction_id()
+        TRANSACTIONS.set(transaction_id, {
+            'amount': payment['amount'],
+            'currency': payment['currency'],
+            'captured': payment['amount'] if captured else 0,
+            'refunded': 0,
+            'reset': False,
+        })
+        response = self._transaction_response(u'00000', u'Transaction approved', transaction_id)
+        response['card'] = masked_card(card)
+        return response
+
+    def _transaction_operation(self, transaction_id, function):
+        """
+        apply function(state) to the state of a transaction while it is locked. It returns
+        an error response or None if the operation is accepted
+        """
+        if self.http_headers.get('Authorization', None) != u'Basic MTIzNDU2Nzg5MDEyMzQ6YWJDZGVGZ0hpSktMbU5vUHFyc3Q=':
+            raise PaylineAuthError(u'Error while creating client. Err HTTP {0}'.format(401))
+
+        error = TRANSACTIONS.update(transaction_id, lambda state: function(state) or False)
+        if error is None:
+            return self._transaction_response(u'02301', u'Transaction not found')
+        if error:
+            return error
+        return self._transaction_response(u'00000', u'Transaction approved', new_transaction_id())
+
+    def doAuthorization(self, **data):
+        """call the doAuthorization SOAP API"""
+        response = self._new_transaction(
+            data, captured=data['payment']['action'] == AUTHORIZATION_AND_CAPTURE_ACTION
+        )
+        if response['result']['code'] == u'00000':
+            response['authorization'] = {
+                'number': response['transaction']['id'][-6:],
+                'date': response['transaction']['date'],
+            }
+        return response
+
+    def doDebit(self, **data):
+        """call the doDebit SOAP API: the authorization has been given by phone"""
+        if not (data.get('authorization') or {}).get('number'):
+            return self._transaction_response(u'02305', u'Invalid field format : Authorization number is required')
+        return self._new_transaction(data, captured=True)
+
+    def doCapture(self, **data):
+        """call the doCapture SOAP API"""
+        amount = data['payment']['amount']
+
+        def capture(state):
+            if state['reset'] or state['captured']:
+                return self._transaction_response(u'02301', u'Transaction can not be captured')
+            if amount <= 0 or amount > state['amount']:
+                return self._transaction_response(u'02303', u'Invalid amount')
+            state['captured'] = amount
+
+        response = self._transaction_operation(data['transactionID'], capture)
+        state = TRANSACTIONS.get(data['transactionID'])
+        if response['result']['code'] == u'00000' and state is not None:
+            # the capture shares the state of the authorization: it can be refunded
+            TRANSACTIONS.set(response['transaction']['id'], state)
+        return response
+
+    def doRefund(self, **data):
+        """call the doRefund SOAP API: the captured amount can be refunded in several times"""
+        amount = data['payment']['amount']
+
+        def refund(state):
+            if not state['captured']:
+                return self._transaction_response(u'02301', u'Transaction can not be refunded')
+            if amount <= 0 or state['refunded'] + amount > state['captured']:
+                return self._transaction_response(u'02303', u'Invalid amount')
+            state['refunded'] += amount
+
+        return self._transaction_operation(data['transactionID'], refund)
+
+    def doReset(self, **data):
+        """call the doReset SOAP API: cancel an authorization which is not captured"""
+
+        def reset(state):
+            if state['reset'] or state['captured']:
+                return self._transaction_response(u'02301', u'Transaction can not be reset')
+            state['reset'] = True
+
+        return self._transaction_operation(data['transactionID'], reset)
+
+    @staticmethod
+    def _wallet_response(code, message, **data):
+        """response of the wallet operations"""
+        data['result'] = {
+            'code': code,
+            'longMessage': message,
+            'shortMessage': message,
+        }
+        return data
+
+    def _check_wallet_access(self):
+        if self.http_headers.get('Authorization', None) != u'Basic MTIzNDU2Nzg5MDEyMzQ6YWJDZGVGZ0hpSktMbU5vUHFyc3Q=':
+            raise PaylineAuthError(u'Error while creating client. Err HTTP {0}'.format(401))
+
+    @staticmethod
+    def _wallet_fields(wallet):
+        return dict((key, wallet.get(key)) for key in ('lastName', 'firstName', 'email'))
+
+    def createWallet(self, **data):
+        """call the createWallet SOAP API"""
+        self._check_wallet_access()
+        wallet = data['wallet']
+        if not wallet.get('walletId') or not (wallet.get('card') or {}).get('number'):
+            return self._wallet_response(u'02305', u'Invalid field format : walletId and card are required')
+        if WALLETS.get(wallet['walletId']) is not None:
+            return self._wallet_response(u'02502', u'Wallet already exists')
+        card = masked_card(wallet['card'])
+        WALLETS.set(wallet['walletId'], {
+            'wallet': self._wallet_fields(wallet),
+            'cards': {u'1': {'card': card, 'isDisabled': False}},
+        })
+        return self._wallet_response(u'02500', u'Operation Successfull', card=card)
+
+    def updateWallet(self, **data):
+        """call the updateWallet SOAP API: the card of cardInd (the first one by default) is replaced or added"""
+        self._check_wallet_access()
+        wallet = data['wallet']
+        card_ind = data.get('cardInd') or u'1'
+
+        def update(state):
+            state['wallet'].update(
+                (key, value) for key, value in self._wallet_fields(wallet).items() if value is not None
+            )
+            card = state['cards'].get(card_ind)
+            if wallet.get('card'):
+                card = state['cards'][card_ind] = {'card': masked_card(wallet['card']), 'isDisabled': False}
+            return card and card['card']
+
+        card = WALLETS.update(wallet.get('walletId'), update)
+        if card is None:
+            return self._wallet_response(u'02503', u'Wallet not found')
+        return self._wallet_response(u'02500', u'Operation Successfull', card=card)
+
+    def getWallet(self, **data):
+        """call the getWallet SOAP API"""
+        self._check_wallet_access()
+        state = WALLETS.get(data['walletId'])
+        card = state and state['cards'].get(data.get('cardInd') or u'1')
+        if card is None:
+            return self._wallet_response(u'02503', u'Wallet not found')
+        wallet = dict(state['wallet'], walletId=data['walletId'], card=card['card'])
+        return self._wallet_response(
+            u'02500', u'Operation Successfull', wallet=wallet, isDisabled=u'1' if card['isDisabled'] else u'0'
+        )
+
+    def getCards(self, **data):
+        """call the getCards SOAP API: the cards of a wallet (or the card of cardInd)"""
+        self._check_wallet_access()
+        state = WALLETS.get(data['walletId'])
+        if state is None:
+            return self._wallet_response(u'02503', u'Wallet not found')
+        cards = [
+            dict(
+                state['wallet'], walletId=data['walletId'], card=card['card'], cardInd=card_ind,
+                isDisabled=u'1' if card['isDisabled'] else u'0', default=u'1' if card_ind == u'1' else u'0'
+            )
+            for card_ind, card in sorted(state['cards'].items())
+            if not data.get('cardInd') or card_ind == data['cardInd']
+        ]
+        return self._wallet_response(u'02500', u'Operation Successfull', cardsList=cards)
+
+    def _set_disabled(self, wallet_id, card_ind, is_disabled):
+        """disable or enable the cards of a wallet: return False if it doesn't exist"""
+        def update(state):
+            for ind, card in state['cards'].items():
+                if not card_ind or ind == card_ind:
+                    card['isDisabled'] = is_disabled
+            return True
+        return bool(WALLETS.update(wallet_id, update))
+
+    def disableWallet(self, **data):
+        """call the disableWallet SOAP API"""
+        self._check_wallet_access()
+        wallet_ids = [item['walletId'] for item in data['walletIdList']]
+        disabled = [
+            wallet_id for wallet_id in wallet_ids if self._set_disabled(wallet_id, data.get('cardInd'), True)
+        ]
+        if not disabled:
+            return self._wallet_response(u'02503', u'Wallet not found')
+        return self._wallet_response(u'02500', u'Operation Successfull', walletIdList=disabled)
+
+    def enableWallet(self, **data):
+        """call the enableWallet SOAP API"""
+        self._check_wallet_access()
+        if not self._set_disabled(data['walletId'], data.get('cardInd'), False):
+            return self._wallet_response(u'02503', u'Wallet not found')
+        return self._wallet_response(u'02500', u'Operation Successfull')
+
+    def doImmediateWalletPayment(self, **data):
+        """call the doImmediateWalletPayment SOAP API: a payment with a card of a wallet"""
+        self._check_wallet_access()
+        state = WALLETS.get(data['walletId'])
+        card = state and state['cards'].get(data.get('cardInd') or u'1')
+        if card is None:
+            return self._transaction_response(u'02503', u'Wallet not found')
+        if card['isDisabled']:
+            return self._transaction_response(u'02504', u'Wallet is disabled')
+        response = self._new_transaction(
+            dict(data, card=None), captured=data['payment']['action'] == AUTHORIZATION_AND_CAPTURE_ACTION
+        )
+        response.pop('card', None)
+        if response['result']['code'] == u'00000':
+            response['authorization'] = {
+                'number': response['transaction']['id'][-6:],
+                'date': response['transaction']['date'],
+            }
+        return response
+
+    def _mass_traitment(self, transaction_ids, amounts=None):
+        """register a mass traitment: the unknown transactions and the null amounts fail"""
+        if self.http_headers.get('Authorization', None) != u'Basic MTIzNDU2Nzg5MDEyMzQ6YWJDZGVGZ0hpSktMbU5vUHFyc3Q=':
+            raise PaylineAuthError(u'Error while creating client. Err HTTP {0}'.format(401))
+
+        if not transaction_ids or len(transaction_ids) > MASS_TRAITMENT_MAX_LINES:
+            raise PaylineApiError(u'Invalid field format : {0} to {1} authorizations expected'.format(
+                1, MASS_TRAITMENT_MAX_LINES
+            ))
+
+        failed = []
+        for index, transaction_id in enumerate(transaction_ids):
+            if transaction_id.startswith(u'UNKNOWN'):
+                failed.append({
+                    'transactionID': transaction_id,
+                    'result': {'code': u'02301', 'longMessage': u'Transaction not found',
+                               'shortMessage': u'Transaction not found'},
+                })
+            elif amounts is not None and amounts[index] <= 0:
+                failed.append({
+                    'transactionID': transaction_id,
+                    'result': {'code': u'02303', 'longMessage': u'Invalid amount',
+                               'shortMessage': u'Invalid amount'},
+                })
+
+        with _mass_traitment_ids_lock:
+            mass_traitment_id = u'{0:08}'.format(next(_mass_traitment_ids))
+        MASS_TRAITMENTS.set(mass_traitment_id, {
+            'lines': len(transaction_ids),
+            'failed': failed,
+            'pending_calls': MASS_TRAITMENT_PENDING_CALLS,
+        })
+        return {
+            'result': {
+                'code': u'00000',
+                'longMessage': u'Operation Successfull',
+                'shortMessage': u'Operation Successfull',
+            },
+            'massTraitmentID': mass_traitment_id,
+            'date': datetime.now().strftime('%d/%m/%Y %H:%M'),
+        }
+
+    def doMassCapture(self, **data):
+        """call the doMassCapture SOAP API"""
+        captures = [item['capture'] for item in data['captureAuthorizationList']]
+        return self._mass_traitment(
+            [capture['transactionID'] for capture in captures],
+            [capture['payment']['amount'] for capture in captures]
+        )
+
+    def doMassRefund(self, **data):
+        """call the doMassRefund SOAP API"""
+        refunds = [item['refund'] for item in data['refundAuthorizationList']]
+        return self._mass_traitment(
+            [refund['transactionID'] for refund in refunds],
+            [refund['payment']['amount'] for refund in refunds]
+        )
+
+    def doMassReset(self, **data):
+        """call the doMassReset SOAP API"""
+        return self._mass_traitment([item['transactionID'] for item in data['resetAuthorizationList']])
+
+    @staticmethod
+    def _next_mass_traitment_call(mass_traitment):
+        """count a getMassTraitmentDetails call: return (mass traitment, is still pending)"""
+        if mass_traitment['pending_calls'] > 0:
+            mass_traitment['pending_calls'] -= 1
+            return mass_traitment, True
+        return mass_traitment, False
+
+    def getMassTraitmentDetails(self, **data):
+        """call the getMassTraitmentDetails SOAP API"""
+        if self.http_headers.get('Authorization', None) != u'Basic MTIzNDU2Nzg5MDEyMzQ6YWJDZGVGZ0hpSktMbU5vUHFyc3Q=':
+            raise PaylineAuthError(u'Error while creating client. Err HTTP {0}'.format(401))
+
+        mass_traitment = MASS_TRAITMENTS.update(data['massTraitmentID'], self._next_mass_traitment_call)
+        if mass_traitment is None:
+            return {
+                'result': {
+                    'code': u'02301',
+                    'longMessage': u'This mass traitment does not exist',
+                    'shortMessage': u'Invalid Transaction',
+                },
+                'massTraitementID': data['massTraitmentID'],
+            }
+
+        mass_traitment, is_pending = mass_traitment
+        if is_pending:
+            return {
+                'result': {
+                    'code': u'02000',
+                    'longMessage': u'Transaction in progress',
+                    'shortMessage': u'Transaction in progress',
+                },
+                'massTraitementID': data['massTraitmentID'],
+            }
+
+        return {
+            'result': {
+                'code': u'00000',
+                'longMessage': u'Operation Successfull',
+                'shortMessage': u'Operation Successfull',
+            },
+            'massTraitementID': data['massTraitmentID'],
+            'totalLinesNumber': str(mass_traitment['lines']),
+            'failedLinesNumber': str(len(mass_traitment['failed'])),
+            'failedListObject': mass_traitment['failed'] or None,
+        }
+
+    def _search_transaction(self, date):
+        """the transaction generated at a given date: always the same for a date"""
+        return {
+            'id': date.strftime('%Y%m%d%H%M%S'),
+            'date': date.strftime('%d/%m/%Y %H:%M'),
+            'isDuplicated': u'0',
+            'isPossibleFraud': u'1' if date.minute == 0 else u'0',
+        }
+
+    def transactionsSearch(self, **data):
+        """call the transactionsSearch SOAP API: deterministic transactions between the dates"""
+        if self.http_headers.get('Authorization', None) != u'Basic MTIzNDU2Nzg5MDEyMzQ6YWJDZGVGZ0hpSktMbU5vUHFyc3Q=':
+            raise PaylineAuthError(u'Error while creating client. Err HTTP {0}'.format(401))
+
+        try:
+            start_date = datetime.strptime(data['startDate'], '%d/%m/%Y %H:%M')
+            end_date = datetime.strptime(data['endDate'], '%d/%m/%Y %H:%M') + timedelta(minutes=1)
+        except (KeyError, TypeError, ValueError):
+            return self.get_response(u'Invalid field format : startDate and endDate : dd/mm/yyyy HH:MM expected')
+
+        transactions = []
+        date = start_date
+        while date < end_date and len(transactions) < SEARCH_LIMIT:
+            transactions.append(self._search_transaction(date))
+            date += SEARCH_TRANSACTION_INTERVAL
+
+        return {
+            'result': {
+                'code': u'00000',
+                'longMessage': u'Transaction approved',
+                'shortMessage': u'Transaction approved',
+            },
+            'transactionList': transactions or None,
+        }
+
+    def getTransactionDetails(self, **data):
+        """call the getTransactionDetails SOAP API"""
+        if self.http_headers.get('Authorization', None) != u'Basic MTIzNDU2Nzg5MDEyMzQ6YWJDZGVGZ0hpSktMbU5vUHFyc3Q=':
+            raise PaylineAuthError(u'Error while creating client. Err HTTP {0}'.format(401))
+
+        try:
+            date = datetime.strptime(data['transactionId'] or u'', '%Y%m%d%H%M%S')
+        except ValueError:
+            return self.get_response(u'Transaction not found')
+
+        return {
+            'result': {
+                'code': u'00000',
+                'longMessage': u'Transaction approved',
+                'shortMessage': u'Transaction approved',
+            },
+            'transaction': self._search_transaction(date),
+            'payment': {'amount': u'1000', 'currency': u'978', 'action': u'101', 'mode': u'CPT'},
+            'order': {'ref': u'order-{0}'.format(data['transactionId'])},
+            'contractNumber': u'1234567',
+        }
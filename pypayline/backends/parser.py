@@ -0,0 +1,387 @@
+# -*- coding: utf-8 -*-
+"""
+Python client for the Payline SOAP API
+Streaming SOAP response parser : the response elements are converted to python values
+while the XML is read, with the types of the WSDL. No DOM tree is built and the items
+of a list can be yielded one by one
+"""
+
+from __future__ import print_function
+
+import threading
+from collections import deque
+from xml.etree import ElementTree
+
+import six
+from pysimplesoap.client import SoapFault
+from pysimplesoap.helpers import Struct, TYPE_UNMARSHAL_FN
+
+from pypayline.backends.generated import get_generated_module
+from pypayline.backends.serializer import FAST_OPERATIONS
+from pypayline.wsdl import wsdl_path
+
+
+XSD_NAMESPACE = u'http://www.w3.org/2001/XMLSchema'
+
+# size of the parts of the response given to the XML parser when the items are yielded
+CHUNK_SIZE = 64 * 1024
+
+
+class UnsupportedResponse(Exception):
+    """The response can't be read by the streaming parser: pysimplesoap must be used"""
+    pass
+
+
+def local_name(tag):
+    """'{namespace}name' -> 'name'"""
+    return tag.rpartition(u'}')[2]
+
+
+def repeated_elements(wsdl):
+    """
+    return the set of (type name, element name) of the elements which may occur several
+    times (maxOccurs > 1) in the types of a local WSDL. pysimplesoap doesn't keep this information
+    """
+    path = wsdl_path(wsdl)
+    repeated = set()
+    if path is None:
+        return repeated
+
+    names = []  # names of the enclosing complexType or element
+    for event, node in ElementTree.iterparse(path, events=('start', 'end')):
+        if not node.tag.startswith(u'{' + XSD_NAMESPACE + u'}'):
+            continue
+        kind = local_name(node.tag)
+        if kind not in (u'complexType', u'element'):
+            continue
+        if event == 'start':
+            if kind == u'element' and node.get('maxOccurs', u'1') not in (u'0', u'1') and names:
+                parent_name = next((name for name in reversed(names) if name), None)
+                repeated.add((parent_name, node.get('name')))
+            names.append(node.get('name'))
+        else:
+            names.pop()
+            node.clear()
+    return repeated
+
+
+class Element(object):
+    """an element of a complex type: its compiled type or conversion function"""
+
+    def __init__(self, name, node=None, convert=None, repeated=False):
+        self.name = name
+        self.node = node  # CompiledNode of the complex types
+        self.convert = convert  # function converting the text of the simple types
+        self.repeated = repeated
+
+
+class CompiledNode(object):
+    """
+    A complex type of the WSDL. A type containing only a repeated element
+    (billingRecordList, privateDataList...) is read as a list of its items
+    """
+
+    def __init__(self):
+        self.elements = {}
+        self.item_name = None
+
+
+def text_converter(field_type):
+    """return the function converting the text of an element as pysimplesoap does"""
+    if field_type in (str, six.text_type):
+        return None
+    return TYPE_UNMARSHAL_FN.get(field_type, field_type)
+
+
+def compile_node(struct, repeated, compiled_nodes):
+    """return the CompiledNode of a pysimplesoap Struct"""
+    compiled = compiled_nodes.get(id(struct))
+    if compiled is not None:
+        return compiled
+    compiled = compiled_nodes[id(struct)] = CompiledNode()
+    type_name = struct.key[0] if isinstance(struct.key, tuple) else struct.key
+    for name, field_type in struct.items():
+        is_repeated = (type_name, name) in repeated
+        if isinstance(field_type, list):
+            # array of the WSDL
+            is_repeated = True
+            field_type = field_type[0] if field_type else str
+        if isinstance(field_type, Struct):
+            element = Element(name, node=compile_node(field_type, repeated, compiled_nodes), repeated=is_repeated)
+        elif isinstance(field_type, dict):
+            raise UnsupportedResponse(name)
+        else:
+            element = Element(name, convert=text_converter(field_type), repeated=is_repeated)
+        compiled.elements[name] = element
+    if len(compiled.elements) == 1:
+        element, = compiled.elements.values()
+        if element.repeated:
+            compiled.item_name = element.name
+    return compiled
+
+
+# type of the unknown elements and of the SOAP faults: the children are kept as texts
+ANY_NODE = CompiledNode()
+
+
+class Frame(object):
+    """an element being parsed"""
+
+    def __init__(self, name, element, path):
+        self.name = name
+        self.element = element
+        self.path = path
+        self.value = None
+        self.texts = []
+
+
+class ResponseHandler(object):
+    """
+    ElementTree parser target building the python value of a SOAP response. The items of
+    the list found at lazy_path (names of the elements from the response element) are
+    stored in the items list instead of the response
+    """
+
+    def __init__(self, root, lazy_path=None):
+        self.root = root
+        self.lazy_path = lazy_path
+        self.depth = 0
+        self.stack = []
+        self.response = None
+        self.items = deque()
+
+    def start(self, tag, attrib):
+        self.depth += 1
+        # Envelope (1) > Body (2) > response element (3)
+        if self.depth < 3:
+            return
+        if u'href' in attrib:
+            raise UnsupportedResponse(u'multiRef')
+        name = local_name(tag)
+        if self.depth == 3:
+            if name == u'Fault':
+                self.stack.append(Frame(name, Element(name, node=ANY_NODE), ()))
+            else:
+                self.stack.append(Frame(name, Element(name, node=self.root), ()))
+            return
+        if not self.stack:
+            return
+
+        parent = self.stack[-1]
+        node = parent.element.node
+        if node is None:
+            raise UnsupportedResponse(u'{0} in the simple type {1}'.format(name, parent.name))
+        element = node.elements.get(name)
+        if element is None:
+            element = Element(name, node=ANY_NODE)
+        path = parent.path + (name,) if self.lazy_path else None
+        self.stack.append(Frame(name, element, path))
+
+    def data(self, text):
+        if self.stack:
+            self.stack[-1].texts.append(text)
+
+    def end(self, tag):
+        self.depth -= 1
+        if self.depth < 2 or not self.stack:
+            return
+        frame = self.stack.pop()
+        value = self.frame_value(frame)
+
+        if not self.stack:
+            if frame.name == u'Fault' and frame.element.node is ANY_NODE:
+                value = value or {}
+                raise SoapFault(value.get(u'faultcode') or u'', value.get(u'faultstring') or u'')
+            self.response = value
+            return
+
+        if self.lazy_path is not None and frame.path == self.lazy_path:
+            # the items have been streamed
+            return
+
+        parent = self.stack[-1]
+        if parent.element.node.item_name is not None:
+            if self.lazy_path is not None and parent.path == self.lazy_path:
+                self.items.append(value)
+            else:
+                if parent.value is None:
+                    parent.value = []
+                parent.value.append(value)
+        else:
+            if parent.value is None:
+                parent.value = {}
+            if frame.element.repeated:
+                parent.value.setdefault(frame.name, []).append(value)
+            else:
+                parent.value[frame.name] = value
+
+    def frame_value(self, frame):
+        """python value of a parsed element"""
+        element = frame.element
+        if element.node is not None and element.node is not ANY_NODE:
+            # complex type: None if the element is empty, as pysimplesoap does
+            return frame.value
+        if frame.value is not None:
+            # unknown element with children
+            return frame.value
+        text = u''.join(frame.texts)
+        if not text:
+            return None
+        if element.convert is None:
+            return text
+        try:
+            return element.convert(text)
+        except (ValueError, TypeError) as err:
+            raise ValueError(u'Tag: {0}: {1}'.format(frame.name, err))
+
+    def close(self):
+        return self.response
+
+
+class CompiledResponse(object):
+    """Compiled output of an operation"""
+
+    def __init__(self, name, operation, repeated, compiled_nodes):
+        self.name = name
+        (_output_name, root), = operation['output'].items()
+        self.root = compile_node(root, repeated, compiled_nodes)
+
+    def new_parser(self, lazy_path=None):
+        """return (XML parser, handler)"""
+        handler = ResponseHandler(self.root, lazy_path=lazy_path)
+        return ElementTree.XMLParser(target=handler), handler
+
+
+class GeneratedResponse(CompiledResponse):
+    """Output of an operation whose nodes are in a generated module (see pypayline.codegen)"""
+
+    def __init__(self, name, root):
+        self.name = name
+        self.root = root
+
+
+class StreamedResponse(object):
+    """
+    A SOAP response whose list items at the given path are parsed while they are iterated.
+    The other elements are available in the response attribute once the iteration is over
+    """
+
+    def __init__(self, compiled, content, path):
+        self.parser, self.handler = compiled.new_parser(lazy_path=tuple(path))
+        self.content = content
+        self.offset = 0
+        self.complete = False
+
+    def __iter__(self):
+        items = self.handler.items
+        while True:
+            while items:
+                yield items.popleft()
+            if self.complete:
+                return
+            self.read()
+
+    def read(self):
+        """give the next chunk of the response to the XML parser"""
+        if self.offset < len(self.content):
+            self.parser.feed(self.content[self.offset:self.offset + CHUNK_SIZE])
+            self.offset += CHUNK_SIZE
+        else:
+            self.parser.close()
+            self.complete = True
+            self.content = None
+
+    @property
+    def response(self):
+        """the response without the streamed list: the pending items are dropped"""
+        while not self.complete:
+            self.read()
+            self.handler.items.clear()
+        return self.handler.response
+
+
+class ResponseParser(object):
+    """
+    Streaming parser of the operations of a service: the hot operations are compiled on first use
+    and all the operations use the generated module of the WSDL when there is one
+    """
+
+    def __init__(self, service_model, operations=FAST_OPERATIONS, generated=None):
+        """
+        :param operations : operations compiled from the types of the service model
+        :param generated : module generated from the WSDL of the service model (see pypayline.backends.generated)
+        """
+        self.service_model = service_model
+        self.operations = operations
+        self.generated_responses = generated.RESPONSES if generated is not None else {}
+        self.compiled_responses = {}
+        self.compiled_nodes = {}
+        self._repeated = None
+        self._lock = threading.Lock()
+
+    def port_operations(self):
+        """operations of the service port"""
+        service = self.service_model.services[self.service_model.api_name]
+        port, = service['ports'].values()
+        return port['operations']
+
+    def get_response(self, method):
+        """return the CompiledResponse or None if the operation is parsed by pysimplesoap"""
+        compiled = self.compiled_responses.get(method)
+        if compiled is None and (method in self.generated_responses or method in self.operations):
+            with self._lock:
+                compiled = self.compiled_responses.get(method)
+                if compiled is None and method in self.generated_responses:
+                    compiled = GeneratedResponse(method, self.generated_responses[method])
+                    self.compiled_responses[method] = compiled
+                elif compiled is None:
+                    operation = self.port_operations().get(method)
+                    if operation is None:
+                        return None
+                    if self._repeated is None:
+                        self._repeated = repeated_elements(self.service_model.wsdl)
+                    try:
+                        compiled = CompiledResponse(method, operation, self._repeated, self.compiled_nodes)
+                    except UnsupportedResponse:
+                        self.operations = tuple(name for name in self.operations if name != method)
+                        return None
+                    self.compiled_responses[method] = compiled
+        return compiled
+
+    def parse(self, method, content):
+        """
+        return the response as a dictionnary or None if pysimplesoap must be used
+        :raise: SoapFault if the response is a fault
+        """
+        compiled = self.get_response(method)
+        if compiled is None:
+            return None
+        parser, handler = compiled.new_parser()
+        try:
+            parser.feed(content)
+            return parser.close()
+        except UnsupportedResponse:
+            return None
+
+    def stream(self, method, content, path):
+        """
+        return a StreamedResponse yielding the items of the list at path (names of the
+        elements from the response element, ('billingRecordList', ) for example)
+        :raise: ValueError if the operation can't be streamed
+        """
+        compiled = self.get_response(method)
+        if compiled is None:
+            raise ValueError(u'{0} responses can not be streamed'.format(method))
+        return StreamedResponse(compiled, content, path)
+
+
+_parsers_lock = threading.Lock()
+
+
+def get_parser(service_model):
+    """return the ResponseParser of a service model. It is shared by all the clients"""
+    if service_model.parser is None:
+        with _parsers_lock:
+            if service_model.parser is None:
+                service_model.parser = ResponseParser(service_model, generated=get_generated_module(service_model))
+    return service_model.parser
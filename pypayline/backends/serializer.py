@@ -0,0 +1,289 @@
+# -*- coding: utf-8 -*-
+"""
+Python client for the Payline SOAP API
+Fast SOAP envelope serializer : the requests of the hot operations are written from
+templates precompiled from the WSDL types instead of walking the pysimplesoap type tree.
+With the WSDL files of the package, all the operations are written by the generated modules
+(see pypayline.codegen)
+"""
+
+from __future__ import print_function
+
+import threading
+
+import six
+from pysimplesoap.client import soap_namespaces
+from pysimplesoap.helpers import Struct, TYPE_MARSHAL_FN
+
+from pypayline.backends.generated import get_generated_module
+
+
+# operations serialized by the precompiled templates. The other ones use pysimplesoap
+# (which can't serialize the lists of authorizations of the mass operations)
+FAST_OPERATIONS = (
+    'doWebPayment', 'getWebPaymentDetails', 'getPaymentRecord',
+    'doAuthorization', 'doCapture', 'doRefund', 'doReset', 'doDebit',
+    'createWallet', 'updateWallet', 'getWallet', 'getCards', 'disableWallet', 'enableWallet',
+    'doImmediateWalletPayment',
+    'doMassCapture', 'doMassRefund', 'doMassReset', 'getMassTraitmentDetails',
+    'transactionsSearch', 'getTransactionDetails',
+)
+
+ENVELOPE_START = (
+    u'<?xml version="1.0" encoding="UTF-8"?>'
+    u'<soap:Envelope xmlns:xsi="http://www.w3.org/2001/XMLSchema-instance" '
+    u'xmlns:xsd="http://www.w3.org/2001/XMLSchema" xmlns:soap="{soap_uri}">\n'
+    u'<soap:Header/>\n'
+    u'<soap:Body>\n'
+    u'    <{name} xmlns="{namespace}">\n    '
+)
+
+ENVELOPE_END = u'</{name}>\n</soap:Body>\n</soap:Envelope>'
+
+
+class UnsupportedValue(Exception):
+    """The value can't be written by the precompiled template: pysimplesoap must be used"""
+    pass
+
+
+def escape(text):
+    """escape a text node as minidom (used by pysimplesoap) does"""
+    if u'&' in text:
+        text = text.replace(u'&', u'&amp;')
+    if u'<' in text:
+        text = text.replace(u'<', u'&lt;')
+    if u'"' in text:
+        text = text.replace(u'"', u'&quot;')
+    if u'>' in text:
+        text = text.replace(u'>', u'&gt;')
+    return text
+
+
+def to_text(value):
+    """convert a simple value to text as pysimplesoap does"""
+    if isinstance(value, six.string_types):
+        return value
+    return TYPE_MARSHAL_FN.get(type(value), str)(value)
+
+
+class Field(object):
+    """An element of a complex type with its precompiled tags"""
+
+    def __init__(self, name, namespace, field_type):
+        self.name = name
+        xmlns = u' xmlns="{0}"'.format(namespace) if namespace else u''
+        self.open_tag = u'<{0}{1}>'.format(name, xmlns)
+        self.close_tag = u'</{0}>'.format(name)
+        self.empty_tag = u'<{0}{1}/>'.format(name, xmlns)
+        self.type = field_type  # None for simple types, CompiledType otherwise
+
+
+class CompiledType(object):
+    """A complex type of the WSDL: list of its fields in the xsd:sequence order"""
+
+    def __init__(self, struct):
+        self.struct = struct
+        self.fields = []
+        self.names = set()
+
+    def write(self, parts, value):
+        """append the children elements of the value to parts"""
+        if not isinstance(value, dict):
+            raise UnsupportedValue(value)
+        check_names(self.names, value)
+        for field in self.fields:
+            field_value = value.get(field.name)
+            if field_value is not None:
+                write_element(parts, field, field_value)
+
+
+def check_names(names, value):
+    """:raise: ValueError if the dictionnary has keys which are not elements of the type"""
+    if not names.issuperset(value):
+        unknown = [key for key in value if key not in names]
+        raise ValueError('Invalid Args Structure. Errors: Argument keys {0} not in parameter'.format(unknown))
+
+
+def write_text(parts, open_tag, close_tag, value):
+    """append the element of a simple type to parts"""
+    if isinstance(value, list):
+        # repeated simple element (maxOccurs > 1)
+        for item in value:
+            if item is not None:
+                write_text(parts, open_tag, close_tag, item)
+    elif isinstance(value, (dict, tuple)):
+        raise UnsupportedValue(value)
+    else:
+        parts.append(open_tag)
+        parts.append(escape(to_text(value)))
+        parts.append(close_tag)
+
+
+def write_items(parts, write, open_tag, close_tag, empty_tag, value):
+    """append the element of a complex type to parts: write(parts, item) appends the children of an item"""
+    if isinstance(value, list):
+        # several items of a sequence in the same element (selectedContractList...)
+        items = value
+    else:
+        items = [value]
+    children = []
+    for item in items:
+        write(children, item)
+    if children:
+        parts.append(open_tag)
+        parts.extend(children)
+        parts.append(close_tag)
+    else:
+        parts.append(empty_tag)
+
+
+def write_element(parts, field, value):
+    """append the element of a field to parts"""
+    if field.type is not None:
+        write_items(parts, field.type.write, field.open_tag, field.close_tag, field.empty_tag, value)
+    else:
+        write_text(parts, field.open_tag, field.close_tag, value)
+
+
+def compile_type(struct, compiled_types):
+    """return the CompiledType of a pysimplesoap Struct"""
+    compiled = compiled_types.get(id(struct))
+    if compiled is None:
+        compiled = compiled_types[id(struct)] = CompiledType(struct)
+        for name, field_type in struct.items():
+            if isinstance(field_type, list):
+                # arrays of the WSDL are left to pysimplesoap
+                field_type = Unsupported
+            elif isinstance(field_type, Struct):
+                field_type = compile_type(field_type, compiled_types)
+            else:
+                field_type = None
+            compiled.fields.append(Field(name, struct.namespaces.get(name), field_type))
+            compiled.names.add(name)
+    return compiled
+
+
+class Unsupported(object):
+    """type of the fields which can't be written by the templates"""
+
+    @staticmethod
+    def write(parts, value):
+        raise UnsupportedValue(value)
+
+
+class CompiledOperation(object):
+    """Precompiled envelope of an operation request"""
+
+    def __init__(self, name, operation, compiled_types):
+        self.name = name
+        self.action = operation.get('action')
+        (input_name, root), = operation['input'].items()
+        self.start = ENVELOPE_START.format(
+            soap_uri=soap_namespaces['soap'], name=input_name, namespace=operation['namespace']
+        )
+        self.end = ENVELOPE_END.format(name=input_name)
+        self.root = CompiledType(root)
+        for key, field_type in root.items():
+            if isinstance(field_type, list):
+                field_type = Unsupported
+                namespace = None
+            elif isinstance(field_type, Struct):
+                # the elements of the request use the target namespace of the operation
+                namespace = None if root.references.get(key) else root.namespaces.get(key)
+                field_type = compile_type(field_type, compiled_types)
+            else:
+                namespace = None
+                field_type = None
+            self.root.fields.append(Field(key, namespace, field_type))
+            self.root.names.add(key)
+
+    def serialize(self, data):
+        """return the request envelope as utf-8 bytes"""
+        parts = [self.start]
+        self.root.write(parts, data)
+        parts.append(self.end)
+        return u''.join(parts).encode('utf-8')
+
+
+class GeneratedOperation(object):
+    """Request of an operation written by the function of a generated module (see pypayline.codegen)"""
+
+    def __init__(self, name, build, names, action):
+        self.name = name
+        self.build = build
+        self.names = names
+        self.action = action
+
+    def serialize(self, data):
+        """return the request envelope as utf-8 bytes"""
+        check_names(self.names, data)
+        return self.build(**data)
+
+
+class EnvelopeSerializer(object):
+    """
+    Serializer of the operations of a service: the hot operations use the templates, compiled on
+    first use, and all the operations use the generated module of the WSDL when there is one
+    """
+
+    def __init__(self, service_model, operations=FAST_OPERATIONS, generated=None):
+        """
+        :param operations : operations compiled from the types of the service model
+        :param generated : module generated from the WSDL of the service model (see pypayline.backends.generated)
+        """
+        self.service_model = service_model
+        self.operations = operations
+        self.generated_requests = generated.REQUESTS if generated is not None else {}
+        self.compiled_operations = {}
+        self.compiled_types = {}
+        self._lock = threading.Lock()
+
+    def port_operations(self):
+        """operations of the service port"""
+        service = self.service_model.services[self.service_model.api_name]
+        port, = service['ports'].values()
+        return port['operations']
+
+    def get_operation(self, method):
+        """return the GeneratedOperation, the CompiledOperation or None if the operation is not precompiled"""
+        compiled = self.compiled_operations.get(method)
+        if compiled is None and (method in self.generated_requests or method in self.operations):
+            with self._lock:
+                compiled = self.compiled_operations.get(method)
+                if compiled is None and method in self.generated_requests:
+                    compiled = GeneratedOperation(method, *self.generated_requests[method])
+                    self.compiled_operations[method] = compiled
+                elif compiled is None:
+                    operation = self.port_operations().get(method)
+                    if operation is None:
+                        return None
+                    compiled = CompiledOperation(method, operation, self.compiled_types)
+                    self.compiled_operations[method] = compiled
+        return compiled
+
+    def serialize(self, method, data):
+        """
+        return (body, soap action) of the request or None if pysimplesoap must be used
+        :raise: ValueError if the data does not match the WSDL types
+        """
+        compiled = self.get_operation(method)
+        if compiled is None:
+            return None
+        try:
+            return compiled.serialize(data), compiled.action
+        except UnsupportedValue:
+            return None
+
+
+_serializers_lock = threading.Lock()
+
+
+def get_serializer(service_model):
+    """return the EnvelopeSerializer of a service model. It is shared by all the clients"""
+    if service_model.serializer is None:
+        with _serializers_lock:
+            if service_model.serializer is None:
+                service_model.serializer = EnvelopeSerializer(
+                    service_model, generated=get_generated_module(service_model)
+                )
+    return service_model.serializer
@@ -7,61 +7,310 @@ SOAP Backends : for real usage
 from __future__ import print_function
 
 import logging
-try:
-    from urllib2 import HTTPError
-except ImportError:
-    HTTPError = Exception
+import threading
+import time
 
-from pysimplesoap.client import SoapClient, SoapFault
+import six
+from pysimplesoap.client import SimpleXMLElement, SoapFault, soap_namespaces
+from six.moves.urllib.error import HTTPError
 
+from pypayline.backends.generated.operations import SERVICE_OPERATIONS
+from pypayline.backends.parser import get_parser
+from pypayline.backends.serializer import get_serializer
+from pypayline.backends.transport import get_transport
+from pypayline.cache import result_code
 from pypayline.exceptions import PaylineAuthError, PaylineApiError
+from pypayline.instrumentation import Instrumentation
+from pypayline.resilience import IDEMPOTENT_OPERATIONS
+from pypayline.wsdl import get_service_model
 
 
 logger = logging.getLogger(u'pypayline')
 
 
-class SoapBackend(object):
+class PreparedRequest(Exception):
+    """Raised by RequestCapture: carries the serialized request instead of sending it"""
+
+    def __init__(self, location, body, headers):
+        super(PreparedRequest, self).__init__(location)
+        self.location, self.body, self.headers = location, body, headers
+
+
+class RequestCapture(object):
+    """pysimplesoap Http stand-in which stops the call once the request is serialized"""
+
+    def request(self, url, method='POST', body=None, headers=None):
+        raise PreparedRequest(url, body, headers)
+
+
+def prepare_soap_request(soap_client, method, **data):
     """
-    Manage communication with Payline over SOAP API
+    Serialize a SOAP call with pysimplesoap without sending it
+    :return: PreparedRequest
     """
+    http = soap_client.http
+    soap_client.http = RequestCapture()
+    try:
+        getattr(soap_client, method)(**data)
+    except PreparedRequest as prepared_request:
+        return prepared_request
+    finally:
+        soap_client.http = http
+    raise RuntimeError(u'{0} request has been sent'.format(method))
+
+
+def parse_soap_response(soap_client, method, content):
+    """
+    Parse the response of a SOAP call with pysimplesoap
+    :return: the response as a dictionnary
+    :raise: SoapFault if the response is a fault
+    """
+    operation = soap_client.get_operation(method)
+    response = SimpleXMLElement(content, namespace=operation.get('namespace') or soap_client.namespace)
+    if response('Fault', ns=list(soap_namespaces.values()), error=False):
+        raise SoapFault(six.text_type(response.faultcode), six.text_type(response.faultstring))
+    body = response('Body', ns=soap_namespaces['soap']).children()
+    result = body.unmarshall(operation['output'], strict=soap_client.strict)
+    return result and list(result.values())[0]
 
-    def __init__(self, *args, **kwargs):
-        """initialize the soap client and get wsdl file for service definition"""
-        kwargs.pop('api_name')
-        self.soap_client = SoapClient(*args, **kwargs)
-        self.services = self.soap_client.services
+
+def web_payment_result(response):
+    """check the doWebPayment response and return (redirect_url, token)"""
+    if response['result']['code'] != u"00000":
+        raise PaylineApiError(response['result']['longMessage'])
+    return response['redirectURL'], response['token']
+
+
+class WebPaymentMethods(object):
+    """hand-written methods of the WebPaymentAPI backends"""
 
     def doWebPayment(self, **data):
-        """call the doWebPayment SOAP API"""
+        """call the doWebPayment SOAP API: return (redirect_url, token)"""
         try:
-            logger.debug('> {0}'.format(data))
-            response = self.soap_client.doWebPayment(**data)
-            logger.debug('< {0}'.format(response))
-            if response['result']['code'] != u"00000":
-                raise PaylineApiError(response['result']['longMessage'])
-            return response['redirectURL'], response['token']
+            logger.debug(u'> %s', data)
+            response = self.call('doWebPayment', **data)
+            logger.debug(u'< %s', response)
+            return web_payment_result(response)
         except SoapFault as err:
-            raise PaylineApiError(unicode(err))
+            raise PaylineApiError(six.text_type(err))
         except HTTPError as err:
             raise PaylineAuthError(u'Error while creating client. Err HTTP {0}'.format(err.code))
 
-    def getWebPaymentDetails(self, **data):
-        """call the getWebPaymentDetails SOAP API"""
+
+class BillingRecordMethods(object):
+    """hand-written methods of the DirectPaymentAPI backends"""
+
+    def iterBillingRecords(self, **data):
+        """
+        call the getPaymentRecord SOAP API and yield the billing records while they are parsed:
+        the whole list is never built
+        """
         try:
-            response = self.soap_client.getWebPaymentDetails(**data)
-            return response
-        except SoapFault as err:
-            raise PaylineApiError(unicode(err))
+            content = self.send('getPaymentRecord', **data)
         except HTTPError as err:
             raise PaylineAuthError(u'Error while creating client. Err HTTP {0}'.format(err.code))
+        try:
+            for billing_record in self.parser.stream('getPaymentRecord', content, ('billingRecordList', )):
+                yield billing_record
+        except SoapFault as err:
+            raise PaylineApiError(six.text_type(err))
+
 
-    def getPaymentRecord(self, **data):
-        """call the getPaymentRecord SOAP API"""
+_service_classes = {}
+_service_classes_lock = threading.Lock()
+
+
+def service_backend_class(backend_class, api_name):
+    """
+    return the subclass of a backend class for a service: with the hand-written methods of the service
+    (see SoapBackend.service_methods) and the generated methods of its operations. The backend class
+    itself if the service has no generated methods
+    """
+    operations = SERVICE_OPERATIONS.get(api_name)
+    if operations is None or issubclass(backend_class, operations):
+        return backend_class
+    key = (backend_class, api_name)
+    service_class = _service_classes.get(key)
+    if service_class is None:
+        with _service_classes_lock:
+            service_class = _service_classes.get(key)
+            if service_class is None:
+                bases = (backend_class, ) + tuple(backend_class.service_methods.get(api_name, ())) + (operations, )
+                service_class = type(
+                    str(u'{0}{1}'.format(api_name, backend_class.__name__)), bases,
+                    {'__module__': backend_class.__module__}
+                )
+                _service_classes[key] = service_class
+    return service_class
+
+
+class SoapBackend(object):
+    """
+    Manage communication with Payline over SOAP API. A backend is an instance of the subclass of its
+    service (see service_backend_class): a method by SOAP operation of the service
+    """
+    transport_factory = staticmethod(get_transport)
+    # hand-written methods of the services: they replace the generated ones
+    service_methods = {'WebPaymentAPI': (WebPaymentMethods, ), 'DirectPaymentAPI': (BillingRecordMethods, )}
+
+    def __new__(cls, wsdl, location, http_headers, api_name, *args, **kwargs):
+        return super(SoapBackend, cls).__new__(service_backend_class(cls, api_name))
+
+    def __init__(self, wsdl, location, http_headers, api_name, cache=None, trace=None, transport=None,
+                 pool_size=None, pool_idle_timeout=None, connect_timeout=None, read_timeout=None, hooks=None,
+                 resilience=None):
+        """
+        initialize the soap client. The wsdl file is parsed only once per process:
+        the soap client is bound to the shared service model
+
+        :param transport : object sending the HTTP requests (see pypayline.backends.transport.HttpTransport).
+            If None, the process-wide pooled transport for the given settings is used
+        :param pool_size : maximum number of idle connections kept per host
+        :param pool_idle_timeout : idle connections are closed after this number of seconds
+        :param connect_timeout : timeout in seconds when opening a connection
+        :param read_timeout : timeout in seconds when waiting for a response
+        :param hooks : instrumentation hooks of the calls (see pypayline.instrumentation)
+        :param resilience : ResiliencePolicy of the calls: timeouts, retries, hedging and circuit breaker
+            (see pypayline.resilience)
+        """
+        self.api_name = api_name
+        self.instrumentation = Instrumentation(hooks)
+        self.resilience = resilience
+        self.service_model = get_service_model(api_name, wsdl, cache=cache)
+        if transport is None:
+            transport_settings = dict(
+                pool_size=pool_size, idle_timeout=pool_idle_timeout,
+                connect_timeout=connect_timeout, read_timeout=read_timeout
+            )
+            transport = self.transport_factory(**dict(
+                (key, value) for key, value in transport_settings.items() if value is not None
+            ))
+        self.transport = transport
+        if trace:
+            soap_logger = logging.getLogger('pysimplesoap.client')
+            soap_logger.setLevel(logging.DEBUG if trace is True else trace)
+        self.soap_client = self.service_model.new_soap_client(
+            location=location, http_headers=http_headers, http=transport
+        )
+        self.services = self.soap_client.services
+        self.serializer = get_serializer(self.service_model)
+        self.parser = get_parser(self.service_model)
+
+    def warmup(self):
+        """compile the envelope templates and the response parsers of the hot operations of the service"""
+        operations = self.serializer.port_operations()
+        for method in self.serializer.operations:
+            if method in operations:
+                self.serializer.get_operation(method)
+                self.parser.get_response(method)
+
+    def prepare_request(self, method, **data):
+        """
+        Serialize a SOAP call: the hot operations use the precompiled envelopes, the other ones pysimplesoap
+        :return: PreparedRequest
+        """
+        serialized = self.serializer.serialize(method, data)
+        if serialized is None:
+            return prepare_soap_request(self.soap_client, method, **data)
+        body, action = serialized
+        headers = {
+            'Content-type': 'text/xml; charset="UTF-8"',
+            'Content-length': str(len(body)),
+        }
+        if action is not None:
+            headers['SOAPAction'] = str(action)
+        headers.update(self.soap_client.http_headers)
+        return PreparedRequest(str(self.soap_client.location), body, headers)
+
+    def parse_response(self, method, content):
+        """
+        Parse the response of a SOAP call: the hot operations use the streaming parser, the other ones pysimplesoap
+        :return: the response as a dictionnary
+        :raise: SoapFault if the response is a fault
+        """
+        response = self.parser.parse(method, content)
+        if response is None:
+            return parse_soap_response(self.soap_client, method, content)
+        return response
+
+    def send(self, method, **data):
+        """serialize the request, send it and return the content of the response"""
+        return self.send_request(method, data)
+
+    def send_request(self, method, data, timeout=None):
+        """send: timeout overrides the read timeout of the transport"""
+        request = self.prepare_request(method, **data)
+        _headers, content = self.transport.request(
+            request.location, 'POST', body=request.body, headers=request.headers,
+            **self.transport_options(method, timeout=timeout)
+        )
+        return content
+
+    def transport_options(self, method, timings=None, timeout=None):
+        """
+        keyword arguments of transport.request for the timings, the timeout and the idempotent operations,
+        if the transport supports them
+        """
+        options = {}
+        if timings is not None and getattr(self.transport, 'reports_timings', False):
+            options['timings'] = timings
+        if timeout is not None and getattr(self.transport, 'accepts_timeout', False):
+            options['timeout'] = timeout
+        if getattr(self.transport, 'accepts_idempotent', False):
+            idempotent_operations = IDEMPOTENT_OPERATIONS if self.resilience is None \
+                else self.resilience.idempotent_operations
+            options['idempotent'] = method in idempotent_operations
+        return options
+
+    def send_instrumented(self, event, method, data, timeout=None):
+        """send: the serialize, connect and wait timings and the sizes are recorded in the event"""
+        start = time.time()
+        request = self.prepare_request(method, **data)
+        sent = time.time()
+        event.timings['serialize'] = sent - start
+        event.request_size = len(request.body)
+        timings = {}
+        _headers, content = self.transport.request(
+            request.location, 'POST', body=request.body, headers=request.headers,
+            **self.transport_options(method, timings, timeout)
+        )
+        event.timings['connect'] = timings.get('connect', 0.0)
+        event.timings['wait'] = time.time() - sent - event.timings['connect']
+        event.response_size = len(content)
+        return content
+
+    def parse_instrumented(self, event, method, content):
+        """parse_response: the parse timing and the result code are recorded in the event"""
+        start = time.time()
+        response = self.parse_response(method, content)
+        event.timings['parse'] = time.time() - start
+        event.result_code = result_code(response) or None
+        return response
+
+    def call(self, method, **data):
+        """serialize the request, send it and parse the response of a SOAP operation"""
+        if self.resilience is None:
+            return self.attempt(method, data)
+        return self.resilience.call(method, lambda timeout: self.attempt(method, data, timeout))
+
+    def attempt(self, method, data, timeout=None):
+        """a single call of a SOAP operation: timeout overrides the read timeout of the transport"""
+        if not self.instrumentation.enabled:
+            return self.parse_response(method, self.send_request(method, data, timeout))
+        event = self.instrumentation.start(self.api_name, method)
         try:
-            response = self.soap_client.getPaymentRecord(**data)
-            return response
+            return self.parse_instrumented(event, method, self.send_instrumented(event, method, data, timeout))
+        except Exception as err:
+            event.error = err
+            raise
+        finally:
+            self.instrumentation.finish(event)
+
+    def call_operation(self, method, data):
+        """call a SOAP operation with the elements of data which are not None: the errors are Payline errors"""
+        try:
+            return self.call(method, **dict((key, value) for key, value in data.items() if value is not None))
         except SoapFault as err:
-            raise PaylineApiError(unicode(err))
+            raise PaylineApiError(six.text_type(err))
         except HTTPError as err:
             raise PaylineAuthError(u'Error while creating client. Err HTTP {0}'.format(err.code))
-
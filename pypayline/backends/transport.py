@@ -0,0 +1,307 @@
+# -*- coding: utf-8 -*-
+"""
+Python client for the Payline SOAP API
+HTTP transport : persistent connections to the Payline hosts
+"""
+
+from __future__ import print_function
+
+import logging
+import select
+import socket
+import ssl
+import threading
+import time
+
+from six.moves import http_client
+from six.moves.urllib.error import HTTPError
+from six.moves.urllib.parse import urlsplit
+
+
+logger = logging.getLogger(u'pypayline')
+
+
+DEFAULT_POOL_SIZE = 10
+DEFAULT_IDLE_TIMEOUT = 60
+DEFAULT_CONNECT_TIMEOUT = 10
+DEFAULT_READ_TIMEOUT = 60
+
+# error raised when the server closes the connection before the status line of the response
+REMOTE_DISCONNECTED = getattr(http_client, 'RemoteDisconnected', http_client.BadStatusLine)
+
+
+def is_dropped(connection):
+    """True if the server has closed an idle connection: its socket is readable before any request"""
+    if connection.sock is None:
+        return False
+    try:
+        readable, _writable, _errors = select.select([connection.sock], [], [], 0)
+    except (ValueError, socket.error):
+        return True
+    return bool(readable)
+
+
+def open_socket(host, port, connect_timeout):
+    """
+    open a TCP connection. Nagle's algorithm is disabled as http_client does: the headers and
+    the body of the requests are sent separately and the body must not wait for the ACK of the headers
+    """
+    sock = socket.create_connection((host, port), connect_timeout)
+    sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+    return sock
+
+
+class HTTPConnection(http_client.HTTPConnection):
+    """HTTP connection with distinct connect and read timeouts"""
+
+    def __init__(self, host, port, pool):
+        http_client.HTTPConnection.__init__(self, host, port, timeout=pool.connect_timeout)
+        self.pool = pool
+
+    def connect(self):
+        self.sock = open_socket(self.host, self.port, self.pool.connect_timeout)
+        self.sock.settimeout(self.pool.read_timeout)
+        self.pool.connection_opened()
+
+
+class HTTPSConnection(http_client.HTTPSConnection):
+    """HTTPS connection with distinct connect and read timeouts, resuming the TLS session of its pool"""
+
+    def __init__(self, host, port, pool):
+        http_client.HTTPSConnection.__init__(
+            self, host, port, timeout=pool.connect_timeout, context=pool.ssl_context
+        )
+        self.pool = pool
+
+    def connect(self):
+        sock = open_socket(self.host, self.port, self.pool.connect_timeout)
+        self.sock = self.pool.ssl_context.wrap_socket(
+            sock, server_hostname=self.host, session=self.pool.tls_session
+        )
+        self.sock.settimeout(self.pool.read_timeout)
+        self.pool.connection_opened(tls_session=self.sock.session, tls_resumed=self.sock.session_reused)
+
+
+class ConnectionPool(object):
+    """
+    Persistent connections to one host. At most pool_size idle connections are kept:
+    the extra connections needed under load are closed once used
+    """
+
+    def __init__(self, scheme, host, port, pool_size, idle_timeout, connect_timeout, read_timeout,
+                 ssl_context=None):
+        self.scheme, self.host, self.port = scheme, host, port
+        self.pool_size = pool_size
+        self.idle_timeout = idle_timeout
+        self.connect_timeout = connect_timeout
+        self.read_timeout = read_timeout
+        self.ssl_context = ssl_context
+        self.tls_session = None
+        self.connections_count = 0
+        self.tls_resumed_count = 0
+        self._idle = []  # (last used time, connection) : the last one is the most recent
+        self._lock = threading.Lock()
+
+    def connection_opened(self, tls_session=None, tls_resumed=False):
+        """called by the connections when a new socket is opened"""
+        with self._lock:
+            self.connections_count += 1
+            if tls_resumed:
+                self.tls_resumed_count += 1
+            if tls_session is not None:
+                self.tls_session = tls_session
+
+    def new_connection(self):
+        """create a connection: the socket is opened on first request"""
+        if self.scheme == 'https':
+            return HTTPSConnection(self.host, self.port, self)
+        return HTTPConnection(self.host, self.port, self)
+
+    def get_connection(self):
+        """return (connection, is_reused): an idle connection if any, a new one otherwise"""
+        now = time.time()
+        expired = []
+        connection = None
+        with self._lock:
+            while self._idle:
+                last_used, idle_connection = self._idle.pop()
+                if now - last_used < self.idle_timeout:
+                    if is_dropped(idle_connection):
+                        idle_connection.close()
+                        continue
+                    connection = idle_connection
+                    break
+                expired.append(idle_connection)
+            # the remaining connections are older than the expired ones
+            if expired:
+                expired.extend(idle_connection for _last_used, idle_connection in self._idle)
+                del self._idle[:]
+        for expired_connection in expired:
+            expired_connection.close()
+        if connection is None:
+            return self.new_connection(), False
+        return connection, True
+
+    def put_connection(self, connection):
+        """give back a connection after a complete response"""
+        with self._lock:
+            if len(self._idle) < self.pool_size:
+                self._idle.append((time.time(), connection))
+                return
+        connection.close()
+
+    def close(self):
+        """close all the idle connections"""
+        with self._lock:
+            idle, self._idle = self._idle, []
+        for _last_used, connection in idle:
+            connection.close()
+
+
+class HttpTransport(object):
+    """
+    HTTP transport for pysimplesoap keeping a pool of persistent connections per host.
+    A single transport can be shared by many clients and threads.
+    """
+    # request() accepts a timings dictionnary (see pypayline.instrumentation)
+    reports_timings = True
+    # request() accepts a read timeout (see pypayline.resilience)
+    accepts_timeout = True
+    # request() accepts an idempotent flag (see send_again)
+    accepts_idempotent = True
+
+    def __init__(self, pool_size=DEFAULT_POOL_SIZE, idle_timeout=DEFAULT_IDLE_TIMEOUT,
+                 connect_timeout=DEFAULT_CONNECT_TIMEOUT, read_timeout=DEFAULT_READ_TIMEOUT,
+                 ssl_context=None):
+        """
+        :param pool_size : maximum number of idle connections kept per host
+        :param idle_timeout : idle connections older than this number of seconds are closed
+        :param connect_timeout : timeout in seconds when opening a connection
+        :param read_timeout : timeout in seconds when waiting for the response
+        :param ssl_context : ssl.SSLContext used for the https connections
+        """
+        self.pool_size = pool_size
+        self.idle_timeout = idle_timeout
+        self.connect_timeout = connect_timeout
+        self.read_timeout = read_timeout
+        self.ssl_context = ssl_context or ssl.create_default_context()
+        self.pools = {}
+        self._lock = threading.Lock()
+
+    def get_pool(self, scheme, host, port):
+        """return the connection pool of a host"""
+        key = (scheme, host, port)
+        pool = self.pools.get(key)
+        if pool is None:
+            with self._lock:
+                pool = self.pools.get(key)
+                if pool is None:
+                    pool = ConnectionPool(
+                        scheme, host, port, self.pool_size, self.idle_timeout,
+                        self.connect_timeout, self.read_timeout,
+                        ssl_context=self.ssl_context if scheme == 'https' else None
+                    )
+                    self.pools[key] = pool
+        return pool
+
+    def request(self, url, method='POST', body=None, headers=None, timings=None, timeout=None, idempotent=False):
+        """
+        Send a request, pysimplesoap Http interface
+        :param timings : if not None, the seconds spent to open the connection are added to timings['connect']
+        :param timeout : read timeout in seconds of this request. The read_timeout of the transport if None
+        :param idempotent : True if the request can be sent twice without side effect (see send_again)
+        :return: (response headers, response content)
+        :raise: HTTPError if the response status is an error except 500 (used for SOAP faults)
+        :raise: ValueError if the url is not an http or https url with a host
+        """
+        parts = urlsplit(url)
+        scheme = parts.scheme.lower()
+        if scheme not in ('http', 'https') or not parts.hostname:
+            raise ValueError(u'Invalid SOAP location {0!r}: an http or https url is expected'.format(url))
+        port = parts.port or (443 if scheme == 'https' else 80)
+        pool = self.get_pool(scheme, parts.hostname, port)
+        path = parts.path or '/'
+        if parts.query:
+            path = '{0}?{1}'.format(path, parts.query)
+
+        connection, is_reused = pool.get_connection()
+        try:
+            response = self._send(connection, method, path, body, headers or {}, timings, timeout)
+        except Exception as err:
+            connection.close()
+            if not self.send_again(err, is_reused, idempotent):
+                raise
+            # the request has not been handled by the server: send it on a new connection
+            logger.debug(u'Stale connection to {0}, reconnecting'.format(parts.hostname))
+            connection = pool.new_connection()
+            try:
+                response = self._send(connection, method, path, body, headers or {}, timings, timeout)
+            except Exception:
+                connection.close()
+                raise
+
+        try:
+            content = response.read()
+        except Exception:
+            connection.close()
+            raise
+
+        if response.will_close:
+            connection.close()
+        else:
+            if timeout is not None:
+                connection.sock.settimeout(pool.read_timeout)
+            pool.put_connection(connection)
+
+        response_headers = dict((key.lower(), value) for key, value in response.getheaders())
+        if response.status >= 400 and response.status != 500:
+            raise HTTPError(url, response.status, response.reason, response_headers, None)
+        return response_headers, content
+
+    @staticmethod
+    def send_again(err, is_reused, idempotent):
+        """
+        True if a request which failed with err can be sent again on a new connection: the request
+        has not been sent (CannotSendRequest), or the reused connection has been closed by the server
+        before the status line of the response and the request is idempotent. A payment may have been
+        processed by Payline when the connection is closed after the request is sent: it is never sent twice
+        """
+        if isinstance(err, http_client.CannotSendRequest):
+            return True
+        return is_reused and idempotent and isinstance(err, REMOTE_DISCONNECTED)
+
+    def _send(self, connection, method, path, body, headers, timings=None, timeout=None):
+        """send the request on the connection and return the response"""
+        if (timings is not None or timeout is not None) and connection.sock is None:
+            start = time.time()
+            connection.connect()
+            if timings is not None:
+                timings['connect'] = timings.get('connect', 0.0) + time.time() - start
+        if timeout is not None:
+            connection.sock.settimeout(timeout)
+        connection.request(method, path, body=body, headers=headers)
+        return connection.getresponse()
+
+    def close(self):
+        """close all the idle connections"""
+        for pool in list(self.pools.values()):
+            pool.close()
+
+
+_transports = {}
+_transports_lock = threading.Lock()
+
+
+def get_transport(pool_size=DEFAULT_POOL_SIZE, idle_timeout=DEFAULT_IDLE_TIMEOUT,
+                  connect_timeout=DEFAULT_CONNECT_TIMEOUT, read_timeout=DEFAULT_READ_TIMEOUT):
+    """return the process-wide transport for these settings: the clients share its connection pools"""
+    key = (pool_size, idle_timeout, connect_timeout, read_timeout)
+    with _transports_lock:
+        transport = _transports.get(key)
+        if transport is None:
+            transport = HttpTransport(
+                pool_size=pool_size, idle_timeout=idle_timeout,
+                connect_timeout=connect_timeout, read_timeout=read_timeout
+            )
+            _transports[key] = transport
+    return transport
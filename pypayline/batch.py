@@ -0,0 +1,219 @@
+# -*- coding: utf-8 -*-
+"""
+Python client for the Payline SOAP API
+Batches of API calls : bounded parallelism, rate limiting and prefetching
+"""
+
+from __future__ import print_function
+
+import itertools
+import logging
+import threading
+import time
+
+from six.moves import queue
+
+
+logger = logging.getLogger(u'pypayline')
+
+
+DEFAULT_MAX_WORKERS = 10
+
+
+def chunks(items, size):
+    """yield lists of at most size items from an iterable, without reading it all"""
+    iterator = iter(items)
+    while True:
+        chunk = list(itertools.islice(iterator, size))
+        if not chunk:
+            return
+        yield chunk
+
+
+class RateLimiter(object):
+    """
+    Token bucket limiting the number of calls per second. It can be shared by several threads
+    and batches: the calls of all of them count for the same limit
+    """
+
+    def __init__(self, rate, burst=1):
+        """
+        :param rate : maximum number of calls per second
+        :param burst : number of calls which can be done at once after an idle period
+        """
+        if rate <= 0:
+            raise ValueError(u'rate must be positive')
+        self.rate = float(rate)
+        self.burst = burst
+        self.tokens = float(burst)
+        self.last_time = time.time()
+        self._lock = threading.Lock()
+
+    def reserve(self):
+        """take a token and return the number of seconds to wait before the call"""
+        with self._lock:
+            now = time.time()
+            self.tokens = min(self.burst, self.tokens + (now - self.last_time) * self.rate)
+            self.last_time = now
+            self.tokens -= 1
+            if self.tokens >= 0:
+                return 0
+            return -self.tokens / self.rate
+
+    def acquire(self):
+        """wait until a call is allowed"""
+        delay = self.reserve()
+        if delay > 0:
+            time.sleep(delay)
+
+
+def get_rate_limiter(rate_limit):
+    """return a RateLimiter for the rate_limit argument: None, a number of calls per second or a RateLimiter"""
+    if rate_limit is None or isinstance(rate_limit, RateLimiter):
+        return rate_limit
+    return RateLimiter(rate_limit)
+
+
+class BatchResults(object):
+    """
+    Iterator of the (item, result) of a batch, in the order of completion. The calls run in
+    max_workers threads and the errors are collected in the errors dictionnary
+    {item: exception} instead of stopping the batch
+    """
+
+    def __init__(self, function, items, max_workers=DEFAULT_MAX_WORKERS, rate_limit=None):
+        """
+        :param function : function called with each item
+        :param items : iterable of the items. It is consumed by the workers as the batch progresses
+        :param max_workers : number of calls running at the same time
+        :param rate_limit : maximum number of calls per second (or a shared RateLimiter). No limit if None
+        """
+        if max_workers < 1:
+            raise ValueError(u'max_workers must be at least 1')
+        self.function = function
+        self.items = iter(items)
+        self.max_workers = max_workers
+        self.rate_limiter = get_rate_limiter(rate_limit)
+        self.errors = {}
+        self.count = 0
+        # the workers wait when the results are not consumed
+        self._results = queue.Queue(maxsize=max_workers * 2)
+        self._items_lock = threading.Lock()
+        self._stopped = threading.Event()
+        self._threads = None
+
+    def next_item(self):
+        """return (True, item) or (False, None) once all the items have been taken"""
+        with self._items_lock:
+            if self._stopped.is_set():
+                return False, None
+            try:
+                return True, next(self.items)
+            except StopIteration:
+                return False, None
+
+    def work(self):
+        """worker thread: call the function for the items until the end of the batch"""
+        try:
+            while True:
+                has_item, item = self.next_item()
+                if not has_item:
+                    break
+                if self.rate_limiter is not None:
+                    self.rate_limiter.acquire()
+                try:
+                    result = (item, self.function(item), None)
+                except Exception as err:
+                    logger.warning(u'Batch call failed for {0}: {1}'.format(item, err))
+                    result = (item, None, err)
+                if not self.put(result):
+                    break
+        finally:
+            self.put(None)
+
+    def put(self, result):
+        """give a result to the consumer. Return False if the batch has been stopped"""
+        while not self._stopped.is_set():
+            try:
+                self._results.put(result, timeout=0.1)
+                return True
+            except queue.Full:
+                pass
+        return False
+
+    def start(self):
+        """start the worker threads"""
+        self._threads = [
+            threading.Thread(target=self.work, name=u'pypayline-batch-{0}'.format(index))
+            for index in range(self.max_workers)
+        ]
+        for thread in self._threads:
+            thread.daemon = True
+            thread.start()
+
+    def stop(self):
+        """stop the batch: the calls in progress are completed and the remaining items are skipped"""
+        self._stopped.set()
+
+    def __iter__(self):
+        if self._threads is not None:
+            raise RuntimeError(u'The batch can be iterated only once')
+        self.start()
+        running = len(self._threads)
+        try:
+            while running:
+                result = self._results.get()
+                if result is None:
+                    running -= 1
+                    continue
+                item, value, error = result
+                self.count += 1
+                if error is not None:
+                    self.errors[item] = error
+                else:
+                    yield item, value
+        finally:
+            self.stop()
+
+
+def prefetch(iterable, size=1):
+    """
+    yield the items of an iterable which is read in a background thread, at most size items
+    ahead of the consumer. The errors of the iterable are raised in the consumer
+    """
+    buffer = queue.Queue(maxsize=size)
+    stopped = threading.Event()
+
+    def put(entry):
+        while not stopped.is_set():
+            try:
+                buffer.put(entry, timeout=0.1)
+                return True
+            except queue.Full:
+                pass
+        return False
+
+    def read():
+        try:
+            for item in iterable:
+                if not put((True, item)):
+                    return
+        except Exception as err:
+            put((False, err))
+        else:
+            put((False, None))
+
+    thread = threading.Thread(target=read, name=u'pypayline-prefetch')
+    thread.daemon = True
+    thread.start()
+    try:
+        while True:
+            is_item, value = buffer.get()
+            if is_item:
+                yield value
+            elif value is not None:
+                raise value
+            else:
+                return
+    finally:
+        stopped.set()
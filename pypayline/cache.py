@@ -0,0 +1,308 @@
+# -*- coding: utf-8 -*-
+"""
+Python client for the Payline SOAP API
+Cache of the results of the read-only calls (getWebPaymentDetails, getPaymentRecord, getWallet, getCards)
+"""
+
+from __future__ import print_function
+
+import copy
+import json
+import logging
+import threading
+import time
+import uuid
+from collections import OrderedDict
+
+
+logger = logging.getLogger(u'pypayline')
+
+
+DEFAULT_MAX_SIZE = 10000
+
+# the payment is complete: the result won't change
+DEFAULT_TERMINAL_TTL = 600
+# other results (payments in progress, unknown codes...): not cached, a status poll must reach Payline
+DEFAULT_TTL = 0
+
+# the wallets and their cards: they are also invalidated by the updates of the client
+DEFAULT_WALLET_TTL = 300
+
+# result code of the successful wallet operations: the only results kept by the WalletCache
+WALLET_SUCCESS_CODE = u'02500'
+
+# the payment is still in progress: the result is never cached
+PENDING_RESULT_CODES = (u'02000', u'02005', u'02015', u'02306', u'02533')
+
+
+class MemoryStore(object):
+    """
+    In-process LRU store with expiration. It can be shared by several clients and threads.
+    The values are copied when stored and when returned: the callers can't change the stored ones.
+    Shared stores (memcached, redis...) must provide the same get, set and delete methods
+    """
+
+    def __init__(self, max_size=DEFAULT_MAX_SIZE, clock=time.time):
+        """
+        :param max_size : maximum number of entries: the least recently used are dropped
+        :param clock : function returning the current time in seconds
+        """
+        self.max_size = max_size
+        self.clock = clock
+        self._entries = OrderedDict()  # key: (expiration time, value)
+        self._lock = threading.Lock()
+
+    def get(self, key):
+        """return the value or None if it is missing or expired"""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            expiration, value = entry
+            if expiration <= self.clock():
+                del self._entries[key]
+                return None
+            # most recently used
+            del self._entries[key]
+            self._entries[key] = entry
+        return copy.deepcopy(value)
+
+    def set(self, key, value, ttl):
+        """store a value for ttl seconds"""
+        value = copy.deepcopy(value)
+        with self._lock:
+            self._entries.pop(key, None)
+            self._entries[key] = (self.clock() + ttl, value)
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+
+    def delete(self, key):
+        """remove a value"""
+        with self._lock:
+            self._entries.pop(key, None)
+
+    def clear(self):
+        """remove all the values"""
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self):
+        return len(self._entries)
+
+
+class SQLiteStore(object):
+    """
+    Store with expiration in a SQLite database: it is shared by the processes of a host and kept
+    when they restart. The values must be JSON serializable (the tuples are returned as lists)
+    """
+
+    def __init__(self, path, table='pypayline_store', clock=time.time):
+        """
+        :param path : path of the database file (created if it doesn't exist)
+        :param table : name of the table of the entries
+        :param clock : function returning the current time in seconds
+        """
+        import sqlite3
+
+        self.path = path
+        self.table = table
+        self.clock = clock
+        self._lock = threading.Lock()
+        self._connection = sqlite3.connect(path, timeout=30, check_same_thread=False)
+        with self._lock, self._connection:
+            self._connection.execute(
+                u'CREATE TABLE IF NOT EXISTS {0} (key TEXT PRIMARY KEY, value TEXT, expiration REAL)'.format(table)
+            )
+
+    def get(self, key):
+        """return the value or None if it is missing or expired"""
+        with self._lock:
+            row = self._connection.execute(
+                u'SELECT value, expiration FROM {0} WHERE key = ?'.format(self.table), (key,)
+            ).fetchone()
+        if row is None or row[1] <= self.clock():
+            return None
+        return json.loads(row[0])
+
+    def set(self, key, value, ttl):
+        """store a value for ttl seconds"""
+        with self._lock, self._connection:
+            self._connection.execute(
+                u'INSERT OR REPLACE INTO {0} (key, value, expiration) VALUES (?, ?, ?)'.format(self.table),
+                (key, json.dumps(value), self.clock() + ttl)
+            )
+
+    def delete(self, key):
+        """remove a value"""
+        with self._lock, self._connection:
+            self._connection.execute(u'DELETE FROM {0} WHERE key = ?'.format(self.table), (key,))
+
+    def purge(self):
+        """remove the expired values"""
+        with self._lock, self._connection:
+            self._connection.execute(u'DELETE FROM {0} WHERE expiration <= ?'.format(self.table), (self.clock(),))
+
+    def clear(self):
+        """remove all the values"""
+        with self._lock, self._connection:
+            self._connection.execute(u'DELETE FROM {0}'.format(self.table))
+
+    def close(self):
+        with self._lock:
+            self._connection.close()
+
+    def __len__(self):
+        with self._lock:
+            return self._connection.execute(u'SELECT COUNT(*) FROM {0}'.format(self.table)).fetchone()[0]
+
+
+class TTLPolicy(object):
+    """Time to live of a result according to its result code"""
+
+    def __init__(self, ttls=None, default_ttl=DEFAULT_TTL, pending_codes=PENDING_RESULT_CODES):
+        """
+        :param ttls : dictionnary {result code: seconds} of the terminal result codes. By default, the
+            successful results (00000) are kept DEFAULT_TERMINAL_TTL seconds
+        :param default_ttl : seconds for the other result codes. 0 (by default) to cache only the codes of ttls
+        :param pending_codes : result codes which are never cached, even with a default_ttl
+        """
+        self.ttls = {u'00000': DEFAULT_TERMINAL_TTL} if ttls is None else dict(ttls)
+        self.default_ttl = default_ttl
+        self.pending_codes = frozenset(pending_codes)
+
+    def ttl(self, result_code):
+        """return the time to live in seconds of a result. 0 if it must not be cached"""
+        if result_code in self.pending_codes:
+            return 0
+        return self.ttls.get(result_code, self.default_ttl)
+
+
+class ResultCache(object):
+    """
+    Cache of the API results with hit and miss counters. A single ResultCache can be given
+    to several clients: the entries are keyed by merchant
+    """
+
+    def __init__(self, store=None, policy=None):
+        """
+        :param store : MemoryStore or any object with the get(key), set(key, value, ttl) and delete(key)
+            methods. A new MemoryStore by default
+        :param policy : TTLPolicy
+        """
+        self.store = MemoryStore() if store is None else store
+        self.policy = TTLPolicy() if policy is None else policy
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def make_key(*parts):
+        """key of an entry: a text, usable by the shared stores"""
+        return u':'.join([u'pypayline'] + [u'{0}'.format(part) for part in parts])
+
+    def get(self, key):
+        """return the cached value or None, and count the hit or the miss"""
+        try:
+            value = self.store.get(key)
+        except Exception as err:
+            # an unavailable shared store must not break the payments
+            logger.warning(u'Result cache error: {0}'.format(err))
+            value = None
+        with self._lock:
+            if value is None:
+                self.misses += 1
+            else:
+                self.hits += 1
+        return value
+
+    def set(self, key, value, result_code):
+        """store a value with the TTL of its result code"""
+        ttl = self.policy.ttl(result_code)
+        if ttl > 0:
+            try:
+                self.store.set(key, value, ttl)
+            except Exception as err:
+                logger.warning(u'Result cache error: {0}'.format(err))
+
+    def invalidate(self, key):
+        """remove a value"""
+        self.store.delete(key)
+
+    @property
+    def stats(self):
+        """hits and misses counters"""
+        total = self.hits + self.misses
+        return {
+            'hits': self.hits,
+            'misses': self.misses,
+            'hit_ratio': float(self.hits) / total if total else 0.0,
+        }
+
+    def reset_stats(self):
+        """reset the counters"""
+        with self._lock:
+            self.hits = self.misses = 0
+
+
+class WalletCache(ResultCache):
+    """
+    Cache of the wallets and of their cards (masked numbers, expiration dates...): only the
+    successful results are kept. All the entries of a wallet are invalidated at once when it
+    is updated, disabled or enabled
+    """
+
+    def __init__(self, store=None, ttl=DEFAULT_WALLET_TTL):
+        """
+        :param store : MemoryStore or any object with the get, set and delete methods (see ResultCache)
+        :param ttl : seconds during which the wallets are kept
+        """
+        super(WalletCache, self).__init__(store, TTLPolicy(ttls={WALLET_SUCCESS_CODE: ttl}, default_ttl=0))
+        self.ttl = ttl
+
+    def generation_key(self, merchant_id, wallet_id):
+        return self.make_key(merchant_id, u'wallet', wallet_id)
+
+    def wallet_key(self, merchant_id, wallet_id, operation, *args):
+        """key of a result of a wallet. It changes when the wallet is invalidated. None if the store fails"""
+        try:
+            generation = self.store.get(self.generation_key(merchant_id, wallet_id)) or u'0'
+        except Exception as err:
+            logger.warning(u'Result cache error: {0}'.format(err))
+            return None
+        return self.make_key(merchant_id, operation, wallet_id, generation, *args)
+
+    def invalidate_wallet(self, merchant_id, wallet_id):
+        """
+        forget the results of a wallet: the keys of its entries are changed, which works with the
+        shared stores. The generation outlives the entries of the previous one
+        """
+        try:
+            self.store.set(self.generation_key(merchant_id, wallet_id), uuid.uuid4().hex, self.ttl)
+        except Exception as err:
+            logger.warning(u'Result cache error: {0}'.format(err))
+
+
+def get_result_cache(result_cache):
+    """return the ResultCache for the result_cache argument of the clients: None, True or a ResultCache"""
+    if result_cache is None or result_cache is False:
+        return None
+    if result_cache is True:
+        return ResultCache()
+    return result_cache
+
+
+def get_wallet_cache(wallet_cache):
+    """return the WalletCache for the wallet_cache argument of the clients: None, True or a WalletCache"""
+    if wallet_cache is None or wallet_cache is False:
+        return None
+    if wallet_cache is True:
+        return WalletCache()
+    return wallet_cache
+
+
+def result_code(data):
+    """result code of a raw response"""
+    try:
+        return data['result']['code']
+    except (KeyError, TypeError):
+        return u''
@@ -7,19 +7,41 @@ client class
 from __future__ import print_function
 
 import base64
+import logging
 import os
-from datetime import datetime
+import threading
+import time
+from collections import deque
+from datetime import datetime, timedelta
 from decimal import Decimal
 
 import six
 
-from pypayline.backends.soap import SoapBackend
-from pypayline.exceptions import InvalidCurrencyError, ArgumentsError
+from pypayline.batch import BatchResults, DEFAULT_MAX_WORKERS, chunks, prefetch
+from pypayline.cache import get_result_cache, get_wallet_cache, result_code as get_result_code
+from pypayline.idempotency import get_idempotency_layer
+from pypayline.pruning import full_wsdl_path, pruned_wsdl_path
+from pypayline.results import PaymentRecord, WebPaymentDetails
+from pypayline.schedule import get_billing_cycle, recurring_request, to_cents
+from pypayline.exceptions import (
+    InvalidCurrencyError, ArgumentsError, MassTraitmentTimeoutError, PaylineApiError
+)
+
+
+logger = logging.getLogger(u'pypayline')
+
+
+def import_string(path):
+    """return the object of a dotted path: pypayline.backends.soap.SoapBackend for example"""
+    module_name, name = path.rsplit(u'.', 1)
+    module = __import__(module_name, fromlist=[name])
+    return getattr(module, name)
 
 
 class PaylineBaseAPI(object):
     """Base class for calling the payline services"""
-    backend_class = SoapBackend
+    # a class or its dotted path: the backend module (and pysimplesoap) is imported with the first call
+    backend_class = 'pypayline.backends.soap.SoapBackend'
     web_service_version = "19"
     api_name = 'PaylineBaseAPI'
 
@@ -29,24 +51,84 @@ class PaylineBaseAPI(object):
     }
 
     def __init__(self, merchant_id=None, access_key=None, contract_number=None,
-                 cache=None, trace=None, homologation=False):
+                 cache=None, trace=None, homologation=False, transport=None,
+                 pool_size=None, pool_idle_timeout=None, connect_timeout=None, read_timeout=None,
+                 result_cache=None, hooks=None, resilience=None, full_wsdl=False):
         """
-        Init the SOAP by getting the WSDL of the service. It is recommeded to cache it
+        Init the SOAP client of the service. It is recommended to cache the compiled WSDL
 
         :param merchant_id : Your Payline Merchant id
         :param access_key : Your Payline access key
         :param contract number : Your Payline contract number
-        :param cache : cache the WSDL file (recommended to do it). Cache is disabled if None
+        :param cache : keep the compiled WSDL on disk (recommended). True uses $PYPAYLINE_CACHE_DIR or
+            ~/.cache/pypayline, a directory path uses this directory. Cache is disabled if None
         :param trace : print some debug logs
-        :param homologation : if True use the homologation host for test. If false, user the regular host
+        :param homologation : if True use the homologation host for test. If false, user the regular host.
+            A base url (http://127.0.0.1:8080 for example) uses this host: see pypayline.simulator
+        :param transport : custom HTTP transport. By default, the connections to Payline are kept
+            in a pool shared by the clients with the same settings
+        :param pool_size : maximum number of idle connections kept per host
+        :param pool_idle_timeout : idle connections are closed after this number of seconds
+        :param connect_timeout : timeout in seconds when opening a connection
+        :param read_timeout : timeout in seconds when waiting for a response
+        :param result_cache : cache of the payment details and records. True for an in-process cache,
+            a pypayline.cache.ResultCache (which can be shared by several clients) or None to disable it
+        :param hooks : instrumentation hooks called around each SOAP call (see pypayline.instrumentation)
+        :param resilience : timeouts, retries, hedging and circuit breaker of the calls: a
+            pypayline.resilience.ResiliencePolicy, which can be shared by several clients
+        :param full_wsdl : load the full WSDL of Payline rather than the pruned WSDL of the service
+            (see pypayline.pruning), for the operations which are not implemented by the backend
         """
 
         self.merchant_id, self.access_key, self.contract_number = merchant_id, access_key, contract_number
         self.sandbox = homologation
         self.cache = cache
         self.trace = trace
+        self.transport = transport
+        self.transport_settings = dict(
+            pool_size=pool_size, pool_idle_timeout=pool_idle_timeout,
+            connect_timeout=connect_timeout, read_timeout=read_timeout
+        )
+        self.result_cache = get_result_cache(result_cache)
+        self.hooks = hooks
+        self.resilience = resilience
+        self.full_wsdl = full_wsdl
+        self.http_headers = self.authorization_headers()
+        # the backend is created on first use: see the backend property and warmup
+        self._backend = None
+        self._backend_lock = threading.Lock()
 
-    def setup_backend(self):
+    def cache_key(self, operation, *args):
+        """key of a result in the result cache or None if the cache is disabled"""
+        if self.result_cache is None:
+            return None
+        return self.result_cache.make_key(self.merchant_id, operation, *args)
+
+    def format_currency(self, currency):
+        """
+        return the ISO 4217 code of a currency
+        :raise: InvalidCurrencyError if currency value is not supported
+        """
+        formatted_currency = self.currencies.get(currency, None)
+        if formatted_currency is None:
+            raise InvalidCurrencyError(u'{0} currency is not supported'.format(currency))
+        return formatted_currency
+
+    def build_payment(self, amount, currency, action):
+        """
+        return the payment of an operation: the amount is in cents
+        :raise: InvalidCurrencyError if currency value is not supported
+        """
+        return {
+            'amount': to_cents(amount),
+            'currency': self.format_currency(currency),
+            'action': action,
+            'mode': u'CPT',
+            'contractNumber': self.contract_number.split(",")[0],
+        }
+
+    def authorization_headers(self):
+        """HTTP headers of the SOAP calls"""
         # Create the header. last char of the base64 token is \n -> remove it
         key = u'{0}:{1}'.format(self.merchant_id, self.access_key)
         if six.PY2:
@@ -55,26 +137,60 @@ class PaylineBaseAPI(object):
             authorization_token = base64.encodebytes(key.encode('ascii')
                                                      )[:-1].decode('ascii')
 
-        self.http_headers = {
+        return {
             u'Authorization': u'Basic {0}'.format(authorization_token),
         }
 
+    def setup_backend(self):
         # Create the webservice client
         # Note that the location attribute is required as the WSDL embeds
         # an invalid location URL. And we use that to differentiate between
         # sandbox/production.
-        self.backend = self.backend_class(
-            wsdl=self.soap_wsdl_url.encode('ascii'),
-            location=self.soap_url.encode('ascii'),  # Requir
+        backend_class = self.backend_class
+        if isinstance(backend_class, six.string_types):
+            backend_class = import_string(backend_class)
+        self.backend = backend_class(
+            wsdl=str(self.soap_wsdl_url),
+            location=str(self.soap_url),  # Required
             http_headers=self.http_headers,
-            cache=self.api_name if self.cache else None,
+            cache=self.cache,
             trace=self.trace,
-            api_name=self.api_name
+            api_name=self.api_name,
+            transport=self.transport,
+            hooks=self.hooks,
+            resilience=self.resilience,
+            **self.transport_settings
         )
 
+    @property
+    def backend(self):
+        """the backend of the service, created on first use: the WSDL is loaded by the first call"""
+        if self._backend is None:
+            with self._backend_lock:
+                if self._backend is None:
+                    self.setup_backend()
+        return self._backend
+
+    @backend.setter
+    def backend(self, backend):
+        self._backend = backend
+
+    def warmup(self):
+        """
+        Create the backend and compile the hot operations now rather than on the first call:
+        for the servers which prefer to pay this cost when they start
+        :return: the client
+        """
+        warmup = getattr(self.backend, 'warmup', None)
+        if warmup is not None:
+            warmup()
+        return self
+
     @property
     def soap_url(self):
-        if self.sandbox:
+        if isinstance(self.sandbox, six.string_types):
+            payline_host = self.sandbox.rstrip(u'/')
+        elif self.sandbox:
             payline_host = u'https://homologation.payline.com'
         else:
             payline_host = u'https://services.payline.com'
@@ -82,10 +198,12 @@ class PaylineBaseAPI(object):
 
     @property
     def soap_wsdl_url(self):
-        return 'file://{}/{}.wsdl'.format(
-            os.path.abspath(os.path.dirname(__file__)),
-            self.api_name
-        )
+        """the pruned WSDL of the service if it exists, the full WSDL otherwise"""
+        if not self.full_wsdl:
+            path = pruned_wsdl_path(self.api_name)
+            if os.path.exists(path):
+                return 'file://{}'.format(path)
+        return 'file://{}'.format(full_wsdl_path(self.api_name))
 
 
 class WebPaymentAPI(PaylineBaseAPI):
@@ -94,24 +212,40 @@ class WebPaymentAPI(PaylineBaseAPI):
 
     def __init__(self, *args, **kwargs):
         """
-            Init the SOAP by getting the WSDL of the service. It is recommeded to cache it
+            Init the SOAP client of the service. It is recommended to cache the compiled WSDL
 
             :param merchant_id : Your Payline Merchant id
             :param access_key : Your Payline access key
             :param contract number : Your Payline contract number
-            :param cache : cache the WSDL file (recommended to do it). Cache is disabled if None
+            :param cache : keep the compiled WSDL on disk (recommended). True uses $PYPAYLINE_CACHE_DIR or
+                ~/.cache/pypayline, a directory path uses this directory. Cache is disabled if None
             :param trace : print some debug logs
-            :param homologation : if True use the homologation host for test. If false, user the regular host
+            :param homologation : if True use the homologation host for test. If false, user the regular host.
+                A base url (http://127.0.0.1:8080 for example) uses this host: see pypayline.simulator
+            :param transport : custom HTTP transport. By default, the connections to Payline are kept
+                in a pool shared by the clients with the same settings
+            :param pool_size : maximum number of idle connections kept per host
+            :param pool_idle_timeout : idle connections are closed after this number of seconds
+            :param connect_timeout : timeout in seconds when opening a connection
+            :param read_timeout : timeout in seconds when waiting for a response
+            :param result_cache : cache of the payment details and records: True, a ResultCache or None
+            :param hooks : instrumentation hooks called around each SOAP call
+            :param resilience : ResiliencePolicy of the calls (see pypayline.resilience)
+            :param full_wsdl : load the full WSDL rather than the pruned WSDL of the service
+            :param idempotency : payment sessions by order: True, an IdempotencyLayer (which can be shared
+                by several clients) or None to disable it. A do_web_payment repeating the order_ref, amount
+                and currency of a call of the window returns its (redirect_url, token)
         """
+        self.idempotency = get_idempotency_layer(kwargs.pop('idempotency', None))
         super(WebPaymentAPI, self).__init__(*args, **kwargs)
-        self.setup_backend()
 
     def do_web_payment(
             self, amount, currency, order_ref, return_url, cancel_url,
             selected_contract_list=None,
             second_selected_contract_list=None,
             notification_url='', recurring_times=None,
-            recurring_period_in_months=None, payline_action=100, taxes=0, country='', buyer=None
+            recurring_period_in_months=None, payline_action=100, taxes=0, country='', buyer=None,
+            billing_cycle=None
         ):
         """
         Calls the Payline SOAP API for making a new payment
@@ -123,12 +257,14 @@ class WebPaymentAPI(PaylineBaseAPI):
         :param cancel_url: The Url to go if user cancels the payment
         :param notification_url: The Url to call for sending IPN
         :param recurring_times: number of payments
-        :param recurring_period_in_months: Recurring period in months
+        :param recurring_period_in_months: Recurring period in months: 1, 2, 3, 6, 12 or 24
         :param payline_action: Payline code. Can be 100 (Autorisation) or 101 (Autorisation + validation)
             See Payline docs
         :param taxes: amount of taxes (for info)
         :param country: country (for info)
         :param buyer: dictionnary with buyer info
+        :param billing_cycle: Payline billing cycle of the recurring payment, rather than
+            recurring_period_in_months (see pypayline.schedule.BILLING_CYCLES: 10 for daily...)
         :return: Payline response as a dictionnary with the following keys
             - redirectURL : where to redirect the user
             - token = a token for the query
@@ -141,44 +277,59 @@ class WebPaymentAPI(PaylineBaseAPI):
             - InvalidCurrencyError if currency value is not supported
             - ArgumentsError : if recurring is invalid
         """
+        request = self.build_web_payment_request(
+            amount, currency, order_ref, return_url, cancel_url,
+            selected_contract_list=selected_contract_list,
+            second_selected_contract_list=second_selected_contract_list,
+            notification_url=notification_url, recurring_times=recurring_times,
+            recurring_period_in_months=recurring_period_in_months, payline_action=payline_action,
+            taxes=taxes, country=country, buyer=buyer, billing_cycle=billing_cycle
+        )
+        if self.idempotency is None:
+            return self.send_web_payment(request)
+        return self.idempotency.call(self.idempotency_key(request), lambda: self.send_web_payment(request))
 
-        # Check and convert params
-        formatted_amount = int(amount * 100)
-        formatted_taxes = int(taxes * 100)
+    def send_web_payment(self, request):
+        """call doWebPayment with the parameters of build_web_payment_request: return (redirect_url, token)"""
+        redirect_url, token = self.backend.doWebPayment(**request)
+        return redirect_url, token
 
-        formatted_currency = self.currencies.get(currency, None)
+    def idempotency_key(self, request):
+        """key of a payment in the idempotency layer: its order, amount and currency"""
+        return self.idempotency.make_key(
+            self.merchant_id, request['order']['ref'], request['payment']['amount'], request['payment']['currency']
+        )
 
-        if formatted_currency is None:
-            raise InvalidCurrencyError(u'{0} currency is not supported'.format(currency))
+    def build_web_payment_request(
+            self, amount, currency, order_ref, return_url, cancel_url,
+            selected_contract_list=None,
+            second_selected_contract_list=None,
+            notification_url='', recurring_times=None,
+            recurring_period_in_months=None, payline_action=100, taxes=0, country='', buyer=None,
+            billing_cycle=None
+        ):
+        """
+        Check the arguments of do_web_payment and convert them to the doWebPayment parameters
+        :return: dictionnary of the doWebPayment parameters
+        :raise:
+            - InvalidCurrencyError if currency value is not supported
+            - ArgumentsError : if recurring is invalid
+        """
+
+        # Check and convert params
+        formatted_amount = to_cents(amount)
+        formatted_taxes = to_cents(taxes)
+
+        formatted_currency = self.format_currency(currency)
 
         if recurring_times is None:
             payment_mode = u'CPT'
             recurring = None
         else:
             payment_mode = u'NX'
-            recurring_amount = formatted_amount // recurring_times
-            first_amount = recurring_amount + (formatted_amount - recurring_times * recurring_amount)
-            if recurring_period_in_months is None:
-                raise ArgumentsError(u'The recurring_period_in_months argument should be set with interger values')
-
-            recurring_periods_map = {
-                1: 40,  # Monthly
-                3: 60,  # Quarterly
-                6: 70,  # Half-yearly
-            }
-            try:
-                recurring_period = recurring_periods_map[int(recurring_period_in_months)]
-            except ValueError:
-                raise ArgumentsError(u'The recurring_period_in_months argument should be an interger value')
-            except KeyError:
-                raise ArgumentsError(u'The recurring_period_in_months argument should be in 1, 3 or 6 months')
-
-            recurring = {
-                'billingLeft': recurring_times,
-                'firstAmount': first_amount,
-                'amount': recurring_amount,
-                'billingCycle': recurring_period,
-            }
+            recurring = recurring_request(
+                formatted_amount, recurring_times, get_billing_cycle(recurring_period_in_months, billing_cycle)
+            )
 
         if selected_contract_list is None:
             selected_contract_list = [{ 'selectedContract': c }
@@ -187,7 +338,7 @@ class WebPaymentAPI(PaylineBaseAPI):
             selected_contract_list = [{ 'selectedContract': c }
                                       for c in selected_contract_list]
 
-        redirect_url, token = self.backend.doWebPayment(
+        return dict(
             version=self.web_service_version,
             payment={
                 'amount': formatted_amount,
@@ -214,7 +365,6 @@ class WebPaymentAPI(PaylineBaseAPI):
             cancelURL=cancel_url,
             notificationURL=notification_url
         )
-        return redirect_url, token
 
     def get_web_payment_details(self, token):
         """
@@ -228,11 +378,46 @@ class WebPaymentAPI(PaylineBaseAPI):
          - currency: the used currency
          - data: the raw data
         """
-        data = self.backend.getWebPaymentDetails(
-            version=self.web_service_version,
-            token=token
-        )
+        return self.parse_web_payment_details(self.web_payment_details_data(token))
+
+    def get_web_payment_details_result(self, token):
+        """
+        Get the status of a payment as a typed result, more compact than the raw data
+        :param token: The payment token (returned by do_web_payment)
+        :return: pypayline.results.WebPaymentDetails
+        """
+        return WebPaymentDetails(self.web_payment_details_data(token))
+
+    def web_payment_details_data(self, token):
+        """the raw getWebPaymentDetails response, from the result cache if enabled"""
+        key = self.cache_key('getWebPaymentDetails', token)
+        data = None if key is None else self.result_cache.get(key)
+        if data is None:
+            data = self.backend.getWebPaymentDetails(
+                version=self.web_service_version,
+                token=token
+            )
+            if key is not None:
+                self.result_cache.set(key, data, get_result_code(data))
+        return data
 
+    def get_web_payment_details_many(self, tokens, max_workers=DEFAULT_MAX_WORKERS, rate_limit=None):
+        """
+        Get the status of many payments: the calls are done in parallel by a pool of threads
+        :param tokens: iterable of payment tokens
+        :param max_workers: number of calls running at the same time
+        :param rate_limit: maximum number of calls per second or a pypayline.batch.RateLimiter
+            shared by several batches. No limit if None
+        :return: BatchResults : iterator of (token, get_web_payment_details tuple) in the order
+            of completion. The errors are collected in its errors attribute as {token: exception}
+        """
+        return BatchResults(self.get_web_payment_details, tokens, max_workers=max_workers, rate_limit=rate_limit)
+
+    def parse_web_payment_details(self, data):
+        """
+        Convert the getWebPaymentDetails response to the get_web_payment_details tuple
+        :param data: the raw data
+        """
         try:
             is_transaction_ok = not int(data['transaction']['isPossibleFraud'])
         except (KeyError, TypeError):
@@ -268,19 +453,41 @@ class DirectPaymentAPI(PaylineBaseAPI):
     """client for Payline DirectPayment API"""
     api_name = 'DirectPaymentAPI'
 
+    # payline_action of do_authorization: authorization only or authorization + capture
+    authorization_action = 100
+    authorization_and_capture_action = 101
+    capture_action = 201
+    debit_action = 204
+    refund_action = 421
+
     def __init__(self, *args, **kwargs):
         """
-            Init the SOAP by getting the WSDL of the service. It is recommeded to cache it
+            Init the SOAP client of the service. It is recommended to cache the compiled WSDL
 
             :param merchant_id : Your Payline Merchant id
             :param access_key : Your Payline access key
             :param contract number : Your Payline contract number
-            :param cache : cache the WSDL file (recommended to do it). Cache is disabled if None
+            :param cache : keep the compiled WSDL on disk (recommended). True uses $PYPAYLINE_CACHE_DIR or
+                ~/.cache/pypayline, a directory path uses this directory. Cache is disabled if None
             :param trace : print some debug logs
-            :param homologation : if True use the homologation host for test. If false, user the regular host
+            :param homologation : if True use the homologation host for test. If false, user the regular host.
+                A base url (http://127.0.0.1:8080 for example) uses this host: see pypayline.simulator
+            :param transport : custom HTTP transport. By default, the connections to Payline are kept
+                in a pool shared by the clients with the same settings
+            :param pool_size : maximum number of idle connections kept per host
+            :param pool_idle_timeout : idle connections are closed after this number of seconds
+            :param connect_timeout : timeout in seconds when opening a connection
+            :param read_timeout : timeout in seconds when waiting for a response
+            :param result_cache : cache of the payment details and records: True, a ResultCache or None
+            :param hooks : instrumentation hooks called around each SOAP call
+            :param resilience : ResiliencePolicy of the calls (see pypayline.resilience)
+            :param full_wsdl : load the full WSDL rather than the pruned WSDL of the service
+            :param wallet_cache : cache of the wallets and of their cards: True, a WalletCache (which can be
+                shared by several clients) or None to disable it. The wallets updated, disabled or enabled
+                by the client are invalidated
         """
+        self.wallet_cache = get_wallet_cache(kwargs.pop('wallet_cache', None))
         super(DirectPaymentAPI, self).__init__(*args, **kwargs)
-        self.setup_backend()
 
     def get_payment_record(self, contract_number, payment_record_id):
         """
@@ -294,11 +501,499 @@ class DirectPaymentAPI(PaylineBaseAPI):
          - amount: the paid amount,
          - data: the raw data
         """
-        data = self.backend.getPaymentRecord(
+        return self.parse_payment_record(self.payment_record_data(contract_number, payment_record_id))
+
+    def get_payment_record_result(self, contract_number, payment_record_id):
+        """
+        Get the status of a payment as a typed result, more compact than the raw data
+        :param contract_number: Contract number
+        :param payment_record_id: record identifier, Received by IPN
+        :return: pypayline.results.PaymentRecord. Its billing records are converted on first access
+        """
+        return PaymentRecord(self.payment_record_data(contract_number, payment_record_id))
+
+    def payment_record_data(self, contract_number, payment_record_id):
+        """the raw getPaymentRecord response, from the result cache if enabled"""
+        key = self.cache_key('getPaymentRecord', contract_number, payment_record_id)
+        data = None if key is None else self.result_cache.get(key)
+        if data is None:
+            data = self.backend.getPaymentRecord(
+                contractNumber=contract_number,
+                paymentRecordId=payment_record_id
+            )
+            if key is not None:
+                self.result_cache.set(key, data, get_result_code(data))
+        return data
+
+    def iter_billing_records(self, contract_number, payment_record_id):
+        """
+        Get the billing records of a recurring payment. The records are yielded while the
+        response is parsed: long lists of billing records are never fully built in memory
+        :param contract_number: Contract number
+        :param payment_record_id: record identifier, Received by IPN
+        :return: iterator of the billing records as dictionnaries
+        """
+        return self.backend.iterBillingRecords(
             contractNumber=contract_number,
             paymentRecordId=payment_record_id
         )
 
+    def do_authorization(self, amount, currency, order_ref, card, payline_action=100, buyer=None, taxes=0,
+                         country=''):
+        """
+        Authorize a payment with the card data in a single call: the buyer is not redirected to Payline
+
+        :param amount: amount to pay
+        :param currency: currency (currenttly supported EUR and USD)
+        :param order_ref: The order refernce (in your shopping system) corresponding to the payment
+        :param card: dictionnary of the card data: number, type (CB, VISA...), expirationDate (mmyy), cvx...
+            or the token of a card
+        :param payline_action: 100 (Autorisation) or 101 (Autorisation + validation)
+        :param buyer: dictionnary with buyer info
+        :param taxes: amount of taxes (for info)
+        :param country: country (for info)
+        :return: tuple
+         - result_code = the API result code ('00000' if the payment is accepted)
+         - transaction_id: the id of the transaction, for do_capture, do_reset or do_refund
+         - authorization_number: the number of the authorization
+         - data: the raw data
+        :raise:
+            - PaylineApiError if call to SOAP API fails
+            - InvalidCurrencyError if currency value is not supported
+        """
+        data = self.backend.doAuthorization(**self.build_authorization_request(
+            amount, currency, order_ref, card, payline_action=payline_action, buyer=buyer, taxes=taxes,
+            country=country
+        ))
+        return self.parse_authorization(data)
+
+    def do_capture(self, transaction_id, amount, currency):
+        """
+        Capture an authorized payment
+        :param transaction_id: the id of the authorization transaction
+        :param amount: captured amount: at most the authorized amount
+        :param currency: currency of the authorization
+        :return: tuple (result_code, transaction_id of the capture, data)
+        :raise: InvalidCurrencyError if currency value is not supported
+        """
+        data = self.backend.doCapture(**self.build_capture_request(transaction_id, amount, currency))
+        return self.parse_transaction_result(data)
+
+    def do_refund(self, transaction_id, amount, currency, comment=None):
+        """
+        Refund a captured payment. It can be done in several times
+        :param transaction_id: the id of the captured transaction
+        :param amount: refunded amount
+        :param currency: currency of the payment
+        :param comment: comment of the refund
+        :return: tuple (result_code, transaction_id of the refund, data)
+        :raise: InvalidCurrencyError if currency value is not supported
+        """
+        data = self.backend.doRefund(**self.build_refund_request(transaction_id, amount, currency, comment))
+        return self.parse_transaction_result(data)
+
+    def do_reset(self, transaction_id, comment=None):
+        """
+        Cancel an authorization which has not been captured
+        :param transaction_id: the id of the authorization transaction
+        :param comment: comment of the reset
+        :return: tuple (result_code, transaction_id of the reset, data)
+        """
+        data = self.backend.doReset(**self.build_reset_request(transaction_id, comment))
+        return self.parse_transaction_result(data)
+
+    def do_debit(self, amount, currency, order_ref, card, authorization_number, authorization_date,
+                 buyer=None, taxes=0, country=''):
+        """
+        Debit a card with an authorization obtained outside of Payline (by phone for example)
+        :param amount: amount to pay
+        :param currency: currency (currenttly supported EUR and USD)
+        :param order_ref: The order refernce (in your shopping system) corresponding to the payment
+        :param card: dictionnary of the card data, see do_authorization
+        :param authorization_number: number of the authorization
+        :param authorization_date: datetime of the authorization
+        :return: tuple (result_code, transaction_id, data)
+        :raise: InvalidCurrencyError if currency value is not supported
+        """
+        data = self.backend.doDebit(**self.build_debit_request(
+            amount, currency, order_ref, card, authorization_number, authorization_date,
+            buyer=buyer, taxes=taxes, country=country
+        ))
+        return self.parse_transaction_result(data)
+
+    def create_wallet(self, wallet_id, card, last_name=None, first_name=None, email=None, buyer=None):
+        """
+        Register the card of a buyer in a wallet: the next payments don't need the card data
+        :param wallet_id: id of the wallet in your shopping system
+        :param card: dictionnary of the card data: number, type (CB, VISA...), expirationDate (mmyy), cvx...
+        :param last_name: last name of the owner of the wallet
+        :param first_name: first name of the owner of the wallet
+        :param email: email of the owner of the wallet
+        :param buyer: dictionnary with buyer info
+        :return: tuple (result_code ('02500' if the wallet is created), data)
+        """
+        data = self.backend.createWallet(**self.build_create_wallet_request(
+            wallet_id, card, last_name=last_name, first_name=first_name, email=email, buyer=buyer
+        ))
+        return self.parse_wallet_result(data)
+
+    def update_wallet(self, wallet_id, card=None, card_ind=None, last_name=None, first_name=None, email=None,
+                      buyer=None):
+        """
+        Update the owner of a wallet or one of its cards
+        :param wallet_id: id of the wallet
+        :param card: new card data. The card is not changed if None
+        :param card_ind: index of the updated card in the wallet. The first card if None
+        :return: tuple (result_code, data)
+        """
+        try:
+            data = self.backend.updateWallet(**self.build_update_wallet_request(
+                wallet_id, card=card, card_ind=card_ind, last_name=last_name, first_name=first_name, email=email,
+                buyer=buyer
+            ))
+        finally:
+            # even if the call fails: the wallet may have been updated
+            self.invalidate_wallet(wallet_id)
+        return self.parse_wallet_result(data)
+
+    def get_wallet(self, wallet_id, card_ind=None):
+        """
+        Get a wallet and one of its cards (masked number, expiration date...)
+        :param wallet_id: id of the wallet
+        :param card_ind: index of the card in the wallet. The first card if None
+        :return: tuple
+         - result_code = the API result code ('02500' if the wallet exists)
+         - is_disabled: the card of the wallet is disabled
+         - wallet: dictionnary of the wallet (walletId, lastName, firstName, email, card...) or None
+         - data: the raw data
+        """
+        data = self.cached_wallet_call('getWallet', wallet_id, card_ind)
+        return self.parse_wallet(data)
+
+    def get_cards(self, wallet_id, card_ind=None):
+        """
+        Get the cards of a wallet
+        :param wallet_id: id of the wallet
+        :param card_ind: index of a card. All the cards if None
+        :return: tuple (result_code, list of the cards, data). The cards are dictionnaries with the
+            cardInd, card (masked number, expiration date...), isDisabled and default keys
+        """
+        data = self.cached_wallet_call('getCards', wallet_id, card_ind)
+        return self.parse_cards(data)
+
+    def disable_wallet(self, wallet_ids, card_ind=None):
+        """
+        Disable some wallets or one of their cards: they can't be used for the payments
+        :param wallet_ids: list of wallet ids (or a single wallet id)
+        :param card_ind: index of the disabled card. All the cards if None
+        :return: tuple (result_code, list of the disabled wallet ids, data)
+        """
+        if isinstance(wallet_ids, six.string_types):
+            wallet_ids = [wallet_ids]
+        try:
+            data = self.backend.disableWallet(**self.build_disable_wallet_request(wallet_ids, card_ind))
+        finally:
+            for wallet_id in wallet_ids:
+                self.invalidate_wallet(wallet_id)
+        return self.parse_disable_wallet(data)
+
+    def enable_wallet(self, wallet_id, card_ind=None):
+        """
+        Enable a disabled wallet or one of its cards
+        :param wallet_id: id of the wallet
+        :param card_ind: index of the enabled card. All the cards if None
+        :return: tuple (result_code, data)
+        """
+        try:
+            data = self.backend.enableWallet(**self.build_enable_wallet_request(wallet_id, card_ind))
+        finally:
+            self.invalidate_wallet(wallet_id)
+        return self.parse_wallet_result(data)
+
+    def do_immediate_wallet_payment(self, wallet_id, amount, currency, order_ref, cvx=None, card_ind=None,
+                                    payline_action=100, buyer=None, taxes=0, country=''):
+        """
+        Authorize a payment with a card of a wallet
+        :param wallet_id: id of the wallet
+        :param amount: amount to pay
+        :param currency: currency (currenttly supported EUR and USD)
+        :param order_ref: The order refernce (in your shopping system) corresponding to the payment
+        :param cvx: the security code of the card, if required by the contract
+        :param card_ind: index of the card in the wallet. The first card if None
+        :param payline_action: 100 (Autorisation) or 101 (Autorisation + validation)
+        :return: tuple (result_code, transaction_id, authorization_number, data): see do_authorization
+        :raise: InvalidCurrencyError if currency value is not supported
+        """
+        data = self.backend.doImmediateWalletPayment(**self.build_immediate_wallet_payment_request(
+            wallet_id, amount, currency, order_ref, cvx=cvx, card_ind=card_ind, payline_action=payline_action,
+            buyer=buyer, taxes=taxes, country=country
+        ))
+        return self.parse_authorization(data)
+
+    def wallet_cache_key(self, operation, wallet_id, card_ind):
+        """key of a result in the wallet cache or None if the cache is disabled"""
+        if self.wallet_cache is None:
+            return None
+        return self.wallet_cache.wallet_key(self.merchant_id, wallet_id, operation, card_ind)
+
+    def cached_wallet_call(self, operation, wallet_id, card_ind):
+        """call getWallet or getCards, unless the result is in the wallet cache"""
+        key = self.wallet_cache_key(operation, wallet_id, card_ind)
+        data = None if key is None else self.wallet_cache.get(key)
+        if data is None:
+            data = getattr(self.backend, operation)(**self.build_get_wallet_request(wallet_id, card_ind))
+            if key is not None:
+                self.wallet_cache.set(key, data, get_result_code(data))
+        return data
+
+    def invalidate_wallet(self, wallet_id):
+        """forget the cached results of a wallet"""
+        if self.wallet_cache is not None:
+            self.wallet_cache.invalidate_wallet(self.merchant_id, wallet_id)
+
+    @property
+    def wallet_contract_number(self):
+        """the contract of the wallets: the first one of the client"""
+        return self.contract_number.split(",")[0] if self.contract_number else self.contract_number
+
+    def build_wallet(self, wallet_id, card=None, last_name=None, first_name=None, email=None):
+        """the wallet parameter of createWallet and updateWallet"""
+        wallet = {
+            'walletId': wallet_id,
+            'lastName': last_name,
+            'firstName': first_name,
+            'email': email,
+        }
+        if card is not None:
+            wallet['card'] = card
+        return wallet
+
+    def build_create_wallet_request(self, wallet_id, card, last_name=None, first_name=None, email=None, buyer=None):
+        """createWallet parameters"""
+        return dict(
+            version=self.web_service_version,
+            contractNumber=self.wallet_contract_number,
+            wallet=self.build_wallet(wallet_id, card, last_name, first_name, email),
+            buyer=buyer or {},
+            owner={},
+        )
+
+    def build_update_wallet_request(self, wallet_id, card=None, card_ind=None, last_name=None, first_name=None,
+                                    email=None, buyer=None):
+        """updateWallet parameters"""
+        return dict(
+            version=self.web_service_version,
+            contractNumber=self.wallet_contract_number,
+            cardInd=card_ind,
+            wallet=self.build_wallet(wallet_id, card, last_name, first_name, email),
+            buyer=buyer or {},
+            owner={},
+        )
+
+    def build_get_wallet_request(self, wallet_id, card_ind=None):
+        """getWallet and getCards parameters"""
+        return dict(
+            version=self.web_service_version,
+            contractNumber=self.wallet_contract_number,
+            walletId=wallet_id,
+            cardInd=card_ind,
+        )
+
+    def build_disable_wallet_request(self, wallet_ids, card_ind=None):
+        """disableWallet parameters"""
+        return dict(
+            contractNumber=self.wallet_contract_number,
+            cardInd=card_ind,
+            walletIdList=[{'walletId': wallet_id} for wallet_id in wallet_ids],
+        )
+
+    def build_enable_wallet_request(self, wallet_id, card_ind=None):
+        """enableWallet parameters"""
+        return dict(
+            contractNumber=self.wallet_contract_number,
+            cardInd=card_ind,
+            walletId=wallet_id,
+        )
+
+    def build_immediate_wallet_payment_request(self, wallet_id, amount, currency, order_ref, cvx=None,
+                                               card_ind=None, payline_action=100, buyer=None, taxes=0,
+                                               country=''):
+        """
+        doImmediateWalletPayment parameters
+        :raise: InvalidCurrencyError if currency value is not supported
+        """
+        return dict(
+            version=self.web_service_version,
+            payment=self.build_payment(amount, currency, payline_action),
+            order=self.build_order(order_ref, amount, currency, taxes, country),
+            buyer=buyer or {},
+            walletId=wallet_id,
+            cardInd=card_ind,
+            cvx=cvx,
+        )
+
+    def build_order(self, order_ref, amount, currency, taxes=0, country=''):
+        """
+        return the order of a payment
+        :raise: InvalidCurrencyError if currency value is not supported
+        """
+        return {
+            'ref': order_ref,
+            'amount': to_cents(amount),
+            'currency': self.format_currency(currency),
+            'date': datetime.now().strftime('%d/%m/%Y %H:%M'),
+            'taxes': to_cents(taxes),
+            'country': country,
+        }
+
+    def build_authorization_request(self, amount, currency, order_ref, card, payline_action=100, buyer=None,
+                                    taxes=0, country=''):
+        """
+        Check the arguments of do_authorization and convert them to the doAuthorization parameters
+        :raise: InvalidCurrencyError if currency value is not supported
+        """
+        return dict(
+            version=self.web_service_version,
+            payment=self.build_payment(amount, currency, payline_action),
+            card=card,
+            order=self.build_order(order_ref, amount, currency, taxes, country),
+            buyer=buyer or {},
+            owner={},
+        )
+
+    def build_capture_request(self, transaction_id, amount, currency):
+        """doCapture parameters"""
+        return dict(
+            version=self.web_service_version,
+            transactionID=transaction_id,
+            payment=self.build_payment(amount, currency, self.capture_action),
+        )
+
+    def build_refund_request(self, transaction_id, amount, currency, comment=None):
+        """doRefund parameters"""
+        return dict(
+            version=self.web_service_version,
+            transactionID=transaction_id,
+            payment=self.build_payment(amount, currency, self.refund_action),
+            comment=comment,
+        )
+
+    def build_reset_request(self, transaction_id, comment=None):
+        """doReset parameters"""
+        return dict(
+            version=self.web_service_version,
+            transactionID=transaction_id,
+            comment=comment,
+        )
+
+    def build_debit_request(self, amount, currency, order_ref, card, authorization_number, authorization_date,
+                            buyer=None, taxes=0, country=''):
+        """doDebit parameters"""
+        if isinstance(authorization_date, datetime):
+            authorization_date = authorization_date.strftime('%d/%m/%Y %H:%M')
+        return dict(
+            version=self.web_service_version,
+            payment=self.build_payment(amount, currency, self.debit_action),
+            card=card,
+            order=self.build_order(order_ref, amount, currency, taxes, country),
+            buyer=buyer or {},
+            owner={},
+            authorization={'number': authorization_number, 'date': authorization_date},
+        )
+
+    def parse_transaction_result(self, data):
+        """
+        Convert the response of doCapture, doRefund, doReset or doDebit to (result_code, transaction_id, data)
+        :param data: the raw data
+        """
+        try:
+            result_code = data['result']['code']
+        except (TypeError, KeyError):
+            result_code = ""
+
+        try:
+            transaction_id = data['transaction']['id']
+        except (TypeError, KeyError):
+            transaction_id = None
+
+        return result_code, transaction_id, data
+
+    def parse_authorization(self, data):
+        """
+        Convert the doAuthorization response to the do_authorization tuple
+        :param data: the raw data
+        """
+        result_code, transaction_id, data = self.parse_transaction_result(data)
+        try:
+            authorization_number = data['authorization']['number']
+        except (TypeError, KeyError):
+            authorization_number = None
+        return result_code, transaction_id, authorization_number, data
+
+    def parse_wallet_result(self, data):
+        """
+        Convert the response of createWallet, updateWallet or enableWallet to (result_code, data)
+        :param data: the raw data
+        """
+        try:
+            result_code = data['result']['code']
+        except (TypeError, KeyError):
+            result_code = ""
+        return result_code, data
+
+    def parse_wallet(self, data):
+        """
+        Convert the getWallet response to the get_wallet tuple
+        :param data: the raw data
+        """
+        result_code, data = self.parse_wallet_result(data)
+        try:
+            wallet = data['wallet']
+        except (TypeError, KeyError):
+            wallet = None
+        try:
+            is_disabled = data['isDisabled'] in (True, 1, u'1', u'true')
+        except (TypeError, KeyError):
+            is_disabled = False
+        return result_code, is_disabled, wallet, data
+
+    def parse_cards(self, data):
+        """
+        Convert the getCards response to the get_cards tuple
+        :param data: the raw data
+        """
+        result_code, data = self.parse_wallet_result(data)
+        try:
+            cards = data['cardsList'] or []
+        except (TypeError, KeyError):
+            cards = []
+        if isinstance(cards, dict):
+            # single card
+            cards = cards.get('cards') or []
+            cards = cards if isinstance(cards, list) else [cards]
+        return result_code, cards, data
+
+    def parse_disable_wallet(self, data):
+        """
+        Convert the disableWallet response to the disable_wallet tuple
+        :param data: the raw data
+        """
+        result_code, data = self.parse_wallet_result(data)
+        try:
+            wallet_ids = data['walletIdList'] or []
+        except (TypeError, KeyError):
+            wallet_ids = []
+        if isinstance(wallet_ids, dict):
+            wallet_ids = wallet_ids.get('walletId') or []
+        if not isinstance(wallet_ids, list):
+            wallet_ids = [wallet_ids]
+        return result_code, wallet_ids, data
+
+    def parse_payment_record(self, data):
+        """
+        Convert the getPaymentRecord response to the get_payment_record tuple
+        :param data: the raw data
+        """
         try:
             order_ref = data['order']['ref']
         except (TypeError, KeyError):
@@ -317,3 +1012,371 @@ class DirectPaymentAPI(PaylineBaseAPI):
             result_code = ""
 
         return result_code, order_ref, amount, data
+
+
+class MassPaymentAPI(PaylineBaseAPI):
+    """client for Payline MassPayment API: capture, refund or reset many authorizations at once"""
+    api_name = 'MassPaymentAPI'
+
+    # maximum number of authorizations per call (maxOccurs of the lists in the WSDL)
+    batch_size = 5000
+
+    capture_action = 201
+    refund_action = 421
+
+    # result codes of a mass traitment which is not complete yet
+    pending_result_codes = (u'02000', u'02005', u'02015')
+
+    def __init__(self, *args, **kwargs):
+        """
+            Init the SOAP client of the service. It is recommended to cache the compiled WSDL
+
+            :param merchant_id : Your Payline Merchant id
+            :param access_key : Your Payline access key
+            :param contract number : Your Payline contract number
+            :param cache : keep the compiled WSDL on disk (recommended). True uses $PYPAYLINE_CACHE_DIR or
+                ~/.cache/pypayline, a directory path uses this directory. Cache is disabled if None
+            :param trace : print some debug logs
+            :param homologation : if True use the homologation host for test. If false, user the regular host.
+                A base url (http://127.0.0.1:8080 for example) uses this host: see pypayline.simulator
+            :param transport : custom HTTP transport. By default, the connections to Payline are kept
+                in a pool shared by the clients with the same settings
+            :param pool_size : maximum number of idle connections kept per host
+            :param pool_idle_timeout : idle connections are closed after this number of seconds
+            :param connect_timeout : timeout in seconds when opening a connection
+            :param read_timeout : timeout in seconds when waiting for a response
+            :param hooks : instrumentation hooks called around each SOAP call
+            :param resilience : ResiliencePolicy of the calls (see pypayline.resilience)
+            :param full_wsdl : load the full WSDL rather than the pruned WSDL of the service
+        """
+        super(MassPaymentAPI, self).__init__(*args, **kwargs)
+
+    def do_mass_capture(self, captures, comment=None):
+        """
+        Capture many authorizations. The list is sent in batches of batch_size authorizations
+        :param captures: iterable of (transaction_id, amount, currency)
+        :param comment: comment of the mass traitments
+        :return: list of (result_code, mass_traitment_id, data), one per batch
+        :raise: InvalidCurrencyError if currency value is not supported
+        """
+        results = []
+        for batch in chunks(captures, self.batch_size):
+            data = self.backend.doMassCapture(
+                version=self.web_service_version,
+                captureAuthorizationList=[
+                    {'capture': {
+                        'transactionID': transaction_id,
+                        'payment': self.build_payment(amount, currency, self.capture_action),
+                    }}
+                    for transaction_id, amount, currency in batch
+                ],
+                comment=comment
+            )
+            results.append(self.parse_mass_result(data))
+        return results
+
+    def do_mass_refund(self, refunds, comment=None):
+        """
+        Refund many transactions. The list is sent in batches of batch_size transactions
+        :param refunds: iterable of (transaction_id, amount, currency)
+        :param comment: comment of the mass traitments
+        :return: list of (result_code, mass_traitment_id, data), one per batch
+        :raise: InvalidCurrencyError if currency value is not supported
+        """
+        results = []
+        for batch in chunks(refunds, self.batch_size):
+            data = self.backend.doMassRefund(
+                version=self.web_service_version,
+                refundAuthorizationList=[
+                    {'refund': {
+                        'transactionID': transaction_id,
+                        'payment': self.build_payment(amount, currency, self.refund_action),
+                    }}
+                    for transaction_id, amount, currency in batch
+                ],
+                comment=comment
+            )
+            results.append(self.parse_mass_result(data))
+        return results
+
+    def do_mass_reset(self, transaction_ids, comment=None):
+        """
+        Cancel many authorizations. The list is sent in batches of batch_size transactions
+        :param transaction_ids: iterable of transaction ids
+        :param comment: comment of the mass traitments
+        :return: list of (result_code, mass_traitment_id, data), one per batch
+        """
+        results = []
+        for batch in chunks(transaction_ids, self.batch_size):
+            data = self.backend.doMassReset(
+                version=self.web_service_version,
+                resetAuthorizationList=[{'transactionID': transaction_id} for transaction_id in batch],
+                comment=comment
+            )
+            results.append(self.parse_mass_result(data))
+        return results
+
+    def parse_mass_result(self, data):
+        """
+        Convert the response of a mass operation to (result_code, mass_traitment_id, data)
+        :param data: the raw data
+        """
+        try:
+            result_code = data['result']['code']
+        except (KeyError, TypeError):
+            result_code = ""
+
+        try:
+            mass_traitment_id = data['massTraitmentID']
+        except (KeyError, TypeError):
+            mass_traitment_id = None
+
+        return result_code, mass_traitment_id, data
+
+    def get_mass_traitment_details(self, mass_traitment_id):
+        """
+        Get the status of a mass traitment
+        :param mass_traitment_id: id returned by do_mass_capture, do_mass_refund or do_mass_reset
+        :return: tuple
+         - result_code = the API result code
+         - total_lines: number of authorizations of the traitment
+         - failed_lines: number of failed authorizations
+         - failed: list of the failed authorizations
+         - data: the raw data
+        """
+        data = self.backend.getMassTraitmentDetails(
+            version=self.web_service_version,
+            massTraitmentID=mass_traitment_id
+        )
+        return self.parse_mass_traitment_details(data)
+
+    def parse_mass_traitment_details(self, data):
+        """
+        Convert the getMassTraitmentDetails response to the get_mass_traitment_details tuple
+        :param data: the raw data
+        """
+        try:
+            result_code = data['result']['code']
+        except (KeyError, TypeError):
+            result_code = ""
+
+        try:
+            total_lines = int(data['totalLinesNumber'])
+        except (KeyError, TypeError, ValueError):
+            total_lines = None
+
+        try:
+            failed_lines = int(data['failedLinesNumber'])
+        except (KeyError, TypeError, ValueError):
+            failed_lines = None
+
+        try:
+            failed = data['failedListObject'] or []
+        except (KeyError, TypeError):
+            failed = []
+
+        return result_code, total_lines, failed_lines, failed, data
+
+    def wait_mass_traitment(self, mass_traitment_id, interval=5, max_interval=60, backoff=2, timeout=3600):
+        """
+        Poll the status of a mass traitment until it is complete. The delay between two calls
+        is multiplied by backoff after each call, up to max_interval
+        :param mass_traitment_id: id returned by do_mass_capture, do_mass_refund or do_mass_reset
+        :param interval: seconds before the second call
+        :param max_interval: maximum number of seconds between two calls
+        :param backoff: multiplier of the delay
+        :param timeout: maximum number of seconds to wait
+        :return: the get_mass_traitment_details tuple of the complete traitment
+        :raise: MassTraitmentTimeoutError if the traitment is still in progress after timeout seconds
+        """
+        deadline = time.time() + timeout
+        while True:
+            details = self.get_mass_traitment_details(mass_traitment_id)
+            if details[0] not in self.pending_result_codes:
+                return details
+            remaining = deadline - time.time()
+            if remaining <= 0:
+                raise MassTraitmentTimeoutError(
+                    u'Mass traitment {0} is still in progress after {1}s'.format(mass_traitment_id, timeout)
+                )
+            logger.debug(u'Mass traitment {0} in progress, next check in {1}s'.format(mass_traitment_id, interval))
+            time.sleep(min(interval, remaining))
+            interval = min(interval * backoff, max_interval)
+
+
+class ExtendedAPI(PaylineBaseAPI):
+    """client for Payline Extended API: transactions search and details"""
+    api_name = 'ExtendedAPI'
+
+    date_format = '%d/%m/%Y %H:%M'
+
+    # maximum number of transactions of a transactionsSearch response (maxOccurs in the WSDL)
+    search_page_limit = 5000
+
+    # transactions_search keyword arguments: transactionsSearch criteria
+    search_criteria = {
+        'transaction_id': 'transactionId',
+        'order_ref': 'orderRef',
+        'contract_number': 'contractNumber',
+        'authorization_number': 'authorizationNumber',
+        'return_code': 'returnCode',
+        'payment_mean': 'paymentMean',
+        'transaction_type': 'transactionType',
+        'name': 'name',
+        'first_name': 'firstName',
+        'email': 'email',
+        'card_number': 'cardNumber',
+        'currency': 'currency',
+        'min_amount': 'minAmount',
+        'max_amount': 'maxAmount',
+        'wallet_id': 'walletId',
+        'sequence_number': 'sequenceNumber',
+        'token': 'token',
+    }
+
+    def __init__(self, *args, **kwargs):
+        """
+            Init the SOAP client of the service. It is recommended to cache the compiled WSDL
+
+            :param merchant_id : Your Payline Merchant id
+            :param access_key : Your Payline access key
+            :param contract number : Your Payline contract number
+            :param cache : keep the compiled WSDL on disk (recommended). True uses $PYPAYLINE_CACHE_DIR or
+                ~/.cache/pypayline, a directory path uses this directory. Cache is disabled if None
+            :param trace : print some debug logs
+            :param homologation : if True use the homologation host for test. If false, user the regular host.
+                A base url (http://127.0.0.1:8080 for example) uses this host: see pypayline.simulator
+            :param transport : custom HTTP transport. By default, the connections to Payline are kept
+                in a pool shared by the clients with the same settings
+            :param pool_size : maximum number of idle connections kept per host
+            :param pool_idle_timeout : idle connections are closed after this number of seconds
+            :param connect_timeout : timeout in seconds when opening a connection
+            :param read_timeout : timeout in seconds when waiting for a response
+            :param hooks : instrumentation hooks called around each SOAP call
+            :param resilience : ResiliencePolicy of the calls (see pypayline.resilience)
+            :param full_wsdl : load the full WSDL rather than the pruned WSDL of the service
+        """
+        super(ExtendedAPI, self).__init__(*args, **kwargs)
+
+    def get_transaction_details(self, transaction_id=None, order_ref=None, start_date=None, end_date=None):
+        """
+        Get the details of a transaction
+        :param transaction_id: the transaction id
+        :param order_ref: the order id, if the transaction id is unknown
+        :param start_date: datetime: beginning of the search by order_ref
+        :param end_date: datetime: end of the search by order_ref
+        :return: tuple
+         - result_code = the API result code
+         - order_ref: the order id,
+         - amount: the paid amount,
+         - currency: the used currency
+         - data: the raw data
+        """
+        data = self.backend.getTransactionDetails(
+            version=self.web_service_version,
+            transactionId=transaction_id,
+            orderRef=order_ref,
+            startDate=start_date.strftime(self.date_format) if start_date else None,
+            endDate=end_date.strftime(self.date_format) if end_date else None,
+        )
+
+        try:
+            result_code = data['result']['code']
+        except (KeyError, TypeError):
+            result_code = ""
+
+        try:
+            order_ref = data['order']['ref']
+        except (KeyError, TypeError):
+            order_ref = None
+
+        try:
+            amount = int(data['payment']['amount'])
+            amount = Decimal('{0}.{1:02}'.format(amount // 100, amount % 100))
+        except (KeyError, TypeError, ValueError):
+            amount = None
+
+        try:
+            currency_reverse = dict([(v, k) for (k, v) in self.currencies.items()])
+            currency = currency_reverse[int(data['payment']['currency'])]
+        except (KeyError, TypeError, ValueError):
+            currency = None
+
+        return result_code, order_ref, amount, currency, data
+
+    def transactions_search(self, start_date, end_date, window=timedelta(days=1), prefetch_pages=True, **criteria):
+        """
+        Search the transactions between two dates. transactionsSearch has no pagination: the
+        period is searched window by window and a window is split when its response is full.
+        The next window is fetched in the background while the current one is consumed
+        :param start_date: datetime: beginning of the period
+        :param end_date: datetime: end of the period
+        :param window: timedelta: period searched by each call
+        :param prefetch_pages: fetch the next window while the current one is consumed
+        :param criteria: other search criteria: order_ref, contract_number, return_code, currency...
+            (see search_criteria)
+        :return: iterator of the transactions as dictionnaries
+        :raise:
+            - ArgumentsError if a criterion is unknown
+            - PaylineApiError if a search fails
+        """
+        search_data = {}
+        for name, value in criteria.items():
+            try:
+                search_data[self.search_criteria[name]] = value
+            except KeyError:
+                raise ArgumentsError(u'{0} is not a transactions search criterion'.format(name))
+        if window < timedelta(minutes=1):
+            raise ArgumentsError(u'The window argument should be at least one minute')
+
+        pages = self.search_pages(start_date, end_date, window, search_data)
+        if prefetch_pages:
+            pages = prefetch(pages)
+        return (transaction for page in pages for transaction in page)
+
+    def search_pages(self, start_date, end_date, window, search_data):
+        """
+        yield the transaction lists of the successive windows of the period. The dates are
+        sent to the minute: the windows are consecutive minute ranges
+        """
+        minute = timedelta(minutes=1)
+        start_date = start_date.replace(second=0, microsecond=0)
+        end_date = end_date.replace(second=0, microsecond=0)
+
+        windows = deque()
+        window_start = start_date
+        while window_start <= end_date:
+            window_end = min(window_start + window - minute, end_date)
+            windows.append((window_start, window_end))
+            window_start = window_end + minute
+
+        while windows:
+            window_start, window_end = windows.popleft()
+            data = self.backend.transactionsSearch(
+                version=self.web_service_version,
+                startDate=window_start.strftime(self.date_format),
+                endDate=window_end.strftime(self.date_format),
+                **search_data
+            )
+            try:
+                result_code = data['result']['code']
+            except (KeyError, TypeError):
+                result_code = ""
+            if result_code != u'00000':
+                raise PaylineApiError(
+                    ((data or {}).get('result') or {}).get('longMessage') or
+                    u'transactionsSearch failed: {0}'.format(result_code)
+                )
+
+            transactions = data.get('transactionList') or []
+            if len(transactions) >= self.search_page_limit:
+                if window_end > window_start:
+                    # the response may be truncated: search the two halves of the window
+                    middle = window_start + timedelta(minutes=int((window_end - window_start).total_seconds() // 120))
+                    windows.appendleft((middle + minute, window_end))
+                    windows.appendleft((window_start, middle))
+                    continue
+                logger.warning(u'More than {0} transactions at {1}: the search results may be truncated'.format(
+                    self.search_page_limit, window_start
+                ))
+            yield transactions
@@ -0,0 +1,479 @@
+# -*- coding: utf-8 -*-
+"""
+Python client for the Payline SOAP API
+Generated operations: the requests and the responses of all the operations of the Payline services
+are compiled from the full WSDL files into static modules, so that no type of the WSDL is walked when
+a client is created or called. The module of a service has:
+
+- a function writing the request envelope of each operation, with the elements of the request as
+  keyword arguments, and a function writing the children elements of each complex type
+- the nodes of the streaming parser for the responses, with the conversion function of each element
+
+The operations module has the methods of the backends: a class by service, with a method by operation
+of the service taking the same arguments.
+
+python -m pypayline.codegen [--output-dir directory] [api name...]
+
+writes pypayline/backends/generated/web_payment_api.py... and operations.py. The generated modules
+are only used with the WSDL files they have been generated from: run it again when they change
+"""
+
+from __future__ import print_function
+
+import argparse
+import keyword
+import logging
+import os
+import re
+
+from pypayline import pruning
+from pypayline.backends.generated import generated_module_name
+from pypayline.wsdl import parse_service_model, wsdl_digest
+
+
+logger = logging.getLogger(u'pypayline')
+
+
+API_NAMES = pruning.API_NAMES
+
+OPERATIONS_MODULE = u'operations'
+
+MAX_LINE_LENGTH = 120
+
+HEADER = u'''# -*- coding: utf-8 -*-
+"""
+Python client for the Payline SOAP API
+{description}
+Generated by python -m pypayline.codegen: do not edit
+"""
+
+from __future__ import print_function
+'''
+
+# names imported by the generated modules of the services, if they are used
+IMPORTS = (
+    (u'pysimplesoap.client', (u'soap_namespaces', )),
+    (u'pysimplesoap.helpers', (u'REVERSE_TYPE_MAP', )),
+    (u'pypayline.backends.parser', (u'CompiledNode', u'Element', u'text_converter')),
+    (u'pypayline.backends.serializer', (
+        u'ENVELOPE_END', u'ENVELOPE_START', u'UnsupportedValue', u'check_names', u'write_items', u'write_text'
+    )),
+)
+
+# names used in the generated functions: the elements of the requests can't be named after them
+RESERVED_NAMES = frozenset((u'parts', u'field', u'value', u'self', u'data'))
+
+
+def generated_directory():
+    """directory of the generated modules of the package"""
+    return os.path.join(os.path.abspath(os.path.dirname(__file__)), u'backends', u'generated')
+
+
+def generated_module_path(name, directory=None):
+    return os.path.join(directory or generated_directory(), u'{0}.py'.format(name))
+
+
+def text_literal(text):
+    """python literal of a text of the WSDL"""
+    return u'u' + repr(str(text))
+
+
+def python_name(name):
+    """'privateDataList' -> 'private_data_list'"""
+    return re.sub(r'\W', u'_', generated_module_name(name))
+
+
+def type_name(struct):
+    """name of the type of a pysimplesoap Struct"""
+    name = struct.key[0] if isinstance(struct.key, tuple) else struct.key
+    return name or u'anonymous'
+
+
+def wrap(start, arguments, end, indent=u''):
+    """
+    lines of a call or a signature: start + the arguments separated by commas + end. If they don't fit in
+    a line, the arguments are written on the following lines
+    """
+    line = u'{0}{1}{2}{3}'.format(indent, start, u', '.join(arguments), end)
+    if len(line) <= MAX_LINE_LENGTH:
+        return [line]
+    lines = [indent + start]
+    current = indent + u'    '
+    for argument in arguments:
+        item = argument + u','
+        if current.strip() and len(current) + 1 + len(item) > MAX_LINE_LENGTH:
+            lines.append(current)
+            current = indent + u'    '
+        current += (u' ' if current.strip() else u'') + item
+    lines.append(current[:-1])
+    lines.append(indent + end.lstrip())
+    return lines
+
+
+def names_source(constant, names):
+    """lines of the frozenset of the names of the elements of a type"""
+    return wrap(u'{0} = frozenset(('.format(constant), [u"'{0}'".format(name) for name in names] + (
+        [u''] if len(names) == 1 else []
+    ), u'))')
+
+
+def def_lines(name, arguments, indent=u''):
+    """lines of a function definition: the arguments which don't fit in the line are aligned with the first one"""
+    signature = u'{0}def {1}('.format(indent, name)
+    lines = []
+    current = signature
+    for index, argument in enumerate(arguments):
+        item = argument + (u'):' if index == len(arguments) - 1 else u',')
+        if current != signature:
+            if len(current) + 1 + len(item) > MAX_LINE_LENGTH:
+                lines.append(current)
+                current = u' ' * len(signature)
+            else:
+                current += u' '
+        current += item
+    if not arguments:
+        current += u'):'
+    lines.append(current)
+    return lines
+
+
+def check_argument_names(method, names):
+    """:raise: ValueError if an element of the request can't be the name of an argument"""
+    for name in names:
+        if not re.match(r'^[A-Za-z_]\w*$', name) or keyword.iskeyword(name) or name in RESERVED_NAMES:
+            raise ValueError(u'{0}: the element {1} can not be an argument'.format(method, name))
+
+
+class Identifiers(object):
+    """the unique names of a generated module"""
+
+    def __init__(self):
+        self.used = set()
+
+    def new(self, name):
+        identifier, index = name, 1
+        while identifier in self.used or keyword.iskeyword(identifier):
+            index += 1
+            identifier = u'{0}_{1}'.format(name, index)
+        self.used.add(identifier)
+        return identifier
+
+
+class ServiceGenerator(object):
+    """
+    Source of the generated module of a service: the requests are compiled by the templates of
+    pypayline.backends.serializer and the responses by pypayline.backends.parser, then written as code
+    """
+
+    def __init__(self, service_model, repeated, digests):
+        """
+        :param service_model : ServiceModel parsed from the full WSDL
+        :param repeated : (type name, element name) of the repeated elements (see parser.repeated_elements)
+        :param digests : digests of the WSDL files the module can be used with
+        """
+        self.service_model = service_model
+        self.repeated = repeated
+        self.digests = digests
+        self.identifiers = Identifiers()
+        self.compiled_types = {}
+        self.compiled_nodes = {}
+        self.writers = {}  # {id(CompiledType): name of its write function}
+        self.writer_sources = []
+        self.nodes = {}  # {id(CompiledNode): name}
+        self.node_declarations = []
+        self.node_sources = []
+        self.converters = {}  # {conversion function: name}
+        self.converter_sources = []
+        self.requests = []  # [(operation, build function, names, action)]
+        self.responses = []  # [(operation, node)]
+
+    def port_operations(self):
+        service = self.service_model.services[self.service_model.api_name]
+        port, = service['ports'].values()
+        return port['operations']
+
+    def signatures(self):
+        """{operation: names of the elements of the request}"""
+        signatures = {}
+        for method, operation in self.port_operations().items():
+            (_input_name, root), = operation['input'].items()
+            signatures[method] = list(root.keys())
+        return signatures
+
+    def source(self):
+        """source of the module"""
+        from pypayline.backends.parser import UnsupportedResponse, compile_node
+        from pypayline.backends.serializer import CompiledOperation
+
+        request_sources = []
+        for method, operation in self.port_operations().items():
+            compiled = CompiledOperation(method, operation, self.compiled_types)
+            request_sources.append(self.build_source(compiled, operation['namespace']))
+            (_output_name, root), = operation['output'].items()
+            try:
+                node = compile_node(root, self.repeated, self.compiled_nodes)
+            except UnsupportedResponse as err:
+                logger.warning(u'{0}: {1} responses are parsed by pysimplesoap ({2})'.format(
+                    self.service_model.api_name, method, err
+                ))
+                continue
+            self.responses.append((method, self.node_name(node, root)))
+
+        constants = [u'API_NAME = {0}'.format(text_literal(self.service_model.api_name)), u'']
+        constants.append(u'# SHA-256 of the WSDL files (full and pruned) the module has been generated from')
+        constants.append(u'WSDL_DIGESTS = (')
+        constants.extend(u"    '{0}',".format(digest) for digest in self.digests)
+        constants.extend([u')', u'', u"SOAP_URI = soap_namespaces['soap']"])
+        if self.converter_sources:
+            constants.append(u'')
+            constants.extend(self.converter_sources)
+        requests = [
+            u'# {operation: (function writing the request, names of its elements, soap action)}', u'REQUESTS = {'
+        ]
+        for method, build, names, action in self.requests:
+            requests.extend(wrap(u"'{0}': (".format(method), [
+                build, names, u'None' if action is None else text_literal(action)
+            ], u'),', u'    '))
+        requests.append(u'}')
+        responses = [u'# nodes of the types of the responses: all are created before their elements refer to them']
+        responses.extend(self.node_declarations)
+        for source in self.node_sources:
+            responses.append(u'')
+            responses.extend(source)
+        responses.extend([u'', u'# {operation: node of the response}', u'RESPONSES = {'])
+        for method, node in self.responses:
+            responses.append(u"    '{0}': {1},".format(method, node))
+        responses.append(u'}')
+        blocks = [constants] + self.writer_sources + request_sources + [requests, responses]
+        body = u'\n\n\n'.join(u'\n'.join(block) for block in blocks) + u'\n'
+        header = [HEADER.format(description=u'{0} operations: the functions writing the requests and the nodes '
+                                            u'parsing the responses'.format(self.service_model.api_name))]
+        for module, names in IMPORTS:
+            used = [name for name in names if re.search(r'\b{0}\b'.format(name), body)]
+            if not used:
+                continue
+            if module.startswith(u'pypayline') and not header[-1].startswith(u'from pypayline'):
+                header.append(u'')
+            line = u'from {0} import {1}'.format(module, u', '.join(used))
+            header.extend([line] if len(line) <= MAX_LINE_LENGTH else wrap(
+                u'from {0} import ('.format(module), used, u')'
+            ))
+        return u'\n'.join(header) + u'\n\n\n' + body
+
+    def writer_name(self, compiled_type):
+        """name of the function writing the children of a CompiledType: its source is added once"""
+        name = self.writers.get(id(compiled_type))
+        if name is not None:
+            return name
+        base = python_name(type_name(compiled_type.struct))
+        name = self.writers[id(compiled_type)] = self.identifiers.new(u'write_' + base)
+        names = self.identifiers.new(base.upper() + u'_NAMES')
+        body = []
+        for field in compiled_type.fields:
+            body.extend(self.field_lines(field, u"value.get('{0}')".format(field.name), u'field', u'    '))
+        self.writer_sources.append(names_source(names, [field.name for field in compiled_type.fields]) + [
+            u'',
+            u'',
+            u'def {0}(parts, value):'.format(name),
+            u'    """append the elements of {0} to parts"""'.format(type_name(compiled_type.struct)),
+            u'    if not isinstance(value, dict):',
+            u'        raise UnsupportedValue(value)',
+            u'    check_names({0}, value)'.format(names),
+        ] + body)
+        return name
+
+    def field_lines(self, field, getter, variable, indent):
+        """lines writing a field of a type: getter is the expression of its value"""
+        from pypayline.backends.serializer import Unsupported
+
+        if field.type is Unsupported:
+            # arrays of the WSDL are left to pysimplesoap
+            return [
+                u'{0}if {1} is not None:'.format(indent, getter),
+                u'{0}    raise UnsupportedValue({1})'.format(indent, getter),
+            ]
+        if field.type is None:
+            call = wrap(u'write_text(', [
+                u'parts', text_literal(field.open_tag), text_literal(field.close_tag), variable
+            ], u')', indent + u'    ')
+        else:
+            call = wrap(u'write_items(', [
+                u'parts', self.writer_name(field.type), text_literal(field.open_tag),
+                text_literal(field.close_tag), text_literal(field.empty_tag), variable
+            ], u')', indent + u'    ')
+        lines = []
+        if getter != variable:
+            lines.append(u'{0}{1} = {2}'.format(indent, variable, getter))
+        lines.append(u'{0}if {1} is not None:'.format(indent, variable))
+        return lines + call
+
+    def build_source(self, compiled, namespace):
+        """source of the function writing the request of a CompiledOperation"""
+        names = [field.name for field in compiled.root.fields]
+        check_argument_names(compiled.name, names)
+        base = python_name(compiled.name)
+        name = self.identifiers.new(u'build_' + base)
+        start = self.identifiers.new(base.upper() + u'_START')
+        end = self.identifiers.new(base.upper() + u'_END')
+        names_constant = self.identifiers.new(base.upper() + u'_NAMES')
+        self.requests.append((compiled.name, name, names_constant, compiled.action))
+        (input_name, _root), = self.port_operations()[compiled.name]['input'].items()
+        lines = wrap(u'{0} = ENVELOPE_START.format('.format(start), [
+            u'soap_uri=SOAP_URI', u'name={0}'.format(text_literal(input_name)),
+            u'namespace={0}'.format(text_literal(namespace)),
+        ], u')')
+        lines.append(u'{0} = ENVELOPE_END.format(name={1})'.format(end, text_literal(input_name)))
+        lines.extend(names_source(names_constant, names))
+        lines.append(u'')
+        lines.append(u'')
+        lines.extend(def_lines(name, [u'{0}=None'.format(field_name) for field_name in names]))
+        lines.append(u'    """the {0} request envelope as utf-8 bytes"""'.format(compiled.name))
+        lines.append(u'    parts = [{0}]'.format(start))
+        for field in compiled.root.fields:
+            lines.extend(self.field_lines(field, field.name, field.name, u'    '))
+        lines.append(u'    parts.append({0})'.format(end))
+        lines.append(u"    return u''.join(parts).encode('utf-8')")
+        return lines
+
+    def converter_name(self, convert):
+        """name of the conversion function of the simple elements: its source is added once"""
+        from pysimplesoap.helpers import REVERSE_TYPE_MAP
+        from pypayline.backends.parser import text_converter
+
+        name = self.converters.get(convert)
+        if name is not None:
+            return name
+        for xsd_name in sorted(REVERSE_TYPE_MAP):
+            # the aliases of pysimplesoap (integer...) are equal when they have the same xsd type
+            if text_converter(REVERSE_TYPE_MAP[xsd_name]) == convert:
+                name = self.converters[convert] = self.identifiers.new(u'CONVERT_' + python_name(xsd_name).upper())
+                self.converter_sources.append(u"{0} = text_converter(REVERSE_TYPE_MAP['{1}'])".format(name, xsd_name))
+                return name
+        raise ValueError(u'{0}: no xsd type of the conversion function {1!r}'.format(
+            self.service_model.api_name, convert
+        ))
+
+    def node_name(self, node, struct):
+        """name of a CompiledNode of a Struct: its source is added once"""
+        name = self.nodes.get(id(node))
+        if name is not None:
+            return name
+        name = self.nodes[id(node)] = self.identifiers.new(python_name(type_name(struct)) + u'_node')
+        self.node_declarations.append(u'{0} = CompiledNode()'.format(name))
+        elements = []
+        for element_name, element in node.elements.items():
+            arguments = [u"'{0}'".format(element_name)]
+            if element.node is not None:
+                field_type = struct[element_name]
+                if isinstance(field_type, list):
+                    field_type = field_type[0]
+                arguments.append(u'node={0}'.format(self.node_name(element.node, field_type)))
+            if element.convert is not None:
+                arguments.append(u'convert={0}'.format(self.converter_name(element.convert)))
+            if element.repeated:
+                arguments.append(u'repeated=True')
+            elements.extend(wrap(u"'{0}': Element(".format(element_name), arguments, u'),', u'    '))
+        source = [u'{0}.elements = {{'.format(name) + (u'' if elements else u'}')]
+        if elements:
+            source.extend(elements)
+            source.append(u'}')
+        if node.item_name is not None:
+            source.append(u"{0}.item_name = '{1}'".format(name, node.item_name))
+        self.node_sources.append(source)
+        return name
+
+
+def operations_class_name(api_name):
+    """'WebPaymentAPI' -> 'WebPaymentAPIOperations'"""
+    return u'{0}Operations'.format(api_name)
+
+
+def operations_source(services):
+    """
+    source of the operations module: a class by service
+    :param services : [(api name, {operation: names of the elements of the request})]
+    """
+    lines = [HEADER.format(description=u'The methods of the backends: a method by operation of each Payline service')]
+    for index, (api_name, signatures) in enumerate(services):
+        lines.extend([u''] * (1 if index == 0 else 2))
+        lines.append(u'class {0}(object):'.format(operations_class_name(api_name)))
+        lines.append(u'    """')
+        lines.append(u'    The SOAP operations of the {0} service, with the elements of their request'.format(api_name))
+        lines.append(u'    as keyword arguments: the backends implement call_operation(method, data)')
+        lines.append(u'    """')
+        for method in sorted(signatures):
+            names = signatures[method]
+            check_argument_names(method, names)
+            lines.append(u'')
+            lines.extend(def_lines(method, [u'self'] + [u'{0}=None'.format(name) for name in names], u'    '))
+            lines.append(u'        """call the {0} SOAP API"""'.format(method))
+            lines.extend(wrap(u"return self.call_operation('{0}', {{".format(method), [
+                u"'{0}': {0}".format(name) for name in names
+            ], u'})', u'        '))
+    lines.append(u'')
+    lines.append(u'')
+    lines.append(u'# the methods of the backend of each service')
+    lines.extend(wrap(u'SERVICE_OPERATIONS = {', [
+        u"'{0}': {1}".format(api_name, operations_class_name(api_name)) for api_name, _signatures in services
+    ], u'}'))
+    return u'\n'.join(lines) + u'\n'
+
+
+def wsdl_url(path):
+    return u'file://{0}'.format(path)
+
+
+def service_digests(api_name, source_directory=None):
+    """SHA-256 of the full and pruned WSDL files of a service"""
+    digests = []
+    for path_function in (pruning.full_wsdl_path, pruning.pruned_wsdl_path):
+        path = path_function(api_name, source_directory)
+        if os.path.exists(path):
+            digests.append(wsdl_digest(wsdl_url(path)))
+    return digests
+
+
+def generate_service(api_name, source_directory=None):
+    """return (source of the module of a service, {operation: names of the elements of the request})"""
+    from pypayline.backends.parser import repeated_elements
+
+    wsdl = wsdl_url(pruning.full_wsdl_path(api_name, source_directory))
+    service_model = parse_service_model(api_name, wsdl, wsdl_digest(wsdl))
+    generator = ServiceGenerator(service_model, repeated_elements(wsdl), service_digests(api_name, source_directory))
+    return generator.source(), generator.signatures()
+
+
+def write_generated_modules(api_names=API_NAMES, source_directory=None, output_directory=None):
+    """write the modules of the services and the operations module: return their paths"""
+    paths = []
+    services = []
+    for api_name in api_names:
+        source, signatures = generate_service(api_name, source_directory)
+        services.append((api_name, signatures))
+        paths.append(write_module(generated_module_path(generated_module_name(api_name), output_directory), source))
+    if set(api_names) == set(API_NAMES):
+        # the methods of all the services
+        paths.append(write_module(
+            generated_module_path(OPERATIONS_MODULE, output_directory), operations_source(services)
+        ))
+    return paths
+
+
+def write_module(path, source):
+    with open(path, 'wb') as module_file:
+        module_file.write(source.encode('utf-8'))
+    logger.info(u'{0}: {1} lines'.format(path, source.count(u'\n')))
+    return path
+
+
+def main(args=None):
+    parser = argparse.ArgumentParser(description=u'Write the modules generated from the WSDL files of Payline')
+    parser.add_argument('api_names', nargs='*', default=API_NAMES, help=u'services (all by default)')
+    parser.add_argument('--output-dir', default=None, help=u'directory of the modules (the package by default)')
+    options = parser.parse_args(args)
+    for path in write_generated_modules(options.api_names, output_directory=options.output_dir):
+        print(u'{0}: {1} bytes'.format(path, os.path.getsize(path)))
+
+
+if __name__ == '__main__':
+    main()
@@ -22,4 +22,13 @@ class PaylineApiError(Exception):
 
 class ArgumentsError(Exception):
     """The api is called with wrong arguments"""
-    pass
\ No newline at end of file
+    pass
+
+class MassTraitmentTimeoutError(Exception):
+    """The mass traitment is still in progress after the given timeout"""
+    pass
+
+
+class CircuitOpenError(Exception):
+    """Payline is failing: the calls fail fast until the circuit breaker lets a trial call through"""
+    pass
@@ -0,0 +1,144 @@
+# -*- coding: utf-8 -*-
+"""
+Python client for the Payline SOAP API
+Idempotent web payments: a do_web_payment call repeating the order_ref, amount and currency of a
+previous call in the window returns the (redirect_url, token) of the existing payment session, and
+the concurrent duplicate calls share a single request to Payline.
+
+    client = WebPaymentAPI(..., idempotency=IdempotencyLayer(SQLiteStore('/var/lib/shop/payline.db'), window=900))
+
+The sessions are kept in a MemoryStore by default: the SQLiteStore (or a shared store with the
+same get, set and delete methods) keeps them for all the processes. The concurrent calls are
+coalesced within a process
+"""
+
+from __future__ import print_function
+
+import logging
+import threading
+
+from pypayline.cache import MemoryStore, ResultCache
+
+
+logger = logging.getLogger(u'pypayline')
+
+
+# seconds during which a repeated payment returns the existing session
+DEFAULT_IDEMPOTENCY_WINDOW = 900
+
+
+class InFlightCall(object):
+    """a call to Payline waited for by the duplicate calls"""
+
+    def __init__(self):
+        self.event = threading.Event()
+        self.result = None
+        self.error = None
+
+
+class IdempotencyLayer(object):
+    """
+    Payment sessions by order, with counters. A single IdempotencyLayer can be given to several
+    clients: the entries are keyed by merchant
+    """
+
+    def __init__(self, store=None, window=DEFAULT_IDEMPOTENCY_WINDOW):
+        """
+        :param store : MemoryStore, SQLiteStore or any object with the get(key), set(key, value, ttl)
+            and delete(key) methods. A new MemoryStore by default
+        :param window : seconds during which a repeated payment returns the existing session
+        """
+        self.store = MemoryStore() if store is None else store
+        self.window = window
+        self.hits = 0
+        self.misses = 0
+        self.coalesced = 0
+        self._calls = {}  # {key: InFlightCall}
+        self._async_calls = {}  # {key: asyncio future}: see pypayline.aioidempotency
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def make_key(merchant_id, order_ref, amount, currency):
+        """key of a payment: the amount is in cents and the currency is the ISO 4217 code"""
+        return ResultCache.make_key(merchant_id, u'doWebPayment', order_ref, amount, currency)
+
+    def count(self, name):
+        with self._lock:
+            setattr(self, name, getattr(self, name) + 1)
+
+    def get(self, key):
+        """return the (redirect_url, token) of a payment or None"""
+        try:
+            value = self.store.get(key)
+        except Exception as err:
+            # an unavailable shared store must not break the payments
+            logger.warning(u'Idempotency store error: {0}'.format(err))
+            return None
+        return None if value is None else tuple(value)
+
+    def set(self, key, result):
+        """keep the (redirect_url, token) of a payment for the window"""
+        if not result or not result[1]:
+            # no session has been created
+            return
+        try:
+            self.store.set(key, list(result), self.window)
+        except Exception as err:
+            logger.warning(u'Idempotency store error: {0}'.format(err))
+
+    def forget(self, key):
+        """remove a payment: the next call creates a new session"""
+        self.store.delete(key)
+
+    def call(self, key, function):
+        """
+        return the stored result of a payment, or the result of function() which is called once
+        for the concurrent calls with the same key. Its errors are raised by all of them
+        """
+        result = self.get(key)
+        if result is not None:
+            self.count('hits')
+            return result
+        with self._lock:
+            call = self._calls.get(key)
+            leader = call is None
+            if leader:
+                call = self._calls[key] = InFlightCall()
+        if not leader:
+            self.count('coalesced')
+            call.event.wait()
+            if call.error is not None:
+                raise call.error
+            return call.result
+        try:
+            # the previous leader may have stored its result since the first lookup
+            result = self.get(key)
+            if result is not None:
+                self.count('hits')
+                call.result = result
+                return result
+            call.result = function()
+            self.set(key, call.result)
+            self.count('misses')
+            return call.result
+        except Exception as err:
+            call.error = err
+            raise
+        finally:
+            with self._lock:
+                del self._calls[key]
+            call.event.set()
+
+    @property
+    def stats(self):
+        """hits, misses and coalesced counters"""
+        return {'hits': self.hits, 'misses': self.misses, 'coalesced': self.coalesced}
+
+
+def get_idempotency_layer(idempotency):
+    """return the IdempotencyLayer for the idempotency argument of the clients: None, True or an IdempotencyLayer"""
+    if idempotency is None or idempotency is False:
+        return None
+    if idempotency is True:
+        return IdempotencyLayer()
+    return idempotency
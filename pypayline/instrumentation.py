@@ -0,0 +1,339 @@
+# -*- coding: utf-8 -*-
+"""
+Python client for the Payline SOAP API
+Instrumentation of the SOAP operations: hooks called around each call with its timings
+split in phases (serialize, connect, wait, parse), the payload sizes and the result code.
+
+    collector = HistogramCollector()
+    add_hook(collector)  # every client of the process
+    client = WebPaymentAPI(..., hooks=[PrometheusHook()])  # or a single client
+"""
+
+from __future__ import print_function
+
+import bisect
+import logging
+import threading
+import time
+
+
+logger = logging.getLogger(u'pypayline')
+
+
+PHASES = ('serialize', 'connect', 'wait', 'parse')
+
+# upper bounds in seconds of the histogram buckets
+DEFAULT_BUCKETS = (
+    0.0001, 0.00025, 0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30, 60
+)
+
+
+class OperationEvent(object):
+    """A SOAP call, given to the hooks when it starts and when it is finished"""
+
+    def __init__(self, api_name, operation):
+        self.api_name = api_name
+        self.operation = operation
+        self.start_time = time.time()
+        self.duration = None
+        # seconds spent in each phase
+        self.timings = dict((phase, 0.0) for phase in PHASES)
+        self.request_size = None
+        self.response_size = None
+        self.result_code = None
+        # exception raised by the call (SoapFault, HTTPError, socket errors...)
+        self.error = None
+
+    @property
+    def error_type(self):
+        """name of the class of the error or None"""
+        return None if self.error is None else self.error.__class__.__name__
+
+    def __repr__(self):
+        return '<OperationEvent {0}.{1} {2}>'.format(self.api_name, self.operation, self.result_code or self.error_type)
+
+
+class Hook(object):
+    """Base class of the hooks: override started and/or finished"""
+
+    def started(self, event):
+        """called before the request is serialized"""
+        pass
+
+    def finished(self, event):
+        """called once the response is parsed or the call has failed"""
+        pass
+
+
+class FunctionHook(Hook):
+    """a function called with the finished events"""
+
+    def __init__(self, function):
+        self.function = function
+
+    def finished(self, event):
+        self.function(event)
+
+
+def as_hook(hook):
+    """return a Hook for a Hook or a function"""
+    if isinstance(hook, Hook) or hasattr(hook, 'finished'):
+        return hook
+    if callable(hook):
+        return FunctionHook(hook)
+    raise TypeError(u'A hook must be a Hook or a function: {0!r}'.format(hook))
+
+
+_global_hooks = []
+_global_hooks_lock = threading.Lock()
+
+
+def add_hook(hook):
+    """instrument the calls of every client of the process. Return the hook, for remove_hook"""
+    hook = as_hook(hook)
+    with _global_hooks_lock:
+        _global_hooks.append(hook)
+    return hook
+
+
+def remove_hook(hook):
+    """stop a hook added by add_hook"""
+    with _global_hooks_lock:
+        if hook in _global_hooks:
+            _global_hooks.remove(hook)
+
+
+class Instrumentation(object):
+    """The hooks of a backend: its own hooks and the hooks of the process"""
+
+    def __init__(self, hooks=None):
+        self.hooks = [as_hook(hook) for hook in hooks or ()]
+
+    @property
+    def enabled(self):
+        return bool(self.hooks or _global_hooks)
+
+    def all_hooks(self):
+        return self.hooks + _global_hooks
+
+    def start(self, api_name, operation):
+        """return the event of a new call"""
+        event = OperationEvent(api_name, operation)
+        for hook in self.all_hooks():
+            try:
+                hook.started(event)
+            except Exception:
+                logger.exception(u'Instrumentation hook error')
+        return event
+
+    def finish(self, event):
+        """give the event of a finished call to the hooks"""
+        event.duration = time.time() - event.start_time
+        for hook in self.all_hooks():
+            try:
+                hook.finished(event)
+            except Exception:
+                # the monitoring must not break the payments
+                logger.exception(u'Instrumentation hook error')
+
+
+class Histogram(object):
+    """bucket counts of durations"""
+
+    def __init__(self, buckets):
+        self.buckets = buckets
+        self.counts = [0] * (len(buckets) + 1)  # the last one is +Inf
+        self.count = 0
+        self.sum = 0.0
+
+    def observe(self, value):
+        self.counts[bisect.bisect_left(self.buckets, value)] += 1
+        self.count += 1
+        self.sum += value
+
+    def percentile(self, percent):
+        """upper bound of the bucket of the percentile: None if there is no value"""
+        if not self.count:
+            return None
+        rank = self.count * percent / 100.0
+        total = 0
+        for index, count in enumerate(self.counts):
+            total += count
+            if total >= rank and count:
+                return self.buckets[index] if index < len(self.buckets) else float('inf')
+        return float('inf')
+
+    def as_dict(self):
+        return {
+            'buckets': list(self.buckets),
+            'counts': list(self.counts),
+            'count': self.count,
+            'sum': self.sum,
+        }
+
+
+class HistogramCollector(Hook):
+    """
+    In-memory collector: histograms of the durations per (api name, operation, phase),
+    and counters of the result codes and errors
+    """
+
+    def __init__(self, buckets=DEFAULT_BUCKETS):
+        self.buckets = tuple(sorted(buckets))
+        self.histograms = {}  # (api_name, operation, phase): Histogram
+        self.result_codes = {}  # (api_name, operation, result_code): count
+        self.errors = {}  # (api_name, operation, error type): count
+        self.request_bytes = {}  # (api_name, operation): total
+        self.response_bytes = {}
+        self._lock = threading.Lock()
+
+    def observe(self, key, value):
+        histogram = self.histograms.get(key)
+        if histogram is None:
+            histogram = self.histograms[key] = Histogram(self.buckets)
+        histogram.observe(value)
+
+    def finished(self, event):
+        key = (event.api_name, event.operation)
+        with self._lock:
+            self.observe(key + ('total', ), event.duration)
+            for phase, value in event.timings.items():
+                self.observe(key + (phase, ), value)
+            if event.error is not None:
+                error_key = key + (event.error_type, )
+                self.errors[error_key] = self.errors.get(error_key, 0) + 1
+            else:
+                code_key = key + (event.result_code, )
+                self.result_codes[code_key] = self.result_codes.get(code_key, 0) + 1
+            if event.request_size is not None:
+                self.request_bytes[key] = self.request_bytes.get(key, 0) + event.request_size
+            if event.response_size is not None:
+                self.response_bytes[key] = self.response_bytes.get(key, 0) + event.response_size
+
+    def histogram(self, api_name, operation, phase='total'):
+        """return the Histogram of an operation or None"""
+        return self.histograms.get((api_name, operation, phase))
+
+    def percentile(self, api_name, operation, percent, phase='total'):
+        """upper bound in seconds of the percentile of an operation (or of a phase). None if not called"""
+        with self._lock:
+            histogram = self.histogram(api_name, operation, phase)
+            return None if histogram is None else histogram.percentile(percent)
+
+    def snapshot(self):
+        """copy of the collected data, as dictionnaries"""
+        with self._lock:
+            return {
+                'histograms': dict((key, histogram.as_dict()) for key, histogram in self.histograms.items()),
+                'result_codes': dict(self.result_codes),
+                'errors': dict(self.errors),
+                'request_bytes': dict(self.request_bytes),
+                'response_bytes': dict(self.response_bytes),
+            }
+
+    def reset(self):
+        with self._lock:
+            self.histograms.clear()
+            self.result_codes.clear()
+            self.errors.clear()
+            self.request_bytes.clear()
+            self.response_bytes.clear()
+
+
+class PrometheusHook(Hook):
+    """Export the calls as Prometheus metrics. prometheus_client is only imported when the hook is created"""
+
+    def __init__(self, registry=None, namespace='pypayline', buckets=DEFAULT_BUCKETS):
+        """
+        :param registry : prometheus_client CollectorRegistry. The default registry if None
+        :param namespace : prefix of the metric names
+        """
+        try:
+            import prometheus_client
+        except ImportError:
+            raise ImportError(u'prometheus_client is required by PrometheusHook: pip install prometheus_client')
+
+        kwargs = {'namespace': namespace}
+        if registry is not None:
+            kwargs['registry'] = registry
+        self.duration = prometheus_client.Histogram(
+            'soap_phase_seconds', u'Duration of the phases of the SOAP calls',
+            ['api', 'operation', 'phase'], buckets=buckets, **kwargs
+        )
+        self.calls = prometheus_client.Counter(
+            'soap_calls_total', u'SOAP calls by result code', ['api', 'operation', 'result_code'], **kwargs
+        )
+        self.errors = prometheus_client.Counter(
+            'soap_errors_total', u'Failed SOAP calls by error', ['api', 'operation', 'error'], **kwargs
+        )
+        self.payload = prometheus_client.Counter(
+            'soap_payload_bytes_total', u'Size of the SOAP requests and responses',
+            ['api', 'operation', 'direction'], **kwargs
+        )
+
+    def finished(self, event):
+        api, operation = event.api_name, event.operation
+        self.duration.labels(api, operation, 'total').observe(event.duration)
+        for phase, value in event.timings.items():
+            self.duration.labels(api, operation, phase).observe(value)
+        if event.error is not None:
+            self.errors.labels(api, operation, event.error_type).inc()
+        else:
+            self.calls.labels(api, operation, event.result_code or u'').inc()
+        if event.request_size is not None:
+            self.payload.labels(api, operation, 'request').inc(event.request_size)
+        if event.response_size is not None:
+            self.payload.labels(api, operation, 'response').inc(event.response_size)
+
+
+class OpenTelemetryHook(Hook):
+    """
+    Record the calls as OpenTelemetry metrics and spans. opentelemetry is only imported
+    when the hook is created
+    """
+
+    def __init__(self, meter_provider=None, tracer_provider=None, traces=True):
+        """
+        :param meter_provider : the global meter provider if None
+        :param tracer_provider : the global tracer provider if None
+        :param traces : create a span per call
+        """
+        try:
+            from opentelemetry import metrics, trace
+        except ImportError:
+            raise ImportError(u'opentelemetry-api is required by OpenTelemetryHook: pip install opentelemetry-api')
+
+        meter = metrics.get_meter(u'pypayline', meter_provider=meter_provider)
+        self.duration = meter.create_histogram(
+            u'pypayline.soap.duration', unit=u's', description=u'Duration of the phases of the SOAP calls'
+        )
+        self.payload = meter.create_counter(
+            u'pypayline.soap.payload', unit=u'By', description=u'Size of the SOAP requests and responses'
+        )
+        self.tracer = trace.get_tracer(u'pypayline', tracer_provider=tracer_provider) if traces else None
+
+    def finished(self, event):
+        attributes = {u'payline.api': event.api_name, u'payline.operation': event.operation}
+        if event.result_code is not None:
+            attributes[u'payline.result_code'] = event.result_code
+        if event.error is not None:
+            attributes[u'error.type'] = event.error_type
+        self.duration.record(event.duration, dict(attributes, **{u'payline.phase': u'total'}))
+        for phase, value in event.timings.items():
+            self.duration.record(value, dict(attributes, **{u'payline.phase': phase}))
+        if event.request_size is not None:
+            self.payload.add(event.request_size, dict(attributes, **{u'payline.direction': u'request'}))
+        if event.response_size is not None:
+            self.payload.add(event.response_size, dict(attributes, **{u'payline.direction': u'response'}))
+
+        if self.tracer is not None:
+            start_time = int(event.start_time * 1e9)
+            span = self.tracer.start_span(
+                u'{0}.{1}'.format(event.api_name, event.operation), start_time=start_time, attributes=attributes
+            )
+            for phase in PHASES:
+                span.set_attribute(u'payline.{0}_seconds'.format(phase), event.timings[phase])
+            if event.error is not None:
+                span.record_exception(event.error)
+            span.end(end_time=start_time + int(event.duration * 1e9))
+
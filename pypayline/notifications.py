@@ -0,0 +1,223 @@
+# -*- coding: utf-8 -*-
+"""
+Python client for the Payline SOAP API
+Receiver of the payment notifications (IPN): Payline calls the notification_url of do_web_payment
+with the token of the payment. The receiver acknowledges at once, ignores the tokens already
+received in the deduplication window and queues the others: worker threads get the payment details
+and call the callback of the application.
+
+    def on_payment(token, details):
+        # details is a pypayline.results.WebPaymentDetails
+        ...
+
+    application = NotificationReceiver(WebPaymentAPI(...), on_payment, workers=8)  # a WSGI application
+
+When the queue is full, the notification is answered with a 503 status and forgotten, so that it
+is processed when Payline sends it again. See pypayline.aionotifications for the ASGI version
+"""
+
+from __future__ import print_function
+
+import logging
+import threading
+import time
+from collections import OrderedDict
+
+from six.moves import queue
+from six.moves.urllib.parse import parse_qs
+
+
+logger = logging.getLogger(u'pypayline')
+
+
+DEFAULT_WORKERS = 4
+DEFAULT_MAX_QUEUE = 1000
+DEFAULT_DEDUP_WINDOW = 300
+DEFAULT_MAX_TOKENS = 100000
+
+# results of a notification
+ACCEPTED, DUPLICATE, BUSY = 'accepted', 'duplicate', 'busy'
+
+# HTTP responses of the notification results: the duplicates are acknowledged too
+RESPONSES = {
+    ACCEPTED: ('200 OK', b'OK'),
+    DUPLICATE: ('200 OK', b'OK'),
+    BUSY: ('503 Service Unavailable', b'BUSY'),
+    None: ('400 Bad Request', b'TOKEN EXPECTED'),
+}
+
+
+def notification_token(query_string, body=b''):
+    """the token of a notification: in the query string (GET) or the form (POST). None if missing"""
+    for data in (query_string, body):
+        if isinstance(data, bytes):
+            data = data.decode('latin-1')
+        values = parse_qs(data or u'').get(u'token')
+        if values and values[0]:
+            return values[0]
+    return None
+
+
+class DedupWindow(object):
+    """
+    The tokens received in the last window seconds. It is bounded: the oldest tokens are
+    forgotten when it is full
+    """
+
+    def __init__(self, window=DEFAULT_DEDUP_WINDOW, max_size=DEFAULT_MAX_TOKENS, clock=time.time):
+        """
+        :param window : seconds during which a token is a duplicate
+        :param max_size : maximum number of tokens kept
+        :param clock : function returning the current time in seconds
+        """
+        self.window = window
+        self.max_size = max_size
+        self.clock = clock
+        self._tokens = OrderedDict()  # {token: time received}, oldest first
+        self._lock = threading.Lock()
+
+    def add(self, token):
+        """record a token: return False if it has been received in the window"""
+        with self._lock:
+            now = self.clock()
+            while self._tokens:
+                oldest, received = next(iter(self._tokens.items()))
+                if now - received < self.window and len(self._tokens) < self.max_size:
+                    break
+                del self._tokens[oldest]
+            if token in self._tokens:
+                return False
+            self._tokens[token] = now
+            return True
+
+    def discard(self, token):
+        """forget a token: its next notification is processed"""
+        with self._lock:
+            self._tokens.pop(token, None)
+
+    def __len__(self):
+        return len(self._tokens)
+
+
+class NotificationReceiver(object):
+    """
+    WSGI application receiving the Payline notifications. The payment details are fetched by a
+    pool of threads, started with the first notification
+    """
+
+    def __init__(self, client, callback, workers=DEFAULT_WORKERS, max_queue=DEFAULT_MAX_QUEUE,
+                 dedup_window=DEFAULT_DEDUP_WINDOW, error_callback=None, clock=time.time):
+        """
+        :param client : WebPaymentAPI getting the payment details
+        :param callback : function called with (token, WebPaymentDetails) by the workers
+        :param workers : number of threads getting the details at the same time
+        :param max_queue : maximum number of notifications waiting for a worker
+        :param dedup_window : seconds during which the notifications of a token are ignored
+        :param error_callback : function called with (token, exception) when the details can't be
+            fetched or the callback fails. The token is forgotten: its next notification is processed
+        :param clock : function returning the current time in seconds
+        """
+        self.client = client
+        self.callback = callback
+        self.workers = workers
+        self.error_callback = error_callback
+        self.dedup = DedupWindow(dedup_window, clock=clock)
+        self.queue = queue.Queue(max_queue)
+        self.accepted = 0
+        self.duplicates = 0
+        self.rejected = 0
+        self.processed = 0
+        self.failed = 0
+        self._threads = []
+        self._lock = threading.Lock()
+
+    def count(self, name):
+        with self._lock:
+            setattr(self, name, getattr(self, name) + 1)
+
+    def start(self):
+        """start the workers if they are not running"""
+        with self._lock:
+            if self._threads:
+                return
+            for index in range(self.workers):
+                thread = threading.Thread(target=self.work, name=u'pypayline-notifications-{0}'.format(index))
+                thread.daemon = True
+                thread.start()
+                self._threads.append(thread)
+
+    def stop(self, timeout=None):
+        """process the queued notifications and stop the workers"""
+        with self._lock:
+            threads, self._threads = self._threads, []
+        for _thread in threads:
+            self.queue.put(None)
+        for thread in threads:
+            thread.join(timeout)
+
+    def join(self):
+        """wait until the queued notifications are processed"""
+        self.queue.join()
+
+    def notify(self, token):
+        """
+        queue the notification of a payment without waiting for its processing
+        :return: ACCEPTED, DUPLICATE if the token has been received in the window or BUSY if the queue is full
+        """
+        if not self.dedup.add(token):
+            self.count('duplicates')
+            return DUPLICATE
+        if not self._threads:
+            self.start()
+        try:
+            self.queue.put_nowait(token)
+        except queue.Full:
+            self.dedup.discard(token)
+            self.count('rejected')
+            logger.warning(u'Notification queue full: the notification of {0} is rejected'.format(token))
+            return BUSY
+        self.count('accepted')
+        return ACCEPTED
+
+    def work(self):
+        while True:
+            token = self.queue.get()
+            try:
+                if token is None:
+                    return
+                self.process(token)
+            finally:
+                self.queue.task_done()
+
+    def process(self, token):
+        """get the details of a payment and call the callback"""
+        try:
+            details = self.client.get_web_payment_details_result(token)
+            self.callback(token, details)
+        except Exception as err:
+            self.failure(token, err)
+        else:
+            self.count('processed')
+
+    def failure(self, token, err):
+        self.dedup.discard(token)
+        self.count('failed')
+        logger.exception(u'Notification of {0} failed: {1!r}'.format(token, err))
+        if self.error_callback is not None:
+            try:
+                self.error_callback(token, err)
+            except Exception:
+                logger.exception(u'Notification error callback failed')
+
+    def __call__(self, environ, start_response):
+        body = b''
+        if environ.get('REQUEST_METHOD') == 'POST':
+            try:
+                length = int(environ.get('CONTENT_LENGTH') or 0)
+            except ValueError:
+                length = 0
+            body = environ['wsgi.input'].read(length) if length > 0 else b''
+        token = notification_token(environ.get('QUERY_STRING', ''), body)
+        status, content = RESPONSES[self.notify(token) if token else None]
+        start_response(status, [('Content-Type', 'text/plain'), ('Content-Length', str(len(content)))])
+        return [content]
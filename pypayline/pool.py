@@ -0,0 +1,81 @@
+# -*- coding: utf-8 -*-
+"""
+Python client for the Payline SOAP API
+Pool of the clients of several merchant accounts (marketplaces)
+
+    pool = PaylineClientPool(WebPaymentAPI, max_size=500, cache=True)
+    redirect_url, token = pool.get(merchant_id, access_key, contract_number).do_web_payment(...)
+
+The clients of a pool share the service model (parsed WSDL, envelope templates, response
+parsers) and the connection pools of the transport: only their Authorization header differs
+"""
+
+from __future__ import print_function
+
+import logging
+import threading
+from collections import OrderedDict
+
+from pypayline.client import WebPaymentAPI
+
+
+logger = logging.getLogger(u'pypayline')
+
+
+DEFAULT_MAX_CLIENTS = 1000
+
+
+class PaylineClientPool(object):
+    """
+    Bounded LRU of the clients of the merchants. It can be used from several threads:
+    a single client is created per merchant account
+    """
+
+    def __init__(self, api_class=WebPaymentAPI, max_size=DEFAULT_MAX_CLIENTS, **client_kwargs):
+        """
+        :param api_class : class of the clients (WebPaymentAPI, DirectPaymentAPI, AsyncWebPaymentAPI...)
+        :param max_size : maximum number of clients: the least recently used are dropped
+        :param client_kwargs : other arguments of the clients (cache, homologation, transport, result_cache,
+            hooks...), the same for all the merchants
+        """
+        self.api_class = api_class
+        self.max_size = max_size
+        self.client_kwargs = client_kwargs
+        self._clients = OrderedDict()  # (merchant_id, access_key, contract_number): client
+        self._lock = threading.Lock()
+        self.created = 0
+
+    def get(self, merchant_id, access_key, contract_number=None):
+        """return the client of a merchant account. It is created if needed"""
+        key = (merchant_id, access_key, contract_number)
+        with self._lock:
+            client = self._clients.pop(key, None)
+            if client is None:
+                # the backend is created by the first call of the client: this is cheap
+                client = self.api_class(merchant_id, access_key, contract_number, **self.client_kwargs)
+                self.created += 1
+            # most recently used
+            self._clients[key] = client
+            while len(self._clients) > self.max_size:
+                self._clients.popitem(last=False)
+        return client
+
+    def remove(self, merchant_id, access_key=None):
+        """drop the clients of a merchant (all its access keys if access_key is None): after a key rotation"""
+        with self._lock:
+            for key in list(self._clients):
+                if key[0] == merchant_id and (access_key is None or key[1] == access_key):
+                    del self._clients[key]
+
+    def clear(self):
+        """drop all the clients"""
+        with self._lock:
+            self._clients.clear()
+
+    def warmup(self):
+        """load the service model of the clients now rather than on the first call. Return the pool"""
+        self.api_class(None, None, None, **self.client_kwargs).warmup()
+        return self
+
+    def __len__(self):
+        return len(self._clients)
@@ -0,0 +1,239 @@
+# -*- coding: utf-8 -*-
+"""
+Python client for the Payline SOAP API
+Pruned WSDL files: each WSDL of Payline describes the four services with all their types, while a
+client binds a single service. The pruned WSDL of a service only keeps the operations of its backend
+and the schema types they reach, which makes it faster to parse and lighter in memory.
+
+python -m pypayline.pruning [--output-dir directory] [api name...]
+
+writes WebPaymentAPI.pruned.wsdl... next to the full WSDL files. The clients load them by default:
+see the full_wsdl argument of the clients. The generated modules keep the digests of the pruned files:
+run python -m pypayline.codegen again once they are written
+"""
+
+from __future__ import print_function
+
+import argparse
+import logging
+import os
+from xml.dom import minidom
+
+
+logger = logging.getLogger(u'pypayline')
+
+
+API_NAMES = ('WebPaymentAPI', 'DirectPaymentAPI', 'MassPaymentAPI', 'ExtendedAPI')
+
+WSDL_NAMESPACE = u'http://schemas.xmlsoap.org/wsdl/'
+SCHEMA_NAMESPACE = u'http://www.w3.org/2001/XMLSchema'
+
+# attributes of the schema elements referencing a type or an element
+REFERENCE_ATTRIBUTES = ('type', 'ref', 'base', 'element')
+
+
+def wsdl_directory():
+    """directory of the WSDL files of the package"""
+    return os.path.abspath(os.path.dirname(__file__))
+
+
+def full_wsdl_path(api_name, directory=None):
+    return os.path.join(directory or wsdl_directory(), u'{0}.wsdl'.format(api_name))
+
+
+def pruned_wsdl_path(api_name, directory=None):
+    return os.path.join(directory or wsdl_directory(), u'{0}.pruned.wsdl'.format(api_name))
+
+
+def backend_operations(api_name):
+    """the SOAP operations of the backend of a service: the methods generated for it (see pypayline.codegen)"""
+    from pypayline.backends.generated.operations import SERVICE_OPERATIONS
+    operations = SERVICE_OPERATIONS[api_name]
+    return frozenset(name for name in vars(operations) if name[:1].islower())
+
+
+def local_name(node):
+    return node.localName or node.nodeName.split(u':')[-1]
+
+
+def children(node, name=None, namespace=None):
+    """the child elements of a node, with the given local name and namespace"""
+    return [
+        child for child in node.childNodes
+        if child.nodeType == child.ELEMENT_NODE and (name is None or local_name(child) == name) and
+        (namespace is None or child.namespaceURI == namespace)
+    ]
+
+
+def remove(node):
+    """remove a node and the indentation before it"""
+    parent = node.parentNode
+    previous = node.previousSibling
+    if previous is not None and previous.nodeType == previous.TEXT_NODE and not previous.data.strip():
+        parent.removeChild(previous)
+    parent.removeChild(node)
+
+
+def namespaces_of(node):
+    """{prefix: namespace} declared by a node and its ancestors"""
+    namespaces = {}
+    ancestors = []
+    while node is not None and node.nodeType == node.ELEMENT_NODE:
+        ancestors.append(node)
+        node = node.parentNode
+    for ancestor in reversed(ancestors):
+        for name, value in ancestor.attributes.items():
+            if name == u'xmlns':
+                namespaces[None] = value
+            elif name.startswith(u'xmlns:'):
+                namespaces[name[len(u'xmlns:'):]] = value
+    return namespaces
+
+
+def qualified_name(value, namespaces):
+    """(namespace, name) of a prefixed reference (tns1:payment)"""
+    prefix, _sep, name = value.rpartition(u':')
+    return namespaces.get(prefix or None), name
+
+
+def names_anonymous_type(annotation):
+    """
+    True if pysimplesoap reads the anonymous type of an element after its annotation: it takes the
+    first child of the element as its type, so the annotation is kept for the pruned service model
+    to be the same as the full one
+    """
+    parent = annotation.parentNode
+    if local_name(parent) != u'element' or parent.hasAttribute(u'type'):
+        return False
+    elements = children(parent)
+    return len(elements) > 1 and elements[0] is annotation
+
+
+class Schemas(object):
+    """the top-level elements and types of the schemas of a WSDL, by (namespace, name)"""
+
+    def __init__(self, types_node):
+        self.schemas = children(types_node, u'schema', SCHEMA_NAMESPACE)
+        self.definitions = {}
+        for schema in self.schemas:
+            namespace = schema.getAttribute(u'targetNamespace')
+            for node in children(schema):
+                if node.hasAttribute(u'name'):
+                    self.definitions[(namespace, node.getAttribute(u'name'))] = node
+
+    def reachable(self, roots):
+        """the definitions reached from the (namespace, name) roots"""
+        reached = set()
+        pending = list(roots)
+        while pending:
+            key = pending.pop()
+            if key in reached or key not in self.definitions:
+                continue
+            reached.add(key)
+            node = self.definitions[key]
+            namespaces = namespaces_of(node)
+            for descendant in [node] + node.getElementsByTagName(u'*'):
+                for attribute in REFERENCE_ATTRIBUTES:
+                    if descendant.hasAttribute(attribute):
+                        pending.append(qualified_name(descendant.getAttribute(attribute), namespaces))
+        return reached
+
+
+def prune_wsdl(content, api_name, operations=None, keep_documentation=False):
+    """
+    return the pruned WSDL of a service
+    :param content : the full WSDL (bytes)
+    :param api_name : name of the service (WebPaymentAPI...)
+    :param operations : operations to keep. The operations of the backend of the service if None
+    :param keep_documentation : keep the annotations of the schemas
+    """
+    if operations is None:
+        operations = backend_operations(api_name)
+    document = minidom.parseString(content)
+    definitions = document.documentElement
+    namespaces = namespaces_of(definitions)
+
+    # the service and its binding and port type
+    for service in children(definitions, u'service', WSDL_NAMESPACE):
+        if service.getAttribute(u'name') != api_name:
+            remove(service)
+    ports = [
+        port for service in children(definitions, u'service', WSDL_NAMESPACE)
+        for port in children(service, u'port', WSDL_NAMESPACE)
+    ]
+    binding_names = set(qualified_name(port.getAttribute(u'binding'), namespaces)[1] for port in ports)
+    port_type_names = set()
+    for binding in children(definitions, u'binding', WSDL_NAMESPACE):
+        if binding.getAttribute(u'name') not in binding_names:
+            remove(binding)
+            continue
+        port_type_names.add(qualified_name(binding.getAttribute(u'type'), namespaces)[1])
+        for operation in children(binding, u'operation', WSDL_NAMESPACE):
+            if operation.getAttribute(u'name') not in operations:
+                remove(operation)
+
+    message_names = set()
+    for port_type in children(definitions, u'portType', WSDL_NAMESPACE):
+        if port_type.getAttribute(u'name') not in port_type_names:
+            remove(port_type)
+            continue
+        for operation in children(port_type, u'operation', WSDL_NAMESPACE):
+            if operation.getAttribute(u'name') not in operations:
+                remove(operation)
+                continue
+            for message in children(operation):
+                if message.hasAttribute(u'message'):
+                    message_names.add(qualified_name(message.getAttribute(u'message'), namespaces)[1])
+
+    # the messages and the schema elements of their parts
+    roots = set()
+    for message in children(definitions, u'message', WSDL_NAMESPACE):
+        if message.getAttribute(u'name') not in message_names:
+            remove(message)
+            continue
+        for part in children(message, u'part', WSDL_NAMESPACE):
+            if part.hasAttribute(u'element'):
+                roots.add(qualified_name(part.getAttribute(u'element'), namespaces))
+
+    for types_node in children(definitions, u'types', WSDL_NAMESPACE):
+        schemas = Schemas(types_node)
+        reached = schemas.reachable(roots)
+        for key, node in schemas.definitions.items():
+            if key not in reached:
+                remove(node)
+        if not keep_documentation:
+            for schema in schemas.schemas:
+                for annotation in schema.getElementsByTagNameNS(SCHEMA_NAMESPACE, u'annotation'):
+                    if not names_anonymous_type(annotation):
+                        remove(annotation)
+
+    return b'<?xml version="1.0" encoding="UTF-8"?>\n' + definitions.toxml().encode('utf-8')
+
+
+def write_pruned_wsdl(api_name, source_directory=None, output_directory=None, operations=None):
+    """write the pruned WSDL of a service and return its path"""
+    with open(full_wsdl_path(api_name, source_directory), 'rb') as wsdl_file:
+        content = wsdl_file.read()
+    path = pruned_wsdl_path(api_name, output_directory or source_directory)
+    pruned = prune_wsdl(content, api_name, operations)
+    with open(path, 'wb') as pruned_file:
+        pruned_file.write(pruned)
+        pruned_file.write(b'\n')
+    logger.info(u'{0}: {1} bytes -> {2} bytes'.format(path, len(content), len(pruned)))
+    return path
+
+
+def main(args=None):
+    parser = argparse.ArgumentParser(description=u'Write the pruned WSDL files of the Payline services')
+    parser.add_argument('api_names', nargs='*', default=API_NAMES, help=u'services (all by default)')
+    parser.add_argument('--output-dir', default=None, help=u'directory of the pruned files (the package by default)')
+    options = parser.parse_args(args)
+    for api_name in options.api_names:
+        path = write_pruned_wsdl(api_name, output_directory=options.output_dir)
+        print(u'{0}: {1} -> {2} bytes'.format(
+            path, os.path.getsize(full_wsdl_path(api_name)), os.path.getsize(path)
+        ))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,243 @@
+# -*- coding: utf-8 -*-
+"""
+Python client for the Payline SOAP API
+Resilience of the SOAP calls: per-operation timeouts, retries with exponential backoff and
+hedged requests for the idempotent operations, and a circuit breaker failing fast when Payline
+is failing.
+
+    policy = ResiliencePolicy(
+        timeouts={'getWebPaymentDetails': 5}, retry=RetryPolicy(max_attempts=3),
+        hedge_delay=0.5, circuit_breaker=CircuitBreaker()
+    )
+    client = WebPaymentAPI(..., resilience=policy)  # a policy can be shared by several clients
+"""
+
+from __future__ import print_function
+
+import logging
+import random
+import socket
+import threading
+import time
+from collections import deque
+
+from six.moves import http_client, queue
+from six.moves.urllib.error import HTTPError
+
+from pypayline.exceptions import CircuitOpenError
+
+
+logger = logging.getLogger(u'pypayline')
+
+
+# read-only operations: they can be sent again without side effect
+IDEMPOTENT_OPERATIONS = (
+    'getWebPaymentDetails', 'getPaymentRecord', 'getTransactionDetails', 'getWallet', 'getCards'
+)
+
+
+def is_transient(err):
+    """
+    True if the error is a failure of Payline or of the network (timeouts, connection errors,
+    HTTP 5xx statuses), which may not happen again. SOAP faults and HTTP 4xx statuses are not
+    """
+    if isinstance(err, HTTPError):
+        return err.code >= 500
+    return isinstance(err, (socket.error, socket.timeout, http_client.HTTPException))
+
+
+class RetryPolicy(object):
+    """Number of attempts of the idempotent calls and exponential backoff between them"""
+
+    def __init__(self, max_attempts=3, backoff=0.1, multiplier=2.0, max_backoff=2.0, jitter=0.5):
+        """
+        :param max_attempts : maximum number of calls, including the first one
+        :param backoff : seconds to wait before the first retry
+        :param multiplier : factor of the delay between two retries
+        :param max_backoff : maximum delay in seconds
+        :param jitter : fraction of the delay which is random, so that the clients don't retry together
+        """
+        self.max_attempts = max_attempts
+        self.backoff = backoff
+        self.multiplier = multiplier
+        self.max_backoff = max_backoff
+        self.jitter = jitter
+
+    def delay(self, attempt):
+        """seconds to wait after the given failed attempt (1 for the first call)"""
+        delay = min(self.max_backoff, self.backoff * self.multiplier ** (attempt - 1))
+        return delay * (1 - self.jitter * random.random())
+
+
+class CircuitBreaker(object):
+    """
+    Fail fast when the rate of transient errors of the last calls is too high. Once open, the
+    calls raise CircuitOpenError during reset_timeout seconds, then a single trial call is let
+    through: its success closes the circuit, its failure opens it again. It can be shared by
+    several clients and threads
+    """
+    CLOSED, OPEN, HALF_OPEN = 'closed', 'open', 'half-open'
+
+    def __init__(self, failure_rate=0.5, window=20, min_calls=10, reset_timeout=30, clock=time.time):
+        """
+        :param failure_rate : fraction of failed calls in the window opening the circuit
+        :param window : number of the last calls taken into account
+        :param min_calls : the circuit is not opened before this number of calls in the window
+        :param reset_timeout : seconds before a trial call once the circuit is open
+        :param clock : function returning the current time in seconds
+        """
+        self.failure_rate = failure_rate
+        self.min_calls = min_calls
+        self.reset_timeout = reset_timeout
+        self.clock = clock
+        self.state = self.CLOSED
+        self.opened_at = None
+        self.rejected = 0
+        self._results = deque(maxlen=window)  # True for the failed calls
+        self._trial = False
+        self._lock = threading.Lock()
+
+    def before_call(self):
+        """:raise: CircuitOpenError if the call must not be done"""
+        with self._lock:
+            if self.state == self.CLOSED:
+                return
+            if self.state == self.OPEN and self.clock() - self.opened_at >= self.reset_timeout:
+                self.state = self.HALF_OPEN
+                self._trial = False
+            if self.state == self.HALF_OPEN and not self._trial:
+                self._trial = True
+                return
+            self.rejected += 1
+        raise CircuitOpenError(u'Payline calls are suspended after too many errors')
+
+    def record(self, failed):
+        """record the result of a call"""
+        with self._lock:
+            if self.state == self.HALF_OPEN:
+                if failed:
+                    self.open()
+                else:
+                    self.state = self.CLOSED
+                    self._results.clear()
+                return
+            self._results.append(failed)
+            if len(self._results) >= self.min_calls:
+                if sum(self._results) >= self.failure_rate * len(self._results):
+                    self.open()
+
+    def open(self):
+        if self.state != self.OPEN:
+            logger.warning(u'Circuit breaker opened: Payline calls are suspended')
+        self.state = self.OPEN
+        self.opened_at = self.clock()
+        self._results.clear()
+
+
+class ResiliencePolicy(object):
+    """Timeouts, retries, hedging and circuit breaker of the calls of a backend"""
+
+    def __init__(self, timeouts=None, default_timeout=None, retry=None, hedge_delay=None, circuit_breaker=None,
+                 idempotent_operations=IDEMPOTENT_OPERATIONS, sleep=time.sleep):
+        """
+        :param timeouts : dictionnary {operation: read timeout in seconds of a call}
+        :param default_timeout : read timeout of the other operations. The one of the transport if None
+        :param retry : RetryPolicy of the idempotent operations. No retry if None
+        :param hedge_delay : if the response of an idempotent call is not received after this number of
+            seconds, a second request is sent and the first response is used. No hedging if None
+        :param circuit_breaker : CircuitBreaker of all the operations
+        :param idempotent_operations : operations which can be retried and hedged
+        :param sleep : function waiting for the backoff delays
+        """
+        self.timeouts = dict(timeouts or {})
+        self.default_timeout = default_timeout
+        self.retry = retry
+        self.hedge_delay = hedge_delay
+        self.circuit_breaker = circuit_breaker
+        self.idempotent_operations = frozenset(idempotent_operations)
+        self.sleep = sleep
+        self.retries = 0
+        self.hedges = 0
+        self._lock = threading.Lock()
+
+    def timeout(self, method):
+        """read timeout of a call of an operation or None"""
+        return self.timeouts.get(method, self.default_timeout)
+
+    def max_attempts(self, method):
+        if self.retry is None or method not in self.idempotent_operations:
+            return 1
+        return self.retry.max_attempts
+
+    def count(self, name):
+        with self._lock:
+            setattr(self, name, getattr(self, name) + 1)
+
+    def call(self, method, function):
+        """
+        call function(timeout) with the policy of the operation
+        :return: the result of the first successful call
+        :raise: the error of the last call or CircuitOpenError
+        """
+        timeout = self.timeout(method)
+        hedged = self.hedge_delay is not None and method in self.idempotent_operations
+        max_attempts = self.max_attempts(method)
+        attempt = 0
+        while True:
+            attempt += 1
+            if self.circuit_breaker is not None:
+                self.circuit_breaker.before_call()
+            try:
+                if hedged:
+                    result = self.hedged_call(function, timeout)
+                else:
+                    result = function(timeout)
+            except Exception as err:
+                transient = is_transient(err)
+                if self.circuit_breaker is not None:
+                    self.circuit_breaker.record(transient)
+                if not transient or attempt >= max_attempts:
+                    raise
+                logger.info(u'{0} failed ({1!r}): retry {2}/{3}'.format(method, err, attempt, max_attempts - 1))
+                self.count('retries')
+                self.sleep(self.retry.delay(attempt))
+            else:
+                if self.circuit_breaker is not None:
+                    self.circuit_breaker.record(False)
+                return result
+
+    def hedged_call(self, function, timeout):
+        """
+        call function(timeout) in a thread and once more in another one if it has not returned
+        after hedge_delay seconds: return the first result, or raise the last error if both fail
+        """
+        results = queue.Queue()
+
+        def attempt():
+            try:
+                results.put((True, function(timeout)))
+            except Exception as err:
+                results.put((False, err))
+
+        def start():
+            thread = threading.Thread(target=attempt)
+            thread.daemon = True
+            thread.start()
+
+        start()
+        pending = 1
+        try:
+            succeeded, value = results.get(timeout=self.hedge_delay)
+        except queue.Empty:
+            self.count('hedges')
+            start()
+            pending += 1
+            succeeded, value = results.get()
+        pending -= 1
+        while not succeeded and pending:
+            # the other request may still succeed
+            succeeded, value = results.get()
+            pending -= 1
+        if succeeded:
+            return value
+        raise value
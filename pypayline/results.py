@@ -0,0 +1,319 @@
+# -*- coding: utf-8 -*-
+"""
+Python client for the Payline SOAP API
+Typed results: compact objects with the elements of the WSDL response types in __slots__,
+rather than the nested dictionnaries of the raw responses.
+
+    details = client.get_web_payment_details_result(token)
+    details.result.code, details.transaction.id, details.payment.amount, details.amount
+    details.billing_records  # converted on first access
+
+The rarely used elements (billing records of the web payments, buyer, extended card) are kept
+as they are received and converted on first access. as_dict() returns the raw response, without the empty elements
+"""
+
+from __future__ import print_function
+
+from decimal import Decimal
+
+import six
+from six.moves import intern
+
+
+# the shorter texts are shared by the results
+MAX_INTERNED_LENGTH = 20
+
+
+def amount_from_cents(value):
+    """Decimal amount of an amount in cents (int or text). None if it is not a number"""
+    try:
+        amount = int(value)
+    except (TypeError, ValueError):
+        return None
+    return Decimal(amount) / 100
+
+
+def as_bool(value):
+    """the flags are 0/1 texts on the wire and booleans in the mock"""
+    if value is None or value == u'':
+        return None
+    if isinstance(value, six.string_types):
+        return value.lower() in (u'1', u'true')
+    return bool(value)
+
+
+def list_of(result_class, item_name):
+    """
+    converter of a list of the WSDL (billingRecordList...): a tuple of result_class objects.
+    The items are given without their item element by the streaming parser, with it by pysimplesoap
+    """
+    def convert(value):
+        if isinstance(value, dict) and list(value.keys()) == [item_name]:
+            value = value[item_name]
+        if value is None:
+            return ()
+        if not isinstance(value, list):
+            value = [value]
+        return tuple(
+            result_class(item[item_name] if isinstance(item, dict) and list(item.keys()) == [item_name] else item)
+            for item in value
+        )
+    return convert
+
+
+class LazyElement(object):
+    """an element kept as it is received and converted on first access"""
+
+    def __init__(self, name, convert):
+        self.name = name
+        self.slot = '_' + name
+        self.convert = convert
+
+    def __get__(self, instance, owner):
+        if instance is None:
+            return self
+        value = getattr(instance, self.slot)
+        if isinstance(value, (dict, list)):
+            value = self.convert(value)
+            setattr(instance, self.slot, value)
+        return value
+
+    def __set__(self, instance, value):
+        setattr(instance, self.slot, value)
+
+
+class ResultType(type):
+    """metaclass of the typed results: the __slots__ are the fields of the WSDL type"""
+
+    def __new__(mcs, name, bases, namespace):
+        lazy = namespace.get('lazy', {})
+        slots = [(u'_' + field) if field in lazy else field for field in namespace.get('fields', ())]
+        if not any(hasattr(base, '_extra') for base in bases):
+            slots.append('_extra')
+        namespace['__slots__'] = tuple(str(slot) for slot in slots)
+        for field, convert in lazy.items():
+            namespace[field] = LazyElement(field, convert)
+        return type.__new__(mcs, name, bases, namespace)
+
+
+class ResultObject(six.with_metaclass(ResultType, object)):
+    """
+    Base class of the typed results. The elements of the response which are not in the WSDL type
+    are kept in a dictionnary, only if there are some
+    """
+    # elements of the WSDL type, in the xsd:sequence order
+    fields = ()
+    # {field: class or converter} of the complex elements converted on construction
+    nested = {}
+    # {field: converter} of the complex elements converted on first access
+    lazy = {}
+
+    def __init__(self, data=None):
+        """
+        :param data : dictionnary of a raw response or of one of its elements
+        """
+        data = data or {}
+        extra = None
+        for name, value in data.items():
+            if name not in self.fields:
+                if extra is None:
+                    extra = {}
+                extra[name] = value
+        self._extra = extra
+        for name in self.fields:
+            value = data.get(name)
+            if isinstance(value, str) and len(value) <= MAX_INTERNED_LENGTH:
+                # the codes, dates, flags... are the same in many results
+                value = intern(value)
+            elif value is not None and name in self.nested and isinstance(value, (dict, list)):
+                value = self.nested[name](value)
+            setattr(self, name, value)
+
+    def get(self, name, default=None):
+        """value of an element, including the elements which are not in the WSDL type"""
+        if name in self.fields:
+            return getattr(self, name)
+        return (self._extra or {}).get(name, default)
+
+    def as_dict(self):
+        """the raw data: nested dictionnaries as returned by the backend, without the empty elements"""
+        data = {}
+        for name in self.fields:
+            # the lazy elements are not converted
+            value = getattr(self, u'_' + name if name in self.lazy else name)
+            if isinstance(value, ResultObject):
+                value = value.as_dict()
+            elif isinstance(value, tuple):
+                value = [item.as_dict() if isinstance(item, ResultObject) else item for item in value]
+            if value is not None:
+                data[name] = value
+        if self._extra:
+            data.update(self._extra)
+        return data
+
+    def __getstate__(self):
+        return self.as_dict()
+
+    def __setstate__(self, state):
+        self.__init__(state)
+
+    def __eq__(self, other):
+        return type(self) is type(other) and self.as_dict() == other.as_dict()
+
+    def __ne__(self, other):
+        return not self == other
+
+    __hash__ = None
+
+    def __repr__(self):
+        values = u', '.join(
+            u'{0}={1!r}'.format(name, getattr(self, name)) for name in self.fields
+            if name not in self.lazy and getattr(self, name) is not None
+        )
+        return u'<{0} {1}>'.format(self.__class__.__name__, values)
+
+
+class Result(ResultObject):
+    """result of an operation"""
+    fields = ('code', 'shortMessage', 'longMessage', 'partnerCode', 'partnerCodeLabel')
+
+
+class Transaction(ResultObject):
+    """a transaction"""
+    fields = (
+        'id', 'date', 'isDuplicated', 'isPossibleFraud', 'fraudResult', 'fraudResultDetails', 'explanation',
+        'threeDSecure', 'softDescriptor', 'score', 'externalWalletType', 'externalWalletContractNumber',
+        'partnerAdditionalData', 'avs'
+    )
+
+    @property
+    def is_possible_fraud(self):
+        return as_bool(self.isPossibleFraud)
+
+
+class Payment(ResultObject):
+    """a payment: the amount is in cents and the currency is the ISO 4217 code"""
+    fields = (
+        'amount', 'currency', 'action', 'mode', 'contractNumber', 'differedActionDate', 'method',
+        'softDescriptor', 'cardBrand', 'registrationToken'
+    )
+
+
+class Order(ResultObject):
+    """an order"""
+    fields = (
+        'ref', 'origin', 'country', 'taxes', 'amount', 'currency', 'date', 'details', 'deliveryTime',
+        'deliveryMode', 'deliveryExpectedDate', 'deliveryExpectedDelay', 'deliveryCharge'
+    )
+
+
+class Card(ResultObject):
+    """a card: the number is masked"""
+    fields = ('number', 'type', 'expirationDate', 'cardholder', 'token')
+
+
+class ExtendedCard(ResultObject):
+    """details of a card"""
+    fields = ('country', 'isCvd', 'bank', 'type', 'network', 'product')
+
+
+class Authorization(ResultObject):
+    """an authorization"""
+    fields = ('number', 'date')
+
+
+class Buyer(ResultObject):
+    """a buyer: the addresses are kept as dictionnaries"""
+    fields = (
+        'title', 'lastName', 'firstName', 'email', 'shippingAdress', 'billingAddress', 'accountCreateDate',
+        'accountAverageAmount', 'accountOrderCount', 'walletId', 'walletDisplayed', 'walletSecured',
+        'walletCardInd', 'ip', 'mobilePhone', 'customerId', 'legalStatus', 'legalDocument', 'birthDate',
+        'fingerprintID', 'deviceFingerprint', 'isBot', 'isIncognito', 'isBehindProxy', 'isFromTor', 'isEmulator',
+        'isRooted', 'hasTimezoneMismatch'
+    )
+
+
+class Recurring(ResultObject):
+    """schedule of a recurring payment"""
+    fields = (
+        'firstAmount', 'amount', 'billingCycle', 'billingLeft', 'billingDay', 'startDate', 'endDate', 'newAmount',
+        'amountModificationDate'
+    )
+
+
+class BillingRecord(ResultObject):
+    """a due date of a recurring payment"""
+    fields = ('date', 'amount', 'status', 'result', 'transaction', 'authorization', 'nbTry', 'rank')
+    nested = {'result': Result, 'transaction': Transaction, 'authorization': Authorization}
+
+
+class ResponseResult(ResultObject):
+    """Base class of the responses"""
+
+    @property
+    def result_code(self):
+        """the API result code"""
+        return self.result.code if isinstance(self.result, Result) else u''
+
+    @property
+    def billing_records(self):
+        """tuple of the BillingRecord"""
+        return self.billingRecordList or ()
+
+
+class WebPaymentDetails(ResponseResult):
+    """response of getWebPaymentDetails"""
+    fields = (
+        'result', 'transaction', 'payment', 'authorization', 'privateDataList', 'paymentRecordId',
+        'billingRecordList', 'authentication3DSecure', 'card', 'extendedCard', 'order', 'paymentAdditionalList',
+        'media', 'numberOfAttempt', 'wallet', 'contractNumberWalletList', 'contractNumber', 'bankAccountData',
+        'subMerchant', 'buyer'
+    )
+    nested = {
+        'result': Result, 'transaction': Transaction, 'payment': Payment, 'authorization': Authorization,
+        'card': Card, 'order': Order,
+    }
+    lazy = {
+        'billingRecordList': list_of(BillingRecord, 'billingRecord'),
+        'extendedCard': ExtendedCard,
+        'buyer': Buyer,
+    }
+
+    @property
+    def is_transaction_ok(self):
+        """no fraud detected. None if unknown"""
+        if not isinstance(self.transaction, Transaction):
+            return None
+        is_possible_fraud = self.transaction.is_possible_fraud
+        return None if is_possible_fraud is None else not is_possible_fraud
+
+    @property
+    def order_ref(self):
+        return self.order.ref if isinstance(self.order, Order) else None
+
+    @property
+    def amount(self):
+        """the paid amount as a Decimal"""
+        return amount_from_cents(self.payment.amount) if isinstance(self.payment, Payment) else None
+
+
+class PaymentRecord(ResponseResult):
+    """response of getPaymentRecord"""
+    fields = (
+        'result', 'recurring', 'isDisabled', 'disableDate', 'billingRecordList', 'privateDataList', 'order',
+        'walletId'
+    )
+    # the billing records are the main part of the response: they are not lazy
+    nested = {
+        'result': Result, 'recurring': Recurring, 'order': Order,
+        'billingRecordList': list_of(BillingRecord, 'billingRecord'),
+    }
+
+    @property
+    def order_ref(self):
+        return self.order.ref if isinstance(self.order, Order) else None
+
+    @property
+    def amount(self):
+        """the amount of the due dates as a Decimal"""
+        return amount_from_cents(self.recurring.amount) if isinstance(self.recurring, Recurring) else None
@@ -0,0 +1,269 @@
+# -*- coding: utf-8 -*-
+"""
+Python client for the Payline SOAP API
+Schedules of the recurring payments (NX mode): amounts and due dates of the installments, with the
+rules of do_web_payment. The amount is split in equal installments in cents and the remainder is
+added to the first one (firstAmount).
+
+    recurring = recurring_request(1250, 4, MONTHLY)  # the recurring element of doWebPayment
+
+Schedules computes the calendars of many plans at once, in arrays: the plans with the same
+billing cycle, number of installments and start date share their computed dates.
+
+    schedules = Schedules(amounts, times, billing_cycles, start_dates)
+    schedules.installments(0)  # [(date, amount in cents)...]
+    schedules.cash_flow(by_month=True)  # [((year, month), amount in cents)...]
+"""
+
+from __future__ import print_function
+
+import calendar
+import operator
+from array import array
+from datetime import date
+from itertools import chain, repeat
+
+from six.moves import map, zip
+
+from pypayline.exceptions import ArgumentsError
+
+try:
+    from itertools import accumulate
+except ImportError:
+    # Python 2
+    def accumulate(values):
+        total = 0
+        for value in values:
+            total += value
+            yield total
+
+
+# the billingCycle codes of Payline
+DAILY = 10
+WEEKLY = 20
+TWICE_A_MONTH = 30
+MONTHLY = 40
+EVERY_TWO_MONTHS = 50
+QUARTERLY = 60
+HALF_YEARLY = 70
+YEARLY = 80
+EVERY_TWO_YEARS = 90
+
+# {billing cycle: (half months, days)} between two installments
+BILLING_CYCLES = {
+    DAILY: (0, 1),
+    WEEKLY: (0, 7),
+    TWICE_A_MONTH: (1, 0),
+    MONTHLY: (2, 0),
+    EVERY_TWO_MONTHS: (4, 0),
+    QUARTERLY: (6, 0),
+    HALF_YEARLY: (12, 0),
+    YEARLY: (24, 0),
+    EVERY_TWO_YEARS: (48, 0),
+}
+
+# {recurring_period_in_months of do_web_payment: billing cycle}
+MONTHS_BILLING_CYCLES = {
+    1: MONTHLY,
+    2: EVERY_TWO_MONTHS,
+    3: QUARTERLY,
+    6: HALF_YEARLY,
+    12: YEARLY,
+    24: EVERY_TWO_YEARS,
+}
+
+# days between the two installments of a month when paying twice a month
+HALF_MONTH_DAYS = 15
+
+# typecode of the arrays: 64 bits, the sums of amounts in cents overflow 32 bits. Python 2 has no 'q':
+# its 'l' has 64 bits on the 64-bit Unix systems
+try:
+    ARRAY_TYPE = array('q').typecode
+except ValueError:
+    ARRAY_TYPE = 'l'
+
+
+def to_cents(amount):
+    """amount in cents of a Decimal amount, truncated as by do_web_payment"""
+    return int(amount * 100)
+
+
+def split_amount(total, times):
+    """
+    (first amount, amount) of the installments of a total amount in cents: the remainder of the
+    division is added to the first installment
+    """
+    if times < 1:
+        raise ArgumentsError(u'The recurring_times argument should be a positive integer')
+    amount = total // times
+    return amount + (total - times * amount), amount
+
+
+def get_billing_cycle(recurring_period_in_months=None, billing_cycle=None):
+    """
+    the Payline billing cycle of a recurring payment
+    :param recurring_period_in_months : months between two installments: 1, 2, 3, 6, 12 or 24
+    :param billing_cycle : Payline code of the billing cycle (10 for daily... see BILLING_CYCLES)
+    :raise: ArgumentsError if no valid period is given
+    """
+    if billing_cycle is not None:
+        try:
+            billing_cycle = int(billing_cycle)
+        except (TypeError, ValueError):
+            raise ArgumentsError(u'The billing_cycle argument should be an interger value')
+        if billing_cycle not in BILLING_CYCLES:
+            raise ArgumentsError(u'The billing_cycle argument should be in {0}'.format(
+                u', '.join(str(cycle) for cycle in sorted(BILLING_CYCLES))
+            ))
+        return billing_cycle
+    if recurring_period_in_months is None:
+        raise ArgumentsError(u'The recurring_period_in_months argument should be set with interger values')
+    try:
+        return MONTHS_BILLING_CYCLES[int(recurring_period_in_months)]
+    except (TypeError, ValueError):
+        raise ArgumentsError(u'The recurring_period_in_months argument should be an interger value')
+    except KeyError:
+        raise ArgumentsError(u'The recurring_period_in_months argument should be in 1, 2, 3, 6, 12 or 24 months')
+
+
+def recurring_request(total, times, billing_cycle):
+    """the recurring element of doWebPayment for an amount in cents paid in several times"""
+    first_amount, amount = split_amount(total, times)
+    return {
+        'billingLeft': times,
+        'firstAmount': first_amount,
+        'amount': amount,
+        'billingCycle': billing_cycle,
+    }
+
+
+class MonthTable(object):
+    """ordinal of the first day and length of the months, by month index (year * 12 + month - 1)"""
+
+    def __init__(self):
+        self.firsts = {}
+        self.lengths = {}
+
+    def load(self, month_index):
+        year, month = divmod(month_index, 12)
+        self.firsts[month_index] = date(year, month + 1, 1).toordinal()
+        self.lengths[month_index] = calendar.monthrange(year, month + 1)[1]
+
+    def add_months(self, year, month, day, months):
+        """ordinal of the day of the month months after (year, month): the last day of shorter months"""
+        month_index = year * 12 + month - 1 + months
+        if month_index not in self.firsts:
+            self.load(month_index)
+        return self.firsts[month_index] + min(day, self.lengths[month_index]) - 1
+
+
+class Schedules(object):
+    """
+    Calendars of the installments of many recurring plans. The plans are stored in columns (arrays
+    with an item by plan) and the installments of all the plans in two flat arrays of dates
+    (ordinals) and amounts in cents: the installments of the plan i are in [offsets[i]:offsets[i + 1]].
+    The columns are computed from each other by map and itertools, without a loop by plan
+    """
+
+    def __init__(self, amounts, times, billing_cycles, start_dates=None, in_cents=False):
+        """
+        :param amounts : total amounts of the plans (Decimal, or in cents if in_cents)
+        :param times : numbers of installments
+        :param billing_cycles : Payline billing cycles (see BILLING_CYCLES)
+        :param start_dates : dates (or ordinals) of the first installments. Today if None
+        :param in_cents : the amounts are in cents
+        """
+        self.totals = array(ARRAY_TYPE, amounts if in_cents else map(to_cents, amounts))
+        self.times = array(ARRAY_TYPE, times)
+        self.billing_cycles = array(ARRAY_TYPE, billing_cycles)
+        if start_dates is None:
+            self.start_dates = array(ARRAY_TYPE, [date.today().toordinal()]) * len(self.totals)
+        else:
+            self.start_dates = array(ARRAY_TYPE, (
+                start_date if isinstance(start_date, int) else start_date.toordinal() for start_date in start_dates
+            ))
+        if not len(self.totals) == len(self.times) == len(self.billing_cycles) == len(self.start_dates):
+            raise ArgumentsError(u'The columns of the plans should have the same length')
+        for billing_cycle in set(self.billing_cycles):
+            get_billing_cycle(billing_cycle=billing_cycle)
+        if self.times and min(self.times) < 1:
+            raise ArgumentsError(u'The recurring_times argument should be a positive integer')
+        self.compute()
+
+    def compute(self):
+        """fill the columns of the amounts and the installments (see split_amount)"""
+        self.amounts = array(ARRAY_TYPE, map(operator.floordiv, self.totals, self.times))
+        remainders = map(operator.sub, self.totals, map(operator.mul, self.amounts, self.times))
+        self.first_amounts = array(ARRAY_TYPE, map(operator.add, self.amounts, remainders))
+        self.offsets = array(ARRAY_TYPE, [0])
+        self.offsets.extend(accumulate(self.times))
+
+        # the plans with the same start date, billing cycle and number of installments share their calendar
+        keys = list(zip(self.start_dates, self.billing_cycles, self.times))
+        months = MonthTable()
+        calendars = dict((key, self.calendar(months, *key)) for key in set(keys))
+        self.dates = array(ARRAY_TYPE, chain.from_iterable(map(calendars.__getitem__, keys)))
+        # the first amount then times - 1 amounts by plan
+        self.installment_amounts = array(ARRAY_TYPE, chain.from_iterable(map(
+            chain, zip(self.first_amounts), map(repeat, self.amounts, map(operator.sub, self.times, repeat(1)))
+        )))
+
+    @staticmethod
+    def calendar(months, start, billing_cycle, times):
+        """array of the ordinals of the installments"""
+        half_months, days = BILLING_CYCLES[billing_cycle]
+        if not half_months:
+            return array(ARRAY_TYPE, range(start, start + days * times, days))
+        start_date = date.fromordinal(start)
+        return array(ARRAY_TYPE, [
+            months.add_months(start_date.year, start_date.month, start_date.day, rank * half_months // 2) +
+            (HALF_MONTH_DAYS if rank * half_months % 2 else 0)
+            for rank in range(times)
+        ])
+
+    def __len__(self):
+        return len(self.totals)
+
+    @property
+    def remainders(self):
+        """the remainders of the divisions, added to the first installments"""
+        return array(ARRAY_TYPE, (first - amount for first, amount in zip(self.first_amounts, self.amounts)))
+
+    def installments(self, index):
+        """[(date, amount in cents)...] of the installments of a plan"""
+        start, end = self.offsets[index], self.offsets[index + 1]
+        return [
+            (date.fromordinal(ordinal), amount)
+            for ordinal, amount in zip(self.dates[start:end], self.installment_amounts[start:end])
+        ]
+
+    def recurring(self, index):
+        """the recurring element of doWebPayment of a plan"""
+        return {
+            'billingLeft': self.times[index],
+            'firstAmount': self.first_amounts[index],
+            'amount': self.amounts[index],
+            'billingCycle': self.billing_cycles[index],
+        }
+
+    def cash_flow(self, start_date=None, end_date=None, by_month=False):
+        """
+        sum of the installments of all the plans by day, or by month
+        :param start_date : first day taken into account (date)
+        :param end_date : last day taken into account (date)
+        :param by_month : group the installments by month rather than by day
+        :return: sorted list of (date or (year, month), amount in cents)
+        """
+        first = start_date.toordinal() if start_date is not None else None
+        last = end_date.toordinal() if end_date is not None else None
+        by_day = {}
+        for ordinal, amount in zip(self.dates, self.installment_amounts):
+            by_day[ordinal] = by_day.get(ordinal, 0) + amount
+        totals = {}
+        for ordinal, amount in by_day.items():
+            if (first is not None and ordinal < first) or (last is not None and ordinal > last):
+                continue
+            day = date.fromordinal(ordinal)
+            key = (day.year, day.month) if by_month else day
+            totals[key] = totals.get(key, 0) + amount
+        return sorted(totals.items())
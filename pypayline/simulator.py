@@ -0,0 +1,388 @@
+# -*- coding: utf-8 -*-
+"""
+Python client for the Payline SOAP API
+Local simulator of the Payline SOAP services for the end-to-end and load tests. The requests
+go through the whole XML and HTTP stack and are answered with the scenarios of the mock backend
+(amount-driven result codes, fraud threshold...)
+
+    python -m pypayline.simulator --port 8080 --latency 0.05 --fault-rate 0.01
+
+    client = WebPaymentAPI(merchant_id=u"12345678901234", access_key=u"abCdeFgHiJKLmNoPqrst",
+                           contract_number=u"1234567", homologation='http://127.0.0.1:8080')
+"""
+
+from __future__ import print_function
+
+import argparse
+import logging
+import os
+import random
+import re
+import sys
+import threading
+import time
+from xml.etree import ElementTree
+
+import six
+from pysimplesoap.client import soap_namespaces
+from pysimplesoap.helpers import Struct
+from six.moves import BaseHTTPServer, socketserver
+
+from pypayline.backends.mock import SoapMockBackend
+from pypayline.backends.parser import ResponseHandler, UnsupportedResponse, compile_node, repeated_elements
+from pypayline.backends.serializer import escape, to_text
+from pypayline.exceptions import PaylineApiError, PaylineAuthError
+from pypayline.wsdl import get_service_model
+
+
+logger = logging.getLogger(u'pypayline')
+
+
+API_NAMES = ('WebPaymentAPI', 'DirectPaymentAPI', 'MassPaymentAPI', 'ExtendedAPI')
+
+DEFAULT_HOST = '127.0.0.1'
+DEFAULT_PORT = 8080
+
+SERVICE_PATH = re.compile(r'^/V4/services/(?P<api_name>\w+)/?$')
+
+# first element of the SOAP body
+REQUEST_ELEMENT = re.compile(br'<(?:\w+:)?Body[^>]*>\s*<(?:\w+:)?(\w+)')
+
+ENVELOPE_START = (
+    u'<?xml version="1.0" encoding="UTF-8"?>\n'
+    u'<soapenv:Envelope xmlns:soapenv="{soap_uri}">\n'
+    u'<soapenv:Body>\n'
+)
+
+ENVELOPE_END = u'</soapenv:Body>\n</soapenv:Envelope>'
+
+FAULT = (
+    u'<soapenv:Fault><faultcode>soapenv:{code}</faultcode>'
+    u'<faultstring>{message}</faultstring></soapenv:Fault>\n'
+)
+
+
+def local_wsdl(api_name):
+    """url of the WSDL bundled with pypayline"""
+    return 'file://{0}/{1}.wsdl'.format(os.path.abspath(os.path.dirname(__file__)), api_name)
+
+
+def fault_response(message, code=u'Server'):
+    """SOAP fault envelope"""
+    return u''.join([
+        ENVELOPE_START.format(soap_uri=soap_namespaces['soap']),
+        FAULT.format(code=code, message=escape(message)),
+        ENVELOPE_END,
+    ]).encode('utf-8')
+
+
+def wrap_items(node, value):
+    """
+    the lists (resetAuthorizationList...) are given to the mock backend as the clients
+    build them: a list of {item name: item}
+    """
+    if node is None or value is None:
+        return value
+    if node.item_name is not None and isinstance(value, list):
+        item = node.elements[node.item_name]
+        return [{node.item_name: wrap_items(item.node, item_value)} for item_value in value]
+    if isinstance(value, dict):
+        for key, item_value in value.items():
+            element = node.elements.get(key)
+            if element is not None and element.node is not None:
+                if element.repeated and isinstance(item_value, list):
+                    value[key] = [wrap_items(element.node, item) for item in item_value]
+                else:
+                    value[key] = wrap_items(element.node, item_value)
+    return value
+
+
+def numeric_amounts(value):
+    """
+    the amounts are texts on the wire: convert them to int as the scenarios of the
+    mock backend expect
+    """
+    if isinstance(value, dict):
+        for key, item in value.items():
+            if key == 'amount' and isinstance(item, six.string_types) and re.match(r'^-?\d+$', item):
+                value[key] = int(item)
+            else:
+                numeric_amounts(item)
+    elif isinstance(value, list):
+        for item in value:
+            numeric_amounts(item)
+    return value
+
+
+class ResponseWriter(object):
+    """Write the response dictionnaries of the mock backend as SOAP responses with the types of the WSDL"""
+
+    def __init__(self, service_model):
+        self.service_model = service_model
+        self.repeated = repeated_elements(service_model.wsdl)
+
+    def write(self, operation, response):
+        """return the response envelope of an operation as utf-8 bytes"""
+        (output_name, root), = operation['output'].items()
+        parts = [
+            ENVELOPE_START.format(soap_uri=soap_namespaces['soap']),
+            u'<{0} xmlns="{1}">\n'.format(output_name, operation['namespace']),
+        ]
+        self.write_struct(parts, root, response, is_root=True)
+        parts.append(u'</{0}>\n'.format(output_name))
+        parts.append(ENVELOPE_END)
+        return u''.join(parts).encode('utf-8')
+
+    def write_struct(self, parts, struct, value, is_root=False):
+        """append the children elements of a complex value"""
+        type_name = struct.key[0] if isinstance(struct.key, tuple) else struct.key
+        if isinstance(value, list):
+            # the mock gives the lists (billingRecordList...) without their item element
+            item_name, = struct.keys()
+            value = {item_name: value}
+        if not isinstance(value, dict):
+            return
+        for name, field_type in struct.items():
+            field_value = value.get(name)
+            if field_value is None:
+                continue
+            # the children of the response element use its namespace
+            namespace = None if is_root else struct.namespaces.get(name)
+            is_repeated = (type_name, name) in self.repeated
+            if isinstance(field_type, list):
+                is_repeated = True
+                field_type = field_type[0] if field_type else str
+            items = field_value if is_repeated and isinstance(field_value, list) else [field_value]
+            for item in items:
+                self.write_element(parts, name, namespace, field_type, item)
+        for name, field_value in value.items():
+            if name not in struct and field_value is not None:
+                # not in the WSDL (failedObject of the mass traitments...): written as it is given
+                self.write_element(parts, name, None, Struct() if isinstance(field_value, dict) else str, field_value)
+
+    def write_element(self, parts, name, namespace, field_type, value):
+        """append an element"""
+        xmlns = u' xmlns="{0}"'.format(namespace) if namespace else u''
+        if isinstance(field_type, Struct):
+            children = []
+            self.write_struct(children, field_type, value)
+            if children:
+                parts.append(u'<{0}{1}>'.format(name, xmlns))
+                parts.extend(children)
+                parts.append(u'</{0}>\n'.format(name))
+            else:
+                parts.append(u'<{0}{1}/>\n'.format(name, xmlns))
+        else:
+            if isinstance(value, bool):
+                # Payline writes the flags as 0/1
+                value = int(value)
+            parts.append(u'<{0}{1}>{2}</{0}>\n'.format(name, xmlns, escape(to_text(value))))
+
+
+class SimulatedService(object):
+    """A Payline service answered by the scenarios of the mock backend"""
+
+    def __init__(self, api_name, cache=None):
+        self.api_name = api_name
+        self.service_model = get_service_model(api_name, local_wsdl(api_name), cache=cache)
+        self.writer = ResponseWriter(self.service_model)
+        service = self.service_model.services[api_name]
+        port, = service['ports'].values()
+        self.operations = port['operations']
+        # name of the request element: (operation, compiled type of the request)
+        self.requests = {}
+        compiled_nodes = {}
+        for name, operation in self.operations.items():
+            (input_name, root), = operation['input'].items()
+            try:
+                node = compile_node(root, self.writer.repeated, compiled_nodes)
+            except UnsupportedResponse:
+                continue
+            self.requests[input_name] = (name, node)
+
+    def parse_request(self, body):
+        """return (operation name, arguments) of a request"""
+        match = REQUEST_ELEMENT.search(body)
+        request = self.requests.get(match.group(1).decode('ascii')) if match else None
+        if request is None:
+            raise PaylineApiError(u'Unknown operation')
+        name, node = request
+        handler = ResponseHandler(node)
+        parser = ElementTree.XMLParser(target=handler)
+        parser.feed(body)
+        data = wrap_items(node, parser.close()) or {}
+        return name, numeric_amounts(data)
+
+    def call(self, name, backend, data):
+        """run the scenario of the mock backend and return the response dictionnary"""
+        if name == 'doWebPayment':
+            # the mock returns (redirect url, token) as the SOAP backend does
+            try:
+                _redirect_url, token = backend.doWebPayment(**data)
+            except PaylineApiError as err:
+                return backend.get_response(six.text_type(err))
+            return backend.get_response(token=token)
+        method = getattr(backend, name, None)
+        if method is None:
+            raise PaylineApiError(u'{0} is not supported by the simulator'.format(name))
+        return method(**data)
+
+    def handle(self, body, headers):
+        """return (HTTP status, response body)"""
+        try:
+            name, data = self.parse_request(body)
+        except Exception as err:
+            return 500, fault_response(u'Invalid request: {0}'.format(err), code=u'Client')
+
+        backend = SoapMockBackend(http_headers=headers, api_name=self.api_name)
+        try:
+            response = self.call(name, backend, data)
+        except PaylineAuthError:
+            return 401, b''
+        except PaylineApiError as err:
+            return 500, fault_response(six.text_type(err))
+        except Exception as err:
+            logger.exception(u'Simulator error in {0}'.format(name))
+            return 500, fault_response(u'{0}: {1}'.format(err.__class__.__name__, err))
+        return 200, self.writer.write(self.operations[name], response)
+
+
+class SimulatorHandler(BaseHTTPServer.BaseHTTPRequestHandler):
+    """HTTP handler of the simulator: keep-alive connections as the Payline servers"""
+    protocol_version = 'HTTP/1.1'
+    # the headers and the body are written separately: don't wait for the ACK of the headers
+    disable_nagle_algorithm = True
+
+    def do_POST(self):
+        body = self.rfile.read(int(self.headers.get('Content-Length') or 0))
+        status, content = self.server.simulator.respond(self.path, self.headers, body)
+        self.send_response(status)
+        self.send_header('Content-Type', 'text/xml; charset=utf-8')
+        self.send_header('Content-Length', str(len(content)))
+        self.end_headers()
+        self.wfile.write(content)
+
+    def log_message(self, format, *args):
+        logger.debug(u'simulator: ' + format, *args)
+
+
+class ThreadingHTTPServer(socketserver.ThreadingMixIn, BaseHTTPServer.HTTPServer):
+    daemon_threads = True
+    request_queue_size = 128
+
+
+class Simulator(object):
+    """
+    Local HTTP server of the Payline services. Use its url as the homologation argument
+    of the clients. The latency and the errors can be injected to test the retries and timeouts
+    """
+
+    def __init__(self, host=DEFAULT_HOST, port=DEFAULT_PORT, latency=0, jitter=0, fault_rate=0,
+                 http_error_rate=0, seed=None, api_names=API_NAMES, cache=None):
+        """
+        :param host : listening address
+        :param port : listening port. 0 picks a free port
+        :param latency : seconds waited before each response
+        :param jitter : random seconds (up to) added to the latency
+        :param fault_rate : part of the requests (0 to 1) answered by a SOAP fault
+        :param http_error_rate : part of the requests (0 to 1) answered by an HTTP 503 error
+        :param seed : seed of the random errors and jitter, for reproducible runs
+        :param api_names : simulated services
+        :param cache : compiled WSDL cache (see pypayline.wsdl.get_service_model)
+        """
+        self.latency = latency
+        self.jitter = jitter
+        self.fault_rate = fault_rate
+        self.http_error_rate = http_error_rate
+        self.random = random.Random(seed)
+        self.services = dict((api_name, SimulatedService(api_name, cache=cache)) for api_name in api_names)
+        self.requests_count = self.faults_count = self.http_errors_count = 0
+        self._lock = threading.Lock()
+        self.server = ThreadingHTTPServer((host, port), SimulatorHandler)
+        self.server.simulator = self
+        self.thread = None
+
+    @property
+    def url(self):
+        """base url to give as the homologation argument of the clients"""
+        host, port = self.server.server_address[:2]
+        return 'http://{0}:{1}'.format(host, port)
+
+    def injected(self):
+        """return (delay in seconds, injected error: None, 'fault' or 'http') of a request"""
+        with self._lock:
+            self.requests_count += 1
+            delay = self.latency + (self.random.uniform(0, self.jitter) if self.jitter else 0)
+            draw = self.random.random()
+            if draw < self.http_error_rate:
+                self.http_errors_count += 1
+                return delay, 'http'
+            if draw < self.http_error_rate + self.fault_rate:
+                self.faults_count += 1
+                return delay, 'fault'
+            return delay, None
+
+    def respond(self, path, headers, body):
+        """return (HTTP status, response body) of a request"""
+        delay, error = self.injected()
+        if delay > 0:
+            time.sleep(delay)
+
+        match = SERVICE_PATH.match(path)
+        service = self.services.get(match.group('api_name')) if match else None
+        if service is None:
+            return 404, b''
+        if error == 'http':
+            return 503, b''
+        if error == 'fault':
+            return 500, fault_response(u'Injected fault')
+        return service.handle(body, {'Authorization': headers.get('Authorization')})
+
+    def start(self):
+        """serve in a background thread"""
+        self.thread = threading.Thread(target=self.server.serve_forever, name=u'pypayline-simulator')
+        self.thread.daemon = True
+        self.thread.start()
+        return self
+
+    def serve_forever(self):
+        """serve in the current thread"""
+        self.server.serve_forever()
+
+    def close(self):
+        """stop the server"""
+        if self.thread is not None:
+            self.server.shutdown()
+            self.thread = None
+        self.server.server_close()
+
+
+def main(args=None):
+    """command line: python -m pypayline.simulator"""
+    parser = argparse.ArgumentParser(description=u'Local simulator of the Payline SOAP services')
+    parser.add_argument('--host', default=DEFAULT_HOST)
+    parser.add_argument('--port', type=int, default=DEFAULT_PORT)
+    parser.add_argument('--latency', type=float, default=0, help=u'seconds waited before each response')
+    parser.add_argument('--jitter', type=float, default=0, help=u'random seconds added to the latency')
+    parser.add_argument('--fault-rate', type=float, default=0, help=u'part of the requests answered by a SOAP fault')
+    parser.add_argument('--http-error-rate', type=float, default=0,
+                        help=u'part of the requests answered by an HTTP 503 error')
+    parser.add_argument('--seed', type=int, default=None)
+    options = parser.parse_args(args)
+
+    simulator = Simulator(
+        host=options.host, port=options.port, latency=options.latency, jitter=options.jitter,
+        fault_rate=options.fault_rate, http_error_rate=options.http_error_rate, seed=options.seed, cache=True
+    )
+    print(u'Payline simulator listening on {0} (homologation={0!r})'.format(simulator.url))
+    sys.stdout.flush()
+    try:
+        simulator.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        simulator.close()
+
+
+if __name__ == '__main__':
+    main()
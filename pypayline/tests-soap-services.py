@@ -5,14 +5,42 @@ Python client for the Payline SOAP API
 
 from datetime import datetime
 from decimal import Decimal
+import hashlib
 import logging
 import re
 import sys
 import unittest
 import os
+import shutil
+import socket
+import subprocess
+import tempfile
+import threading
+import time
 
-from pypayline.client import PaylineBaseAPI, WebPaymentAPI, DirectPaymentAPI
-from pypayline.exceptions import InvalidCurrencyError, PaylineApiError, PaylineAuthError
+from pypayline.client import PaylineBaseAPI, WebPaymentAPI, DirectPaymentAPI, MassPaymentAPI, ExtendedAPI
+from pypayline.exceptions import CircuitOpenError, InvalidCurrencyError, PaylineApiError, PaylineAuthError
+from pypayline import codegen, pruning, wsdl
+from pypayline.backends.generated import get_generated_module
+from pypayline.backends.generated.operations import SERVICE_OPERATIONS
+from pypayline.backends.serializer import EnvelopeSerializer, escape
+from pypayline.backends.soap import SoapBackend, prepare_soap_request, parse_soap_response
+from pypayline.backends.transport import HttpTransport
+from pypayline.pool import PaylineClientPool
+from pypayline.resilience import CircuitBreaker, ResiliencePolicy, RetryPolicy
+from pypayline import results
+from pypayline.instrumentation import HistogramCollector, Hook, PrometheusHook, add_hook, remove_hook
+from pypayline.simulator import ResponseWriter, Simulator
+
+try:
+    import asyncio
+    from pypayline.aioclient import AsyncWebPaymentAPI
+    from pypayline.backends.aiotransport import AsyncHttpTransport
+except (ImportError, SyntaxError):
+    asyncio = None
+
+from pysimplesoap.client import SoapFault
+from six.moves import BaseHTTPServer, http_client, socketserver
 
 
 logger = logging.getLogger('pypayline')
@@ -61,6 +89,11 @@ class PaylineBaseAPITestCase(unittest.TestCase):
             'https://homologation.payline.com/V4/services/SampleAPI'
         )
 
+    def test_soap_url_base_url(self):
+        self.api.api_name = 'SampleAPI'
+        self.api.sandbox = 'http://127.0.0.1:8080/'
+        self.assertEqual(self.api.soap_url, 'http://127.0.0.1:8080/V4/services/SampleAPI')
+
     def test_soap_wsdl_url_is_local(self):
         url = self.api.soap_wsdl_url
         self.assertTrue(url.startswith('file://'))
@@ -82,24 +115,44 @@ class PaylineBaseAPITestCase(unittest.TestCase):
 
 class WebPaymentAPITestCase(unittest.TestCase):
 
+    @classmethod
+    def setUpClass(cls):
+        cls.simulator = Simulator(port=0, api_names=('WebPaymentAPI', )).start()
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.simulator.close()
+
     def setUp(self):
-        self.api = WebPaymentAPI('1234', 'ABCD', 'contract1,contract2')
-        # Ensure we don't make any network call
-        self.api.backend.soap_client.location = 'test'
+        self.api = WebPaymentAPI(u'12345678901234', u'abCdeFgHiJKLmNoPqrst', 'contract1,contract2')
+        # Ensure we don't make any network call: the requests are sent to the local simulator
+        self.api.backend.soap_client.location = '{0}/V4/services/WebPaymentAPI'.format(self.simulator.url)
 
     def test_soap_url(self):
         self.assertEqual(os.path.basename(self.api.soap_url), 'WebPaymentAPI')
 
     def test_soap_wsdl_url(self):
+        self.assertEqual(os.path.basename(self.api.soap_wsdl_url),
+                         'WebPaymentAPI.pruned.wsdl')
+        self.api.full_wsdl = True
         self.assertEqual(os.path.basename(self.api.soap_wsdl_url),
                          'WebPaymentAPI.wsdl')
 
     def test_do_web_payment(self):
-        self.api.do_web_payment(
+        redirect_url, token = self.api.do_web_payment(
             amount=Decimal("12.50"), currency=u"EUR", order_ref='ref1',
             return_url='http://freexian.com/success/',
             cancel_url='http://freexian.com/cancel/',
         )
+        self.assertTrue(token)
+        self.assertIn(token, redirect_url)
+
+    def test_invalid_location(self):
+        self.api.backend.soap_client.location = 'test'
+        self.assertRaises(
+            ValueError, self.api.do_web_payment, amount=Decimal("12.50"), currency=u"EUR", order_ref='ref1',
+            return_url='http://freexian.com/success/', cancel_url='http://freexian.com/cancel/',
+        )
 
 class DirectPaymentAPITestCase(unittest.TestCase):
 
@@ -113,9 +166,1272 @@ class DirectPaymentAPITestCase(unittest.TestCase):
                          'DirectPaymentAPI')
 
     def test_soap_wsdl_url(self):
+        self.assertEqual(os.path.basename(self.api.soap_wsdl_url),
+                         'DirectPaymentAPI.pruned.wsdl')
+        self.api.full_wsdl = True
         self.assertEqual(os.path.basename(self.api.soap_wsdl_url),
                          'DirectPaymentAPI.wsdl')
 
 
+GET_MASS_TRAITMENT_DETAILS_RESPONSE = b"""<?xml version="1.0" encoding="UTF-8"?>
+<soapenv:Envelope xmlns:soapenv="http://schemas.xmlsoap.org/soap/envelope/">
+<soapenv:Body>
+<getMassTraitmentDetailsResponse xmlns="http://impl.ws.payline.experian.com">
+<result><code xmlns="http://obj.ws.payline.experian.com">00000</code></result>
+<massTraitementID>12</massTraitementID>
+<totalLinesNumber>3</totalLinesNumber>
+<failedLinesNumber>2</failedLinesNumber>
+<failedListObject>
+<failedObject><transactionID xmlns="http://obj.ws.payline.experian.com">1</transactionID>
+<result><code xmlns="http://obj.ws.payline.experian.com">02301</code></result></failedObject>
+<failedObject><transactionID xmlns="http://obj.ws.payline.experian.com">2</transactionID>
+<result><code xmlns="http://obj.ws.payline.experian.com">02301</code></result></failedObject>
+</failedListObject>
+</getMassTraitmentDetailsResponse>
+</soapenv:Body>
+</soapenv:Envelope>"""
+
+
+class MassPaymentAPITestCase(unittest.TestCase):
+
+    def setUp(self):
+        self.api = MassPaymentAPI('1234', 'ABCD', 'contract1')
+
+    def test_soap_url(self):
+        self.assertEqual(os.path.basename(self.api.soap_url), 'MassPaymentAPI')
+
+    def test_soap_wsdl_url(self):
+        self.assertEqual(os.path.basename(self.api.soap_wsdl_url), 'MassPaymentAPI.pruned.wsdl')
+        self.api.full_wsdl = True
+        self.assertEqual(os.path.basename(self.api.soap_wsdl_url), 'MassPaymentAPI.wsdl')
+
+    def test_do_mass_capture_request(self):
+        request = self.api.backend.prepare_request(
+            'doMassCapture', version='19', comment=None, captureAuthorizationList=[
+                {'capture': {'transactionID': '1', 'payment': self.api.build_payment(Decimal('1'), 'EUR', 201)}},
+                {'capture': {'transactionID': '2', 'payment': self.api.build_payment(Decimal('2'), 'EUR', 201)}},
+            ]
+        )
+        self.assertEqual(request.headers['SOAPAction'], 'doMassCapture')
+        self.assertEqual(request.body.count(b'<capture xmlns="http://obj.ws.payline.experian.com">'), 2)
+        self.assertTrue(b'<captureAuthorizationList xmlns="http://impl.ws.payline.experian.com"><capture' in request.body)
+
+    def test_do_mass_reset_request(self):
+        request = self.api.backend.prepare_request(
+            'doMassReset', version='19', comment='c',
+            resetAuthorizationList=[{'transactionID': '1'}, {'transactionID': '2'}]
+        )
+        self.assertTrue(
+            b'<resetAuthorizationList xmlns="http://impl.ws.payline.experian.com">'
+            b'<transactionID xmlns="http://obj.ws.payline.experian.com">1</transactionID>'
+            b'<transactionID xmlns="http://obj.ws.payline.experian.com">2</transactionID>'
+            b'</resetAuthorizationList>' in request.body
+        )
+
+    def test_mass_traitment_details(self):
+        data = self.api.backend.parse_response('getMassTraitmentDetails', GET_MASS_TRAITMENT_DETAILS_RESPONSE)
+        result_code, total_lines, failed_lines, failed, data = self.api.parse_mass_traitment_details(data)
+        self.assertEqual(result_code, '00000')
+        self.assertEqual((total_lines, failed_lines), (3, 2))
+        self.assertEqual([item['transactionID'] for item in failed], ['1', '2'])
+
+
+TRANSACTIONS_SEARCH_RESPONSE = b"""<?xml version="1.0" encoding="UTF-8"?>
+<soapenv:Envelope xmlns:soapenv="http://schemas.xmlsoap.org/soap/envelope/">
+<soapenv:Body>
+<transactionsSearchResponse xmlns="http://impl.ws.payline.experian.com">
+<result><code xmlns="http://obj.ws.payline.experian.com">00000</code></result>
+<transactionList>
+<transaction xmlns="http://obj.ws.payline.experian.com"><id>1</id><date>01/06/2016 10:00</date></transaction>
+<transaction xmlns="http://obj.ws.payline.experian.com"><id>2</id><date>01/06/2016 10:01</date></transaction>
+</transactionList>
+</transactionsSearchResponse>
+</soapenv:Body>
+</soapenv:Envelope>"""
+
+
+class ExtendedAPITestCase(unittest.TestCase):
+
+    def setUp(self):
+        self.api = ExtendedAPI('1234', 'ABCD', 'contract1')
+
+    def test_soap_url(self):
+        self.assertEqual(os.path.basename(self.api.soap_url), 'ExtendedAPI')
+
+    def test_soap_wsdl_url(self):
+        self.assertEqual(os.path.basename(self.api.soap_wsdl_url), 'ExtendedAPI.pruned.wsdl')
+        self.api.full_wsdl = True
+        self.assertEqual(os.path.basename(self.api.soap_wsdl_url), 'ExtendedAPI.wsdl')
+
+    def test_transactions_search_request(self):
+        request = self.api.backend.prepare_request(
+            'transactionsSearch', version='19', startDate='01/06/2016 00:00', endDate='01/06/2016 23:59',
+            orderRef='ref1'
+        )
+        self.assertEqual(request.headers['SOAPAction'], 'transactionsSearch')
+        self.assertTrue(b'<orderRef>ref1</orderRef><startDate>01/06/2016 00:00</startDate>' in request.body)
+
+    def test_transactions_search_response(self):
+        data = self.api.backend.parse_response('transactionsSearch', TRANSACTIONS_SEARCH_RESPONSE)
+        self.assertEqual(data['transactionList'], [
+            {'id': '1', 'date': '01/06/2016 10:00'}, {'id': '2', 'date': '01/06/2016 10:01'}
+        ])
+
+
+class ServiceModelRegistryTestCase(unittest.TestCase):
+
+    def test_wsdl_parsed_once(self):
+        api1 = WebPaymentAPI('1234', 'ABCD', 'contract1')
+        api2 = WebPaymentAPI('5678', 'EFGH', 'contract2', homologation=True)
+        self.assertIs(api1.backend.service_model, api2.backend.service_model)
+        self.assertIs(api1.backend.services, api2.backend.services)
+        self.assertIsNot(api1.backend.soap_client, api2.backend.soap_client)
+
+    def test_one_model_per_service(self):
+        web_api = WebPaymentAPI('1234', 'ABCD', 'contract1')
+        direct_api = DirectPaymentAPI('1234', 'ABCD', 'contract1')
+        self.assertIsNot(web_api.backend.service_model, direct_api.backend.service_model)
+        self.assertEqual(list(web_api.backend.services.keys()), ['WebPaymentAPI'])
+        self.assertEqual(list(direct_api.backend.services.keys()), ['DirectPaymentAPI'])
+
+    def test_model_keyed_by_content(self):
+        api = WebPaymentAPI('1234', 'ABCD', 'contract1')
+        model = api.backend.service_model
+        with open(api.soap_wsdl_url[7:], 'rb') as wsdl_file:
+            self.assertEqual(model.digest, hashlib.sha256(wsdl_file.read()).hexdigest())
+
+    def test_clear_registry(self):
+        model = WebPaymentAPI('1234', 'ABCD', 'contract1').backend.service_model
+        wsdl.clear_registry()
+        self.assertIsNot(WebPaymentAPI('1234', 'ABCD', 'contract1').backend.service_model, model)
+
+    def test_soap_client_bound_to_location(self):
+        api = WebPaymentAPI('1234', 'ABCD', 'contract1', homologation=True)
+        self.assertEqual(api.backend.soap_client.location, api.soap_url)
+        self.assertEqual(api.backend.soap_client.http_headers, api.http_headers)
+
+
+class PrunedWsdlTestCase(unittest.TestCase):
+
+    def test_pruned_files_up_to_date(self):
+        """the pruned files must be written again (python -m pypayline.pruning) when the WSDL or the backend change"""
+        directory = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, directory)
+        for api_name in pruning.API_NAMES:
+            with open(pruning.write_pruned_wsdl(api_name, output_directory=directory), 'rb') as pruned_file:
+                with open(pruning.pruned_wsdl_path(api_name), 'rb') as package_file:
+                    self.assertEqual(pruned_file.read(), package_file.read(), api_name)
+
+    def test_same_operations_as_full_wsdl(self):
+        for api_class in (WebPaymentAPI, DirectPaymentAPI, MassPaymentAPI, ExtendedAPI):
+            pruned_model = api_class('1234', 'ABCD', 'contract1').backend.service_model
+            full_model = api_class('1234', 'ABCD', 'contract1', full_wsdl=True).backend.service_model
+            self.assertIsNot(pruned_model, full_model)
+            pruned_port, = pruned_model.services[api_class.api_name]['ports'].values()
+            full_port, = full_model.services[api_class.api_name]['ports'].values()
+            self.assertEqual(sorted(pruned_port['operations']), sorted(full_port['operations']))
+            for method, operation in pruned_port['operations'].items():
+                self.assertEqual(repr(operation), repr(full_port['operations'][method]), method)
+            self.assertEqual(pruning.backend_operations(api_class.api_name), frozenset(pruned_port['operations']))
+
+    def test_operations_of_the_service(self):
+        pruned = pruning.prune_wsdl(
+            open(pruning.full_wsdl_path('WebPaymentAPI'), 'rb').read(), 'WebPaymentAPI', operations=['doWebPayment']
+        )
+        self.assertIn(b'name="doWebPaymentRequest"', pruned)
+        self.assertIn(b'name="selectedContractList"', pruned)
+        self.assertNotIn(b'getWebPaymentDetails', pruned)
+        self.assertNotIn(b'DirectPaymentAPI', pruned)
+        self.assertNotIn(b'<annotation>', pruned)
+
+    def test_fallback_to_full_wsdl(self):
+        api = WebPaymentAPI('1234', 'ABCD', 'contract1')
+        api.api_name = 'UnknownAPI'
+        self.assertEqual(os.path.basename(api.soap_wsdl_url), 'UnknownAPI.wsdl')
+
+
+class LazyBackendTestCase(unittest.TestCase):
+
+    def test_construction_does_not_import_pysimplesoap(self):
+        code = (
+            "import sys\n"
+            "from pypayline.client import WebPaymentAPI, DirectPaymentAPI\n"
+            "WebPaymentAPI('1234', 'ABCD', 'contract1')\n"
+            "DirectPaymentAPI('1234', 'ABCD', 'contract1')\n"
+            "print('pysimplesoap' in sys.modules)\n"
+        )
+        output = subprocess.check_output([sys.executable, '-c', code], env=dict(os.environ, PYTHONPATH=os.getcwd()))
+        self.assertEqual(output.strip(), b'False')
+
+    def test_backend_created_on_first_use(self):
+        api = WebPaymentAPI('1234', 'ABCD', 'contract1')
+        self.assertIsNone(api._backend)
+        self.assertTrue(isinstance(api.backend, SoapBackend))
+        self.assertIs(api.backend, api.backend)
+        self.assertEqual(api.backend.soap_client.http_headers, api.http_headers)
+
+    def test_backend_created_once(self):
+        api = DirectPaymentAPI('1234', 'ABCD', 'contract1')
+        backends = []
+
+        def get_backend():
+            backends.append(api.backend)
+
+        threads = [threading.Thread(target=get_backend) for _index in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        self.assertEqual(len(backends), 8)
+        self.assertEqual(len(set(id(backend) for backend in backends)), 1)
+
+    def test_warmup(self):
+        wsdl.clear_registry()
+        api = WebPaymentAPI('1234', 'ABCD', 'contract1')
+        self.assertIs(api.warmup(), api)
+        self.assertEqual(
+            sorted(api.backend.serializer.compiled_operations.keys()), ['doWebPayment', 'getWebPaymentDetails']
+        )
+        self.assertEqual(
+            sorted(api.backend.parser.compiled_responses.keys()), ['doWebPayment', 'getWebPaymentDetails']
+        )
+
+
+class ClientPoolTestCase(unittest.TestCase):
+
+    def test_shared_backends(self):
+        pool = PaylineClientPool(DirectPaymentAPI, homologation=True)
+        client1 = pool.get('1234', 'ABCD', 'contract1')
+        client2 = pool.get('5678', 'EFGH', 'contract2')
+        self.assertIs(client1.backend.service_model, client2.backend.service_model)
+        self.assertIs(client1.backend.serializer, client2.backend.serializer)
+        self.assertIs(client1.backend.parser, client2.backend.parser)
+        self.assertIs(client1.backend.transport, client2.backend.transport)
+        self.assertEqual(client1.backend.soap_client.http_headers, client1.http_headers)
+        self.assertEqual(client2.backend.soap_client.http_headers, client2.http_headers)
+        self.assertNotEqual(client1.http_headers, client2.http_headers)
+
+    def test_merchants_against_simulator(self):
+        simulator = Simulator(port=0, api_names=('WebPaymentAPI', )).start()
+        try:
+            pool = PaylineClientPool(WebPaymentAPI, homologation=simulator.url)
+            kwargs = dict(
+                amount=Decimal("12.50"), currency=u"EUR", order_ref=u'order1',
+                return_url=u'http://freexian.com/success/', cancel_url=u'http://freexian.com/cancel/'
+            )
+            _redirect_url, token = pool.get(u'12345678901234', u'abCdeFgHiJKLmNoPqrst', u'1234567').do_web_payment(**kwargs)
+            self.assertTrue(token)
+            self.assertRaises(PaylineAuthError, pool.get(u'12345678901234', u'wrong key', u'1234567').do_web_payment, **kwargs)
+        finally:
+            simulator.close()
+
+
+class CompiledWsdlCacheTestCase(unittest.TestCase):
+
+    def setUp(self):
+        self.cache_dir = tempfile.mkdtemp()
+        wsdl.clear_registry()
+
+    def tearDown(self):
+        shutil.rmtree(self.cache_dir)
+        wsdl.clear_registry()
+
+    def compiled_files(self):
+        return [name for name in os.listdir(self.cache_dir) if name.endswith('.pickle')]
+
+    def test_compiled_file_written(self):
+        api = WebPaymentAPI('1234', 'ABCD', 'contract1', cache=self.cache_dir).warmup()
+        files = self.compiled_files()
+        self.assertEqual(len(files), 1)
+        self.assertTrue(files[0].startswith('WebPaymentAPI-' + api.backend.service_model.digest[:32]))
+
+    def test_compiled_file_loaded(self):
+        api = WebPaymentAPI('1234', 'ABCD', 'contract1', cache=self.cache_dir).warmup()
+        wsdl.clear_registry()
+
+        parse_service_model = wsdl.parse_service_model
+        wsdl.parse_service_model = None  # fails if the WSDL is parsed again
+        try:
+            cached_api = WebPaymentAPI('1234', 'ABCD', 'contract1', cache=self.cache_dir).warmup()
+        finally:
+            wsdl.parse_service_model = parse_service_model
+
+        operations = api.backend.services['WebPaymentAPI']['ports']['WebPaymentAPI']['operations']
+        cached_operations = cached_api.backend.services['WebPaymentAPI']['ports']['WebPaymentAPI']['operations']
+        self.assertEqual(list(operations.keys()), list(cached_operations.keys()))
+        request = operations['doWebPayment']['input']['doWebPaymentRequest']
+        cached_request = cached_operations['doWebPayment']['input']['doWebPaymentRequest']
+        self.assertEqual(list(request.keys()), list(cached_request.keys()))
+        self.assertEqual(list(request['payment'].keys()), list(cached_request['payment'].keys()))
+
+    def test_invalid_compiled_file(self):
+        WebPaymentAPI('1234', 'ABCD', 'contract1', cache=self.cache_dir).warmup()
+        path = os.path.join(self.cache_dir, self.compiled_files()[0])
+        with open(path, 'wb') as compiled_file:
+            compiled_file.write(b'invalid')
+        wsdl.clear_registry()
+
+        api = WebPaymentAPI('1234', 'ABCD', 'contract1', cache=self.cache_dir).warmup()
+        self.assertTrue('WebPaymentAPI' in api.backend.services)
+        self.assertTrue(wsdl.load_service_model(
+            'WebPaymentAPI', api.soap_wsdl_url, api.backend.service_model.digest, path
+        ) is not None)
+
+    def test_outdated_compiled_file(self):
+        api = WebPaymentAPI('1234', 'ABCD', 'contract1', cache=self.cache_dir).warmup()
+        path = os.path.join(self.cache_dir, self.compiled_files()[0])
+        self.assertIsNone(wsdl.load_service_model('WebPaymentAPI', api.soap_wsdl_url, 'other-digest', path))
+
+    def test_no_cache(self):
+        WebPaymentAPI('1234', 'ABCD', 'contract1', cache=None).warmup()
+        self.assertEqual(self.compiled_files(), [])
+
+
+GET_WEB_PAYMENT_DETAILS_RESPONSE = b"""<?xml version="1.0" encoding="UTF-8"?>
+<soapenv:Envelope xmlns:soapenv="http://schemas.xmlsoap.org/soap/envelope/">
+<soapenv:Body>
+<getWebPaymentDetailsResponse xmlns="http://impl.ws.payline.experian.com">
+<result><code xmlns="http://obj.ws.payline.experian.com">00000</code>
+<shortMessage xmlns="http://obj.ws.payline.experian.com">ACCEPTED</shortMessage>
+<longMessage xmlns="http://obj.ws.payline.experian.com">Transaction approved</longMessage></result>
+<transaction><id xmlns="http://obj.ws.payline.experian.com">1234567890</id>
+<isPossibleFraud xmlns="http://obj.ws.payline.experian.com">0</isPossibleFraud></transaction>
+<payment><amount xmlns="http://obj.ws.payline.experian.com">1250</amount>
+<currency xmlns="http://obj.ws.payline.experian.com">978</currency></payment>
+<order><ref xmlns="http://obj.ws.payline.experian.com">ref1</ref></order>
+</getWebPaymentDetailsResponse>
+</soapenv:Body>
+</soapenv:Envelope>"""
+
+
+BILLING_RECORD = u"""<billingRecord>
+<date xmlns="http://obj.ws.payline.experian.com">{index:02}/06/2016</date>
+<amount xmlns="http://obj.ws.payline.experian.com">1000</amount>
+<status xmlns="http://obj.ws.payline.experian.com">0</status>
+<result><code xmlns="http://obj.ws.payline.experian.com">00000</code>
+<longMessage xmlns="http://obj.ws.payline.experian.com">Transaction approved</longMessage></result>
+<transaction><id xmlns="http://obj.ws.payline.experian.com">{index}</id>
+<isPossibleFraud xmlns="http://obj.ws.payline.experian.com">0</isPossibleFraud></transaction>
+<authorization><number xmlns="http://obj.ws.payline.experian.com">A{index}</number></authorization>
+<rank xmlns="http://obj.ws.payline.experian.com">{index}</rank>
+</billingRecord>
+"""
+
+
+def get_payment_record_response(records_count, private_data=u''):
+    """getPaymentRecord response with the given number of billing records"""
+    return u"""<?xml version="1.0" encoding="UTF-8"?>
+<soapenv:Envelope xmlns:soapenv="http://schemas.xmlsoap.org/soap/envelope/">
+<soapenv:Body>
+<getPaymentRecordResponse xmlns="http://impl.ws.payline.experian.com">
+<result><code xmlns="http://obj.ws.payline.experian.com">00000</code>
+<shortMessage xmlns="http://obj.ws.payline.experian.com">ACCEPTED</shortMessage></result>
+<recurring><amount xmlns="http://obj.ws.payline.experian.com">1000</amount>
+<billingCycle xmlns="http://obj.ws.payline.experian.com">40</billingCycle></recurring>
+<isDisabled>0</isDisabled>
+<billingRecordList>
+{records}</billingRecordList>
+<privateDataList>{private_data}</privateDataList>
+<order><ref xmlns="http://obj.ws.payline.experian.com">ref1</ref></order>
+</getPaymentRecordResponse>
+</soapenv:Body>
+</soapenv:Envelope>""".format(
+        records=u''.join(BILLING_RECORD.format(index=index) for index in range(records_count)),
+        private_data=private_data
+    ).encode('utf-8')
+
+
+SOAP_FAULT_RESPONSE = b"""<?xml version="1.0" encoding="UTF-8"?>
+<soapenv:Envelope xmlns:soapenv="http://schemas.xmlsoap.org/soap/envelope/">
+<soapenv:Body><soapenv:Fault>
+<faultcode>soapenv:Server</faultcode><faultstring>Internal error</faultstring>
+</soapenv:Fault></soapenv:Body>
+</soapenv:Envelope>"""
+
+
+class StubSoapHandler(BaseHTTPServer.BaseHTTPRequestHandler):
+    """Answer every POST with the same SOAP response on a keep-alive connection"""
+    protocol_version = 'HTTP/1.1'
+
+    def setup(self):
+        BaseHTTPServer.BaseHTTPRequestHandler.setup(self)
+        self.server.connections_count += 1
+
+    def do_POST(self):
+        self.rfile.read(int(self.headers['Content-Length']))
+        self.server.requests.append(self.path)
+        # the connection is closed once the next requests are received, without response
+        if self.server.drops and self.server.drops.pop(0):
+            self.close_connection = True
+            return
+        # injected delays and statuses of the next requests
+        if self.server.delays:
+            time.sleep(self.server.delays.pop(0))
+        status = self.server.statuses.pop(0) if self.server.statuses else self.server.response_status
+        self.send_response(status)
+        self.send_header('Content-Type', 'text/xml; charset=utf-8')
+        self.send_header('Content-Length', str(len(self.server.response_body)))
+        self.end_headers()
+        # the connection is closed in the middle of the next responses
+        if self.server.truncations and self.server.truncations.pop(0):
+            self.wfile.write(self.server.response_body[:len(self.server.response_body) // 2])
+            self.close_connection = True
+            return
+        self.wfile.write(self.server.response_body)
+
+    def log_message(self, *args):
+        pass
+
+
+class ThreadingHTTPServer(socketserver.ThreadingMixIn, BaseHTTPServer.HTTPServer):
+    daemon_threads = True
+
+
+class StubSoapServer(object):
+    """local HTTP server running in a thread"""
+
+    def __init__(self, handler_class=StubSoapHandler):
+        self.server = ThreadingHTTPServer(('127.0.0.1', 0), handler_class)
+        self.server.connections_count = 0
+        self.server.requests = []
+        self.server.response_status = 200
+        self.server.delays = []
+        self.server.statuses = []
+        self.server.drops = []
+        self.server.truncations = []
+        self.server.response_body = GET_WEB_PAYMENT_DETAILS_RESPONSE
+        self.thread = threading.Thread(target=self.server.serve_forever)
+        self.thread.daemon = True
+        self.thread.start()
+
+    @property
+    def url(self):
+        return 'http://127.0.0.1:{0}/V4/services/WebPaymentAPI'.format(self.server.server_port)
+
+    def close(self):
+        self.server.shutdown()
+        self.server.server_close()
+
+
+class EnvelopeSerializerTestCase(unittest.TestCase):
+
+    def setUp(self):
+        self.api = WebPaymentAPI('1234', 'ABCD', 'contract1')
+        self.direct_api = DirectPaymentAPI('1234', 'ABCD', 'contract1')
+
+    def assertSameEnvelope(self, backend, method, **data):
+        request = backend.prepare_request(method, **data)
+        soap_request = prepare_soap_request(backend.soap_client, method, **data)
+        self.assertEqual(request.body, soap_request.body)
+        self.assertEqual(request.headers, soap_request.headers)
+        self.assertEqual(request.location, soap_request.location)
+
+    def web_payment_request(self, **kwargs):
+        request = self.api.build_web_payment_request(
+            amount=Decimal("12.50"), currency=u"EUR", order_ref=u'ref<1> & co',
+            return_url='http://freexian.com/success/?a=1&b=2', cancel_url='http://freexian.com/cancel/',
+            **kwargs
+        )
+        # pysimplesoap can't serialize a list of selected contracts
+        request['selectedContractList'] = {'selectedContract': 'contract1'}
+        return request
+
+    def test_get_web_payment_details(self):
+        self.assertSameEnvelope(self.api.backend, 'getWebPaymentDetails', version='19', token=u'1a2b<3c>')
+
+    def test_get_payment_record(self):
+        self.assertSameEnvelope(
+            self.direct_api.backend, 'getPaymentRecord', contractNumber='contract1', paymentRecordId=12345
+        )
+
+    def test_do_web_payment(self):
+        self.assertSameEnvelope(self.api.backend, 'doWebPayment', **self.web_payment_request())
+
+    def test_do_web_payment_recurring(self):
+        self.assertSameEnvelope(self.api.backend, 'doWebPayment', **self.web_payment_request(
+            recurring_times=3, recurring_period_in_months=1
+        ))
+
+    def test_do_web_payment_buyer(self):
+        self.assertSameEnvelope(self.api.backend, 'doWebPayment', **self.web_payment_request(
+            buyer={
+                'lastName': u'Dupr\xe9', 'firstName': u'Andr\xe9', 'email': 'andre@example.com',
+                'shippingAdress': {'street1': u'1 rue de la Paix', 'zipCode': '75000', 'country': 'FR'},
+                'accountOrderCount': 3, 'isBot': False,
+            },
+            taxes=Decimal('1.10'), country='FR'
+        ))
+
+    def test_selected_contract_list(self):
+        request = self.api.backend.prepare_request('doWebPayment', **self.api.build_web_payment_request(
+            amount=Decimal("12.50"), currency=u"EUR", order_ref=u'ref',
+            return_url='http://freexian.com/success/', cancel_url='http://freexian.com/cancel/',
+            selected_contract_list=['contract1', 'contract2']
+        ))
+        self.assertTrue(
+            b'<selectedContractList xmlns="http://impl.ws.payline.experian.com">'
+            b'<selectedContract xmlns="http://obj.ws.payline.experian.com">contract1</selectedContract>'
+            b'<selectedContract xmlns="http://obj.ws.payline.experian.com">contract2</selectedContract>'
+            b'</selectedContractList>' in request.body
+        )
+
+    def test_direct_operations(self):
+        card = {'number': u'4970100000000154', 'type': u'CB', 'expirationDate': u'1230', 'cvx': u'123'}
+        requests = [
+            ('doAuthorization', self.direct_api.build_authorization_request(
+                Decimal("12.50"), u'EUR', u'ref', card, buyer={'email': 'andre@example.com'}
+            )),
+            ('doCapture', self.direct_api.build_capture_request(u'123', Decimal("12.50"), u'EUR')),
+            ('doRefund', self.direct_api.build_refund_request(u'123', Decimal("12.50"), u'EUR', u'a & b')),
+            ('doReset', self.direct_api.build_reset_request(u'123')),
+            ('doDebit', self.direct_api.build_debit_request(
+                Decimal("12.50"), u'EUR', u'ref', card, u'1234', datetime(2016, 6, 6, 12, 30)
+            )),
+            ('createWallet', self.direct_api.build_create_wallet_request(u'w1', card, last_name=u'Doe')),
+            ('updateWallet', self.direct_api.build_update_wallet_request(u'w1', card_ind=u'2', email=u'a@b.c')),
+            ('getWallet', self.direct_api.build_get_wallet_request(u'w1')),
+            ('getCards', self.direct_api.build_get_wallet_request(u'w1', u'1')),
+            # pysimplesoap can't serialize a list of wallet ids
+            ('disableWallet', dict(self.direct_api.build_disable_wallet_request([]), walletIdList={'walletId': u'w1'})),
+            ('enableWallet', self.direct_api.build_enable_wallet_request(u'w1')),
+            ('doImmediateWalletPayment', self.direct_api.build_immediate_wallet_payment_request(
+                u'w1', Decimal("12.50"), u'EUR', u'ref', cvx=u'123'
+            )),
+        ]
+        for method, data in requests:
+            self.assertIsNotNone(self.direct_api.backend.serializer.serialize(method, data))
+            self.assertSameEnvelope(self.direct_api.backend, method, **data)
+
+        body, _action = self.direct_api.backend.serializer.serialize(
+            'disableWallet', self.direct_api.build_disable_wallet_request([u'w1', u'w2'])
+        )
+        self.assertEqual(re.findall(r'<walletId[^>]*>(\w+)</walletId>', body.decode('utf-8')), [u'w1', u'w2'])
+
+    def test_invalid_key(self):
+        self.assertRaises(
+            ValueError, self.api.backend.prepare_request, 'getWebPaymentDetails', version='19', token='1', other=2
+        )
+
+    def test_other_operations_use_generated_code(self):
+        api = WebPaymentAPI('1234', 'ABCD', 'contract1', full_wsdl=True)
+        self.assertIsNotNone(api.backend.serializer.serialize('getWebWallet', {'version': '19'}))
+        self.assertSameEnvelope(api.backend, 'getWebWallet', version='19', token=u'1a2b<3c>')
+
+    def test_other_operations_use_pysimplesoap(self):
+        """without the generated module (another WSDL...), the other operations use pysimplesoap"""
+        serializer = EnvelopeSerializer(self.api.backend.service_model)
+        self.assertIsNone(serializer.serialize('getWebWallet', {'version': '19'}))
+        self.assertIsNotNone(serializer.serialize('getWebPaymentDetails', {'version': '19'}))
+        # the pruned WSDL has all the operations of the backend
+        request = prepare_soap_request(self.api.backend.soap_client, 'getWebWallet', version='19', token=u'1a2b')
+        self.assertEqual(request.headers['SOAPAction'], 'getWebWallet')
+
+    def test_escape(self):
+        self.assertEqual(escape(u'a&b<c>"d"'), u'a&amp;b&lt;c&gt;&quot;d&quot;')
+
+
+class ResponseParserTestCase(unittest.TestCase):
+
+    def setUp(self):
+        self.api = WebPaymentAPI('1234', 'ABCD', 'contract1')
+        self.direct_api = DirectPaymentAPI('1234', 'ABCD', 'contract1')
+
+    def test_same_as_pysimplesoap(self):
+        backend = self.api.backend
+        self.assertEqual(
+            backend.parse_response('getWebPaymentDetails', GET_WEB_PAYMENT_DETAILS_RESPONSE),
+            parse_soap_response(backend.soap_client, 'getWebPaymentDetails', GET_WEB_PAYMENT_DETAILS_RESPONSE)
+        )
+
+    def test_billing_records(self):
+        response = self.direct_api.backend.parse_response('getPaymentRecord', get_payment_record_response(3))
+        self.assertEqual(response['result'], {'code': u'00000', 'shortMessage': u'ACCEPTED'})
+        self.assertEqual(response['order'], {'ref': u'ref1'})
+        self.assertEqual(response['privateDataList'], None)
+        billing_records = response['billingRecordList']
+        self.assertEqual(len(billing_records), 3)
+        self.assertEqual(billing_records[2], {
+            'date': u'02/06/2016', 'amount': u'1000', 'status': u'0',
+            'result': {'code': u'00000', 'longMessage': u'Transaction approved'},
+            'transaction': {'id': u'2', 'isPossibleFraud': u'0'},
+            'authorization': {'number': u'A2'},
+            'rank': u'2',
+        })
+
+    def test_typed_result(self):
+        response = self.direct_api.backend.parse_response('getPaymentRecord', get_payment_record_response(3))
+        record = results.PaymentRecord(response)
+        self.assertEqual(record.as_dict(), dict((key, value) for key, value in response.items() if value is not None))
+        self.assertEqual(record.billing_records[2].authorization.number, u'A2')
+        self.assertEqual(record.billing_records[2].transaction.is_possible_fraud, False)
+        pysimplesoap_record = results.PaymentRecord(
+            parse_soap_response(self.direct_api.backend.soap_client, 'getPaymentRecord', get_payment_record_response(3))
+        )
+        # pysimplesoap only keeps the last billing record
+        self.assertEqual([item.rank for item in pysimplesoap_record.billing_records], [u'2'])
+
+    def test_result_fields(self):
+        """the typed results have the elements of the WSDL types"""
+        types = {}
+
+        def collect(name, struct):
+            if hasattr(struct, 'keys'):
+                types.setdefault(name, tuple(struct.keys()))
+                for key, value in struct.items():
+                    collect(key, value[0] if isinstance(value, list) and value else value)
+
+        for api in (self.api, self.direct_api):
+            model = api.backend.service_model
+            port, = model.services[model.api_name]['ports'].values()
+            for method in ('getWebPaymentDetails', 'getPaymentRecord'):
+                if method in port['operations']:
+                    (_name, root), = port['operations'][method]['output'].items()
+                    collect(method, root)
+        for result_class, type_name in (
+            (results.WebPaymentDetails, 'getWebPaymentDetails'), (results.PaymentRecord, 'getPaymentRecord'),
+            (results.Result, 'result'), (results.Transaction, 'transaction'), (results.Payment, 'payment'),
+            (results.Order, 'order'), (results.Card, 'card'), (results.ExtendedCard, 'extendedCard'),
+            (results.Authorization, 'authorization'), (results.Buyer, 'buyer'), (results.Recurring, 'recurring'),
+            (results.BillingRecord, 'billingRecord'),
+        ):
+            self.assertEqual(result_class.fields, types[type_name], type_name)
+
+    def test_private_data_list(self):
+        response = self.direct_api.backend.parse_response('getPaymentRecord', get_payment_record_response(
+            0, private_data=u'<privateData><key>a</key><value>1</value></privateData>'
+                            u'<privateData><key>b</key><value>2</value></privateData>'
+        ))
+        self.assertEqual(response['privateDataList'], [{'key': u'a', 'value': u'1'}, {'key': u'b', 'value': u'2'}])
+        self.assertEqual(response['billingRecordList'], None)
+
+    def test_soap_fault(self):
+        self.assertRaises(SoapFault, self.api.backend.parse_response, 'getWebPaymentDetails', SOAP_FAULT_RESPONSE)
+
+    def test_stream_billing_records(self):
+        content = get_payment_record_response(2000)
+        streamed = self.direct_api.backend.parser.stream('getPaymentRecord', content, ('billingRecordList', ))
+        billing_records = iter(streamed)
+        self.assertEqual(next(billing_records)['rank'], u'0')
+        # the items are parsed while they are consumed
+        self.assertTrue(streamed.offset < len(content))
+        self.assertEqual([billing_record['rank'] for billing_record in billing_records][-1], u'1999')
+        self.assertEqual(streamed.response['order'], {'ref': u'ref1'})
+        self.assertNotIn('billingRecordList', streamed.response)
+
+
+class GeneratedOperationsTestCase(unittest.TestCase):
+
+    def setUp(self):
+        self.direct_api = DirectPaymentAPI('1234', 'ABCD', 'contract1')
+        self.full_direct_api = DirectPaymentAPI('1234', 'ABCD', 'contract1', full_wsdl=True)
+
+    def credit_request(self):
+        return {
+            'version': '19',
+            'payment': {'amount': 1250, 'currency': 978, 'action': 422, 'mode': 'CPT', 'contractNumber': 'contract1'},
+            'card': {'number': u'4970100000000154', 'type': u'CB', 'expirationDate': u'1230', 'cvx': u'123'},
+            'comment': u'a & b',
+            'order': {'ref': u'ref<1>', 'amount': 1250, 'currency': 978, 'date': '06/06/2016 12:30'},
+        }
+
+    def port_operations(self, api):
+        model = api.backend.service_model
+        port, = model.services[model.api_name]['ports'].values()
+        return port['operations']
+
+    def test_generated_modules_up_to_date(self):
+        """the modules must be generated again (python -m pypayline.codegen) when the WSDL files change"""
+        directory = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, directory)
+        for path in codegen.write_generated_modules(output_directory=directory):
+            name = os.path.splitext(os.path.basename(path))[0]
+            with open(path, 'rb') as generated_file:
+                with open(codegen.generated_module_path(name), 'rb') as package_file:
+                    self.assertEqual(generated_file.read(), package_file.read(), name)
+
+    def test_a_method_by_operation(self):
+        for api_class in (WebPaymentAPI, DirectPaymentAPI, MassPaymentAPI, ExtendedAPI):
+            api = api_class('1234', 'ABCD', 'contract1', full_wsdl=True)
+            for method, operation in self.port_operations(api).items():
+                (_input_name, root), = operation['input'].items()
+                code = getattr(SERVICE_OPERATIONS[api_class.api_name], method).__code__
+                self.assertEqual(list(code.co_varnames[:code.co_argcount]), ['self'] + list(root.keys()), method)
+                self.assertTrue(callable(getattr(api.backend, method)))
+            generated = get_generated_module(api.backend.service_model)
+            self.assertEqual(sorted(generated.REQUESTS), sorted(self.port_operations(api)))
+            self.assertEqual(sorted(generated.RESPONSES), sorted(self.port_operations(api)))
+
+    def test_operations_of_the_service(self):
+        """a backend only has the methods of the operations of its service"""
+        web_backend = WebPaymentAPI('1234', 'ABCD', 'contract1').backend
+        mass_backend = MassPaymentAPI('1234', 'ABCD', 'contract1').backend
+        self.assertIsInstance(web_backend, SoapBackend)
+        self.assertTrue(callable(web_backend.getWebWallet))
+        self.assertTrue(callable(web_backend.doWebPayment))
+        for method in ('doMassCapture', 'createMerchant', 'doCredit', 'iterBillingRecords'):
+            self.assertFalse(hasattr(web_backend, method), method)
+        self.assertTrue(callable(mass_backend.doMassCapture))
+        self.assertFalse(hasattr(mass_backend, 'doWebPayment'))
+        self.assertTrue(callable(self.direct_api.backend.iterBillingRecords))
+        self.assertIs(type(WebPaymentAPI('5678', 'EFGH', 'contract2').backend), type(web_backend))
+
+    def test_same_envelope_as_pysimplesoap(self):
+        # doCredit is not a hot operation: it is written by the generated module
+        self.assertIsNone(EnvelopeSerializer(self.direct_api.backend.service_model).serialize('doCredit', {}))
+        request = self.direct_api.backend.prepare_request('doCredit', **self.credit_request())
+        soap_request = prepare_soap_request(
+            self.full_direct_api.backend.soap_client, 'doCredit', **self.credit_request()
+        )
+        self.assertEqual(request.body, soap_request.body)
+        self.assertEqual(request.headers, soap_request.headers)
+
+    def test_invalid_key(self):
+        backend = self.direct_api.backend
+        self.assertRaises(ValueError, backend.prepare_request, 'doCredit', version='19', other=2)
+        self.assertRaises(ValueError, backend.prepare_request, 'doCredit', version='19', card={'other': 2})
+
+    def test_same_response_as_pysimplesoap(self):
+        operations = self.port_operations(self.full_direct_api)
+        writer = ResponseWriter(self.full_direct_api.backend.service_model)
+        responses = [
+            ('doCredit', {
+                'result': {'code': u'00000', 'shortMessage': u'ACCEPTED', 'longMessage': u'Transaction approved'},
+                'transaction': {'id': u'1', 'date': u'06/06/2016 12:30', 'isPossibleFraud': u'0'},
+                'card': {'number': u'497010XXXXXX0154', 'type': u'CB', 'expirationDate': u'1230'},
+            }),
+            ('getEncryptionKey', {
+                'result': {'code': u'00000'},
+                'key': {'keyId': 12, 'modulus': u'a1b2', 'publicExponent': u'010001'},
+            }),
+        ]
+        for method, response in responses:
+            content = writer.write(operations[method], response)
+            parsed = self.direct_api.backend.parse_response(method, content)
+            self.assertEqual(parsed, parse_soap_response(self.full_direct_api.backend.soap_client, method, content))
+        self.assertEqual(parsed['key']['keyId'], 12)
+
+    def test_call(self):
+        stub = StubSoapServer()
+        self.addCleanup(stub.close)
+        backend = self.direct_api.backend
+        backend.soap_client.location = stub.url
+        stub.server.response_body = ResponseWriter(self.full_direct_api.backend.service_model).write(
+            self.port_operations(self.full_direct_api)['doCredit'], {'result': {'code': u'00000'}}
+        )
+        self.assertEqual(backend.doCredit(**self.credit_request()), {'result': {'code': u'00000'}})
+        stub.server.response_body = SOAP_FAULT_RESPONSE
+        self.assertRaises(PaylineApiError, backend.doCredit, version='19')
+
+    def test_other_wsdl(self):
+        """the generated modules are not used with other WSDL files"""
+        model = self.direct_api.backend.service_model
+        self.assertIsNotNone(get_generated_module(model))
+        other_model = wsdl.ServiceModel(model.api_name, model.wsdl, u'0' * 64, model.services, model.namespace, None)
+        self.assertIsNone(get_generated_module(other_model))
+
+
+class HttpTransportTestCase(unittest.TestCase):
+
+    def setUp(self):
+        self.stub = StubSoapServer()
+
+    def tearDown(self):
+        self.stub.close()
+
+    def get_api(self, **kwargs):
+        api = WebPaymentAPI('1234', 'ABCD', 'contract1', **kwargs)
+        api.backend.soap_client.location = self.stub.url
+        return api
+
+    def test_connection_reused(self):
+        api = self.get_api(transport=HttpTransport())
+        for _index in range(3):
+            result_code, is_transaction_ok, order_ref, amount, currency, data = api.get_web_payment_details('token')
+            self.assertEqual(result_code, '00000')
+            self.assertEqual(order_ref, 'ref1')
+            self.assertEqual(amount, Decimal('12.50'))
+        self.assertEqual(len(self.stub.server.requests), 3)
+        self.assertEqual(self.stub.server.connections_count, 1)
+
+    def test_connection_shared_between_clients(self):
+        transport = HttpTransport()
+        self.get_api(transport=transport).get_web_payment_details('token1')
+        self.get_api(transport=transport).get_web_payment_details('token2')
+        self.assertEqual(self.stub.server.connections_count, 1)
+
+    def test_default_transport_shared(self):
+        api1 = self.get_api(pool_size=3, read_timeout=5)
+        api2 = self.get_api(pool_size=3, read_timeout=5)
+        api3 = self.get_api(pool_size=4, read_timeout=5)
+        self.assertIs(api1.backend.transport, api2.backend.transport)
+        self.assertIsNot(api1.backend.transport, api3.backend.transport)
+        self.assertEqual(api3.backend.transport.pool_size, 4)
+        self.assertEqual(api3.backend.transport.read_timeout, 5)
+
+    def test_nagle_disabled(self):
+        transport = HttpTransport()
+        self.get_api(transport=transport).get_web_payment_details('token1')
+        pool, = transport.pools.values()
+        _last_used, connection = pool._idle[0]
+        self.assertTrue(connection.sock.getsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY))
+
+    def test_idle_timeout(self):
+        api = self.get_api(transport=HttpTransport(idle_timeout=0))
+        api.get_web_payment_details('token1')
+        api.get_web_payment_details('token2')
+        self.assertEqual(self.stub.server.connections_count, 2)
+
+    def test_stale_connection(self):
+        transport = HttpTransport()
+        api = self.get_api(transport=transport)
+        api.get_web_payment_details('token1')
+        # the server closes the idle connection
+        for pool in transport.pools.values():
+            for _last_used, connection in pool._idle:
+                connection.sock.shutdown(2)
+        result_code = api.get_web_payment_details('token2')[0]
+        self.assertEqual(result_code, '00000')
+        self.assertEqual(self.stub.server.connections_count, 2)
+
+    def test_dropped_idempotent_request(self):
+        """a read-only request is sent again when the reused connection is closed without response"""
+        api = self.get_api(transport=HttpTransport())
+        api.get_web_payment_details('token1')
+        self.stub.server.drops = [True]
+        self.assertEqual(api.get_web_payment_details('token2')[0], '00000')
+        self.assertEqual(len(self.stub.server.requests), 3)
+        self.assertEqual(self.stub.server.connections_count, 2)
+
+    def test_dropped_payment_not_sent_again(self):
+        """a payment may have been processed when the connection is closed: it is never sent twice"""
+        api = self.get_api(transport=HttpTransport())
+        api.get_web_payment_details('token1')
+        self.stub.server.drops = [True]
+        self.assertRaises(
+            http_client.HTTPException, api.do_web_payment, amount=Decimal("12.50"), currency=u"EUR",
+            order_ref='ref1', return_url='http://freexian.com/success/', cancel_url='http://freexian.com/cancel/'
+        )
+        self.assertEqual(len(self.stub.server.requests), 2)
+
+    def test_iter_billing_records(self):
+        self.stub.server.response_body = get_payment_record_response(5)
+        api = DirectPaymentAPI('1234', 'ABCD', 'contract1', transport=HttpTransport())
+        api.backend.soap_client.location = self.stub.url
+        ranks = [billing_record['rank'] for billing_record in api.iter_billing_records('contract1', '12345')]
+        self.assertEqual(ranks, [u'0', u'1', u'2', u'3', u'4'])
+
+    def test_soap_fault(self):
+        self.stub.server.response_status = 500
+        self.stub.server.response_body = SOAP_FAULT_RESPONSE
+        api = self.get_api(transport=HttpTransport())
+        self.assertRaises(PaylineApiError, api.get_web_payment_details, 'token')
+
+    def test_http_error(self):
+        self.stub.server.response_status = 401
+        api = self.get_api(transport=HttpTransport())
+        self.assertRaises(PaylineAuthError, api.get_web_payment_details, 'token')
+
+
+class InstrumentationTestCase(unittest.TestCase):
+
+    def setUp(self):
+        self.stub = StubSoapServer()
+        self.collector = HistogramCollector()
+
+    def tearDown(self):
+        self.stub.close()
+
+    def get_api(self, **kwargs):
+        api = WebPaymentAPI('1234', 'ABCD', 'contract1', transport=HttpTransport(), **kwargs)
+        api.backend.soap_client.location = self.stub.url
+        return api
+
+    def test_phases(self):
+        events = []
+        api = self.get_api(hooks=[self.collector, events.append])
+        api.get_web_payment_details('token1')
+        api.get_web_payment_details('token2')
+
+        first, second = events
+        self.assertEqual((first.api_name, first.operation, first.result_code),
+                         ('WebPaymentAPI', 'getWebPaymentDetails', '00000'))
+        self.assertTrue(first.timings['connect'] > 0)
+        # the connection is reused
+        self.assertEqual(second.timings['connect'], 0)
+        for phase in ('serialize', 'wait', 'parse'):
+            self.assertTrue(second.timings[phase] > 0)
+        self.assertTrue(second.duration >= sum(second.timings.values()))
+        self.assertEqual(second.response_size, len(GET_WEB_PAYMENT_DETAILS_RESPONSE))
+        self.assertTrue(second.request_size > 0)
+
+        histogram = self.collector.histogram('WebPaymentAPI', 'getWebPaymentDetails')
+        self.assertEqual(histogram.count, 2)
+        self.assertEqual(self.collector.result_codes, {('WebPaymentAPI', 'getWebPaymentDetails', '00000'): 2})
+        self.assertTrue(0 < self.collector.percentile('WebPaymentAPI', 'getWebPaymentDetails', 99) <= 60)
+
+    def test_errors(self):
+        self.stub.server.response_status = 500
+        self.stub.server.response_body = SOAP_FAULT_RESPONSE
+        api = self.get_api(hooks=[self.collector])
+        self.assertRaises(PaylineApiError, api.get_web_payment_details, 'token')
+        self.stub.server.response_status = 401
+        self.assertRaises(PaylineAuthError, api.get_web_payment_details, 'token')
+        self.assertEqual(self.collector.errors, {
+            ('WebPaymentAPI', 'getWebPaymentDetails', 'SoapFault'): 1,
+            ('WebPaymentAPI', 'getWebPaymentDetails', 'HTTPError'): 1,
+        })
+
+    def test_global_hook(self):
+        hook = add_hook(self.collector)
+        try:
+            self.get_api().get_web_payment_details('token')
+        finally:
+            remove_hook(hook)
+        self.get_api().get_web_payment_details('token')
+        self.assertEqual(self.collector.histogram('WebPaymentAPI', 'getWebPaymentDetails').count, 1)
+
+    def test_failing_hook(self):
+        class FailingHook(Hook):
+            def finished(self, event):
+                raise ValueError('monitoring is down')
+
+        api = self.get_api(hooks=[FailingHook(), self.collector])
+        self.assertEqual(api.get_web_payment_details('token')[0], '00000')
+        self.assertEqual(self.collector.histogram('WebPaymentAPI', 'getWebPaymentDetails').count, 1)
+
+    def test_prometheus_optional(self):
+        try:
+            import prometheus_client
+        except ImportError:
+            self.assertRaises(ImportError, PrometheusHook)
+        else:
+            registry = prometheus_client.CollectorRegistry()
+            api = self.get_api(hooks=[PrometheusHook(registry=registry)])
+            api.get_web_payment_details('token')
+            self.assertEqual(registry.get_sample_value('pypayline_soap_calls_total', {
+                'api': 'WebPaymentAPI', 'operation': 'getWebPaymentDetails', 'result_code': '00000'
+            }), 1)
+
+
+class ResilienceTestCase(unittest.TestCase):
+    """timeouts, retries, hedging and circuit breaker against a stub server with injected delays"""
+
+    def setUp(self):
+        self.stub = StubSoapServer()
+        self.now = 1000.0
+
+    def tearDown(self):
+        self.stub.close()
+
+    def get_api(self, policy):
+        api = WebPaymentAPI('1234', 'ABCD', 'contract1', transport=HttpTransport(), resilience=policy)
+        api.backend.soap_client.location = self.stub.url
+        return api
+
+    def retry(self, max_attempts=3):
+        return RetryPolicy(max_attempts=max_attempts, backoff=0.01, jitter=0)
+
+    def test_timeout_and_retry(self):
+        self.stub.server.delays = [1]
+        policy = ResiliencePolicy(timeouts={'getWebPaymentDetails': 0.2}, retry=self.retry())
+        start = time.time()
+        self.assertEqual(self.get_api(policy).get_web_payment_details('token')[0], '00000')
+        self.assertTrue(time.time() - start < 0.9)
+        self.assertEqual(len(self.stub.server.requests), 2)
+        self.assertEqual(policy.retries, 1)
+
+    def test_retry_server_errors(self):
+        self.stub.server.statuses = [503, 502]
+        policy = ResiliencePolicy(retry=self.retry())
+        self.assertEqual(self.get_api(policy).get_web_payment_details('token')[0], '00000')
+        self.assertEqual(len(self.stub.server.requests), 3)
+
+    def test_retries_exhausted(self):
+        self.stub.server.statuses = [503] * 3
+        api = self.get_api(ResiliencePolicy(retry=self.retry()))
+        self.assertRaises(PaylineAuthError, api.get_web_payment_details, 'token')
+        self.assertEqual(len(self.stub.server.requests), 3)
+
+    def test_no_retry_of_payments(self):
+        self.stub.server.statuses = [503]
+        api = self.get_api(ResiliencePolicy(retry=self.retry()))
+        self.assertRaises(
+            PaylineAuthError, api.do_web_payment, Decimal('12.50'), u'EUR', u'ref1',
+            u'http://example.com/success/', u'http://example.com/cancel/'
+        )
+        self.assertEqual(len(self.stub.server.requests), 1)
+
+    def test_no_retry_of_faults(self):
+        self.stub.server.response_status = 500
+        self.stub.server.response_body = SOAP_FAULT_RESPONSE
+        api = self.get_api(ResiliencePolicy(retry=self.retry()))
+        self.assertRaises(PaylineApiError, api.get_web_payment_details, 'token')
+        self.assertEqual(len(self.stub.server.requests), 1)
+
+    def test_hedging(self):
+        self.stub.server.delays = [1]
+        policy = ResiliencePolicy(hedge_delay=0.1)
+        start = time.time()
+        self.assertEqual(self.get_api(policy).get_web_payment_details('token')[0], '00000')
+        self.assertTrue(time.time() - start < 0.9)
+        self.assertEqual(policy.hedges, 1)
+        self.assertEqual(len(self.stub.server.requests), 2)
+
+    def test_no_hedging_when_fast(self):
+        policy = ResiliencePolicy(hedge_delay=0.5)
+        self.get_api(policy).get_web_payment_details('token')
+        self.assertEqual(policy.hedges, 0)
+        self.assertEqual(len(self.stub.server.requests), 1)
+
+    def test_circuit_breaker(self):
+        breaker = CircuitBreaker(window=4, min_calls=2, reset_timeout=10, clock=lambda: self.now)
+        api = self.get_api(ResiliencePolicy(circuit_breaker=breaker))
+        self.stub.server.statuses = [503, 503]
+        self.assertRaises(PaylineAuthError, api.get_web_payment_details, 'token')
+        self.assertRaises(PaylineAuthError, api.get_web_payment_details, 'token')
+        self.assertEqual(breaker.state, CircuitBreaker.OPEN)
+        # fail fast
+        self.assertRaises(CircuitOpenError, api.get_web_payment_details, 'token')
+        self.assertEqual(len(self.stub.server.requests), 2)
+        self.assertEqual(breaker.rejected, 1)
+        # trial call
+        self.now += 10
+        self.assertEqual(api.get_web_payment_details('token')[0], '00000')
+        self.assertEqual(breaker.state, CircuitBreaker.CLOSED)
+
+    @unittest.skipIf(asyncio is None, 'asyncio is not available')
+    def test_async(self):
+        self.stub.server.delays = [1, 1]
+        policy = ResiliencePolicy(timeouts={'getWebPaymentDetails': 0.2}, retry=self.retry(), hedge_delay=0.1)
+        api = AsyncWebPaymentAPI('1234', 'ABCD', 'contract1', transport=AsyncHttpTransport(), resilience=policy)
+        api.backend.soap_client.location = self.stub.url
+        loop = asyncio.new_event_loop()
+        try:
+            start = time.time()
+            self.assertEqual(loop.run_until_complete(api.get_web_payment_details('token'))[0], '00000')
+            self.assertTrue(time.time() - start < 0.9)
+        finally:
+            loop.close()
+        self.assertEqual(policy.hedges, 1)
+
+
+@unittest.skipIf(asyncio is None, 'asyncio is not available')
+class AsyncSoapBackendTestCase(unittest.TestCase):
+
+    def setUp(self):
+        self.stub = StubSoapServer()
+        self.loop = asyncio.new_event_loop()
+        asyncio.set_event_loop(self.loop)
+
+    def tearDown(self):
+        self.loop.close()
+        asyncio.set_event_loop(None)
+        self.stub.close()
+
+    def get_api(self, **kwargs):
+        api = AsyncWebPaymentAPI('1234', 'ABCD', 'contract1', **kwargs)
+        api.backend.soap_client.location = self.stub.url
+        return api
+
+    def test_get_web_payment_details(self):
+        api = self.get_api(transport=AsyncHttpTransport())
+        result_code, is_transaction_ok, order_ref, amount, currency, data = self.loop.run_until_complete(
+            api.get_web_payment_details('token')
+        )
+        self.assertEqual(result_code, '00000')
+        self.assertEqual(is_transaction_ok, True)
+        self.assertEqual(order_ref, 'ref1')
+        self.assertEqual(amount, Decimal('12.50'))
+        self.assertEqual(currency, 'EUR')
+
+    def test_instrumentation(self):
+        collector = HistogramCollector()
+        api = self.get_api(transport=AsyncHttpTransport(), hooks=[collector])
+        self.loop.run_until_complete(api.get_web_payment_details('token'))
+        histogram = collector.histogram('WebPaymentAPI', 'getWebPaymentDetails', 'connect')
+        self.assertEqual(histogram.count, 1)
+        self.assertTrue(histogram.sum > 0)
+        self.assertEqual(collector.result_codes, {('WebPaymentAPI', 'getWebPaymentDetails', '00000'): 1})
+
+    def test_connection_reused(self):
+        api = self.get_api(transport=AsyncHttpTransport())
+        for _index in range(3):
+            self.loop.run_until_complete(api.get_web_payment_details('token'))
+        self.assertEqual(len(self.stub.server.requests), 3)
+        self.assertEqual(self.stub.server.connections_count, 1)
+
+    def test_concurrent_calls(self):
+        transport = AsyncHttpTransport(max_connections=4)
+        api = self.get_api(transport=transport)
+
+        async def get_all():
+            return await asyncio.gather(*[api.get_web_payment_details('token') for _index in range(20)])
+
+        results = self.loop.run_until_complete(get_all())
+        self.assertEqual([result[0] for result in results], ['00000'] * 20)
+        self.assertTrue(self.stub.server.connections_count <= 4)
+
+    def test_http_error(self):
+        self.stub.server.response_status = 401
+        api = self.get_api(transport=AsyncHttpTransport())
+        self.assertRaises(
+            PaylineAuthError, self.loop.run_until_complete, api.get_web_payment_details('token')
+        )
+
+    def test_dropped_idempotent_request(self):
+        """a read-only request is sent again when the reused connection is closed without response"""
+        api = self.get_api(transport=AsyncHttpTransport())
+        self.loop.run_until_complete(api.get_web_payment_details('token1'))
+        self.stub.server.drops = [True]
+        self.assertEqual(self.loop.run_until_complete(api.get_web_payment_details('token2'))[0], '00000')
+        self.assertEqual(len(self.stub.server.requests), 3)
+        self.assertEqual(self.stub.server.connections_count, 2)
+
+    def test_dropped_payment_not_sent_again(self):
+        """a payment may have been processed when the connection is closed: it is never sent twice"""
+        api = self.get_api(transport=AsyncHttpTransport())
+        self.loop.run_until_complete(api.get_web_payment_details('token1'))
+        self.stub.server.drops = [True]
+        self.assertRaises(
+            http_client.RemoteDisconnected, self.loop.run_until_complete, api.do_web_payment(
+                amount=Decimal("12.50"), currency=u"EUR", order_ref='ref1',
+                return_url='http://freexian.com/success/', cancel_url='http://freexian.com/cancel/'
+            )
+        )
+        self.assertEqual(len(self.stub.server.requests), 2)
+
+    def test_truncated_response_not_sent_again(self):
+        api = self.get_api(transport=AsyncHttpTransport())
+        self.loop.run_until_complete(api.get_web_payment_details('token1'))
+        self.stub.server.truncations = [True]
+        self.assertRaises(
+            http_client.IncompleteRead, self.loop.run_until_complete, api.get_web_payment_details('token2')
+        )
+        self.assertEqual(len(self.stub.server.requests), 2)
+
+    def test_timeout(self):
+        """socket.timeout is raised as by the sync backend"""
+        self.stub.server.delays = [1]
+        api = self.get_api(transport=AsyncHttpTransport(read_timeout=0.2))
+        self.assertRaises(socket.timeout, self.loop.run_until_complete, api.get_web_payment_details('token'))
+
+    def test_host_header(self):
+        """the Host header is the one of http.client: without the default port"""
+        self.assertEqual(AsyncHttpTransport.host_header('https', 'services.payline.com', 443), 'services.payline.com')
+        self.assertEqual(AsyncHttpTransport.host_header('http', 'localhost', 80), 'localhost')
+        self.assertEqual(AsyncHttpTransport.host_header('http', 'localhost', 8080), 'localhost:8080')
+        self.assertEqual(AsyncHttpTransport.host_header('https', 'localhost', 80), 'localhost:80')
+        self.assertEqual(AsyncHttpTransport.host_header('http', '::1', 8080), '[::1]:8080')
+        request = AsyncHttpTransport().serialize_request('POST', '/', 'localhost', b'<a/>', {'Host': 'other'})
+        self.assertEqual(request.split(b'\r\n')[1], b'Host: localhost')
+
+
+class SimulatorTestCase(unittest.TestCase):
+    """end-to-end calls to the local simulator"""
+
+    @classmethod
+    def setUpClass(cls):
+        cls.simulator = Simulator(port=0).start()
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.simulator.close()
+
+    def setUp(self):
+        self.simulator.latency = self.simulator.fault_rate = self.simulator.http_error_rate = 0
+
+    def get_api(self, api_class=WebPaymentAPI, access_key=u"abCdeFgHiJKLmNoPqrst"):
+        return api_class(
+            u"12345678901234", access_key, u"1234567", homologation=self.simulator.url, transport=HttpTransport()
+        )
+
+    def pay(self, api, amount):
+        return api.do_web_payment(
+            amount=amount, currency=u"EUR", order_ref=u'ref1',
+            return_url='http://freexian.com/success/', cancel_url='http://freexian.com/cancel/'
+        )
+
+    def test_web_payment(self):
+        api = self.get_api()
+        _redirect_url, token = self.pay(api, Decimal("12.50"))
+        result_code, is_transaction_ok, order_ref, amount, currency, _data = api.get_web_payment_details(token)
+        self.assertEqual(result_code, '00000')
+        self.assertTrue(is_transaction_ok)
+        self.assertEqual((order_ref, amount, currency), (u'ref1', Decimal("12.50"), u'EUR'))
+
+    def test_scenarios(self):
+        api = self.get_api()
+        _redirect_url, token = self.pay(api, Decimal("25.00"))
+        self.assertEqual(api.get_web_payment_details(token)[0], '02500')
+        # possible fraud
+        _redirect_url, token = self.pay(api, Decimal("10000"))
+        self.assertFalse(api.get_web_payment_details(token)[1])
+        self.assertNotEqual(api.get_web_payment_details('unknown')[0], '00000')
+        self.assertRaises(PaylineApiError, self.pay, api, Decimal("0"))
+
+    def test_mass_traitment(self):
+        api = self.get_api(MassPaymentAPI)
+        (result_code, mass_traitment_id, _data), = api.do_mass_reset([u'1', u'UNKNOWN2'])
+        self.assertEqual(result_code, '00000')
+        api.wait_mass_traitment(mass_traitment_id, interval=0)
+        _result_code, total_lines, failed_lines, failed, _data = api.get_mass_traitment_details(mass_traitment_id)
+        self.assertEqual((total_lines, failed_lines), (2, 1))
+        self.assertEqual(failed[0]['transactionID'], u'UNKNOWN2')
+
+    def test_direct_payment(self):
+        api = self.get_api(DirectPaymentAPI)
+        card = {'number': u'4970100000000154', 'type': u'CB', 'expirationDate': u'1230', 'cvx': u'123'}
+        result_code, transaction_id, authorization_number, data = api.do_authorization(
+            Decimal("12.50"), u'EUR', u'ref1', card
+        )
+        self.assertEqual(result_code, '00000')
+        self.assertEqual(authorization_number, transaction_id[-6:])
+        self.assertEqual(data['card']['number'], u'497010XXXXXX0154')
+        result_code, capture_id, _data = api.do_capture(transaction_id, Decimal("12.50"), u'EUR')
+        self.assertEqual(result_code, '00000')
+        self.assertEqual(api.do_refund(capture_id, Decimal("12.50"), u'EUR')[0], '00000')
+        self.assertEqual(api.do_reset(transaction_id)[0], '02301')
+
+    def test_wallet(self):
+        api = self.get_api(DirectPaymentAPI)
+        card = {'number': u'4970100000000154', 'type': u'CB', 'expirationDate': u'1230', 'cvx': u'123'}
+        self.assertEqual(api.create_wallet(u'simulated-wallet', card, last_name=u'Doe')[0], '02500')
+        other_card = dict(card, number=u'5555555555554444')
+        self.assertEqual(api.update_wallet(u'simulated-wallet', card=other_card, card_ind=u'2')[0], '02500')
+        result_code, is_disabled, wallet, _data = api.get_wallet(u'simulated-wallet')
+        self.assertEqual((result_code, is_disabled, wallet['lastName']), ('02500', False, u'Doe'))
+        result_code, cards, _data = api.get_cards(u'simulated-wallet')
+        self.assertEqual([item['card']['number'] for item in cards], [u'497010XXXXXX0154', u'555555XXXXXX4444'])
+        result_code, wallet_ids, _data = api.disable_wallet([u'simulated-wallet', u'unknown'])
+        self.assertEqual((result_code, wallet_ids), ('02500', [u'simulated-wallet']))
+        self.assertEqual(
+            api.do_immediate_wallet_payment(u'simulated-wallet', Decimal("12.50"), u'EUR', u'ref2')[0], '02504'
+        )
+        self.assertEqual(api.enable_wallet(u'simulated-wallet')[0], '02500')
+        result_code, transaction_id, authorization_number, _data = api.do_immediate_wallet_payment(
+            u'simulated-wallet', Decimal("12.50"), u'EUR', u'ref2', card_ind=u'2'
+        )
+        self.assertEqual((result_code, authorization_number), ('00000', transaction_id[-6:]))
+
+    def test_authentication(self):
+        api = self.get_api(access_key=u'wrong')
+        self.assertRaises(PaylineAuthError, api.get_web_payment_details, 'token')
+
+    def test_latency(self):
+        self.simulator.latency = 0.2
+        api = self.get_api()
+        start = time.time()
+        api.get_web_payment_details('token')
+        self.assertTrue(time.time() - start >= 0.2)
+
+    def test_injected_errors(self):
+        api = self.get_api()
+        self.simulator.fault_rate = 1
+        self.assertRaises(PaylineApiError, api.get_web_payment_details, 'token')
+        self.simulator.fault_rate = 0
+        self.simulator.http_error_rate = 1
+        self.assertRaises(PaylineAuthError, api.get_web_payment_details, 'token')
+
+
 if __name__ == '__main__':
     unittest.main()
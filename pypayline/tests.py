@@ -6,16 +6,50 @@ python tests.py [+soap]
 if +soap -> Use the real SOAP API
 """
 
-from datetime import datetime
+from datetime import datetime, timedelta
 from decimal import Decimal
 import logging
+import pickle
+import os
 import re
+import shutil
+import socket
 import sys
+import tempfile
+import threading
+import time
 import unittest
 
-from pypayline.backends.mock import SoapMockBackend
-from pypayline.client import WebPaymentAPI as WebPaymentAPIBase, DirectPaymentAPI as DirectPaymentAPIBase
-from pypayline.exceptions import InvalidCurrencyError, PaylineApiError, PaylineAuthError
+import six
+
+from pypayline.backends import mock as mock_backend
+from pypayline.backends.mock import SoapMockBackend, StateStore
+from pypayline.batch import BatchResults, prefetch
+from pypayline.cache import MemoryStore, ResultCache, SQLiteStore, TTLPolicy, WalletCache
+from pypayline.client import (
+    WebPaymentAPI as WebPaymentAPIBase, DirectPaymentAPI as DirectPaymentAPIBase,
+    MassPaymentAPI as MassPaymentAPIBase, ExtendedAPI as ExtendedAPIBase
+)
+from pypayline.idempotency import IdempotencyLayer
+from pypayline.notifications import ACCEPTED, BUSY, DUPLICATE, NotificationReceiver
+from pypayline.pool import PaylineClientPool
+from pypayline.resilience import CircuitBreaker, ResiliencePolicy, RetryPolicy
+from pypayline.results import BillingRecord, Card, PaymentRecord, WebPaymentDetails
+from pypayline import schedule
+from pypayline.exceptions import (
+    InvalidCurrencyError, PaylineApiError, PaylineAuthError, MassTraitmentTimeoutError, ArgumentsError,
+    CircuitOpenError
+)
+
+try:
+    import asyncio
+    from pypayline.aioclient import (
+        AsyncWebPaymentAPI as AsyncWebPaymentAPIBase, AsyncDirectPaymentAPI as AsyncDirectPaymentAPIBase
+    )
+    from pypayline.backends.aiomock import AsyncSoapMockBackend
+    from pypayline.aionotifications import AsyncNotificationReceiver
+except (ImportError, SyntaxError):
+    asyncio = None
 
 
 logger = logging.getLogger('pypayline')
@@ -45,7 +79,56 @@ class DirectPaymentAPI(DirectPaymentAPIBase):
     backend_class = SoapMockBackend if USE_MOCK else DirectPaymentAPIBase.backend_class
 
 
+class MassPaymentAPI(MassPaymentAPIBase):
+    """Class for calling the payline services"""
+    backend_class = SoapMockBackend if USE_MOCK else MassPaymentAPIBase.backend_class
+
+
+class ExtendedAPI(ExtendedAPIBase):
+    """Class for calling the payline services"""
+    backend_class = SoapMockBackend if USE_MOCK else ExtendedAPIBase.backend_class
+
+
+if asyncio is not None:
+    class AsyncWebPaymentAPI(AsyncWebPaymentAPIBase):
+        """Class for calling the payline services from an event loop"""
+        backend_class = AsyncSoapMockBackend if USE_MOCK else AsyncWebPaymentAPIBase.backend_class
+
+    class AsyncDirectPaymentAPI(AsyncDirectPaymentAPIBase):
+        """Class for calling the payline services from an event loop"""
+        backend_class = AsyncSoapMockBackend if USE_MOCK else AsyncDirectPaymentAPIBase.backend_class
+
+
+# test card of the direct payments
+DIRECT_CARD = {'number': u'4970100000000154', 'type': u'CB', 'expirationDate': u'1230', 'cvx': u'123'}
+
+
+class CoroutineRunner(object):
+    """Wraps an asyncio client: its coroutines are run until complete, so the scenarios can be shared"""
+    api_class = None
+
+    def __init__(self, *args, **kwargs):
+        self.api = self.api_class(*args, **kwargs)
+
+    def __getattr__(self, name):
+        attribute = getattr(self.api, name)
+        if asyncio.iscoroutinefunction(attribute):
+            return lambda *args, **kwargs: asyncio.get_event_loop().run_until_complete(attribute(*args, **kwargs))
+        if name.startswith('iter_'):
+            return lambda *args, **kwargs: asyncio.get_event_loop().run_until_complete(
+                self.collect(attribute(*args, **kwargs))
+            )
+        return attribute
+
+    @staticmethod
+    async def collect(iterator):
+        """list of the items of an asynchronous iterator"""
+        return [item async for item in iterator]
+
+
 class SoapApiTestCase(unittest.TestCase):
+    web_payment_api_class = WebPaymentAPI
+    direct_payment_api_class = DirectPaymentAPI
 
     def setUp(self):
         """initialize mocks"""
@@ -73,7 +156,7 @@ class SoapApiTestCase(unittest.TestCase):
 
     def test_header(self):
         """check the authorization header is filled"""
-        client = WebPaymentAPI(
+        client = self.web_payment_api_class(
             merchant_id=self.merchant_id, access_key=self.access_key, contract_number=self.contract_number,
             homologation=True
         )
@@ -85,7 +168,7 @@ class SoapApiTestCase(unittest.TestCase):
 
         dummy_order_ref = datetime.now().strftime('%Y%m%d%H%M')
 
-        client = WebPaymentAPI(
+        client = self.web_payment_api_class(
             merchant_id=self.merchant_id, access_key=self.access_key, contract_number=self.contract_number,
             homologation=True
         )
@@ -110,7 +193,7 @@ class SoapApiTestCase(unittest.TestCase):
 
         dummy_order_ref = datetime.now().strftime('%Y%m%d%H%M')
 
-        client = WebPaymentAPI(
+        client = self.web_payment_api_class(
             merchant_id=self.merchant_id, access_key=self.access_key, contract_number=self.contract_number,
             homologation=True
         )
@@ -135,7 +218,7 @@ class SoapApiTestCase(unittest.TestCase):
 
         dummy_order_ref = datetime.now().strftime('%Y%m%d%H%M')
 
-        client = WebPaymentAPI(
+        client = self.web_payment_api_class(
             merchant_id=self.merchant_id, access_key=self.access_key, contract_number=self.contract_number,
             homologation=True, cache=u"WebPaymentAPI"
         )
@@ -151,7 +234,7 @@ class SoapApiTestCase(unittest.TestCase):
         logger.setLevel(logging.DEBUG)
         dummy_order_ref = datetime.now().strftime('%Y%m%d%H%M')
 
-        client = WebPaymentAPI(
+        client = self.web_payment_api_class(
             merchant_id=self.merchant_id, access_key=self.access_key, contract_number=self.contract_number,
             homologation=True
         )
@@ -176,7 +259,7 @@ class SoapApiTestCase(unittest.TestCase):
         """Check error if wrong value"""
         dummy_order_ref = datetime.now().strftime('%Y%m%d%H%M')
 
-        client = WebPaymentAPI(
+        client = self.web_payment_api_class(
             merchant_id=self.merchant_id, access_key=self.access_key, contract_number=self.contract_number,
             homologation=True
         )
@@ -190,7 +273,7 @@ class SoapApiTestCase(unittest.TestCase):
         """Check error if wrong value"""
         dummy_order_ref = datetime.now().strftime('%Y%m%d%H%M')
 
-        client = WebPaymentAPI(
+        client = self.web_payment_api_class(
             merchant_id=self.merchant_id, access_key=self.access_key, contract_number=self.contract_number,
             homologation=True
         )
@@ -204,7 +287,7 @@ class SoapApiTestCase(unittest.TestCase):
         """Check error if wrong currency"""
         dummy_order_ref = datetime.now().strftime('%Y%m%d%H%M')
 
-        client = WebPaymentAPI(
+        client = self.web_payment_api_class(
             merchant_id=self.merchant_id, access_key=self.access_key, contract_number=self.contract_number,
             homologation=True
         )
@@ -219,7 +302,7 @@ class SoapApiTestCase(unittest.TestCase):
         """Check error if wrong order_ref"""
         dummy_order_ref = u''
 
-        client = WebPaymentAPI(
+        client = self.web_payment_api_class(
             merchant_id=self.merchant_id, access_key=self.access_key, contract_number=self.contract_number,
             homologation=True
         )
@@ -234,7 +317,7 @@ class SoapApiTestCase(unittest.TestCase):
         """Check error if wrong return url"""
         dummy_order_ref = datetime.now().strftime('%Y%m%d%H%M')
 
-        client = WebPaymentAPI(
+        client = self.web_payment_api_class(
             merchant_id=self.merchant_id, access_key=self.access_key, contract_number=self.contract_number,
             homologation=True
         )
@@ -249,7 +332,7 @@ class SoapApiTestCase(unittest.TestCase):
         """Check error if wrong cancel url"""
         dummy_order_ref = datetime.now().strftime('%Y%m%d%H%M')
 
-        client = WebPaymentAPI(
+        client = self.web_payment_api_class(
             merchant_id=self.merchant_id, access_key=self.access_key, contract_number=self.contract_number,
             homologation=True
         )
@@ -264,7 +347,7 @@ class SoapApiTestCase(unittest.TestCase):
         """Check error if Invalid contract"""
         dummy_order_ref = datetime.now().strftime('%Y%m%d%H%M')
 
-        client = WebPaymentAPI(
+        client = self.web_payment_api_class(
             merchant_id=self.merchant_id, access_key=self.access_key, contract_number='',
             homologation=True, cache=False
         )
@@ -279,7 +362,7 @@ class SoapApiTestCase(unittest.TestCase):
         """Check error if Invalid merchant Id"""
         dummy_order_ref = datetime.now().strftime('%Y%m%d%H%M')
 
-        client = WebPaymentAPI(
+        client = self.web_payment_api_class(
             merchant_id=u"1234", access_key=self.access_key, contract_number=self.contract_number,
             homologation=True, cache=False
         )
@@ -293,7 +376,7 @@ class SoapApiTestCase(unittest.TestCase):
     def test_invalid_access_key(self):
         """Check error if Invalid access key"""
         dummy_order_ref = datetime.now().strftime('%Y%m%d%H%M')
-        client = WebPaymentAPI(
+        client = self.web_payment_api_class(
             merchant_id=self.merchant_id, access_key=u"abcd", contract_number=self.contract_number,
             homologation=True, cache=False
         )
@@ -309,7 +392,7 @@ class SoapApiTestCase(unittest.TestCase):
 
         dummy_order_ref = datetime.now().strftime('%Y%m%d%H%M')
 
-        client = WebPaymentAPI(
+        client = self.web_payment_api_class(
             merchant_id=self.merchant_id, access_key=self.access_key, contract_number=self.contract_number,
             homologation=True
         )
@@ -331,7 +414,7 @@ class SoapApiTestCase(unittest.TestCase):
 
         dummy_order_ref = datetime.now().strftime('%Y%m%d%H%M')
 
-        client = WebPaymentAPI(
+        client = self.web_payment_api_class(
             merchant_id=self.merchant_id, access_key=self.access_key, contract_number=self.contract_number,
             homologation=True
         )
@@ -350,7 +433,7 @@ class SoapApiTestCase(unittest.TestCase):
         logger.setLevel(logging.DEBUG)
 
         if USE_MOCK:
-            client = DirectPaymentAPI(
+            client = self.direct_payment_api_class(
                 merchant_id=self.merchant_id, access_key=self.access_key, contract_number=self.contract_number,
                 homologation=True
             )
@@ -364,6 +447,1379 @@ class SoapApiTestCase(unittest.TestCase):
             self.assertTrue(order_ref, '1')
             self.assertTrue(type(data) is dict)
 
+    def test_typed_results(self):
+        """check the typed results have the values of the tuples"""
+        if USE_MOCK:
+            client = self.web_payment_api_class(
+                merchant_id=self.merchant_id, access_key=self.access_key, contract_number=self.contract_number,
+                homologation=True
+            )
+            _redirect_url, token = client.do_web_payment(
+                amount=Decimal("12.50"), currency=u"EUR", order_ref=u'typed',
+                return_url='http://freexian.com/success/', cancel_url='http://freexian.com/cancel/'
+            )
+            details = client.get_web_payment_details_result(token)
+            self.assertTrue(isinstance(details, WebPaymentDetails))
+            self.assertEqual(
+                (details.result_code, details.is_transaction_ok, details.order_ref, details.amount),
+                client.get_web_payment_details(token)[:4]
+            )
+            self.assertEqual(details.payment.currency, 978)
+            self.assertEqual(details.extendedCard.network, u'SUPERCARD')
+
+            client = self.direct_payment_api_class(
+                merchant_id=self.merchant_id, access_key=self.access_key, contract_number=self.contract_number,
+                homologation=True
+            )
+            record = client.get_payment_record_result(self.contract_number, '12345')
+            self.assertEqual((record.result_code, record.order_ref, record.amount), ('00000', '12345', Decimal(10)))
+            self.assertEqual(record.recurring.billingLeft, 3)
+            self.assertEqual(len(record.billing_records), 1)
+            self.assertEqual(record.billing_records[0].authorization.number, '123456789')
+
+    def test_iter_billing_records(self):
+        """check the billing records of a recurring payment"""
+        if USE_MOCK:
+            client = self.direct_payment_api_class(
+                merchant_id=self.merchant_id, access_key=self.access_key, contract_number=self.contract_number,
+                homologation=True
+            )
+
+            billing_records = list(client.iter_billing_records(self.contract_number, '12345'))
+
+            self.assertEqual(len(billing_records), 1)
+            self.assertEqual(billing_records[0]['amount'], 1000)
+
+    def direct_client(self, access_key=None, **kwargs):
+        return self.direct_payment_api_class(
+            merchant_id=self.merchant_id, access_key=access_key or self.access_key,
+            contract_number=self.contract_number, homologation=True, **kwargs
+        )
+
+    @unittest.skipIf(not USE_MOCK, 'the direct payments are only tested with the mock')
+    def test_authorization_capture_refund(self):
+        """check a payment without redirection"""
+        client = self.direct_client()
+        result_code, transaction_id, authorization_number, data = client.do_authorization(
+            Decimal("42.50"), u'EUR', u'order1', DIRECT_CARD
+        )
+        self.assertEqual(result_code, '00000')
+        self.assertTrue(transaction_id)
+        self.assertTrue(authorization_number)
+        self.assertEqual(data['card']['number'], u'497010XXXXXX0154')
+
+        result_code, capture_id, _data = client.do_capture(transaction_id, Decimal("42.50"), u'EUR')
+        self.assertEqual(result_code, '00000')
+        self.assertNotEqual(capture_id, transaction_id)
+        # already captured
+        self.assertEqual(client.do_capture(transaction_id, Decimal("42.50"), u'EUR')[0], '02301')
+
+        self.assertEqual(client.do_refund(capture_id, Decimal("40"), u'EUR', comment=u'refund')[0], '00000')
+        self.assertEqual(client.do_refund(capture_id, Decimal("2.51"), u'EUR')[0], '02303')
+        self.assertEqual(client.do_refund(capture_id, Decimal("2.50"), u'EUR')[0], '00000')
+
+    @unittest.skipIf(not USE_MOCK, 'the direct payments are only tested with the mock')
+    def test_authorization_reset(self):
+        client = self.direct_client()
+        _result_code, transaction_id, _number, _data = client.do_authorization(
+            Decimal("10"), u'USD', u'order2', DIRECT_CARD
+        )
+        self.assertEqual(client.do_refund(transaction_id, Decimal("10"), u'USD')[0], '02301')
+        self.assertEqual(client.do_reset(transaction_id)[0], '00000')
+        self.assertEqual(client.do_capture(transaction_id, Decimal("10"), u'USD')[0], '02301')
+        self.assertEqual(client.do_reset(u'UNKNOWN')[0], '02301')
+
+    @unittest.skipIf(not USE_MOCK, 'the direct payments are only tested with the mock')
+    def test_authorization_and_capture(self):
+        client = self.direct_client()
+        result_code, transaction_id, _number, _data = client.do_authorization(
+            Decimal("10"), u'EUR', u'order3', DIRECT_CARD, payline_action=101
+        )
+        self.assertEqual(result_code, '00000')
+        self.assertEqual(client.do_refund(transaction_id, Decimal("10"), u'EUR')[0], '00000')
+
+    @unittest.skipIf(not USE_MOCK, 'the direct payments are only tested with the mock')
+    def test_authorization_refused(self):
+        client = self.direct_client()
+        card = dict(DIRECT_CARD, number=mock_backend.REFUSED_CARD_NUMBER)
+        result_code, transaction_id, authorization_number, _data = client.do_authorization(
+            Decimal("10"), u'EUR', u'order4', card
+        )
+        self.assertEqual((result_code, transaction_id, authorization_number), ('01100', None, None))
+
+    def test_authorization_invalid_currency(self):
+        client = self.direct_client()
+        self.assertRaises(
+            InvalidCurrencyError, client.do_authorization, Decimal("10"), u'FRF', u'order5', DIRECT_CARD
+        )
+        self.assertRaises(InvalidCurrencyError, client.do_capture, u'123', Decimal("10"), u'FRF')
+
+    def test_direct_amounts_as_web_payment(self):
+        """the amounts of the direct payments are converted to cents as by do_web_payment"""
+        web_client = self.web_payment_api_class(
+            merchant_id=self.merchant_id, access_key=self.access_key, contract_number=self.contract_number
+        )
+        web_request = web_client.build_web_payment_request(
+            amount=Decimal("12.345"), currency=u'EUR', order_ref=u'order9', taxes=Decimal("1.10"),
+            return_url='http://freexian.com/success/', cancel_url='http://freexian.com/cancel/'
+        )
+        request = self.direct_client().build_authorization_request(
+            Decimal("12.345"), u'EUR', u'order9', DIRECT_CARD, taxes=Decimal("1.10")
+        )
+        self.assertEqual(request['payment']['amount'], web_request['payment']['amount'])
+        self.assertEqual(
+            (request['order']['amount'], request['order']['taxes']),
+            (web_request['order']['amount'], web_request['order']['taxes'])
+        )
+
+    @unittest.skipIf(not USE_MOCK, 'the direct payments are only tested with the mock')
+    def test_debit(self):
+        client = self.direct_client()
+        result_code, transaction_id, _data = client.do_debit(
+            Decimal("15"), u'EUR', u'order6', DIRECT_CARD, u'123456', datetime(2016, 6, 6, 12, 30)
+        )
+        self.assertEqual(result_code, '00000')
+        self.assertEqual(client.do_refund(transaction_id, Decimal("15"), u'EUR')[0], '00000')
+        self.assertEqual(client.do_debit(Decimal("15"), u'EUR', u'order7', DIRECT_CARD, u'', u'')[0], '02305')
+
+    def test_direct_payment_invalid_access_key(self):
+        client = self.direct_client(access_key=u'wrong')
+        self.assertRaises(
+            PaylineAuthError, client.do_authorization, Decimal("10"), u'EUR', u'order8', DIRECT_CARD
+        )
+
+    @unittest.skipIf(not USE_MOCK, 'the wallets are only tested with the mock')
+    def test_wallet(self):
+        """check the life of a wallet"""
+        client = self.direct_client()
+        wallet_id = u'wallet-{0}'.format(id(client))
+        result_code, data = client.create_wallet(wallet_id, DIRECT_CARD, last_name=u'Doe', email=u'j@doe.com')
+        self.assertEqual(result_code, '02500')
+        self.assertEqual(data['card']['number'], u'497010XXXXXX0154')
+        self.assertEqual(client.create_wallet(wallet_id, DIRECT_CARD)[0], '02502')
+
+        result_code, is_disabled, wallet, _data = client.get_wallet(wallet_id)
+        self.assertEqual((result_code, is_disabled), ('02500', False))
+        self.assertEqual((wallet['lastName'], wallet['email']), (u'Doe', u'j@doe.com'))
+        self.assertNotIn('cvx', wallet['card'])
+
+        other_card = dict(DIRECT_CARD, number=u'5555555555554444', expirationDate=u'0131')
+        self.assertEqual(client.update_wallet(wallet_id, card=other_card, card_ind=u'2')[0], '02500')
+        result_code, cards, _data = client.get_cards(wallet_id)
+        self.assertEqual([card['cardInd'] for card in cards], [u'1', u'2'])
+        self.assertEqual(cards[1]['card']['number'], u'555555XXXXXX4444')
+
+        result_code, transaction_id, authorization_number, _data = client.do_immediate_wallet_payment(
+            wallet_id, Decimal("20"), u'EUR', u'order9', card_ind=u'2'
+        )
+        self.assertEqual(result_code, '00000')
+        self.assertTrue(authorization_number)
+        self.assertEqual(client.do_capture(transaction_id, Decimal("20"), u'EUR')[0], '00000')
+
+        self.assertEqual(client.disable_wallet(wallet_id)[:2], ('02500', [wallet_id]))
+        self.assertEqual(client.get_wallet(wallet_id)[1], True)
+        self.assertEqual(
+            client.do_immediate_wallet_payment(wallet_id, Decimal("20"), u'EUR', u'order10')[0], '02504'
+        )
+        self.assertEqual(client.enable_wallet(wallet_id)[0], '02500')
+        self.assertEqual(client.get_wallet(wallet_id)[1], False)
+
+        self.assertEqual(client.get_wallet(u'unknown')[0], '02503')
+        self.assertEqual(client.get_cards(u'unknown')[1], [])
+
+    @unittest.skipIf(not USE_MOCK, 'the wallets are only tested with the mock')
+    def test_wallet_cache(self):
+        """check the cached wallets are invalidated by the updates"""
+        client = self.direct_client(wallet_cache=True)
+        wallet_id = u'cached-wallet-{0}'.format(id(client))
+        client.create_wallet(wallet_id, DIRECT_CARD, last_name=u'Doe')
+        self.assertEqual(client.get_wallet(wallet_id)[2]['lastName'], u'Doe')
+        self.assertEqual(client.get_wallet(wallet_id)[2]['lastName'], u'Doe')
+        self.assertEqual((client.wallet_cache.hits, client.wallet_cache.misses), (1, 1))
+
+        client.update_wallet(wallet_id, last_name=u'Smith')
+        self.assertEqual(client.get_wallet(wallet_id)[2]['lastName'], u'Smith')
+        self.assertEqual(client.wallet_cache.misses, 2)
+
+        self.assertEqual(len(client.get_cards(wallet_id)[1]), 1)
+        client.disable_wallet([wallet_id])
+        self.assertEqual(client.get_cards(wallet_id)[1][0]['isDisabled'], u'1')
+        self.assertEqual(client.get_wallet(wallet_id)[1], True)
+        # the errors are not cached
+        client.get_wallet(u'unknown')
+        client.get_wallet(u'unknown')
+        self.assertEqual(client.wallet_cache.hits, 1)
+
+
+
+class BatchTestCase(unittest.TestCase):
+    """get_web_payment_details_many and the batches of calls"""
+
+    def setUp(self):
+        self.merchant_id, self.access_key, self.contract_number = u"12345678901234", u"abCdeFgHiJKLmNoPqrst", u"1234567"
+
+    def test_get_web_payment_details_many(self):
+        if USE_MOCK:
+            client = WebPaymentAPI(
+                merchant_id=self.merchant_id, access_key=self.access_key, contract_number=self.contract_number,
+                homologation=True
+            )
+            _redirect_url, token = client.do_web_payment(
+                amount=Decimal("12.50"), currency=u"EUR", order_ref=u'order',
+                return_url='http://freexian.com/success/', cancel_url='http://freexian.com/cancel/'
+            )
+
+            results = client.get_web_payment_details_many([token] * 20 + ['unknown'], max_workers=4)
+            details = dict(results)
+            self.assertEqual(results.count, 21)
+            self.assertEqual(details[token][0], '00000')
+            self.assertEqual(details[token][3], Decimal("12.50"))
+            self.assertNotEqual(details['unknown'][0], '00000')
+            self.assertEqual(results.errors, {})
+
+    def test_errors_collected(self):
+        if USE_MOCK:
+            client = WebPaymentAPI(
+                merchant_id=self.merchant_id, access_key=u'wrong', contract_number=self.contract_number,
+                homologation=True
+            )
+            results = client.get_web_payment_details_many(['token1', 'token2'])
+            self.assertEqual(list(results), [])
+            self.assertEqual(sorted(results.errors), ['token1', 'token2'])
+            self.assertTrue(isinstance(results.errors['token1'], PaylineAuthError))
+
+    def test_max_workers(self):
+        running = []
+        max_running = []
+        lock = threading.Lock()
+
+        def call(item):
+            with lock:
+                running.append(item)
+                max_running.append(len(running))
+            time.sleep(0.01)
+            with lock:
+                running.remove(item)
+            return item * 2
+
+        results = BatchResults(call, range(40), max_workers=3)
+        self.assertEqual(sorted(results), [(index, index * 2) for index in range(40)])
+        self.assertEqual(max(max_running), 3)
+
+    def test_rate_limit(self):
+        start = time.time()
+        results = list(BatchResults(lambda item: item, range(11), max_workers=4, rate_limit=50))
+        self.assertEqual(len(results), 11)
+        # the first call is done at once, then 1 call every 20ms
+        self.assertTrue(time.time() - start >= 0.19)
+
+    def test_stop_early(self):
+        results = BatchResults(lambda item: item, range(10000), max_workers=2)
+        for _item, _value in results:
+            break
+        self.assertTrue(results.count < 100)
+
+
+@unittest.skipIf(not USE_MOCK, 'the state of the mock is only tested with the mock')
+class MockBackendTestCase(unittest.TestCase):
+    """state of the payments in the mock backend"""
+
+    def setUp(self):
+        self.merchant_id, self.access_key, self.contract_number = u"12345678901234", u"abCdeFgHiJKLmNoPqrst", u"1234567"
+
+    def new_client(self):
+        return WebPaymentAPI(
+            merchant_id=self.merchant_id, access_key=self.access_key, contract_number=self.contract_number,
+            homologation=True
+        )
+
+    def pay(self, client, amount, order_ref):
+        return client.do_web_payment(
+            amount=amount, currency=u"EUR", order_ref=order_ref,
+            return_url='http://freexian.com/success/', cancel_url='http://freexian.com/cancel/'
+        )
+
+    def test_unique_tokens(self):
+        client = self.new_client()
+        _redirect_url1, token1 = self.pay(client, Decimal("12.50"), u'order1')
+        _redirect_url2, token2 = self.pay(client, Decimal("30"), u'order2')
+        self.assertNotEqual(token1, token2)
+
+        # the first payment is still readable
+        res_code, _is_transaction_ok, order_ref, amount, _currency, _raw_data = client.get_web_payment_details(token1)
+        self.assertEqual((res_code, order_ref, amount), ('00000', u'order1', Decimal("12.50")))
+        res_code, _is_transaction_ok, order_ref, amount, _currency, _raw_data = client.get_web_payment_details(token2)
+        self.assertEqual((res_code, order_ref, amount), ('00000', u'order2', Decimal("30")))
+
+    def test_concurrent_payments(self):
+        errors = []
+
+        def pay_many(thread_index):
+            client = self.new_client()
+            try:
+                for index in range(200):
+                    amount = Decimal(thread_index * 1000 + index + 1) / 100
+                    order_ref = u'order-{0}-{1}'.format(thread_index, index)
+                    _redirect_url, token = self.pay(client, amount, order_ref)
+                    details = client.get_web_payment_details(token)
+                    if details[2:4] != (order_ref, amount):
+                        errors.append(details)
+            except Exception as err:
+                errors.append(err)
+
+        threads = [threading.Thread(target=pay_many, args=(index, )) for index in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        self.assertEqual(errors, [])
+
+    def test_state_store_eviction(self):
+        store = StateStore(max_size=2)
+        store.set('a', {'value': 1})
+        store.set('b', {'value': 2})
+        self.assertEqual(store.get('a'), {'value': 1})
+        store.set('c', {'value': 3})
+        self.assertEqual(len(store), 2)
+        self.assertEqual(store.get('b'), None)
+        self.assertEqual(store.update('a', lambda state: state['value']), 1)
+        self.assertEqual(store.update('b', lambda state: state['value']), None)
+
+    def test_evicted_token(self):
+        original_payments = mock_backend.PAYMENTS
+        mock_backend.PAYMENTS = StateStore(max_size=1)
+        try:
+            client = self.new_client()
+            _redirect_url, token1 = self.pay(client, Decimal("12.50"), u'order1')
+            _redirect_url, token2 = self.pay(client, Decimal("12.50"), u'order2')
+            self.assertNotEqual(client.get_web_payment_details(token1)[0], '00000')
+            self.assertEqual(client.get_web_payment_details(token2)[0], '00000')
+        finally:
+            mock_backend.PAYMENTS = original_payments
+
+
+class ClientPoolTestCase(unittest.TestCase):
+    """clients of several merchant accounts"""
+
+    def setUp(self):
+        self.merchant_id, self.access_key, self.contract_number = u"12345678901234", u"abCdeFgHiJKLmNoPqrst", u"1234567"
+        self.pool = PaylineClientPool(WebPaymentAPI, max_size=3, homologation=True)
+
+    def test_client_per_merchant(self):
+        client = self.pool.get(self.merchant_id, self.access_key, self.contract_number)
+        self.assertIs(self.pool.get(self.merchant_id, self.access_key, self.contract_number), client)
+        other_client = self.pool.get(u'other', u'key', self.contract_number)
+        self.assertIsNot(other_client, client)
+        self.assertNotEqual(other_client.http_headers, client.http_headers)
+        self.assertEqual(len(self.pool), 2)
+        self.assertEqual(self.pool.created, 2)
+
+    def test_payment(self):
+        client = self.pool.get(self.merchant_id, self.access_key, self.contract_number)
+        _redirect_url, token = client.do_web_payment(
+            amount=Decimal("12.50"), currency=u"EUR", order_ref=u'order1',
+            return_url='http://freexian.com/success/', cancel_url='http://freexian.com/cancel/'
+        )
+        self.assertEqual(client.get_web_payment_details(token)[0], '00000')
+        self.assertRaises(
+            PaylineAuthError, self.pool.get(self.merchant_id, u'wrong key').get_web_payment_details, token
+        )
+
+    def test_lru(self):
+        first = self.pool.get(u'1', u'key')
+        self.pool.get(u'2', u'key')
+        self.pool.get(u'3', u'key')
+        self.assertIs(self.pool.get(u'1', u'key'), first)
+        self.pool.get(u'4', u'key')
+        self.assertEqual(len(self.pool), 3)
+        self.assertIs(self.pool.get(u'1', u'key'), first)
+        self.pool.get(u'2', u'key')
+        self.assertEqual(self.pool.created, 5)
+
+    def test_remove(self):
+        self.pool.get(u'1', u'key')
+        self.pool.get(u'1', u'other key')
+        self.pool.get(u'2', u'key')
+        self.pool.remove(u'1', u'key')
+        self.assertEqual(len(self.pool), 2)
+        self.pool.remove(u'1')
+        self.assertEqual(len(self.pool), 1)
+        self.pool.clear()
+        self.assertEqual(len(self.pool), 0)
+
+    def test_threads(self):
+        pool = PaylineClientPool(WebPaymentAPI, homologation=True)
+        clients = []
+
+        def get_clients():
+            for index in range(100):
+                clients.append(pool.get(u'{0}'.format(index % 10), u'key'))
+
+        threads = [threading.Thread(target=get_clients) for _index in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        self.assertEqual(len(clients), 800)
+        self.assertEqual(len(set(id(client) for client in clients)), 10)
+        self.assertEqual(pool.created, 10)
+
+
+class ResiliencePolicyTestCase(unittest.TestCase):
+    """retries and circuit breaker without network"""
+
+    def setUp(self):
+        self.now = 1000.0
+        self.calls = []
+
+    def failing(self, errors):
+        """function failing with the given errors, then returning the number of calls"""
+        def function(timeout):
+            self.calls.append(timeout)
+            if errors:
+                raise errors.pop(0)
+            return len(self.calls)
+        return function
+
+    def test_backoff(self):
+        retry = RetryPolicy(backoff=0.1, multiplier=2, max_backoff=0.3, jitter=0)
+        self.assertEqual([retry.delay(attempt) for attempt in (1, 2, 3)], [0.1, 0.2, 0.3])
+        retry = RetryPolicy(backoff=0.1, jitter=0.5)
+        self.assertTrue(0.05 <= retry.delay(1) <= 0.1)
+
+    def test_retry_idempotent_operations(self):
+        delays = []
+        policy = ResiliencePolicy(
+            timeouts={'getPaymentRecord': 3}, retry=RetryPolicy(jitter=0), sleep=delays.append
+        )
+        function = self.failing([socket.timeout(), socket.error()])
+        self.assertEqual(policy.call('getPaymentRecord', function), 3)
+        self.assertEqual(self.calls, [3, 3, 3])
+        self.assertEqual(delays, [0.1, 0.2])
+        self.assertRaises(socket.error, policy.call, 'doWebPayment', self.failing([socket.error()]))
+        self.assertRaises(ValueError, policy.call, 'getPaymentRecord', self.failing([ValueError()]))
+        self.assertEqual(len(self.calls), 5)
+
+    def test_circuit_breaker(self):
+        breaker = CircuitBreaker(failure_rate=0.5, window=4, min_calls=4, reset_timeout=30, clock=lambda: self.now)
+        for failed in (False, True, False):
+            breaker.before_call()
+            breaker.record(failed)
+        self.assertEqual(breaker.state, CircuitBreaker.CLOSED)
+        breaker.record(True)
+        self.assertEqual(breaker.state, CircuitBreaker.OPEN)
+        self.assertRaises(CircuitOpenError, breaker.before_call)
+        self.now += 30
+        breaker.before_call()  # the trial call
+        self.assertRaises(CircuitOpenError, breaker.before_call)
+        breaker.record(True)
+        self.assertEqual(breaker.state, CircuitBreaker.OPEN)
+        self.now += 30
+        breaker.before_call()
+        breaker.record(False)
+        self.assertEqual(breaker.state, CircuitBreaker.CLOSED)
+        breaker.before_call()
+
+    def test_only_transient_errors_open_the_circuit(self):
+        breaker = CircuitBreaker(failure_rate=0.5, window=4, min_calls=4)
+        policy = ResiliencePolicy(circuit_breaker=breaker)
+        for _index in range(4):
+            self.assertRaises(ValueError, policy.call, 'doWebPayment', self.failing([ValueError()]))
+        self.assertEqual(breaker.state, CircuitBreaker.CLOSED)
+        for _index in range(2):
+            self.assertRaises(socket.error, policy.call, 'doWebPayment', self.failing([socket.error()]))
+        self.assertEqual(breaker.state, CircuitBreaker.OPEN)
+        self.assertRaises(CircuitOpenError, policy.call, 'doWebPayment', self.failing([]))
+
+
+@unittest.skipIf(not USE_MOCK, 'the cache is only tested with the mock')
+class ResultCacheTestCase(unittest.TestCase):
+    """cache of the payment details and records"""
+
+    def setUp(self):
+        self.merchant_id, self.access_key, self.contract_number = u"12345678901234", u"abCdeFgHiJKLmNoPqrst", u"1234567"
+        self.now = 1000.0
+
+    def clock(self):
+        return self.now
+
+    def new_client(self, result_cache):
+        client = WebPaymentAPI(
+            merchant_id=self.merchant_id, access_key=self.access_key, contract_number=self.contract_number,
+            homologation=True, result_cache=result_cache
+        )
+        _redirect_url, self.token = client.do_web_payment(
+            amount=Decimal("12.50"), currency=u"EUR", order_ref=u'order',
+            return_url='http://freexian.com/success/', cancel_url='http://freexian.com/cancel/'
+        )
+        return client
+
+    def test_disabled_by_default(self):
+        client = self.new_client(None)
+        self.assertEqual(client.result_cache, None)
+        self.assertEqual(client.get_web_payment_details(self.token)[0], '00000')
+
+    def test_hits(self):
+        client = self.new_client(True)
+        first = client.get_web_payment_details(self.token)
+        second = client.get_web_payment_details(self.token)
+        self.assertEqual(first, second)
+        self.assertEqual(client.result_cache.stats, {'hits': 1, 'misses': 1, 'hit_ratio': 0.5})
+
+        client.result_cache.invalidate(client.cache_key('getWebPaymentDetails', self.token))
+        client.get_web_payment_details(self.token)
+        self.assertEqual(client.result_cache.misses, 2)
+
+    def test_payment_record(self):
+        cache = ResultCache()
+        client = DirectPaymentAPI(
+            merchant_id=self.merchant_id, access_key=self.access_key, contract_number=self.contract_number,
+            homologation=True, result_cache=cache
+        )
+        client.get_payment_record(self.contract_number, u'123456')
+        client.get_payment_record(self.contract_number, u'123456')
+        client.get_payment_record(self.contract_number, u'654321')
+        self.assertEqual((cache.hits, cache.misses), (1, 2))
+
+    def test_shared_by_merchants(self):
+        cache = ResultCache()
+        client = self.new_client(cache)
+        client.get_web_payment_details(self.token)
+        other_client = self.new_client(cache)
+        other_client.merchant_id = u'98765432109876'
+        self.assertNotEqual(client.cache_key('getWebPaymentDetails', self.token), other_client.cache_key('getWebPaymentDetails', self.token))
+
+    def test_ttl_by_result_code(self):
+        cache = ResultCache(store=MemoryStore(clock=self.clock))
+        cache.set('complete', {'ok': True}, u'00000')
+        cache.set('refused', {'ok': False}, u'01100')
+        cache.set('pending', {'ok': None}, u'02306')
+        cache.set('unknown', {'ok': None}, u'02999')
+        self.assertEqual(cache.get('pending'), None)
+        # only the terminal result codes are cached
+        self.assertEqual(cache.get('refused'), None)
+        self.assertEqual(cache.get('unknown'), None)
+        self.assertEqual(cache.get('complete'), {'ok': True})
+        self.now += 601
+        self.assertEqual(cache.get('complete'), None)
+
+        cache = ResultCache(store=MemoryStore(clock=self.clock), policy=TTLPolicy(default_ttl=30))
+        cache.set('refused', {'ok': False}, u'01100')
+        cache.set('pending', {'ok': None}, u'02306')
+        self.assertEqual(cache.get('refused'), {'ok': False})
+        self.assertEqual(cache.get('pending'), None)
+        self.now += 31
+        self.assertEqual(cache.get('refused'), None)
+
+    def test_copies(self):
+        """the cached results can't be changed by the callers"""
+        cache = ResultCache()
+        value = {'result': {'code': u'00000'}}
+        cache.set('complete', value, u'00000')
+        value['result']['code'] = u'changed'
+        cached = cache.get('complete')
+        self.assertEqual(cached, {'result': {'code': u'00000'}})
+        cached['result']['code'] = u'changed'
+        self.assertEqual(cache.get('complete'), {'result': {'code': u'00000'}})
+
+    def test_lru(self):
+        store = MemoryStore(max_size=2, clock=self.clock)
+        store.set('a', 1, 10)
+        store.set('b', 2, 10)
+        self.assertEqual(store.get('a'), 1)
+        store.set('c', 3, 10)
+        self.assertEqual(len(store), 2)
+        self.assertEqual(store.get('b'), None)
+        self.assertEqual(store.get('a'), 1)
+
+    def test_wallet_ttl(self):
+        cache = WalletCache(store=MemoryStore(clock=self.clock), ttl=60)
+        key = cache.wallet_key(self.merchant_id, u'wallet', 'getWallet', None)
+        cache.set(key, {'ok': True}, u'02500')
+        cache.set(cache.wallet_key(self.merchant_id, u'wallet', 'getCards', None), {'error': True}, u'02503')
+        self.assertEqual(cache.get(key), {'ok': True})
+        self.assertEqual(cache.get(cache.wallet_key(self.merchant_id, u'wallet', 'getCards', None)), None)
+        self.now += 61
+        self.assertEqual(cache.get(key), None)
+
+    def test_wallet_invalidation(self):
+        cache = WalletCache(store=MemoryStore(clock=self.clock))
+        key = cache.wallet_key(self.merchant_id, u'wallet', 'getWallet', None)
+        other_key = cache.wallet_key(self.merchant_id, u'other', 'getWallet', None)
+        cache.set(key, {'ok': True}, u'02500')
+        cache.set(other_key, {'ok': True}, u'02500')
+        cache.invalidate_wallet(self.merchant_id, u'wallet')
+        new_key = cache.wallet_key(self.merchant_id, u'wallet', 'getWallet', None)
+        self.assertNotEqual(new_key, key)
+        self.assertEqual(cache.get(new_key), None)
+        self.assertEqual(cache.wallet_key(self.merchant_id, u'other', 'getWallet', None), other_key)
+        self.assertEqual(cache.get(other_key), {'ok': True})
+
+    def test_store_errors(self):
+        class BrokenStore(object):
+            def get(self, key):
+                raise IOError('unavailable')
+
+            def set(self, key, value, ttl):
+                raise IOError('unavailable')
+
+        client = self.new_client(ResultCache(store=BrokenStore()))
+        self.assertEqual(client.get_web_payment_details(self.token)[0], '00000')
+        self.assertEqual(client.get_web_payment_details(self.token)[0], '00000')
+        self.assertEqual(client.result_cache.misses, 2)
+
+
+class SlowMockBackend(SoapMockBackend):
+    """the mock counting the doWebPayment calls, which take some time"""
+    calls = 0
+
+    def doWebPayment(self, **data):
+        SlowMockBackend.calls += 1
+        time.sleep(0.05)
+        return super(SlowMockBackend, self).doWebPayment(**data)
+
+
+@unittest.skipIf(not USE_MOCK, 'the idempotency layer is tested with the mock')
+class IdempotencyTestCase(unittest.TestCase):
+    """repeated web payments"""
+
+    def setUp(self):
+        self.merchant_id, self.access_key, self.contract_number = u"12345678901234", u"abCdeFgHiJKLmNoPqrst", u"1234567"
+        self.now = 1000.0
+        SlowMockBackend.calls = 0
+
+    def clock(self):
+        return self.now
+
+    def new_client(self, idempotency, client_class=WebPaymentAPI):
+        return client_class(
+            merchant_id=self.merchant_id, access_key=self.access_key, contract_number=self.contract_number,
+            homologation=True, idempotency=idempotency
+        )
+
+    def pay(self, client, amount=Decimal("12.50"), currency=u"EUR", order_ref=u'order'):
+        return client.do_web_payment(
+            amount=amount, currency=currency, order_ref=order_ref,
+            return_url='http://freexian.com/success/', cancel_url='http://freexian.com/cancel/'
+        )
+
+    def test_disabled_by_default(self):
+        client = self.new_client(None)
+        self.assertEqual(client.idempotency, None)
+        self.assertNotEqual(self.pay(client), self.pay(client))
+
+    def test_repeated_payment(self):
+        layer = IdempotencyLayer(MemoryStore(clock=self.clock), window=60)
+        client = self.new_client(layer)
+        redirect_url, token = self.pay(client)
+        self.assertEqual(self.pay(client), (redirect_url, token))
+        self.assertEqual(self.pay(self.new_client(layer)), (redirect_url, token))
+        self.assertNotEqual(self.pay(client, amount=Decimal("12.51"))[1], token)
+        self.assertNotEqual(self.pay(client, currency=u"USD")[1], token)
+        self.assertNotEqual(self.pay(client, order_ref=u'other')[1], token)
+        self.assertEqual(layer.stats, {'hits': 2, 'misses': 4, 'coalesced': 0})
+        self.now += 61
+        self.assertNotEqual(self.pay(client)[1], token)
+        self.assertEqual(self.new_client(True).idempotency.window, 900)
+
+    def test_concurrent_calls(self):
+        client = self.new_client(True)
+        client.backend_class = SlowMockBackend
+        results = []
+        lock = threading.Lock()
+
+        def pay():
+            result = self.pay(client)
+            with lock:
+                results.append(result)
+
+        threads = [threading.Thread(target=pay) for _index in range(10)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        self.assertEqual(SlowMockBackend.calls, 1)
+        self.assertEqual(len(results), 10)
+        self.assertEqual(len(set(results)), 1)
+        self.assertEqual(client.idempotency.misses, 1)
+        self.assertEqual(client.idempotency.hits + client.idempotency.coalesced, 9)
+        self.assertTrue(client.idempotency.coalesced > 0)
+
+    def test_call_after_stored_result(self):
+        """a call missing the store while the previous leader stores its result doesn't pay again"""
+        reading, release = threading.Event(), threading.Event()
+
+        class BlockingStore(MemoryStore):
+            blocked = False
+
+            def get(self, key):
+                value = MemoryStore.get(self, key)
+                if not self.blocked:
+                    # the first read misses, then waits for the other call
+                    self.blocked = True
+                    reading.set()
+                    release.wait(5)
+                return value
+
+        layer = IdempotencyLayer(BlockingStore())
+        client = self.new_client(layer)
+        results = []
+        thread = threading.Thread(target=lambda: results.append(self.pay(client)))
+        thread.start()
+        self.assertTrue(reading.wait(5))
+        first = self.pay(client)
+        release.set()
+        thread.join()
+        self.assertEqual(results, [first])
+        self.assertEqual(layer.stats, {'hits': 1, 'misses': 1, 'coalesced': 0})
+
+    def test_errors(self):
+        client = self.new_client(True)
+        self.assertRaises(PaylineApiError, self.pay, client, amount=Decimal("0.00"))
+        self.assertRaises(PaylineApiError, self.pay, client, amount=Decimal("0.00"))
+        self.assertEqual(client.idempotency.misses, 0)
+        self.assertRaises(InvalidCurrencyError, self.pay, client, currency=u"XYZ")
+
+    def test_sqlite_store(self):
+        directory = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, directory)
+        path = os.path.join(directory, 'payline.db')
+        store = SQLiteStore(path, clock=self.clock)
+        self.addCleanup(store.close)
+        redirect_url, token = self.pay(self.new_client(IdempotencyLayer(store)))
+        # an other process
+        other_store = SQLiteStore(path, clock=self.clock)
+        self.addCleanup(other_store.close)
+        other_layer = IdempotencyLayer(other_store)
+        self.assertEqual(self.pay(self.new_client(other_layer)), (redirect_url, token))
+        self.assertEqual(other_layer.hits, 1)
+
+        other_store.set(u'key', {'a': [1, u'\xe9']}, 10)
+        self.assertEqual(store.get(u'key'), {'a': [1, u'\xe9']})
+        self.assertEqual(len(store), 2)
+        self.now += 11
+        self.assertEqual(store.get(u'key'), None)
+        store.purge()
+        self.assertEqual(len(store), 1)
+        store.delete(IdempotencyLayer.make_key(self.merchant_id, u'order', 1250, 978))
+        self.assertEqual(len(store), 0)
+
+    def test_store_errors(self):
+        class BrokenStore(object):
+            def get(self, key):
+                raise IOError('unavailable')
+
+            def set(self, key, value, ttl):
+                raise IOError('unavailable')
+
+        client = self.new_client(IdempotencyLayer(BrokenStore()))
+        self.assertNotEqual(self.pay(client), self.pay(client))
+
+    @unittest.skipIf(asyncio is None, 'asyncio is not available')
+    def test_async_concurrent_calls(self):
+        class SlowAsyncMockBackend(AsyncSoapMockBackend):
+            calls = 0
+
+            async def doWebPayment(self, **data):
+                SlowAsyncMockBackend.calls += 1
+                await asyncio.sleep(0.01)
+                return SoapMockBackend.doWebPayment(self, **data)
+
+        loop = asyncio.new_event_loop()
+        self.addCleanup(loop.close)
+        client = self.new_client(True, AsyncWebPaymentAPI)
+        client.backend_class = SlowAsyncMockBackend
+
+        async def pay_all():
+            first = await asyncio.gather(*[self.pay(client) for _index in range(10)])
+            return first + [await self.pay(client)]
+
+        results = loop.run_until_complete(pay_all())
+        self.assertEqual(SlowAsyncMockBackend.calls, 1)
+        self.assertEqual(len(set(results)), 1)
+        self.assertEqual(client.idempotency.stats, {'hits': 1, 'misses': 1, 'coalesced': 9})
+
+        async def pay_invalid():
+            return await asyncio.gather(
+                *[self.pay(client, amount=Decimal("0.00")) for _index in range(3)], return_exceptions=True
+            )
+
+        errors = loop.run_until_complete(pay_invalid())
+        self.assertTrue(all(isinstance(error, PaylineApiError) for error in errors))
+        self.assertEqual(SlowAsyncMockBackend.calls, 2)
+
+
+class TypedResultTestCase(unittest.TestCase):
+    """compact objects of the responses"""
+
+    def payment_record(self):
+        return {
+            'result': {'code': u'00000', 'shortMessage': u'ACCEPTED'},
+            'recurring': {'amount': u'1000', 'billingLeft': u'3'},
+            'isDisabled': u'0',
+            'billingRecordList': [
+                {'date': u'06/06/2016', 'amount': u'1000', 'result': {'code': u'00000'}, 'transaction': {'id': u'1'}},
+                {'date': u'06/07/2016', 'amount': u'1000', 'status': u'0'},
+            ],
+            'order': {'ref': u'ref1'},
+            'unknown': u'kept',
+        }
+
+    def test_slots(self):
+        record = PaymentRecord(self.payment_record())
+        self.assertFalse(hasattr(record, '__dict__'))
+        self.assertFalse(hasattr(record.recurring, '__dict__'))
+        self.assertRaises(AttributeError, setattr, record, 'other', 1)
+        self.assertEqual(record.amount, Decimal('10'))
+        self.assertEqual(record.result.shortMessage, u'ACCEPTED')
+        self.assertEqual(record.get('unknown'), u'kept')
+        self.assertEqual(record.walletId, None)
+
+    def test_billing_records(self):
+        billing_records = PaymentRecord(self.payment_record()).billing_records
+        self.assertTrue(isinstance(billing_records, tuple))
+        self.assertTrue(all(isinstance(item, BillingRecord) for item in billing_records))
+        self.assertEqual(billing_records[0].transaction.id, u'1')
+        self.assertEqual(billing_records[1].result, None)
+
+    def test_lazy_elements(self):
+        details = WebPaymentDetails({
+            'billingRecordList': self.payment_record()['billingRecordList'], 'buyer': {'lastName': u'Doe'}
+        })
+        self.assertTrue(isinstance(details._billingRecordList, list))
+        self.assertTrue(isinstance(details._buyer, dict))
+        billing_records = details.billing_records
+        self.assertTrue(all(isinstance(item, BillingRecord) for item in billing_records))
+        self.assertTrue(details.billing_records is billing_records)
+        self.assertEqual(details.buyer.lastName, u'Doe')
+        self.assertEqual(details.extendedCard, None)
+
+    def test_pysimplesoap_lists(self):
+        data = self.payment_record()
+        data['billingRecordList'] = {'billingRecord': {'date': u'06/06/2016', 'amount': u'1000'}}
+        self.assertEqual(PaymentRecord(data).billing_records[0].amount, u'1000')
+        data['billingRecordList'] = None
+        self.assertEqual(PaymentRecord(data).billing_records, ())
+
+    def test_as_dict(self):
+        data = self.payment_record()
+        record = PaymentRecord(data)
+        self.assertEqual(record.as_dict(), data)
+        record.billing_records
+        self.assertEqual(record.as_dict(), data)
+        self.assertEqual(pickle.loads(pickle.dumps(record)), record)
+        self.assertNotEqual(record, Card(data))
+
+    def test_flags(self):
+        for value, expected in ((u'1', True), (u'0', False), (True, True), (False, False), (None, None)):
+            details = WebPaymentDetails({'transaction': {'isPossibleFraud': value}})
+            self.assertEqual(details.transaction.is_possible_fraud, expected)
+        self.assertEqual(WebPaymentDetails({}).is_transaction_ok, None)
+        self.assertEqual(WebPaymentDetails({}).result_code, u'')
+
+
+class ScheduleTestCase(unittest.TestCase):
+    """installments of the recurring payments"""
+
+    def web_payment_request(self, **kwargs):
+        client = WebPaymentAPI(u'12345678901234', u'abCdeFgHiJKLmNoPqrst', u'1234567')
+        return client.build_web_payment_request(
+            amount=Decimal("12.51"), currency=u"EUR", order_ref=u'ref',
+            return_url='http://freexian.com/success/', cancel_url='http://freexian.com/cancel/', **kwargs
+        )
+
+    def test_web_payment_recurring(self):
+        request = self.web_payment_request(recurring_times=4, recurring_period_in_months=3)
+        self.assertEqual(request['payment']['mode'], u'NX')
+        self.assertEqual(
+            request['recurring'], {'billingLeft': 4, 'firstAmount': 315, 'amount': 312, 'billingCycle': 60}
+        )
+        for months, billing_cycle in ((1, 40), (2, 50), (6, 70), (12, 80), (24, 90)):
+            request = self.web_payment_request(recurring_times=2, recurring_period_in_months=months)
+            self.assertEqual(request['recurring']['billingCycle'], billing_cycle)
+        request = self.web_payment_request(recurring_times=3, billing_cycle=schedule.WEEKLY)
+        self.assertEqual(request['recurring']['billingCycle'], 20)
+        self.assertEqual(self.web_payment_request()['recurring'], None)
+
+    def test_web_payment_invalid_recurring(self):
+        for kwargs in (
+            {'recurring_times': 3},
+            {'recurring_times': 3, 'recurring_period_in_months': 4},
+            {'recurring_times': 3, 'recurring_period_in_months': 'monthly'},
+            {'recurring_times': 3, 'billing_cycle': 45},
+            {'recurring_times': 0, 'recurring_period_in_months': 1},
+        ):
+            self.assertRaises(ArgumentsError, self.web_payment_request, **kwargs)
+
+    def test_split_amount(self):
+        self.assertEqual(schedule.split_amount(1251, 4), (315, 312))
+        self.assertEqual(schedule.split_amount(1200, 4), (300, 300))
+        self.assertEqual(schedule.split_amount(2, 3), (2, 0))
+        self.assertEqual(schedule.to_cents(Decimal('12.519')), 1251)
+
+    def test_calendars(self):
+        start = datetime(2024, 1, 31).date()
+        schedules = schedule.Schedules(
+            [Decimal('12.51'), Decimal('100'), Decimal('10'), Decimal('30')], [4, 3, 3, 2],
+            [schedule.MONTHLY, schedule.WEEKLY, schedule.TWICE_A_MONTH, schedule.EVERY_TWO_YEARS],
+            [start] * 4
+        )
+        self.assertEqual(len(schedules), 4)
+        self.assertEqual([day.strftime('%Y-%m-%d') for day, _amount in schedules.installments(0)], [
+            '2024-01-31', '2024-02-29', '2024-03-31', '2024-04-30'
+        ])
+        self.assertEqual([amount for _day, amount in schedules.installments(0)], [315, 312, 312, 312])
+        self.assertEqual([day.strftime('%Y-%m-%d') for day, _amount in schedules.installments(1)], [
+            '2024-01-31', '2024-02-07', '2024-02-14'
+        ])
+        self.assertEqual([amount for _day, amount in schedules.installments(1)], [3334, 3333, 3333])
+        self.assertEqual([day.strftime('%Y-%m-%d') for day, _amount in schedules.installments(2)], [
+            '2024-01-31', '2024-02-15', '2024-02-29'
+        ])
+        self.assertEqual([day.strftime('%Y-%m-%d') for day, _amount in schedules.installments(3)], [
+            '2024-01-31', '2026-01-31'
+        ])
+        self.assertEqual(list(schedules.remainders), [3, 1, 1, 0])
+        request = self.web_payment_request(recurring_times=4, recurring_period_in_months=1)
+        self.assertEqual(schedules.recurring(0), request['recurring'])
+
+    def test_cash_flow(self):
+        start = datetime(2024, 1, 15).date()
+        schedules = schedule.Schedules(
+            [1000, 1000, 900], [2, 2, 3], [schedule.MONTHLY, schedule.DAILY, schedule.MONTHLY], [start] * 3,
+            in_cents=True
+        )
+        self.assertEqual(schedules.cash_flow(by_month=True), [((2024, 1), 1800), ((2024, 2), 800), ((2024, 3), 300)])
+        by_day = schedules.cash_flow(start_date=datetime(2024, 1, 16).date(), end_date=datetime(2024, 2, 28).date())
+        self.assertEqual([(day.day, amount) for day, amount in by_day], [(16, 500), (15, 800)])
+        self.assertEqual(sum(schedules.installment_amounts), 2900)
+
+    def test_invalid_plans(self):
+        self.assertRaises(ArgumentsError, schedule.Schedules, [1000], [2], [45], in_cents=True)
+        self.assertRaises(ArgumentsError, schedule.Schedules, [1000], [2, 3], [40], in_cents=True)
+        self.assertRaises(ArgumentsError, schedule.Schedules, [1000], [0], [40], in_cents=True)
+        self.assertRaises(ArgumentsError, schedule.get_billing_cycle, billing_cycle=[40])
+        self.assertRaises(ArgumentsError, schedule.get_billing_cycle, recurring_period_in_months=[1])
+
+    def test_large_amounts(self):
+        """the totals in cents exceed 32 bits"""
+        schedules = schedule.Schedules([Decimal('50000000.01')], [2], [schedule.MONTHLY])
+        self.assertEqual(list(schedules.totals), [5000000001])
+        self.assertEqual(list(schedules.installment_amounts), [2500000001, 2500000000])
+
+
+@unittest.skipIf(not USE_MOCK, 'the notifications are tested with the mock')
+class NotificationReceiverTestCase(unittest.TestCase):
+    """notifications of the payments (IPN)"""
+
+    def setUp(self):
+        self.client = WebPaymentAPI(u'12345678901234', u'abCdeFgHiJKLmNoPqrst', u'1234567')
+        self.received = []
+        self.lock = threading.Lock()
+        self.now = 1000.0
+
+    def pay(self, index=0):
+        _redirect_url, token = self.client.do_web_payment(
+            amount=Decimal("12.50"), currency=u"EUR", order_ref=u'order{0}'.format(index),
+            return_url='http://freexian.com/success/', cancel_url='http://freexian.com/cancel/'
+        )
+        return token
+
+    def callback(self, token, details):
+        with self.lock:
+            self.received.append((token, details))
+
+    def new_receiver(self, **kwargs):
+        kwargs.setdefault('clock', lambda: self.now)
+        receiver = NotificationReceiver(self.client, kwargs.pop('callback', self.callback), **kwargs)
+        self.addCleanup(receiver.stop, 5)
+        return receiver
+
+    def get(self, receiver, query_string, method='GET', body=b''):
+        """call the WSGI application: return (status, content)"""
+        responses = []
+        environ = {
+            'REQUEST_METHOD': method, 'QUERY_STRING': query_string, 'CONTENT_LENGTH': str(len(body)),
+            'wsgi.input': six.BytesIO(body),
+        }
+        content = b''.join(receiver(environ, lambda status, headers: responses.append(status)))
+        return responses[0], content
+
+    def test_notification(self):
+        receiver = self.new_receiver()
+        token = self.pay()
+        self.assertEqual(self.get(receiver, 'notificationType=WEBTRS&token={0}'.format(token)), ('200 OK', b'OK'))
+        receiver.join()
+        (received_token, details), = self.received
+        self.assertEqual(received_token, token)
+        self.assertTrue(isinstance(details, WebPaymentDetails))
+        self.assertEqual(details.result_code, u'00000')
+        self.assertEqual(details.amount, Decimal("12.50"))
+        self.assertEqual((receiver.accepted, receiver.processed, receiver.failed), (1, 1, 0))
+
+    def test_post_and_missing_token(self):
+        receiver = self.new_receiver()
+        token = self.pay()
+        body = 'token={0}'.format(token).encode('ascii')
+        self.assertEqual(self.get(receiver, '', method='POST', body=body), ('200 OK', b'OK'))
+        self.assertEqual(self.get(receiver, 'notificationType=WEBTRS')[0], '400 Bad Request')
+        receiver.join()
+        self.assertEqual([item[0] for item in self.received], [token])
+
+    def test_duplicates(self):
+        receiver = self.new_receiver(dedup_window=60)
+        token = self.pay()
+        self.assertEqual(receiver.notify(token), ACCEPTED)
+        self.assertEqual(receiver.notify(token), DUPLICATE)
+        self.assertEqual(self.get(receiver, 'token={0}'.format(token)), ('200 OK', b'OK'))
+        receiver.join()
+        self.assertEqual(len(self.received), 1)
+        self.now += 61
+        self.assertEqual(receiver.notify(token), ACCEPTED)
+        receiver.join()
+        self.assertEqual(len(self.received), 2)
+        self.assertEqual(receiver.duplicates, 2)
+
+    def test_queue_full(self):
+        release = threading.Event()
+        started = threading.Event()
+
+        def slow_callback(token, details):
+            started.set()
+            release.wait(5)
+            self.callback(token, details)
+
+        receiver = self.new_receiver(callback=slow_callback, workers=1, max_queue=1)
+        tokens = [self.pay(index) for index in range(3)]
+        self.assertEqual(receiver.notify(tokens[0]), ACCEPTED)
+        started.wait(5)
+        self.assertEqual(receiver.notify(tokens[1]), ACCEPTED)
+        self.assertEqual(receiver.notify(tokens[2]), BUSY)
+        self.assertEqual(self.get(receiver, 'token={0}'.format(tokens[2]))[0], '503 Service Unavailable')
+        release.set()
+        receiver.join()
+        # the rejected notification is processed when it is sent again
+        self.assertEqual(receiver.notify(tokens[2]), ACCEPTED)
+        receiver.join()
+        self.assertEqual([item[0] for item in self.received], tokens)
+        self.assertEqual(receiver.rejected, 2)
+
+    def test_errors(self):
+        errors = []
+
+        def failing_callback(token, details):
+            raise ValueError(u'unexpected order')
+
+        receiver = self.new_receiver(callback=failing_callback, error_callback=lambda *args: errors.append(args))
+        token = self.pay()
+        self.assertEqual(receiver.notify(token), ACCEPTED)
+        receiver.join()
+        self.assertEqual(len(errors), 1)
+        self.assertEqual(errors[0][0], token)
+        self.assertTrue(isinstance(errors[0][1], ValueError))
+        self.assertEqual(receiver.failed, 1)
+        # the token is forgotten
+        self.assertEqual(receiver.notify(token), ACCEPTED)
+        receiver.join()
+
+    def test_load(self):
+        """a burst of notifications, each sent 5 times, from 20 threads"""
+        receiver = self.new_receiver(workers=8, max_queue=2000, clock=time.time)
+        tokens = [self.pay(index) for index in range(400)]
+        statuses = []
+        durations = []
+
+        def send(thread_index):
+            for token in tokens[thread_index::4]:
+                start = time.time()
+                status, _content = self.get(receiver, 'notificationType=WEBTRS&token={0}'.format(token))
+                duration = time.time() - start
+                with self.lock:
+                    statuses.append(status)
+                    durations.append(duration)
+
+        threads = [threading.Thread(target=send, args=(index % 4,)) for index in range(20)]
+        start = time.time()
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        receiver.join()
+        logger.info(u'{0} notifications in {1:.3f}s, slowest acknowledgement {2:.1f}ms'.format(
+            len(statuses), time.time() - start, max(durations) * 1000
+        ))
+        self.assertEqual(len(statuses), 2000)
+        self.assertEqual(set(statuses), set(['200 OK']))
+        self.assertEqual(sorted(item[0] for item in self.received), sorted(tokens))
+        self.assertTrue(all(details.result_code == u'00000' for _token, details in self.received))
+        self.assertEqual((receiver.accepted, receiver.duplicates, receiver.processed), (400, 1600, 400))
+
+    @unittest.skipIf(asyncio is None, 'asyncio is not available')
+    def test_asgi(self):
+        loop = asyncio.new_event_loop()
+        self.addCleanup(loop.close)
+        client = AsyncWebPaymentAPI(u'12345678901234', u'abCdeFgHiJKLmNoPqrst', u'1234567')
+        tokens = [self.pay(index) for index in range(50)]
+
+        async def callback(token, details):
+            await asyncio.sleep(0)
+            self.callback(token, details)
+
+        receiver = AsyncNotificationReceiver(client, callback, workers=4, max_queue=100)
+
+        async def request(query_string):
+            sent = []
+
+            async def receive():
+                return {'type': 'http.request', 'body': b'', 'more_body': False}
+
+            async def send(message):
+                sent.append(message)
+
+            await receiver({'type': 'http', 'method': 'GET', 'query_string': query_string}, receive, send)
+            return sent[0]['status'], sent[1]['body']
+
+        async def burst():
+            responses = await asyncio.gather(*[
+                request('token={0}'.format(token).encode('ascii')) for token in tokens * 3
+            ] + [request(b'notificationType=WEBTRS')])
+            await receiver.join()
+            await receiver.stop()
+            return responses
+
+        responses = loop.run_until_complete(burst())
+        self.assertEqual(responses.count((200, b'OK')), 150)
+        self.assertEqual(responses[-1][0], 400)
+        self.assertEqual(sorted(item[0] for item in self.received), sorted(tokens))
+        self.assertEqual((receiver.accepted, receiver.duplicates, receiver.processed), (50, 100, 50))
+
+
+@unittest.skipIf(not USE_MOCK, 'mass traitments are only tested with the mock')
+class MassPaymentAPITestCase(unittest.TestCase):
+    """MassPaymentAPI with the mock backend"""
+
+    def setUp(self):
+        self.merchant_id, self.access_key, self.contract_number = u"12345678901234", u"abCdeFgHiJKLmNoPqrst", u"1234567"
+        self.client = MassPaymentAPI(
+            merchant_id=self.merchant_id, access_key=self.access_key, contract_number=self.contract_number,
+            homologation=True
+        )
+
+    def tearDown(self):
+        mock_backend.MASS_TRAITMENT_PENDING_CALLS = 2
+
+    def test_do_mass_capture(self):
+        captures = [(u'{0:014}'.format(index), Decimal("12.50"), u'EUR') for index in range(10)]
+        captures.append((u'UNKNOWN', Decimal("12.50"), u'EUR'))
+        results = self.client.do_mass_capture(captures, comment=u'nightly capture')
+        self.assertEqual(len(results), 1)
+        result_code, mass_traitment_id, data = results[0]
+        self.assertEqual(result_code, u'00000')
+        self.assertNotEqual(mass_traitment_id, None)
+
+        result_code, total_lines, failed_lines, failed, data = self.client.wait_mass_traitment(
+            mass_traitment_id, interval=0
+        )
+        self.assertEqual(result_code, u'00000')
+        self.assertEqual(total_lines, 11)
+        self.assertEqual(failed_lines, 1)
+        self.assertEqual(failed[0]['transactionID'], u'UNKNOWN')
+
+    def test_batches(self):
+        self.client.batch_size = 4
+        captures = ((u'{0:014}'.format(index), Decimal("1"), u'EUR') for index in range(10))
+        results = self.client.do_mass_capture(captures)
+        self.assertEqual(len(results), 3)
+        self.assertEqual(len(set(mass_traitment_id for _code, mass_traitment_id, _data in results)), 3)
+        totals = [self.client.wait_mass_traitment(mass_traitment_id, interval=0)[1]
+                  for _code, mass_traitment_id, _data in results]
+        self.assertEqual(totals, [4, 4, 2])
+
+    def test_do_mass_refund(self):
+        results = self.client.do_mass_refund([(u'1', Decimal("10"), u'USD'), (u'2', Decimal("0"), u'USD')])
+        details = self.client.wait_mass_traitment(results[0][1], interval=0)
+        self.assertEqual(details[1:3], (2, 1))
+        self.assertEqual(details[3][0]['transactionID'], u'2')
+
+    def test_do_mass_reset(self):
+        results = self.client.do_mass_reset([u'1', u'2', u'3'])
+        details = self.client.wait_mass_traitment(results[0][1], interval=0)
+        self.assertEqual(details[:4], (u'00000', 3, 0, []))
+
+    def test_invalid_currency(self):
+        self.assertRaises(InvalidCurrencyError, self.client.do_mass_capture, [(u'1', Decimal("10"), u'GBP')])
+
+    def test_pending(self):
+        results = self.client.do_mass_reset([u'1'])
+        self.assertEqual(self.client.get_mass_traitment_details(results[0][1])[0], u'02000')
+
+    def test_timeout(self):
+        mock_backend.MASS_TRAITMENT_PENDING_CALLS = 1000
+        results = self.client.do_mass_reset([u'1'])
+        self.assertRaises(
+            MassTraitmentTimeoutError, self.client.wait_mass_traitment, results[0][1], interval=0.01, timeout=0.05
+        )
+
+
+@unittest.skipIf(not USE_MOCK, 'transactions search is only tested with the mock')
+class ExtendedAPITestCase(unittest.TestCase):
+    """ExtendedAPI with the mock backend"""
+
+    def setUp(self):
+        self.merchant_id, self.access_key, self.contract_number = u"12345678901234", u"abCdeFgHiJKLmNoPqrst", u"1234567"
+        self.client = ExtendedAPI(
+            merchant_id=self.merchant_id, access_key=self.access_key, contract_number=self.contract_number,
+            homologation=True
+        )
+        self.start_date = datetime(2016, 6, 1)
+
+    def tearDown(self):
+        mock_backend.SEARCH_LIMIT = 5000
+
+    def test_transactions_search(self):
+        transactions = list(self.client.transactions_search(
+            self.start_date, self.start_date + timedelta(days=3, minutes=-1)
+        ))
+        self.assertEqual(len(transactions), 3 * 24 * 60)
+        ids = [transaction['id'] for transaction in transactions]
+        self.assertEqual(ids, sorted(set(ids)))
+        self.assertEqual(transactions[0]['date'], u'01/06/2016 00:00')
+        self.assertEqual(transactions[-1]['date'], u'03/06/2016 23:59')
+
+    def test_full_window_split(self):
+        mock_backend.SEARCH_LIMIT = self.client.search_page_limit = 100
+        transactions = list(self.client.transactions_search(
+            self.start_date, self.start_date + timedelta(hours=10, minutes=-1), window=timedelta(hours=5)
+        ))
+        ids = [transaction['id'] for transaction in transactions]
+        self.assertEqual(len(ids), 600)
+        self.assertEqual(ids, sorted(set(ids)))
+
+    def test_without_prefetch(self):
+        end_date = self.start_date + timedelta(hours=5)
+        self.assertEqual(
+            list(self.client.transactions_search(self.start_date, end_date, window=timedelta(hours=1))),
+            list(self.client.transactions_search(
+                self.start_date, end_date, window=timedelta(hours=1), prefetch_pages=False
+            ))
+        )
+
+    def test_stop_early(self):
+        transactions = self.client.transactions_search(self.start_date, self.start_date + timedelta(days=365))
+        self.assertEqual(next(transactions)['date'], u'01/06/2016 00:00')
+        transactions.close()
+
+    def test_invalid_criterion(self):
+        self.assertRaises(
+            ArgumentsError, self.client.transactions_search, self.start_date, self.start_date, shop=u'1'
+        )
+
+    def test_search_error(self):
+        client = ExtendedAPI(
+            merchant_id=self.merchant_id, access_key=u'wrong', contract_number=self.contract_number,
+            homologation=True
+        )
+        transactions = client.transactions_search(self.start_date, self.start_date + timedelta(days=1))
+        self.assertRaises(PaylineAuthError, list, transactions)
+
+    def test_incomplete_error_response(self):
+        class Backend(object):
+            def __init__(self, response):
+                self.response = response
+
+            def transactionsSearch(self, **data):
+                return self.response
+
+        end_date = self.start_date + timedelta(hours=1)
+        for response in (None, {}, {'result': None}, {'result': {'code': u'02101'}}):
+            self.client.backend = Backend(response)
+            self.assertRaises(PaylineApiError, list, self.client.transactions_search(self.start_date, end_date))
+        self.client.backend = Backend({'result': {'code': u'02101'}})
+        with self.assertRaises(PaylineApiError) as context:
+            list(self.client.transactions_search(self.start_date, end_date, prefetch_pages=False))
+        self.assertEqual(str(context.exception), u'transactionsSearch failed: 02101')
+
+    def test_get_transaction_details(self):
+        result_code, order_ref, amount, currency, data = self.client.get_transaction_details(u'20160601102000')
+        self.assertEqual(result_code, u'00000')
+        self.assertEqual(order_ref, u'order-20160601102000')
+        self.assertEqual(amount, Decimal('10.00'))
+        self.assertEqual(currency, u'EUR')
+
+    def test_prefetch(self):
+        produced = []
+
+        def pages():
+            for index in range(5):
+                produced.append(index)
+                yield index
+
+        items = prefetch(pages())
+        self.assertEqual(next(items), 0)
+        time.sleep(0.05)
+        # the next item is ready, the following ones are not read yet
+        self.assertTrue(len(produced) <= 3)
+        self.assertEqual(list(items), [1, 2, 3, 4])
+
+
+@unittest.skipIf(asyncio is None, 'asyncio is not available')
+class AsyncSoapApiTestCase(SoapApiTestCase):
+    """Same scenarios with the asyncio clients"""
+
+    class web_payment_api_class(CoroutineRunner):
+        api_class = AsyncWebPaymentAPI if asyncio else None
+
+    class direct_payment_api_class(CoroutineRunner):
+        api_class = AsyncDirectPaymentAPI if asyncio else None
+
+    def setUp(self):
+        super(AsyncSoapApiTestCase, self).setUp()
+        self.loop = asyncio.new_event_loop()
+        asyncio.set_event_loop(self.loop)
+
+    def tearDown(self):
+        super(AsyncSoapApiTestCase, self).tearDown()
+        self.loop.close()
+        asyncio.set_event_loop(None)
+
+    def test_concurrent_payments(self):
+        """check many payments share the event loop"""
+        client = AsyncWebPaymentAPI(
+            merchant_id=self.merchant_id, access_key=self.access_key, contract_number=self.contract_number,
+            homologation=True
+        )
+
+        async def pay(index):
+            return await client.do_web_payment(
+                amount=Decimal("12.50"), currency=u"EUR", order_ref=u'order{0}'.format(index),
+                return_url='http://freexian.com/success/', cancel_url='http://freexian.com/cancel/'
+            )
+
+        async def pay_all():
+            return await asyncio.gather(*[pay(index) for index in range(50)])
+
+        results = self.loop.run_until_complete(pay_all())
+        self.assertEqual(len(results), 50)
+        for redirect_url, token in results:
+            self.assertNotEqual(redirect_url, None)
+
+    def test_get_web_payment_details_many(self):
+        """check the batch of payment details"""
+        client = AsyncWebPaymentAPI(
+            merchant_id=self.merchant_id, access_key=self.access_key, contract_number=self.contract_number,
+            homologation=True
+        )
+        _redirect_url, token = self.loop.run_until_complete(client.do_web_payment(
+            amount=Decimal("12.50"), currency=u"EUR", order_ref=u'order',
+            return_url='http://freexian.com/success/', cancel_url='http://freexian.com/cancel/'
+        ))
+        results = client.get_web_payment_details_many([token] * 10, max_workers=3, rate_limit=1000)
+        details = self.loop.run_until_complete(CoroutineRunner.collect(results))
+        self.assertEqual(len(details), 10)
+        self.assertEqual(details[0][0], token)
+        self.assertEqual(details[0][1][0], '00000')
+        self.assertEqual(results.errors, {})
+
 
 if __name__ == '__main__':
     unittest.main()
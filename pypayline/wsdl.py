@@ -0,0 +1,275 @@
+# -*- coding: utf-8 -*-
+"""
+Python client for the Payline SOAP API
+Process-wide registry of the parsed WSDL service models and their compiled on-disk cache
+"""
+
+from __future__ import print_function
+
+import hashlib
+import logging
+import mmap
+import os
+import pickle
+import tempfile
+import threading
+
+import six
+from six.moves import copyreg
+
+from pypayline import VERSION
+
+
+logger = logging.getLogger(u'pypayline')
+
+
+class ServiceModel(object):
+    """The parsed description of a Payline service, shared by all the clients bound to it"""
+
+    def __init__(self, api_name, wsdl, digest, services, namespace, documentation):
+        self.api_name = api_name
+        self.wsdl = wsdl
+        self.digest = digest
+        self.services = services
+        self.namespace = namespace
+        self.documentation = documentation
+        self.serializer = None  # see pypayline.backends.serializer.get_serializer
+        self.parser = None  # see pypayline.backends.parser.get_parser
+        self._template = None
+
+    def new_soap_client(self, **attributes):
+        """
+        Return a pysimplesoap SoapClient bound to this model. The clients are cloned from a
+        template client, which avoids the setup of an HTTP wrapper by pysimplesoap for each one
+        :param attributes: attributes of the new client (location, http_headers, http...)
+        """
+        from pysimplesoap.client import SoapClient
+
+        if self._template is None:
+            template = SoapClient()
+            template.services = self.services
+            template.namespace = self.namespace
+            template.documentation = self.documentation
+            self._template = template
+
+        soap_client = SoapClient.__new__(SoapClient)
+        soap_client.__dict__.update(self._template.__dict__)
+        # mutable attributes must not be shared between the clients
+        soap_client._SoapClient__headers = {}
+        soap_client.plugins = []
+        soap_client.__dict__.update(attributes)
+        return soap_client
+
+    def __repr__(self):
+        return '<ServiceModel {0} {1}>'.format(self.api_name, self.digest[:12])
+
+
+_models = {}
+_digests = {}
+_lock = threading.Lock()
+
+
+def wsdl_path(wsdl):
+    """return the local path of a file:// WSDL url or None if it is not a local file"""
+    if wsdl.startswith('file://'):
+        return wsdl[len('file://'):]
+    return None
+
+
+def wsdl_digest(wsdl):
+    """
+    SHA-256 of the WSDL content. The digest is computed once per version of the file
+    (based on its size and modification time). For remote WSDLs, the url is hashed.
+    """
+    path = wsdl_path(wsdl)
+    if path is None:
+        return hashlib.sha256(wsdl.encode('utf-8')).hexdigest()
+
+    stat = os.stat(path)
+    signature = (path, stat.st_size, stat.st_mtime)
+    digest = _digests.get(signature)
+    if digest is None:
+        with open(path, 'rb') as wsdl_file:
+            digest = hashlib.sha256(wsdl_file.read()).hexdigest()
+        _digests[signature] = digest
+    return digest
+
+
+def parse_service_model(api_name, wsdl, digest):
+    """parse the WSDL with pysimplesoap and return its ServiceModel"""
+    from pysimplesoap.client import SoapClient
+
+    soap_client = SoapClient(wsdl=wsdl)
+    return ServiceModel(
+        api_name=api_name,
+        wsdl=wsdl,
+        digest=digest,
+        services=soap_client.services,
+        namespace=soap_client.namespace,
+        documentation=soap_client.documentation,
+    )
+
+
+def default_cache_dir():
+    """directory of the compiled WSDL files: $PYPAYLINE_CACHE_DIR or ~/.cache/pypayline"""
+    return os.environ.get('PYPAYLINE_CACHE_DIR') or os.path.join(
+        os.path.expanduser('~'), '.cache', 'pypayline'
+    )
+
+
+def cache_dir_for(cache):
+    """
+    directory to use for the given cache argument of the clients:
+    None/False disables the cache, an existing directory is used as is and any other
+    value selects the default directory
+    """
+    if not cache:
+        return None
+    if isinstance(cache, six.string_types) and os.path.isdir(cache):
+        return cache
+    return default_cache_dir()
+
+
+def _pysimplesoap_version():
+    from pysimplesoap import __version__
+    return __version__
+
+
+def compiled_path(cache_dir, api_name, digest):
+    """path of the compiled model: it changes with the WSDL content and the library versions"""
+    return os.path.join(cache_dir, u'{0}-{1}-{2}-{3}.pickle'.format(
+        api_name, digest[:32], VERSION, _pysimplesoap_version().split(' ')[0]
+    ))
+
+
+def _restore_struct(key, keys):
+    """create an empty pysimplesoap Struct: the items and attributes are restored by pickle"""
+    from pysimplesoap.helpers import Struct
+
+    struct = Struct(key)
+    struct._Struct__keys = keys
+    return struct
+
+
+def _reduce_struct(struct):
+    """
+    pysimplesoap Struct can't be pickled as is: the items are restored before the
+    attributes which hold the order of the keys
+    """
+    state = dict(struct.__dict__)
+    state.pop('_Struct__keys')
+    return _restore_struct, (struct.key, list(struct.keys())), state, None, iter(dict.items(struct))
+
+
+def dump_service_model(model, path):
+    """
+    Write the compiled model to the given path. The file is written in a temporary
+    file first and renamed, so concurrent workers never read a partial file
+    """
+    from pysimplesoap.helpers import Struct
+
+    directory = os.path.dirname(path)
+    if not os.path.isdir(directory):
+        os.makedirs(directory)
+
+    data = {
+        'api_name': model.api_name,
+        'digest': model.digest,
+        'version': VERSION,
+        'pysimplesoap': _pysimplesoap_version(),
+        'services': model.services,
+        'namespace': model.namespace,
+        'documentation': model.documentation,
+    }
+
+    file_descriptor, tmp_path = tempfile.mkstemp(dir=directory, suffix='.tmp')
+    try:
+        with os.fdopen(file_descriptor, 'wb') as tmp_file:
+            pickler = pickle.Pickler(tmp_file, pickle.HIGHEST_PROTOCOL)
+            pickler.dispatch_table = copyreg.dispatch_table.copy()
+            pickler.dispatch_table[Struct] = _reduce_struct
+            pickler.dump(data)
+        getattr(os, 'replace', os.rename)(tmp_path, path)
+    except Exception:
+        os.unlink(tmp_path)
+        raise
+
+
+def load_service_model(api_name, wsdl, digest, path):
+    """Load a compiled model. Return None if the file is missing, invalid or outdated"""
+    try:
+        with open(path, 'rb') as compiled_file:
+            mapped = mmap.mmap(compiled_file.fileno(), 0, access=mmap.ACCESS_READ)
+            try:
+                data = pickle.loads(mapped)
+            finally:
+                mapped.close()
+    except (IOError, OSError, ValueError, EOFError, pickle.UnpicklingError) as err:
+        if os.path.exists(path):
+            logger.warning(u'Invalid compiled WSDL {0}: {1}'.format(path, err))
+        return None
+
+    try:
+        is_valid = (
+            data['api_name'] == api_name and data['digest'] == digest and
+            data['version'] == VERSION and data['pysimplesoap'] == _pysimplesoap_version()
+        )
+    except (KeyError, TypeError):
+        is_valid = False
+    if not is_valid:
+        logger.warning(u'Outdated compiled WSDL {0}'.format(path))
+        return None
+
+    return ServiceModel(
+        api_name=api_name,
+        wsdl=wsdl,
+        digest=digest,
+        services=data['services'],
+        namespace=data['namespace'],
+        documentation=data['documentation'],
+    )
+
+
+def compile_service_model(api_name, wsdl, digest, cache_dir):
+    """return the model from the compiled file in cache_dir. The WSDL is parsed and compiled if needed"""
+    path = compiled_path(cache_dir, api_name, digest)
+    model = load_service_model(api_name, wsdl, digest, path)
+    if model is None:
+        model = parse_service_model(api_name, wsdl, digest)
+        try:
+            dump_service_model(model, path)
+        except (IOError, OSError) as err:
+            logger.warning(u'Can not write compiled WSDL {0}: {1}'.format(path, err))
+    return model
+
+
+def get_service_model(api_name, wsdl, cache=None):
+    """
+    Return the ServiceModel of the given WSDL. It is parsed only once per process for
+    a given api_name and WSDL content: the following calls return the same object.
+
+    :param api_name: name of the Payline service (WebPaymentAPI, DirectPaymentAPI...)
+    :param wsdl: url of the WSDL file
+    :param cache: None to disable the on-disk cache or a directory (see cache_dir_for)
+    """
+    key = (api_name, wsdl_digest(wsdl))
+    model = _models.get(key)
+    if model is None:
+        with _lock:
+            model = _models.get(key)
+            if model is None:
+                logger.debug(u'Parsing WSDL of {0}'.format(api_name))
+                cache_dir = cache_dir_for(cache)
+                if cache_dir:
+                    model = compile_service_model(api_name, wsdl, key[1], cache_dir)
+                else:
+                    model = parse_service_model(api_name, wsdl, key[1])
+                _models[key] = model
+    return model
+
+
+def clear_registry():
+    """forget all the parsed service models. The next clients will parse the WSDL again"""
+    with _lock:
+        _models.clear()
+        _digests.clear()
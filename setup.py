@@ -39,7 +39,8 @@ setup(
     maintainer_email='',
     url='',
     license='LGPL',
-    packages=['pypayline', 'pypayline.backends'],
+    packages=['pypayline', 'pypayline.backends', 'pypayline.backends.generated'],
+    package_data={'pypayline': ['*.wsdl']},
     platforms=["Linux", "Mac OS X", "Win"],
     install_requires=load_requirements(),
 )